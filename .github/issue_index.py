@@ -0,0 +1,615 @@
+#!/usr/bin/env python3
+"""
+SQLite index of the issue and PR markdown written by the sync action.
+
+Builds a SQLite database with one row per ``issue-N.md`` / ``pr-N.md`` file,
+holding its frontmatter fields, and an FTS5 table over titles and bodies.
+Updates are incremental: files whose mtime and size are unchanged are not
+read again, and the action's ``modified-files`` / ``removed-files`` outputs
+can be passed in so only those files are touched.
+"""
+
+import os
+import re
+import sqlite3
+import sys
+
+DEFAULT_DB = "issue-index.sqlite"
+DEFAULT_DIR = "synced-issues"
+
+# Bump when the schema changes; older databases are rebuilt from scratch
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE items (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    type TEXT NOT NULL,
+    number INTEGER,
+    state TEXT,
+    merged TEXT,
+    title TEXT,
+    author TEXT,
+    url TEXT,
+    created TEXT,
+    updated TEXT,
+    comments INTEGER,
+    milestone TEXT,
+    branch TEXT
+);
+CREATE INDEX items_type_state_updated ON items (type, state, updated);
+CREATE INDEX items_updated ON items (updated);
+CREATE TABLE item_values (
+    item_id INTEGER NOT NULL REFERENCES items (id) ON DELETE CASCADE,
+    field TEXT NOT NULL,
+    value TEXT NOT NULL
+);
+CREATE INDEX item_values_lookup ON item_values (field, value, item_id);
+CREATE INDEX item_values_item ON item_values (item_id);
+CREATE VIRTUAL TABLE items_fts USING fts5 (title, body);
+"""
+
+# Frontmatter fields holding comma-separated lists, stored in item_values
+LIST_FIELDS = ("labels", "assignees")
+
+ITEM_FILE = re.compile(r"^(issue|pr)-(\d+)\.md$")
+
+# Relative --updated-since values: 7d, 24h, 2w
+_RELATIVE_SINCE = re.compile(r"^(\d+)([hdw])$")
+
+
+def parse_item(text):
+    """
+    Parse a synced issue or PR markdown file.
+
+    The frontmatter is the ``key: value`` block between the leading ``---``
+    lines written by formatIssueAsMarkdown / formatPRAsMarkdown; values of
+    ``none`` mean unset. The title comes from the first ``# `` heading.
+
+    Returns:
+        (fields, title, body) where ``fields`` maps frontmatter keys to
+        strings and ``body`` is everything after the frontmatter
+
+    Raises:
+        ValueError: If the text does not start with a frontmatter block
+    """
+    lines = text.split("\n")
+    if not lines or lines[0].strip() != "---":
+        raise ValueError("missing frontmatter")
+    fields = {}
+    for index, line in enumerate(lines[1:], start=1):
+        if line.strip() == "---":
+            body = "\n".join(lines[index + 1 :])
+            break
+        key, sep, value = line.partition(":")
+        if sep:
+            fields[key.strip()] = value.strip()
+    else:
+        raise ValueError("unterminated frontmatter")
+
+    title = ""
+    for line in body.split("\n"):
+        if line.startswith("# "):
+            title = _heading_title(line[2:].strip())
+            break
+    return fields, title, body.strip()
+
+
+def _heading_title(heading):
+    """
+    Extract the item title from the first heading of a synced file.
+
+    Issues use ``[Issue N]: [title](url)``; PRs use ``[PR N](url) title``.
+    """
+    issue = re.match(r"^\[Issue \d+\]: \[(.*)\]\([^)]*\)$", heading)
+    if issue:
+        return issue.group(1)
+    pr = re.match(r"^\[PR \d+\]\([^)]*\) (.*)$", heading)
+    if pr:
+        return pr.group(1)
+    return heading
+
+
+def _optional(value):
+    return None if value in (None, "", "none") else value
+
+
+def _item_row(path, stat, text):
+    """Build the items row, list values and FTS text for one file."""
+    fields, title, body = parse_item(text)
+    kind, number = ITEM_FILE.match(os.path.basename(path)).groups()
+    state = fields.get("state", "")
+    merged = _optional(fields.get("merged"))
+    if state.endswith(" (merged)"):
+        state = state[: -len(" (merged)")]
+    comments = fields.get("comments", "")
+    row = {
+        "path": path,
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "type": fields.get("type") or ("issue" if kind == "issue" else "pull_request"),
+        "number": int(number),
+        "state": state or None,
+        "merged": merged,
+        "title": title,
+        "author": _optional(fields.get("author")),
+        "url": _optional(fields.get("url")),
+        "created": _optional(fields.get("created")),
+        "updated": _optional(fields.get("updated")),
+        "comments": int(comments) if comments.isdecimal() else None,
+        "milestone": _optional(fields.get("milestone")),
+        "branch": _optional(fields.get("branch")),
+    }
+    values = [
+        (field, value.strip())
+        for field in LIST_FIELDS
+        if _optional(fields.get(field))
+        for value in fields[field].split(",")
+        if value.strip()
+    ]
+    return row, values, body
+
+
+def connect(db_path=DEFAULT_DB):
+    """
+    Open the index database, creating or rebuilding its schema as needed.
+
+    Raises:
+        RuntimeError: If SQLite was built without FTS5
+    """
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA foreign_keys = ON")
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version != SCHEMA_VERSION:
+        with conn:
+            for table in ("items_fts", "item_values", "items"):
+                conn.execute(f"DROP TABLE IF EXISTS {table}")
+            try:
+                conn.executescript(SCHEMA)
+            except sqlite3.OperationalError as e:
+                conn.close()
+                if "fts5" in str(e):
+                    raise RuntimeError("SQLite was built without FTS5") from None
+                raise
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    return conn
+
+
+def _normalize(path):
+    """Key files by their path relative to the current directory."""
+    return os.path.relpath(os.path.abspath(path))
+
+
+def _scan(directories):
+    """Yield (path, stat) for every synced item file below ``directories``."""
+    for directory in directories:
+        for root, dirs, files in os.walk(directory):
+            dirs.sort()
+            for name in sorted(files):
+                if ITEM_FILE.match(name):
+                    path = os.path.join(root, name)
+                    yield _normalize(path), os.stat(path)
+
+
+def _delete(conn, item_id):
+    conn.execute("DELETE FROM items_fts WHERE rowid = ?", (item_id,))
+    conn.execute("DELETE FROM items WHERE id = ?", (item_id,))
+
+
+def _store(conn, item_id, path, stat):
+    """Insert or replace the rows of one file; returns False if unparseable."""
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    if item_id is not None:
+        _delete(conn, item_id)
+    try:
+        row, values, body = _item_row(path, stat, text)
+    except ValueError as e:
+        print(f"Warning: skipping {path}: {e}", file=sys.stderr)
+        return False
+
+    columns = ", ".join(row)
+    placeholders = ", ".join("?" for _ in row)
+    cursor = conn.execute(
+        f"INSERT INTO items ({columns}) VALUES ({placeholders})", list(row.values())
+    )
+    item_id = cursor.lastrowid
+    conn.executemany(
+        "INSERT INTO item_values (item_id, field, value) VALUES (?, ?, ?)",
+        [(item_id, field, value) for field, value in values],
+    )
+    conn.execute(
+        "INSERT INTO items_fts (rowid, title, body) VALUES (?, ?, ?)",
+        (item_id, row["title"], body),
+    )
+    return True
+
+
+def update_index(conn, directories=None, files=None, removed=None):
+    """
+    Bring the index up to date with the synced markdown files.
+
+    With ``directories``, every ``issue-N.md`` / ``pr-N.md`` below them is
+    stat'ed and only files whose mtime or size changed are parsed; indexed
+    files under those directories that no longer exist are dropped. With
+    ``files`` (e.g. the action's ``modified-files`` output), only those paths
+    are looked at, and listed paths that are gone are dropped. ``removed``
+    paths (``removed-files``) are always dropped.
+
+    Returns:
+        dict with ``indexed``, ``unchanged``, ``removed`` and ``skipped`` counts
+    """
+    counts = {"indexed": 0, "unchanged": 0, "removed": 0, "skipped": 0}
+    known = {
+        path: (item_id, mtime_ns, size)
+        for item_id, path, mtime_ns, size in conn.execute(
+            "SELECT id, path, mtime_ns, size FROM items"
+        )
+    }
+
+    def drop(path):
+        entry = known.pop(path, None)
+        if entry is not None:
+            _delete(conn, entry[0])
+            counts["removed"] += 1
+
+    def refresh(path, stat):
+        entry = known.get(path)
+        if entry is not None and entry[1:] == (stat.st_mtime_ns, stat.st_size):
+            counts["unchanged"] += 1
+            return
+        if _store(conn, entry and entry[0], path, stat):
+            counts["indexed"] += 1
+        else:
+            known.pop(path, None)
+            counts["skipped"] += 1
+
+    with conn:
+        for path in removed or []:
+            drop(_normalize(path))
+
+        if files is not None:
+            for path in files:
+                if not ITEM_FILE.match(os.path.basename(path)):
+                    continue
+                path = _normalize(path)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    drop(path)
+                    continue
+                refresh(path, stat)
+
+        if directories is not None:
+            seen = set()
+            for path, stat in _scan(directories):
+                seen.add(path)
+                refresh(path, stat)
+            prefixes = tuple(
+                "" if d == os.curdir else d + os.sep
+                for d in map(_normalize, directories)
+            )
+            for path in list(known):
+                if path.startswith(prefixes) and path not in seen:
+                    drop(path)
+    return counts
+
+
+def _parse_since(value, now=None):
+    """
+    Turn an ``--updated-since`` value into a timestamp comparable with ``updated``.
+
+    Accepts ISO 8601 dates or times (compared as strings, like the UTC
+    timestamps in the frontmatter) and relative ages such as ``24h``, ``7d``
+    or ``2w``.
+
+    Raises:
+        ValueError: If the value is neither
+    """
+    from datetime import datetime, timedelta, timezone
+
+    match = _RELATIVE_SINCE.match(value)
+    if match:
+        amount, unit = int(match.group(1)), match.group(2)
+        delta = {
+            "h": timedelta(hours=1),
+            "d": timedelta(days=1),
+            "w": timedelta(weeks=1),
+        }
+        now = now or datetime.now(timezone.utc)
+        return (now - amount * delta[unit]).strftime("%Y-%m-%dT%H:%M:%SZ")
+    try:
+        datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        raise ValueError(
+            f"Invalid --updated-since value: {value} (use a date or e.g. 7d)"
+        ) from None
+    return value
+
+
+def _fts_terms(search):
+    """
+    Quote every whitespace-separated word of ``search`` as an FTS5 string.
+
+    Plain words such as ``force-update`` would otherwise be read as FTS5
+    syntax (``force NOT update``, or a column filter for ``col:word``).
+    """
+    return " ".join('"' + term.replace('"', '""') + '"' for term in search.split())
+
+
+def query_items(
+    conn,
+    kind=None,
+    state=None,
+    labels=(),
+    author=None,
+    assignee=None,
+    updated_since=None,
+    search=None,
+    limit=None,
+    fts_syntax=False,
+):
+    """
+    Select indexed items; every given filter must match.
+
+    Args:
+        conn: Connection from ``connect``
+        kind: ``issue`` or ``pull_request``
+        state: ``open``, ``closed`` or ``merged``
+        labels: Labels the item must all carry
+        author: Author login
+        assignee: Assignee login
+        updated_since: Value accepted by ``_parse_since``
+        search: Words that must all appear in the title or body; results
+            are then ordered by relevance instead of most recently updated
+        limit: Maximum number of results
+        fts_syntax: Pass ``search`` to FTS5 as a raw query (AND, OR, NEAR,
+            prefix*, column filters) instead of matching its words literally
+
+    Returns:
+        List of dicts with the items columns (without bookkeeping fields)
+        plus ``labels`` and ``assignees`` lists
+    """
+    where = []
+    params = []
+    if kind:
+        where.append("items.type = ?")
+        params.append(kind)
+    if state == "merged":
+        where.append("items.merged IS NOT NULL")
+    elif state:
+        where.append("items.state = ?")
+        params.append(state)
+    if author:
+        where.append("items.author = ?")
+        params.append(author)
+    for field, values in (
+        ("labels", labels),
+        ("assignees", [assignee] if assignee else []),
+    ):
+        for value in values:
+            where.append(
+                "items.id IN (SELECT item_id FROM item_values "
+                "WHERE field = ? AND value = ?)"
+            )
+            params.extend((field, value))
+    if updated_since:
+        where.append("items.updated >= ?")
+        params.append(_parse_since(updated_since))
+
+    sql = (
+        "SELECT items.id, items.path, items.type, items.number, items.state, "
+        "items.merged, items.title, items.author, items.url, items.created, "
+        "items.updated, items.comments, items.milestone, items.branch FROM items"
+    )
+    if search and not fts_syntax:
+        search = _fts_terms(search)
+    if search:
+        sql += " JOIN items_fts ON items_fts.rowid = items.id"
+        where.append("items_fts MATCH ?")
+        params.append(search)
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    sql += " ORDER BY " + ("items_fts.rank" if search else "items.updated DESC")
+    sql += ", items.number DESC"
+    if limit:
+        sql += " LIMIT ?"
+        params.append(limit)
+
+    cursor = conn.execute(sql, params)
+    columns = [column[0] for column in cursor.description]
+    items = [dict(zip(columns, row)) for row in cursor.fetchall()]
+    by_id = {}
+    for item in items:
+        item.update({field: [] for field in LIST_FIELDS})
+        by_id[item.pop("id")] = item
+    if by_id:
+        placeholders = ", ".join("?" for _ in by_id)
+        for item_id, field, value in conn.execute(
+            "SELECT item_id, field, value FROM item_values "
+            f"WHERE item_id IN ({placeholders}) ORDER BY rowid",
+            list(by_id),
+        ):
+            by_id[item_id][field].append(value)
+    return items
+
+
+def _split_list(value):
+    """Split a comma-separated action output, dropping empty entries."""
+    return [part.strip() for part in (value or "").split(",") if part.strip()]
+
+
+def cmd_update(args):
+    """Handle update command."""
+    files = None
+    if args.files is not None:
+        files = _split_list(args.files)
+    directories = args.dirs or (None if files is not None else [DEFAULT_DIR])
+
+    conn = connect(args.db)
+    try:
+        counts = update_index(conn, directories, files, _split_list(args.removed))
+    finally:
+        conn.close()
+
+    print(
+        f"✓ Indexed {counts['indexed']} file(s), {counts['unchanged']} unchanged, "
+        f"{counts['removed']} removed"
+    )
+    if counts["skipped"]:
+        print(f"⚠ Warning: Skipped {counts['skipped']} unparseable file(s)")
+
+
+def cmd_query(args):
+    """Handle query command."""
+    import json
+
+    if not os.path.exists(args.db):
+        raise FileNotFoundError(f"Index not found: {args.db} (run update first)")
+    conn = connect(args.db)
+    try:
+        items = query_items(
+            conn,
+            kind={"issues": "issue", "prs": "pull_request"}.get(args.type),
+            state=args.state,
+            labels=args.label or (),
+            author=args.author,
+            assignee=args.assignee,
+            updated_since=args.updated_since,
+            search=args.search,
+            limit=args.limit,
+            fts_syntax=args.fts,
+        )
+    finally:
+        conn.close()
+
+    for item in items:
+        if args.format == "jsonl":
+            sys.stdout.write(json.dumps(item, ensure_ascii=False) + "\n")
+        else:
+            kind = "PR" if item["type"] == "pull_request" else "Issue"
+            state = "merged" if item["merged"] else item["state"]
+            print(
+                f"{kind} #{item['number']}\t{state}\t{item['updated']}\t{item['title']}"
+            )
+
+
+def _build_parser():
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="SQLite index and queries over synced issue and PR markdown",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Index everything below the action's output directory
+  %(prog)s update synced-issues
+
+  # Refresh only what the last sync touched
+  %(prog)s update --files "$MODIFIED_FILES" --removed "$REMOVED_FILES"
+
+  # Open PRs labelled "bug" updated in the last week
+  %(prog)s query --type prs --state open --label bug --updated-since 7d
+
+  # Full-text search over titles, bodies and comments as JSON Lines
+  %(prog)s query --search 'force-update cache' --format jsonl
+
+  # Raw FTS5 syntax
+  %(prog)s query --fts --search 'regex OR "parse error"'
+        """,
+    )
+    parser.add_argument(
+        "--db",
+        default=DEFAULT_DB,
+        help=f"Path to the index database (default: {DEFAULT_DB})",
+    )
+    subparsers = parser.add_subparsers(
+        title="commands",
+        description="Available commands",
+        dest="command",
+        required=True,
+    )
+
+    # update command
+    update_parser = subparsers.add_parser(
+        "update",
+        help="Index new and changed files, dropping removed ones",
+    )
+    update_parser.add_argument(
+        "dirs",
+        nargs="*",
+        metavar="DIR",
+        help=(
+            "Directories to scan for issue-N.md and pr-N.md files "
+            f"(default: {DEFAULT_DIR}, unless --files is given)"
+        ),
+    )
+    update_parser.add_argument(
+        "--files",
+        help="Comma-separated files to refresh, e.g. the action's modified-files output",
+    )
+    update_parser.add_argument(
+        "--removed",
+        help="Comma-separated files to drop, e.g. the action's removed-files output",
+    )
+    update_parser.set_defaults(func=cmd_update)
+
+    # query command
+    query_parser = subparsers.add_parser(
+        "query",
+        help="List indexed issues and PRs matching all given filters",
+    )
+    query_parser.add_argument("--type", choices=["issues", "prs"], help="Item type")
+    query_parser.add_argument(
+        "--state", choices=["open", "closed", "merged"], help="Item state"
+    )
+    query_parser.add_argument(
+        "--label",
+        action="append",
+        help="Required label; repeat to require several",
+    )
+    query_parser.add_argument("--author", help="Author login")
+    query_parser.add_argument("--assignee", help="Assignee login")
+    query_parser.add_argument(
+        "--updated-since",
+        help="ISO date or time, or a relative age such as 24h, 7d or 2w",
+    )
+    query_parser.add_argument(
+        "--search",
+        help=(
+            "Words that must all appear in the title or body, matched literally "
+            "(results ordered by relevance)"
+        ),
+    )
+    query_parser.add_argument(
+        "--fts",
+        action="store_true",
+        help="Treat --search as raw FTS5 query syntax (AND, OR, NEAR, prefix*)",
+    )
+    query_parser.add_argument("--limit", type=int, help="Maximum number of results")
+    query_parser.add_argument(
+        "--format",
+        choices=["text", "jsonl"],
+        default="text",
+        help="Output format: tab-separated lines (default) or JSON Lines",
+    )
+    query_parser.set_defaults(func=cmd_query)
+
+    return parser
+
+
+def main():
+    """CLI entry point."""
+    args = _build_parser().parse_args()
+
+    try:
+        args.func(args)
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
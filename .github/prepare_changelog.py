@@ -5,53 +5,621 @@ CHANGELOG.md management tool.
 Provides commands for managing CHANGELOG.md during the release workflow.
 """
 
-import argparse
-import re
+# Only modules needed by every command are imported here; the rest are
+# imported where they are used so common invocations start quickly.
+import os
 import sys
-from pathlib import Path
+import time
 
 # Standard CHANGELOG subsections in order
 STANDARD_SECTIONS = ["Added", "Changed", "Deprecated", "Removed", "Fixed", "Security"]
 
+UNRELEASED_HEADING = "## Unreleased"
 
-def extract_unreleased_content(content):
+# Releases moved out by ``archive`` go to <dir of CHANGELOG>/changelog/<major>.x.md,
+# listed under this heading at the end of the CHANGELOG
+ARCHIVE_DIR = "changelog"
+ARCHIVE_HEADING = "## Archived releases"
+
+# Unreleased entries added with ``add`` live in <dir of CHANGELOG>/changelog.d/
+# as <id>.<section>.md until ``prepare`` folds them into the release
+FRAGMENT_DIR = "changelog.d"
+
+# Chunk size used when copying the unchanged tail of a CHANGELOG
+COPY_CHUNK_SIZE = 1024 * 1024
+
+# Resource limits: larger inputs and slower parses fail fast with a clear
+# error. Override with the CHANGELOG_MAX_BYTES and CHANGELOG_PARSE_TIMEOUT
+# environment variables (inherited by workspace worker processes), which are
+# read when a limit is checked so a bad value cannot break --help.
+DEFAULT_MAX_CHANGELOG_BYTES = 256 * 1024 * 1024
+DEFAULT_PARSE_TIMEOUT = 60.0
+
+# Lines parsed between two checks of the parse deadline
+_DEADLINE_CHECK_INTERVAL = 4096
+
+VERSION_RANGE_SEPARATOR = ".."
+
+
+def _is_semver(version):
+    """Return True for ``X.Y.Z`` with decimal digits in every part."""
+    parts = version.split(".")
+    return len(parts) == 3 and all(part.isdecimal() for part in parts)
+
+
+def _is_selector(selector):
+    """Return True for ``X.Y.Z`` or an ``X.Y.Z..X.Y.Z`` range."""
+    low, sep, high = selector.partition(VERSION_RANGE_SEPARATOR)
+    return _is_semver(low) and (not sep or _is_semver(high))
+
+
+def _is_date(value):
+    """Return True for ``YYYY-MM-DD`` with decimal digits."""
+    parts = value.split("-")
+    return [len(part) for part in parts] == [4, 2, 2] and all(
+        part.isdecimal() for part in parts
+    )
+
+
+class Subsection:
+    """A ``### Name`` subsection inside a block.
+
+    Offsets are byte offsets into the parsed document: ``start`` is the
+    beginning of the heading line, ``body_start`` the first byte after it and
+    ``end`` the beginning of the next heading (or end of the block).
     """
-    Extract content from Unreleased section.
 
-    Returns dict: {section_name: content_lines}
+    __slots__ = ("name", "line", "start", "body_start", "end", "bullets")
+
+    def __init__(self, name, line, start, body_start, end, bullets=None):
+        self.name = name
+        self.line = line
+        self.start = start
+        self.body_start = body_start
+        self.end = end
+        self.bullets = [] if bullets is None else bullets
+
+
+class Block:
+    """A ``## Unreleased`` or ``## [X.Y.Z] - date`` block.
+
+    ``version`` is None for the Unreleased block. ``bullets`` holds the
+    ``(start, end)`` byte span of every list item line in the block body,
+    including items that sit inside a subsection.
     """
-    # Find Unreleased section
-    unreleased_match = re.search(
-        r"## Unreleased\s*\n(.*?)(?=\n## \[|\Z)", content, re.DOTALL
+
+    __slots__ = (
+        "title",
+        "version",
+        "date",
+        "line",
+        "start",
+        "body_start",
+        "end",
+        "subsections",
+        "bullets",
     )
 
-    if not unreleased_match:
-        raise ValueError("No '## Unreleased' section found in CHANGELOG")
+    def __init__(
+        self,
+        title,
+        version,
+        date,
+        line,
+        start,
+        body_start,
+        end,
+        subsections=None,
+        bullets=None,
+    ):
+        self.title = title
+        self.version = version
+        self.date = date
+        self.line = line
+        self.start = start
+        self.body_start = body_start
+        self.end = end
+        self.subsections = [] if subsections is None else subsections
+        self.bullets = [] if bullets is None else bullets
+
+    def subsection(self, name):
+        """Return the first subsection called ``name``, or None."""
+        for subsection in self.subsections:
+            if subsection.name == name:
+                return subsection
+        return None
+
+
+class ChangelogDocument:
+    """Structural model of a CHANGELOG built by ``parse_changelog``.
+
+    ``data`` holds the raw UTF-8 bytes; every offset in the model indexes
+    into it, so slices can be copied out without re-encoding the document.
+    ``archive_start`` is the offset of the ``## Archived releases`` pointer
+    section, or None.
+    """
+
+    __slots__ = ("data", "header_end", "blocks", "archive_start")
+
+    def __init__(self, data, header_end, blocks, archive_start=None):
+        self.data = data
+        self.header_end = header_end
+        self.blocks = blocks
+        self.archive_start = archive_start
+
+    @property
+    def unreleased(self):
+        """The first ``## Unreleased`` block, or None."""
+        for block in self.blocks:
+            if block.version is None:
+                return block
+        return None
+
+    @property
+    def versions(self):
+        """All ``## [X.Y.Z]`` blocks in document order."""
+        return [block for block in self.blocks if block.version is not None]
+
+    def find_version(self, version):
+        """Return the first block for ``version``, or None."""
+        for block in self.blocks:
+            if block.version == version:
+                return block
+        return None
+
+    def text(self, start=0, end=None):
+        """Decode the byte range ``[start, end)`` of the document."""
+        return self.data[start:end].decode("utf-8")
+
+
+def _parse_block_heading(line):
+    """
+    Parse a ``## `` heading line.
+
+    Returns (title, version, date) for block headings, or None for other
+    level-2 headings. ``version`` is None for the Unreleased heading.
+    """
+    title = line[3:].strip()
+    if line.rstrip() == UNRELEASED_HEADING:
+        return title, None, None
+    if not title.startswith("["):
+        return None
+    close = title.find("]")
+    if close == -1:
+        return None
+    version = title[1:close]
+    rest = title[close + 1 :]
+    # Skip an optional link target: ``## [1.0.0](https://...) - date``
+    if rest.startswith("(") and ")" in rest:
+        rest = rest[rest.index(")") + 1 :]
+    rest = rest.strip()
+    date = rest[1:].strip() if rest.startswith("-") else None
+    return title, version, date or None
+
+
+def _env_limit(name, convert, default):
+    """
+    Read a resource limit from the environment variable ``name``.
+
+    Raises:
+        ValueError: If the variable is set to something ``convert`` rejects
+    """
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    try:
+        return convert(value)
+    except ValueError:
+        raise ValueError(
+            f"{name} must be {'an integer' if convert is int else 'a number'}, "
+            f"got {value!r}"
+        ) from None
+
+
+def _check_size(size, max_bytes=None):
+    """Raise ValueError if a CHANGELOG of ``size`` bytes is over the limit."""
+    if max_bytes is None:
+        max_bytes = _env_limit("CHANGELOG_MAX_BYTES", int, DEFAULT_MAX_CHANGELOG_BYTES)
+    if size > max_bytes:
+        raise ValueError(
+            f"CHANGELOG is {size} bytes, above the {max_bytes} byte limit "
+            "(raise it with CHANGELOG_MAX_BYTES)"
+        )
+
+
+def parse_changelog(data, max_bytes=None, timeout=None):
+    """
+    Build a ChangelogDocument from CHANGELOG content in a single pass.
+
+    The parser is line oriented and linear in the size of the input: each
+    line is inspected once and classified as a block heading (``## Unreleased``
+    or ``## [...]``), a subsection heading (``### ``), a list item (first
+    non-blank character is ``-``) or plain text.
+
+    For n input bytes it runs in O(n) time: every line is located with one
+    ``bytes.find`` from the previous line end, sliced once and classified by
+    prefix checks, and only heading lines are decoded. No regular expression
+    is applied to the document, so there is no backtracking on unusual
+    input. Memory is the input plus O(1) per heading and list item.
+
+    Args:
+        data: CHANGELOG content as bytes or str
+        max_bytes: Reject larger inputs (default: CHANGELOG_MAX_BYTES or
+            DEFAULT_MAX_CHANGELOG_BYTES)
+        timeout: Abort after this many seconds (default:
+            CHANGELOG_PARSE_TIMEOUT or DEFAULT_PARSE_TIMEOUT)
+
+    Returns:
+        ChangelogDocument
+
+    Raises:
+        ValueError: If the input exceeds ``max_bytes``, parsing exceeds
+            ``timeout`` or a limit variable is malformed
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    _check_size(len(data), max_bytes)
+    if timeout is None:
+        timeout = _env_limit("CHANGELOG_PARSE_TIMEOUT", float, DEFAULT_PARSE_TIMEOUT)
+    deadline = time.monotonic() + timeout
+
+    blocks = []
+    block = None
+    subsection = None
+    header_end = len(data)
+    archive_start = None
+    size = len(data)
+    pos = 0
+    lineno = 0
+
+    while pos < size:
+        newline = data.find(b"\n", pos)
+        end = size if newline == -1 else newline + 1
+        lineno += 1
+        line = data[pos:end]
+
+        if lineno % _DEADLINE_CHECK_INTERVAL == 0 and time.monotonic() > deadline:
+            raise ValueError(
+                f"Parsing CHANGELOG exceeded the {timeout:g}s time limit at line "
+                f"{lineno} (raise it with CHANGELOG_PARSE_TIMEOUT)"
+            )
+
+        if line.startswith(b"## "):
+            heading = _parse_block_heading(line.decode("utf-8"))
+            if subsection is not None:
+                subsection.end = pos
+                subsection = None
+            if heading is not None:
+                if not blocks:
+                    header_end = pos
+                elif block is not None:
+                    block.end = pos
+                title, version, date = heading
+                block = Block(title, version, date, lineno, pos, end, size)
+                blocks.append(block)
+            elif line.rstrip() == ARCHIVE_HEADING.encode("utf-8"):
+                # The archive pointers are not part of the last release's notes
+                if block is not None:
+                    block.end = pos
+                    block = None
+                archive_start = pos
+        elif line.startswith(b"### ") and block is not None:
+            if subsection is not None:
+                subsection.end = pos
+            name = line[4:].decode("utf-8").strip()
+            subsection = Subsection(name, lineno, pos, end, size)
+            block.subsections.append(subsection)
+        elif block is not None and line.lstrip().startswith(b"-"):
+            span = (pos, end)
+            block.bullets.append(span)
+            if subsection is not None:
+                subsection.bullets.append(span)
+
+        pos = end
+
+    return ChangelogDocument(data, header_end, blocks, archive_start)
+
+
+# ChangelogCache consulted by read_changelog(); set by ChangelogServer
+_document_cache = None
+
+# (GitObjectReader, ref) that file reads go through instead of the working
+# tree; set by GitObjectReader.at()
+_git_source = None
+
+
+def read_changelog(filepath="CHANGELOG.md"):
+    """
+    Read and parse a CHANGELOG file.
+
+    Inside ``GitObjectReader.at(ref)`` the file is read from that ref instead
+    of the working tree.
+
+    Raises:
+        FileNotFoundError: If CHANGELOG file doesn't exist
+    """
+    if _git_source is not None:
+        return parse_changelog(_read_git_changelog(filepath))
+    if not os.path.exists(filepath):
+        raise FileNotFoundError(f"CHANGELOG not found: {filepath}")
+
+    _check_size(os.path.getsize(filepath))
+    if _document_cache is not None:
+        return _document_cache.get(filepath)
+    with open(filepath, "rb") as f:
+        return parse_changelog(f.read())
+
+
+class GitObjectReader:
+    """
+    Read files from git objects through one long-lived ``git cat-file --batch``.
+
+    Every lookup is a ``<ref>:./<path>`` request written to the same process,
+    so reading many files, refs or versions costs a single git start-up and
+    needs no checkout. Only the objects asked for are read, which also works
+    in blobless and sparse clones (git fetches missing blobs on demand).
+
+    Paths are given as for the working tree, relative to the current
+    directory. Use ``at(ref)`` to make the CHANGELOG functions read from a ref.
+    """
+
+    def __init__(self, repo=None):
+        import subprocess
+
+        self.repo = repo
+        self._process = subprocess.Popen(
+            ["git", "cat-file", "--batch"],
+            cwd=repo,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Stop the ``git cat-file`` process."""
+        if self._process.poll() is None:
+            self._process.stdin.close()
+            self._process.wait()
+        self._process.stdout.close()
+
+    def _abort(self):
+        """Kill ``git cat-file`` without draining a pending object."""
+        if self._process.poll() is None:
+            self._process.kill()
+            self._process.wait()
+        self._process.stdin.close()
+        self._process.stdout.close()
+
+    def at(self, ref):
+        """Return a context manager routing CHANGELOG reads to ``ref``."""
+        return _GitSource(self, ref)
+
+    def _request(self, ref, path):
+        """
+        Look ``path`` up at ``ref``; returns (object id, type, content).
+
+        Raises:
+            FileNotFoundError: If the ref or the path does not exist
+            ValueError: If the ref is malformed or the object is too large
+        """
+        if not ref or any(char.isspace() for char in ref):
+            raise ValueError(f"Invalid git ref: {ref!r}")
+        path = os.path.relpath(path, self.repo or os.curdir).replace(os.sep, "/")
+        spec = f"{ref}:./{path}"
+        process = self._process
+        if process.poll() is not None:
+            raise ValueError("git cat-file is no longer running")
+        process.stdin.write(spec.encode("utf-8") + b"\n")
+        process.stdin.flush()
+
+        header = process.stdout.readline()
+        if not header:
+            raise ValueError(f"git cat-file exited while reading {spec}")
+        if header.endswith((b" missing\n", b" ambiguous\n")):
+            raise FileNotFoundError(f"{path} not found at {ref}")
+        object_id, kind, size = header.decode("utf-8").rsplit(" ", 2)
+        size = int(size)
+        try:
+            _check_size(size)
+        except ValueError:
+            # The content is still pending on stdout, so git would block
+            # writing it if we only closed stdin; kill it instead
+            self._abort()
+            raise
+        content = process.stdout.read(size + 1)[:size]
+        return object_id, kind, content
+
+    def read(self, ref, path):
+        """
+        Return the content of file ``path`` at ``ref`` as bytes.
+
+        Raises:
+            FileNotFoundError: If the ref or the path does not exist
+            ValueError: If ``path`` is not a file or is too large
+        """
+        _, kind, content = self._request(ref, path)
+        if kind != "blob":
+            raise ValueError(f"{path} at {ref} is a {kind}, not a file")
+        return content
+
+    def listdir(self, ref, path):
+        """
+        Return the entry names of directory ``path`` at ``ref``.
+
+        Raises:
+            FileNotFoundError: If the ref or the path does not exist
+            ValueError: If ``path`` is not a directory
+        """
+        object_id, kind, content = self._request(ref, path)
+        if kind != "tree":
+            raise ValueError(f"{path} at {ref} is a {kind}, not a directory")
+        # Entries are "<mode> <name>\0<raw object id>"
+        id_size = len(object_id) // 2
+        names = []
+        pos = 0
+        while pos < len(content):
+            nul = content.index(b"\0", pos)
+            names.append(content[content.index(b" ", pos) + 1 : nul].decode("utf-8"))
+            pos = nul + 1 + id_size
+        return names
+
+
+class _GitSource:
+    """Context manager behind ``GitObjectReader.at``."""
+
+    def __init__(self, reader, ref):
+        self.source = (reader, ref)
+        self.previous = None
+
+    def __enter__(self):
+        global _git_source
+        self.previous, _git_source = _git_source, self.source
+        return self.source[1]
+
+    def __exit__(self, *exc):
+        global _git_source
+        _git_source = self.previous
+
+
+def _read_git_changelog(filepath):
+    """Read a CHANGELOG from the active git source."""
+    reader, ref = _git_source
+    try:
+        return reader.read(ref, filepath)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"CHANGELOG not found at {ref}: {filepath}") from None
+
+
+def _read_text(path):
+    """Read a UTF-8 text file from the working tree or the active git source."""
+    if _git_source is None:
+        with open(path, encoding="utf-8") as f:
+            return f.read()
+    import io
+
+    reader, ref = _git_source
+    # Decode like open() does, including newline translation
+    return io.TextIOWrapper(io.BytesIO(reader.read(ref, path)), "utf-8").read()
+
+
+def _listdir(path):
+    """List a directory of the working tree or the active git source."""
+    if _git_source is None:
+        return os.listdir(path)
+    reader, ref = _git_source
+    return reader.listdir(ref, path)
+
+
+def _read_head(f, after_unreleased):
+    """
+    Read lines from a binary file up to the first ``## [`` version heading.
+
+    With ``after_unreleased``, version headings that come before the
+    ``## Unreleased`` heading are kept in the head. The file is left
+    positioned at the start of the version heading, so the rest can be
+    copied without being parsed.
+
+    Returns (head, found) where ``found`` tells whether a version heading
+    was reached before end of file.
+    """
+    lines = []
+    size = 0
+    seen_unreleased = not after_unreleased
+    for line in iter(f.readline, b""):
+        size += len(line)
+        _check_size(size)
+        if line.startswith(b"## "):
+            heading = _parse_block_heading(line.decode("utf-8"))
+            if heading is not None and heading[1] is None:
+                seen_unreleased = True
+            elif heading is not None and seen_unreleased:
+                f.seek(-len(line), os.SEEK_CUR)
+                return b"".join(lines), True
+        lines.append(line)
+    return b"".join(lines), False
+
+
+class _AtomicOutput:
+    """
+    Yield a binary file that atomically replaces ``filepath`` on success.
+
+    Output goes to a temporary file in the same directory, which is fsynced
+    and renamed over the original only once the block completes, so an
+    interrupted run never leaves a half-written CHANGELOG behind.
+    """
 
-    unreleased_text = unreleased_match.group(1)
+    def __init__(self, filepath):
+        self.filepath = filepath
+        self.tmp = None
+        self.out = None
+
+    def __enter__(self):
+        import tempfile
+
+        directory, name = os.path.split(os.path.abspath(self.filepath))
+        fd, self.tmp = tempfile.mkstemp(
+            dir=directory, prefix=f".{name}.", suffix=".tmp"
+        )
+        self.out = os.fdopen(fd, "wb")
+        return self.out
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                self.out.flush()
+                os.fsync(self.out.fileno())
+            self.out.close()
+            if exc_type is None:
+                import shutil
+
+                if os.path.exists(self.filepath):
+                    shutil.copymode(self.filepath, self.tmp)
+                os.replace(self.tmp, self.filepath)
+                return False
+        except BaseException:
+            self._discard()
+            raise
+        self._discard()
+        return False
+
+    def _discard(self):
+        if os.path.exists(self.tmp):
+            os.unlink(self.tmp)
+
+
+def _unreleased_sections(doc):
+    """Collect standard subsections with bullet content from the Unreleased block."""
+    unreleased = doc.unreleased
+    if unreleased is None:
+        raise ValueError("No '## Unreleased' section found in CHANGELOG")
 
-    # Extract each subsection
     sections = {}
     for section in STANDARD_SECTIONS:
-        # Match section header, capture content until next heading at line start
-        pattern = rf"^### {section}\s*\n(.*?)(?=^### |^## |\Z)"
-        match = re.search(pattern, unreleased_text, re.MULTILINE | re.DOTALL)
-        if match:
-            section_content = match.group(1).strip()
-            # Only keep if it has actual bullet points (lines starting with -)
-            if section_content:
-                lines_with_content = [
-                    line
-                    for line in section_content.split("\n")
-                    if line.strip() and line.strip().startswith("-")
-                ]
-                if lines_with_content:
-                    sections[section] = section_content
+        subsection = unreleased.subsection(section)
+        # Only keep if it has actual bullet points (lines starting with -)
+        if subsection is not None and subsection.bullets:
+            sections[section] = doc.text(subsection.body_start, subsection.end).strip()
 
     return sections
 
 
-def create_new_changelog(version, old_sections, rest_of_changelog):
+def extract_unreleased_content(content):
+    """
+    Extract content from Unreleased section.
+
+    Runs in time linear in the size of ``content`` (see parse_changelog).
+
+    Returns dict: {section_name: content_lines}
+    """
+    return _unreleased_sections(parse_changelog(content))
+
+
+def create_new_changelog(version, old_sections, rest_of_changelog=""):
     """
     Create new CHANGELOG structure.
 
@@ -59,6 +627,7 @@ def create_new_changelog(version, old_sections, rest_of_changelog):
         version: Version string (e.g., "1.0.0")
         old_sections: Dict of sections with content from old Unreleased
         rest_of_changelog: Everything after the old Unreleased section
+            (omit to render only the new head of the file)
     """
     lines = []
 
@@ -100,33 +669,188 @@ def create_new_changelog(version, old_sections, rest_of_changelog):
     return "".join(lines)
 
 
+def _scan_unreleased(filepath):
+    """
+    Locate the Unreleased block while reading as little of the file as possible.
+
+    The file is streamed line by line and reading stops at the first ``## [``
+    heading after ``## Unreleased``, so the cost is proportional to the
+    Unreleased section rather than the whole history. In serve mode the
+    cached document is used instead.
+
+    Returns (unreleased, bytes_scanned) where ``unreleased`` is a Block or None.
+
+    Raises:
+        FileNotFoundError: If CHANGELOG file doesn't exist
+    """
+    if _document_cache is not None:
+        doc = read_changelog(filepath)
+        return doc.unreleased, len(doc.data)
+
+    if _git_source is not None:
+        import io
+
+        # The whole blob comes through the pipe; only its head is parsed
+        data = io.BytesIO(_read_git_changelog(filepath))
+        head, _ = _read_head(data, after_unreleased=True)
+        return parse_changelog(head).unreleased, len(head)
+
+    if not os.path.exists(filepath):
+        raise FileNotFoundError(f"CHANGELOG not found: {filepath}")
+    with open(filepath, "rb") as f:
+        head, _ = _read_head(f, after_unreleased=True)
+    return parse_changelog(head).unreleased, len(head)
+
+
 def validate_changelog(filepath="CHANGELOG.md"):
     """
     Validate that CHANGELOG has Unreleased section with content.
 
+    Only the head of the file up to the release after ``## Unreleased`` is
+    read, in time linear in its size (see parse_changelog). Fragments in
+    ``changelog.d/`` count as content.
+
     Returns: (has_section, has_content)
+
+    Raises:
+        ValueError: If a fragment names an unknown section
     """
-    path = Path(filepath)
-    if not path.exists():
-        raise FileNotFoundError(f"CHANGELOG not found: {filepath}")
+    unreleased, _ = _scan_unreleased(filepath)
 
-    content = path.read_text()
+    # Fragments are always read so a malformed one fails here, not in prepare
+    fragments = collect_fragments(filepath)
 
-    # Check for Unreleased section
-    has_section = bool(re.search(r"## Unreleased", content))
+    has_section = unreleased is not None
+    # Any line starting with '-' (bullet point) or a fragment counts as content
+    has_content = has_section and (bool(unreleased.bullets) or bool(fragments))
+
+    return has_section, has_content
 
-    # Check for content in Unreleased section
-    has_content = False
-    if has_section:
-        unreleased_match = re.search(
-            r"## Unreleased\s*\n(.*?)(?=\n## \[|\Z)", content, re.DOTALL
+
+def changelog_stats(filepath="CHANGELOG.md"):
+    """
+    Validate a CHANGELOG and report what the check cost.
+
+    Returns dict with ``has_section``, ``has_content``, ``sections`` (bullet
+    count per STANDARD_SECTIONS entry in the Unreleased block),
+    ``bytes_scanned`` and ``seconds``.
+    """
+    start = time.perf_counter()
+    unreleased, bytes_scanned = _scan_unreleased(filepath)
+
+    sections = dict.fromkeys(STANDARD_SECTIONS, 0)
+    if unreleased is not None:
+        for subsection in unreleased.subsections:
+            if subsection.name in sections:
+                sections[subsection.name] += len(subsection.bullets)
+    fragments = collect_fragments(filepath)
+    for _, section, text in fragments:
+        sections[section] += sum(
+            1 for line in text.splitlines() if line.lstrip().startswith("-")
         )
-        if unreleased_match:
-            unreleased_text = unreleased_match.group(1)
-            # Check if any line starts with '-' (bullet point)
-            has_content = bool(re.search(r"^\s*-", unreleased_text, re.MULTILINE))
 
-    return has_section, has_content
+    return {
+        "has_section": unreleased is not None,
+        "has_content": unreleased is not None
+        and (bool(unreleased.bullets) or bool(fragments)),
+        "sections": sections,
+        "fragments": len(fragments),
+        "bytes_scanned": bytes_scanned,
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def fragment_dir(filepath="CHANGELOG.md"):
+    """Return the directory holding the Unreleased fragments of a CHANGELOG."""
+    return os.path.join(os.path.dirname(filepath), FRAGMENT_DIR)
+
+
+def _fragment_section(name):
+    """Return the STANDARD_SECTIONS entry matching ``name`` case-insensitively."""
+    for section in STANDARD_SECTIONS:
+        if section.lower() == name.lower():
+            return section
+    raise ValueError(
+        f"Unknown changelog section: {name} "
+        f"(expected one of {', '.join(STANDARD_SECTIONS)})"
+    )
+
+
+def add_fragment(section, text, filepath="CHANGELOG.md", fragment_id=None):
+    """
+    Record one Unreleased entry as ``changelog.d/<id>.<section>.md``.
+
+    Only the new file is written, so adding an entry costs the same however
+    long the CHANGELOG is, and entries from different branches never
+    conflict. ``text`` becomes a bullet unless it already starts with one.
+
+    Args:
+        section: One of STANDARD_SECTIONS (case-insensitive)
+        text: Entry text, may span several lines
+        filepath: Path to CHANGELOG.md the fragment belongs to
+        fragment_id: Name for the fragment, e.g. a PR number (default: random)
+
+    Returns:
+        Path of the fragment file
+
+    Raises:
+        ValueError: If the section is unknown, the text is empty, the id is
+            not made of letters, digits, ``-`` and ``_``, or a fragment with
+            this id and section already exists
+    """
+    section = _fragment_section(section)
+    text = text.strip()
+    if not text:
+        raise ValueError("Fragment text is empty")
+    if fragment_id is None:
+        import secrets
+
+        fragment_id = secrets.token_hex(4)
+    fragment_id = str(fragment_id)
+    if not fragment_id or not all(c.isalnum() or c in "-_" for c in fragment_id):
+        raise ValueError(f"Invalid fragment id: {fragment_id!r}")
+
+    if not text.startswith("-"):
+        text = f"- {text}"
+    directory = fragment_dir(filepath)
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{fragment_id}.{section.lower()}.md")
+    try:
+        with open(path, "x", encoding="utf-8") as f:
+            f.write(text + "\n")
+    except FileExistsError:
+        raise ValueError(f"Fragment already exists: {path}") from None
+    return path
+
+
+def collect_fragments(filepath="CHANGELOG.md"):
+    """
+    Read the Unreleased fragments of a CHANGELOG, ordered by file name.
+
+    Files that do not look like ``<id>.<section>.md`` are ignored.
+
+    Returns:
+        List of (path, section, text) tuples
+
+    Raises:
+        ValueError: If a fragment names an unknown section
+    """
+    directory = fragment_dir(filepath)
+    try:
+        names = sorted(_listdir(directory))
+    except FileNotFoundError:
+        return []
+
+    fragments = []
+    for name in names:
+        stem, dot, section = name[: -len(".md")].rpartition(".")
+        if not name.endswith(".md") or not dot or not stem:
+            continue
+        path = os.path.join(directory, name)
+        text = _read_text(path).strip()
+        if text:
+            fragments.append((path, _fragment_section(section), text))
+    return fragments
 
 
 def reset_unreleased(filepath="CHANGELOG.md"):
@@ -138,84 +862,82 @@ def reset_unreleased(filepath="CHANGELOG.md"):
 
     Raises an error if Unreleased section already exists.
     """
-    path = Path(filepath)
-    if not path.exists():
-        raise FileNotFoundError(f"CHANGELOG not found: {filepath}")
-
-    content = path.read_text()
+    import shutil
 
-    # Error if Unreleased already exists - this indicates wrong timing
-    if re.search(r"## Unreleased", content):
-        raise ValueError(
-            "Unreleased section already exists in CHANGELOG.\n"
-            "The reset action should only be used after merging a release to dev,\n"
-            "when the Unreleased section has been removed."
-        )
-
-    # Insert fresh Unreleased at the top (after header)
-    # Find end of header (after the last line before first ## heading)
-    header_match = re.search(r"(.*?\n\n)(?=## \[)", content, re.DOTALL)
-    if header_match:
-        header = header_match.group(1)
-        rest = content[header_match.end() :]
+    if not os.path.exists(filepath):
+        raise FileNotFoundError(f"CHANGELOG not found: {filepath}")
 
-        # Build fresh Unreleased section
+    with _AtomicOutput(filepath) as out, open(filepath, "rb") as src:
+        # Only the header up to the first version section is read here
+        head, found_version = _read_head(src, after_unreleased=False)
+
+        # Error if Unreleased already exists - this indicates wrong timing
+        if parse_changelog(head).unreleased is not None:
+            raise ValueError(
+                "Unreleased section already exists in CHANGELOG.\n"
+                "The reset action should only be used after merging a release to dev,\n"
+                "when the Unreleased section has been removed."
+            )
+        if not found_version:
+            raise ValueError(
+                "Could not find appropriate location for Unreleased section"
+            )
+
+        # Build fresh Unreleased section, inserted before the first version
         unreleased = "## Unreleased\n\n"
         for section in STANDARD_SECTIONS:
             unreleased += f"### {section}\n\n"
 
-        new_content = header + unreleased + rest
-        path.write_text(new_content)
-    else:
-        raise ValueError("Could not find appropriate location for Unreleased section")
+        out.write(head)
+        out.write(unreleased.encode("utf-8"))
+        shutil.copyfileobj(src, out, COPY_CHUNK_SIZE)
 
 
 def prepare_changelog(version, filepath="CHANGELOG.md"):
     """
     Prepare CHANGELOG for release.
 
+    Fragments from ``changelog.d/`` are appended to their sections after the
+    Unreleased content in the same rewrite, and deleted once it is in place.
+
     Args:
         version: Semantic version (e.g., "1.0.0")
         filepath: Path to CHANGELOG.md
     """
+    import shutil
+
     # Validate version format
-    if not re.match(r"^\d+\.\d+\.\d+$", version):
+    if not _is_semver(version):
         raise ValueError(f"Invalid semantic version: {version}")
 
-    # Read current CHANGELOG
-    path = Path(filepath)
-    if not path.exists():
+    if not os.path.exists(filepath):
         raise FileNotFoundError(f"CHANGELOG not found: {filepath}")
 
-    content = path.read_text()
-
-    # Extract Unreleased content
-    old_sections = extract_unreleased_content(content)
+    with _AtomicOutput(filepath) as out, open(filepath, "rb") as src:
+        # Read up to the first version section after Unreleased
+        head, _ = _read_head(src, after_unreleased=True)
 
-    # Get everything after Unreleased section
-    rest_match = re.search(r"## Unreleased\s*\n.*?(?=\n## \[)", content, re.DOTALL)
+        # Extract Unreleased content and fold in the fragments
+        old_sections = _unreleased_sections(parse_changelog(head))
+        fragments = collect_fragments(filepath)
+        for _, section, text in fragments:
+            existing = old_sections.get(section)
+            old_sections[section] = f"{existing}\n{text}" if existing else text
 
-    if rest_match:
-        # Find start of next version section
-        next_version_start = content.find("\n## [", rest_match.end())
-        if next_version_start != -1:
-            rest_of_changelog = content[next_version_start + 1 :]
-        else:
-            rest_of_changelog = ""
-    else:
-        rest_of_changelog = ""
-
-    # Create new CHANGELOG
-    new_content = create_new_changelog(version, old_sections, rest_of_changelog)
-
-    # Write back
-    path.write_text(new_content)
+        # Write the new head, then copy the untouched versions unchanged
+        out.write(create_new_changelog(version, old_sections).encode("utf-8"))
+        shutil.copyfileobj(src, out, COPY_CHUNK_SIZE)
 
+    for path, _, _ in fragments:
+        os.unlink(path)
     return old_sections
 
 
 def cmd_prepare(args):
     """Handle prepare command."""
+    if _workspace_requested(args):
+        return cmd_workspace(args, "prepare", {"version": args.version})
+
     sections = prepare_changelog(args.version, args.file)
 
     print(f"✓ Prepared CHANGELOG for version {args.version}")
@@ -230,23 +952,75 @@ def cmd_prepare(args):
     print("✓ Created fresh Unreleased section")
 
 
+def _iter_refs(refs):
+    """
+    Yield each of ``refs`` while CHANGELOG reads go through git at that ref.
+
+    All refs share one GitObjectReader. Without refs, yield None once and
+    leave reads on the working tree.
+    """
+    if not refs:
+        yield None
+        return
+    with GitObjectReader() as reader:
+        for ref in refs:
+            with reader.at(ref):
+                yield ref
+
+
 def cmd_validate(args):
     """Handle validate command."""
-    has_section, has_content = validate_changelog(args.file)
+    if _workspace_requested(args):
+        if args.stats:
+            raise ValueError("--stats is not supported with --glob/--manifest")
+        return cmd_workspace(args, "validate", {})
+
+    failed = False
+    for ref in _iter_refs(args.refs):
+        failed = not _validate_one(args, ref) or failed
+    if failed:
+        sys.exit(1)
+
+
+def _validate_one(args, ref):
+    """Validate ``args.file`` (at ``ref`` if set); returns True if it passed."""
+    where = f" at {ref}" if ref is not None else ""
+    if args.stats:
+        stats = changelog_stats(args.file)
+        has_section, has_content = stats["has_section"], stats["has_content"]
+        for name, count in stats["sections"].items():
+            print(f"{name}: {count} bullet(s)")
+        print(f"Fragments: {stats['fragments']} file(s)")
+        print(
+            f"Scanned {stats['bytes_scanned']} bytes in "
+            f"{stats['seconds'] * 1000:.2f} ms"
+        )
+    else:
+        has_section, has_content = validate_changelog(args.file)
 
     if not has_section:
-        print("Error: No Unreleased section found in CHANGELOG", file=sys.stderr)
-        sys.exit(1)
+        print(
+            f"Error: No Unreleased section found in CHANGELOG{where}", file=sys.stderr
+        )
+        return False
 
     if not has_content:
         print(
-            "Error: Unreleased section is empty (no changes to release)",
+            f"Error: Unreleased section is empty{where} (no changes to release)",
             file=sys.stderr,
         )
-        sys.exit(1)
+        return False
 
-    print("✓ CHANGELOG validation passed")
+    print(f"✓ CHANGELOG validation passed{where}")
     print("✓ Unreleased section exists with content")
+    return True
+
+
+def cmd_add(args):
+    """Handle add command."""
+    path = add_fragment(args.section, args.text, args.file, args.id)
+
+    print(f"✓ Added {args.section} entry: {path}")
 
 
 def cmd_reset(args):
@@ -272,36 +1046,226 @@ def finalize_release_date(version, release_date, filepath="CHANGELOG.md"):
         FileNotFoundError: If CHANGELOG file doesn't exist
     """
     # Validate version format
-    if not re.match(r"^\d+\.\d+\.\d+$", version):
+    if not _is_semver(version):
         raise ValueError(f"Invalid semantic version: {version}")
 
     # Validate date format
-    if not re.match(r"^\d{4}-\d{2}-\d{2}$", release_date):
+    if not _is_date(release_date):
         raise ValueError(f"Invalid date format: {release_date} (expected YYYY-MM-DD)")
 
-    # Read CHANGELOG
-    path = Path(filepath)
-    if not path.exists():
-        raise FileNotFoundError(f"CHANGELOG not found: {filepath}")
-
-    content = path.read_text()
+    doc = read_changelog(filepath)
 
     # Check if version with TBD exists
-    version_pattern = rf"## \[{re.escape(version)}\] - TBD"
-    if not re.search(version_pattern, content):
+    targets = [
+        block
+        for block in doc.versions
+        if block.version == version and block.date == "TBD"
+    ]
+    if not targets:
         raise ValueError(
             f"Version section '## [{version}] - TBD' not found in CHANGELOG"
         )
 
-    # Replace TBD with release date
-    replacement = f"## [{version}] - {release_date}"
-    new_content = re.sub(version_pattern, replacement, content)
+    # Replace TBD with release date, splicing only the heading lines. The
+    # parsed date is the text after the last "-", so the line ends in TBD
+    # whatever link target or spacing the heading uses.
+    parts = []
+    pos = 0
+    for block in targets:
+        line = doc.data[block.start : block.body_start]
+        heading = line.rstrip()
+        if not heading.endswith(b"TBD"):
+            raise ValueError(f"Could not locate TBD in heading: {heading.decode()}")
+        parts.append(doc.data[pos : block.start])
+        parts.append(
+            heading[: -len(b"TBD")]
+            + release_date.encode("utf-8")
+            + line[len(heading) :]
+        )
+        pos = block.body_start
+    parts.append(doc.data[pos:])
+    if b"".join(parts) == doc.data:
+        raise ValueError(f"Release date for {version} was not updated")
 
     # Write back
-    path.write_text(new_content)
+    with _AtomicOutput(filepath) as out:
+        out.writelines(parts)
+
+
+# Bump when the on-disk layout of the offset index changes
+INDEX_FORMAT = 2
+INDEX_SUFFIX = ".index.json"
+
+
+def index_path(filepath="CHANGELOG.md"):
+    """Return the path of the offset index sidecar for a CHANGELOG."""
+    from pathlib import Path
+
+    return Path(f"{filepath}{INDEX_SUFFIX}")
+
+
+def _digest(data):
+    import hashlib
+
+    return hashlib.sha256(data).hexdigest()
+
+
+def _index_entries(blocks, data, offset=0):
+    """Describe parsed blocks as index entries, shifting offsets by ``offset``."""
+    return [
+        {
+            "version": block.version,
+            "date": block.date,
+            "start": block.start + offset,
+            "body_start": block.body_start + offset,
+            "end": block.end + offset,
+            "sha256": _digest(data[block.start : block.end]),
+        }
+        for block in blocks
+    ]
+
+
+def _reusable_tail(old_entries, data, old_size):
+    """
+    Find index entries from a stale index that are still valid for ``data``.
+
+    CHANGELOG edits happen at the top of the file, so older blocks keep their
+    bytes and only move by the change in file size (``old_size`` is the size
+    the index was built from). Walk the old entries from the end and keep
+    every block whose bytes still hash the same at the shifted position;
+    stop at the first one that does not.
+
+    Returns (entries, delta) where ``entries`` are the reusable old entries
+    in document order and ``delta`` is the offset shift to apply to them.
+    """
+    if not old_entries:
+        return [], 0
+    delta = len(data) - old_size
+    reusable = []
+    for entry in reversed(old_entries):
+        start = entry["start"] + delta
+        end = entry["end"] + delta
+        if start < 0 or (start > 0 and data[start - 1 : start] != b"\n"):
+            break
+        if _digest(data[start:end]) != entry["sha256"]:
+            break
+        reusable.append(entry)
+    reusable.reverse()
+    return reusable, delta
+
+
+def build_index(filepath="CHANGELOG.md", previous=None):
+    """
+    Build the offset index for a CHANGELOG.
+
+    The index maps every block to its ``(start, body_start, end)`` byte
+    range and records the file size, mtime and SHA-256 it was built from.
+    When ``previous`` (a stale index) is given, blocks whose bytes are
+    unchanged are carried over and only the modified head of the file is
+    parsed again.
+
+    Raises:
+        FileNotFoundError: If CHANGELOG file doesn't exist
+    """
+    from pathlib import Path
+
+    path = Path(filepath)
+    if not path.exists():
+        raise FileNotFoundError(f"CHANGELOG not found: {filepath}")
+
+    stat = path.stat()
+    _check_size(stat.st_size)
+    data = path.read_bytes()
+
+    reused, delta = _reusable_tail(
+        previous["blocks"] if previous else [],
+        data,
+        previous["size"] if previous else 0,
+    )
+    head_end = reused[0]["start"] + delta if reused else len(data)
+    entries = _index_entries(parse_changelog(data[:head_end]).blocks, data)
+    for entry in reused:
+        entries.append(
+            dict(
+                entry,
+                start=entry["start"] + delta,
+                body_start=entry["body_start"] + delta,
+                end=entry["end"] + delta,
+            )
+        )
+
+    return {
+        "format": INDEX_FORMAT,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": _digest(data),
+        "blocks": entries,
+    }
+
+
+def load_index(filepath="CHANGELOG.md"):
+    """
+    Return an up-to-date offset index for a CHANGELOG, persisting it.
+
+    A sidecar whose size and mtime match the file is used as is, without
+    reading the CHANGELOG. Otherwise the file is hashed: if only the mtime
+    changed (e.g. after a fresh checkout) the sidecar is re-stamped, and if
+    the content changed it is rebuilt incrementally from the stale entries.
+
+    Raises:
+        FileNotFoundError: If CHANGELOG file doesn't exist
+    """
+    import json
+    from pathlib import Path
+
+    path = Path(filepath)
+    if not path.exists():
+        raise FileNotFoundError(f"CHANGELOG not found: {filepath}")
+
+    sidecar = index_path(filepath)
+    index = None
+    try:
+        index = json.loads(sidecar.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        pass
+    if not isinstance(index, dict) or index.get("format") != INDEX_FORMAT:
+        index = None
+
+    stat = path.stat()
+    if (
+        index is not None
+        and index["size"] == stat.st_size
+        and index["mtime_ns"] == stat.st_mtime_ns
+    ):
+        return index
+
+    if index is not None and index["size"] == stat.st_size:
+        if _digest(path.read_bytes()) == index["sha256"]:
+            index["mtime_ns"] = stat.st_mtime_ns
+            _write_index(sidecar, index)
+            return index
+
+    index = build_index(filepath, previous=index)
+    _write_index(sidecar, index)
+    return index
+
+
+def _write_index(sidecar, index):
+    """Atomically replace the sidecar with ``index``."""
+    import json
+
+    tmp = sidecar.with_name(f"{sidecar.name}.tmp")
+    tmp.write_text(json.dumps(index, separators=(",", ":")), encoding="utf-8")
+    os.replace(tmp, sidecar)
 
 
-def extract_release_notes(version, filepath="CHANGELOG.md"):
+def _read_span(f, start, end):
+    """Read the byte range ``[start, end)`` of an open binary file."""
+    f.seek(start)
+    return f.read(end - start)
+
+
+def extract_release_notes(version, filepath="CHANGELOG.md", use_index=False):
     """
     Extract release notes for a specific version from CHANGELOG.
 
@@ -311,6 +1275,8 @@ def extract_release_notes(version, filepath="CHANGELOG.md"):
     Args:
         version: Semantic version (e.g., "1.0.0")
         filepath: Path to CHANGELOG.md
+        use_index: Look the version up in the offset index sidecar (see
+            ``load_index``) and read only its byte range from the file
 
     Returns:
         Extracted notes as a string, or empty string if none found.
@@ -319,45 +1285,997 @@ def extract_release_notes(version, filepath="CHANGELOG.md"):
         ValueError: If version format is invalid
         FileNotFoundError: If CHANGELOG file doesn't exist
     """
-    if not re.match(r"^\d+\.\d+\.\d+$", version):
-        raise ValueError(f"Invalid semantic version: {version}")
+    for _, _, notes in iter_release_notes([version], filepath, use_index):
+        return notes or ""
+    return ""
 
-    path = Path(filepath)
-    if not path.exists():
-        raise FileNotFoundError(f"CHANGELOG not found: {filepath}")
 
-    content = path.read_text()
+def _version_key(version):
+    return tuple(int(part) for part in version.split("."))
+
+
+def _parse_selector(selector):
+    """
+    Parse a version selector into an inclusive (low, high) version key range.
+
+    Accepts ``X.Y.Z`` or ``X.Y.Z..X.Y.Z``.
+    """
+    low, sep, high = selector.partition(VERSION_RANGE_SEPARATOR)
+    for version in (low, high) if sep else (low,):
+        if not _is_semver(version):
+            raise ValueError(f"Invalid semantic version: {version}")
+    if not sep:
+        return None
+    return _version_key(low), _version_key(high)
+
+
+def iter_release_notes(selectors=None, filepath="CHANGELOG.md", use_index=False):
+    """
+    Extract release notes for several versions from a single read of CHANGELOG.
+
+    Selectors are handled in order. A plain version yields exactly one
+    record, with ``notes`` set to None if the version is missing. A range
+    ``X.Y.Z..X.Y.Z`` (inclusive) yields every version in the CHANGELOG that
+    falls inside it, in document order. Each version is yielded at most once.
+
+    Versions moved out by ``archive_changelog`` are looked up in the shard of
+    their major version; other shards are not read.
+
+    Args:
+        selectors: List of versions or ranges; None selects every version
+        filepath: Path to CHANGELOG.md
+        use_index: Resolve versions through the offset index sidecar and
+            read only their byte ranges from the file
+
+    Yields:
+        (version, date, notes) tuples
+
+    Raises:
+        ValueError: If a selector is not a valid version or range
+        FileNotFoundError: If CHANGELOG file doesn't exist
+    """
+    parsed = [(s, _parse_selector(s)) for s in selectors or []]
+    if use_index and _git_source is not None:
+        raise ValueError("The offset index cannot be used when reading from git")
+
+    if use_index:
+        entries = [
+            (entry["version"], entry["date"], entry["body_start"], entry["end"])
+            for entry in load_index(filepath)["blocks"]
+        ]
+        source = open(filepath, "rb")
+    else:
+        doc = read_changelog(filepath)
+        entries = [
+            (block.version, block.date, block.body_start, block.end)
+            for block in doc.blocks
+        ]
+        source = None
+
+    def notes_for(start, end):
+        if source is not None:
+            return _read_span(source, start, end).decode("utf-8").strip()
+        return doc.text(start, end).strip()
+
+    releases = [
+        (version, date, lambda start=start, end=end: notes_for(start, end))
+        for version, date, start, end in entries
+        if version is not None and _is_semver(version)
+    ]
+    by_version = {}
+    for entry in releases:
+        by_version.setdefault(entry[0], entry)
+
+    shards = {}
+
+    def archived(major):
+        """Releases in the archive shard of ``major``, read on first use."""
+        if major not in shards:
+            shards[major] = _shard_releases(shard_path(filepath, major))
+        return shards[major]
+
+    try:
+        if selectors is None:
+            parsed = [(None, None)]
+        emitted = set()
+        for selector, bounds in parsed:
+            if selector is None:
+                matches = list(releases)
+                for major in archived_majors(filepath):
+                    matches.extend(archived(major))
+            elif bounds is None:
+                entry = by_version.get(selector)
+                if entry is None:
+                    major = _version_key(selector)[0]
+                    entry = next((e for e in archived(major) if e[0] == selector), None)
+                if entry is None:
+                    yield selector, None, None
+                    continue
+                matches = [entry]
+            else:
+                low, high = bounds
+                matches = list(releases)
+                for major in archived_majors(filepath):
+                    if low[0] <= major <= high[0]:
+                        matches.extend(archived(major))
+                matches = [e for e in matches if low <= _version_key(e[0]) <= high]
+            for version, date, read in matches:
+                if version not in emitted:
+                    emitted.add(version)
+                    yield version, date, read()
+    finally:
+        if source is not None:
+            source.close()
+
+
+def shard_path(filepath, major):
+    """Return the archive shard path for releases ``major``.x of a CHANGELOG."""
+    return os.path.join(os.path.dirname(filepath), ARCHIVE_DIR, f"{major}.x.md")
+
+
+def archived_majors(filepath="CHANGELOG.md"):
+    """Return the majors with an archive shard next to a CHANGELOG, newest first."""
+    try:
+        names = _listdir(os.path.join(os.path.dirname(filepath), ARCHIVE_DIR))
+    except FileNotFoundError:
+        return []
+    majors = [name[: -len(".x.md")] for name in names if name.endswith(".x.md")]
+    return sorted((int(major) for major in majors if major.isdecimal()), reverse=True)
+
+
+def _shard_releases(path):
+    """Return (version, date, read_notes) for every release in a shard file."""
+    try:
+        shard = read_changelog(path)
+    except FileNotFoundError:
+        return []
+    return [
+        (
+            block.version,
+            block.date,
+            lambda block=block: shard.text(block.body_start, block.end).strip(),
+        )
+        for block in shard.versions
+        if _is_semver(block.version)
+    ]
+
+
+def archive_changelog(filepath="CHANGELOG.md", keep=None, before_major=None):
+    """
+    Move old releases out of a CHANGELOG into one shard file per major version.
+
+    With ``keep``, every release after the newest ``keep`` is archived; with
+    ``before_major``, every release whose major version is lower. Releases
+    still dated TBD and the newest release (so ``reset`` keeps a place to
+    insert the Unreleased section) are never moved.
+
+    Archived releases are merged into ``changelog/<major>.x.md`` next to the
+    CHANGELOG, newest first, and the CHANGELOG ends with an ``## Archived
+    releases`` section linking every shard. Shards are written before the
+    CHANGELOG, so an interrupted run can leave a release in both files but
+    never in neither; running ``archive`` again cleans it up.
+
+    Returns:
+        Dict mapping each shard path written to the versions moved into it
+
+    Raises:
+        ValueError: If neither or both of ``keep`` and ``before_major`` are
+            given, or ``keep`` is below 1
+        FileNotFoundError: If CHANGELOG file doesn't exist
+    """
+    if (keep is None) == (before_major is None):
+        raise ValueError("Pass exactly one of keep or before_major")
+    if keep is not None and keep < 1:
+        raise ValueError(f"keep must be at least 1, got {keep}")
+
+    doc = read_changelog(filepath)
+    releases = [
+        block
+        for block in doc.versions
+        if _is_semver(block.version) and block.date != "TBD"
+    ]
+    if keep is not None:
+        moving = releases[keep:]
+    else:
+        moving = [
+            block
+            for block in releases[1:]
+            if _version_key(block.version)[0] < before_major
+        ]
+
+    by_major = {}
+    for block in moving:
+        by_major.setdefault(_version_key(block.version)[0], []).append(block)
+
+    archived = {}
+    for major, blocks in by_major.items():
+        path = shard_path(filepath, major)
+        header = (
+            f"# Changelog {major}.x\n\n"
+            f"Releases {major}.x archived from "
+            f"[{os.path.basename(filepath)}](../{os.path.basename(filepath)}).\n\n"
+        )
+        texts = {}
+        if os.path.exists(path):
+            shard = read_changelog(path)
+            header = shard.text(0, shard.header_end)
+            for block in shard.versions:
+                texts[block.version] = shard.text(block.start, block.end)
+        # The CHANGELOG copy wins over one left behind by an interrupted run
+        for block in blocks:
+            texts[block.version] = doc.text(block.start, block.end)
+
+        ordered = sorted(texts, key=_version_key, reverse=True)
+        body = "\n".join(texts[version].rstrip() + "\n" for version in ordered)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with _AtomicOutput(path) as out:
+            out.write((header.rstrip() + "\n\n" + body).encode("utf-8"))
+        archived[path] = [block.version for block in blocks]
+
+    majors = archived_majors(filepath)
+    if not moving and (not majors or doc.archive_start is not None):
+        return archived
+
+    end = len(doc.data) if doc.archive_start is None else doc.archive_start
+    parts = []
+    pos = 0
+    for block in moving:
+        parts.append(doc.data[pos : block.start])
+        pos = block.end
+    parts.append(doc.data[pos:end])
+    pointers = "".join(
+        f"- [{major}.x]({ARCHIVE_DIR}/{major}.x.md)\n" for major in majors
+    )
+    content = b"".join(parts).rstrip() + b"\n\n"
+    content += f"{ARCHIVE_HEADING}\n\n{pointers}".encode("utf-8")
+    with _AtomicOutput(filepath) as out:
+        out.write(content)
+    return archived
+
+
+# Rules checked by ``lint``: id -> description (also the SARIF rule text)
+LINT_RULES = {
+    "duplicate-version": "A version heading appears more than once",
+    "version-order": "Versions are not in descending semantic version order",
+    "release-date-tbd": "An older release still has the TBD date set by prepare",
+    "unknown-section": "A ### subsection is not one of the standard sections",
+    "empty-release": "A version block has no content",
+}
+
+
+def _is_empty_body(data, start, end):
+    """Return True if ``data[start:end]`` holds nothing but headings and blanks."""
+    for line in data[start:end].splitlines():
+        if line.strip() and not line.startswith(b"#"):
+            return False
+    return True
+
+
+def lint_changelog(filepath="CHANGELOG.md"):
+    """
+    Check the whole history of a CHANGELOG, including its archive shards.
 
-    pattern = rf"^## \[{re.escape(version)}\][^\n]*\n(.*?)(?=^## \[|\Z)"
-    match = re.search(pattern, content, re.MULTILINE | re.DOTALL)
+    The CHANGELOG and then each shard (newest major first) are parsed once
+    with parse_changelog, and the findings come from one walk over the
+    resulting blocks, so the cost is linear in the size of the history:
 
-    if not match:
-        return ""
+    - ``duplicate-version``: a version heading seen earlier in the history
+    - ``version-order``: a version not lower than the release before it
+    - ``release-date-tbd``: a ``TBD`` date on any release but the newest,
+      which is TBD between ``prepare`` and ``finalize``
+    - ``unknown-section``: a ``###`` subsection outside STANDARD_SECTIONS
+    - ``empty-release``: a version block without bullets or text
+
+    Returns:
+        List of findings in document order, each a dict with ``rule``,
+        ``file``, ``line`` and ``message``
+
+    Raises:
+        FileNotFoundError: If CHANGELOG file doesn't exist
+    """
+    documents = [(filepath, read_changelog(filepath))]
+    for major in archived_majors(filepath):
+        path = shard_path(filepath, major)
+        documents.append((path, read_changelog(path)))
+
+    findings = []
+
+    def report(rule, path, line, message):
+        findings.append({"rule": rule, "file": path, "line": line, "message": message})
+
+    seen = {}
+    previous = None
+    newest = True
+    for path, doc in documents:
+        for block in doc.blocks:
+            for subsection in block.subsections:
+                if subsection.name not in STANDARD_SECTIONS:
+                    report(
+                        "unknown-section",
+                        path,
+                        subsection.line,
+                        f"Unknown section '{subsection.name}' "
+                        f"(expected one of {', '.join(STANDARD_SECTIONS)})",
+                    )
+            version = block.version
+            if version is None:
+                continue
+
+            if version in seen:
+                first_path, first_line = seen[version]
+                where = "" if first_path == path else f" of {first_path}"
+                report(
+                    "duplicate-version",
+                    path,
+                    block.line,
+                    f"Version {version} already appears at line {first_line}{where}",
+                )
+            else:
+                seen[version] = (path, block.line)
+                if _is_semver(version):
+                    if previous is not None and _version_key(version) >= previous[1]:
+                        report(
+                            "version-order",
+                            path,
+                            block.line,
+                            f"Version {version} follows {previous[0]}; "
+                            "releases must be listed newest first",
+                        )
+                    previous = (version, _version_key(version))
+
+            if block.date == "TBD" and not newest:
+                report(
+                    "release-date-tbd",
+                    path,
+                    block.line,
+                    f"Release {version} still has a TBD date (set it with finalize)",
+                )
+            newest = False
+
+            if not block.bullets and _is_empty_body(
+                doc.data, block.body_start, block.end
+            ):
+                report("empty-release", path, block.line, f"Release {version} is empty")
+    return findings
+
+
+def _sarif_report(findings):
+    """Build a SARIF 2.1.0 log for lint findings."""
+    return {
+        "$schema": "https://json.schemastore.org/sarif-2.1.0.json",
+        "version": "2.1.0",
+        "runs": [
+            {
+                "tool": {
+                    "driver": {
+                        "name": "prepare_changelog",
+                        "rules": [
+                            {"id": rule, "shortDescription": {"text": text}}
+                            for rule, text in LINT_RULES.items()
+                        ],
+                    }
+                },
+                "results": [
+                    {
+                        "ruleId": finding["rule"],
+                        "level": "error",
+                        "message": {"text": finding["message"]},
+                        "locations": [
+                            {
+                                "physicalLocation": {
+                                    "artifactLocation": {
+                                        "uri": finding["file"].replace(os.sep, "/")
+                                    },
+                                    "region": {"startLine": finding["line"]},
+                                }
+                            }
+                        ],
+                        **(
+                            {"properties": {"ref": finding["ref"]}}
+                            if "ref" in finding
+                            else {}
+                        ),
+                    }
+                    for finding in findings
+                ],
+            }
+        ],
+    }
+
+
+def cmd_archive(args):
+    """Handle archive command."""
+    archived = archive_changelog(args.file, args.keep, args.before_major)
+
+    if not archived:
+        print("✓ Nothing to archive")
+    for path, versions in archived.items():
+        print(f"✓ Archived {len(versions)} version(s) to {path}")
+        for version in versions:
+            print(f"  - {version}")
+
+
+def cmd_lint(args):
+    """Handle lint command."""
+    findings = []
+    for ref in _iter_refs(args.refs):
+        for finding in lint_changelog(args.file):
+            findings.append(finding if ref is None else {"ref": ref, **finding})
+
+    if args.format == "text":
+        for finding in findings:
+            prefix = f"{finding['ref']}:" if "ref" in finding else ""
+            print(
+                f"{prefix}{finding['file']}:{finding['line']}: "
+                f"{finding['rule']}: {finding['message']}"
+            )
+        if findings:
+            print(f"✗ {len(findings)} lint finding(s)", file=sys.stderr)
+        else:
+            print(f"✓ No lint findings in {args.file}")
+    else:
+        import json
 
-    notes = match.group(1).strip()
-    return notes if notes else ""
+        report = findings if args.format == "json" else _sarif_report(findings)
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+    if findings:
+        sys.exit(1)
 
 
 def cmd_finalize(args):
     """Handle finalize command."""
+    if _workspace_requested(args):
+        options = {"version": args.version, "date": args.date}
+        return cmd_workspace(args, "finalize", options)
+
     finalize_release_date(args.version, args.date, args.file)
 
     print(f"✓ Set release date for version {args.version}")
     print(f"✓ Date: {args.date}")
 
 
+def _split_extract_targets(targets, select_all):
+    """
+    Split extract-notes positionals into (selectors, file).
+
+    The CHANGELOG path stays an optional trailing positional: the last
+    argument is taken as the file when it is not a version or range.
+    """
+    targets = list(targets)
+    filepath = "CHANGELOG.md"
+    if targets and (len(targets) > 1 or select_all):
+        last = targets[-1]
+        if not _is_selector(last):
+            filepath = targets.pop()
+    if select_all and targets:
+        raise ValueError("--all cannot be combined with explicit versions")
+    if not select_all and not targets:
+        raise ValueError("extract-notes requires a version, a range or --all")
+    return (None if select_all else targets), filepath
+
+
 def cmd_extract_notes(args):
     """Handle extract-notes command."""
-    notes = extract_release_notes(args.version, args.file)
-    if notes:
-        print(notes)
-    else:
-        print(f"No changelog notes found for {args.version}", file=sys.stderr)
+    selectors, filepath = _split_extract_targets(args.targets, args.all)
+    if _workspace_requested(args):
+        if args.format == "text":
+            raise ValueError("--format text is not supported with --glob/--manifest")
+        options = {"selectors": selectors, "index": args.index}
+        return cmd_workspace(args, "extract-notes", options)
+
+    output_format = args.format
+    refs = args.refs
+    single = selectors is not None and len(selectors) == 1
+    single = single and VERSION_RANGE_SEPARATOR not in selectors[0]
+    if output_format is None:
+        output_format = "text" if single and len(refs or []) < 2 else "jsonl"
+    if output_format == "text" and not single:
+        raise ValueError("--format text only supports a single version")
+    if output_format == "text" and len(refs or []) > 1:
+        raise ValueError("--format text only supports a single --ref")
+    if refs and args.index:
+        raise ValueError("--index cannot be combined with --ref")
+
+    missing = []
+    for ref in _iter_refs(refs):
+        prefix = f"{ref}\0" if ref is not None else ""
+        notes_iter = iter_release_notes(selectors, filepath, args.index)
+        for version, date, notes in notes_iter:
+            if output_format == "text":
+                if notes:
+                    print(notes)
+                else:
+                    missing.append((version, ref))
+            elif notes is None:
+                missing.append((version, ref))
+            elif output_format == "jsonl":
+                import json
+
+                record = {"version": version, "date": date, "notes": notes}
+                if ref is not None:
+                    record = {"ref": ref, **record}
+                sys.stdout.write(json.dumps(record, ensure_ascii=False) + "\n")
+            else:
+                sys.stdout.write(f"{prefix}{version}\0{notes}\0")
+
+    for version, ref in missing:
+        where = f" at {ref}" if ref is not None else ""
+        print(f"No changelog notes found for {version}{where}", file=sys.stderr)
+    if missing:
         sys.exit(1)
 
 
-def main():
-    """CLI entry point."""
+def resolve_workspace(pattern=None, manifest=None):
+    """
+    Return the CHANGELOG paths selected by a glob pattern and/or a manifest.
+
+    A manifest lists one path per line; blank lines and lines starting with
+    ``#`` are ignored and relative paths are resolved against the manifest's
+    directory. Duplicates are dropped, keeping the first occurrence.
+
+    Raises:
+        ValueError: If nothing is selected
+        FileNotFoundError: If the manifest doesn't exist
+    """
+    import glob
+    from pathlib import Path
+
+    paths = []
+    if pattern:
+        paths.extend(sorted(glob.glob(pattern, recursive=True)))
+    if manifest:
+        base = Path(manifest).parent
+        for line in Path(manifest).read_text(encoding="utf-8").splitlines():
+            line = line.strip()
+            if line and not line.startswith("#"):
+                paths.append(str(base / line))
+
+    selected = list(dict.fromkeys(paths))
+    if not selected:
+        raise ValueError("No CHANGELOG files matched the workspace selection")
+    return selected
+
+
+def _workspace_task(command, filepath, options):
+    """
+    Run one command on one CHANGELOG, capturing failures instead of raising.
+
+    Returns a dict with ``file``, ``ok`` and either ``result`` or ``error``.
+    Module level so ProcessPoolExecutor can pickle it.
+    """
+    try:
+        if command == "validate":
+            has_section, has_content = validate_changelog(filepath)
+            if not has_section:
+                raise ValueError("No Unreleased section found in CHANGELOG")
+            if not has_content:
+                raise ValueError("Unreleased section is empty (no changes to release)")
+            result = {}
+        elif command == "prepare":
+            result = {"sections": list(prepare_changelog(options["version"], filepath))}
+        elif command == "finalize":
+            finalize_release_date(options["version"], options["date"], filepath)
+            result = {}
+        elif command == "extract-notes":
+            records = [
+                {"version": version, "date": date, "notes": notes}
+                for version, date, notes in iter_release_notes(
+                    options["selectors"], filepath, options["index"]
+                )
+            ]
+            result = {"records": [r for r in records if r["notes"] is not None]}
+            missing = [r["version"] for r in records if r["notes"] is None]
+            if missing:
+                return {
+                    "file": filepath,
+                    "ok": False,
+                    "error": f"No changelog notes found for {', '.join(missing)}",
+                    "result": result,
+                }
+        else:
+            raise ValueError(f"Unsupported workspace command: {command}")
+    except Exception as e:
+        return {"file": filepath, "ok": False, "error": str(e)}
+    return {"file": filepath, "ok": True, "result": result}
+
+
+def run_workspace(command, paths, options=None, jobs=None):
+    """
+    Run a command over many CHANGELOGs in parallel.
+
+    Files are spread over a ProcessPoolExecutor (``jobs`` workers, default
+    one per CPU); a single file or ``jobs=1`` runs in-process. Outcomes are
+    yielded in the order of ``paths`` as they become available, and a
+    failing file never stops the others.
+
+    Yields:
+        Outcome dicts as returned for each file (``file``, ``ok``,
+        ``result`` or ``error``)
+    """
+    options = options or {}
+    if jobs == 1 or len(paths) == 1:
+        for filepath in paths:
+            yield _workspace_task(command, filepath, options)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = jobs or os.cpu_count() or 1
+    chunksize = max(1, len(paths) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(
+            _workspace_task,
+            [command] * len(paths),
+            paths,
+            [options] * len(paths),
+            chunksize=chunksize,
+        )
+
+
+def _workspace_requested(args):
+    return bool(args.glob or args.manifest)
+
+
+def cmd_workspace(args, command, options):
+    """Run a command over a workspace and print one aggregated report."""
+    import json
+
+    if getattr(args, "refs", None):
+        raise ValueError("--ref is not supported with --glob/--manifest")
+    paths = resolve_workspace(args.glob, args.manifest)
+    # extract-notes keeps stdout for the records themselves
+    report = sys.stderr if command == "extract-notes" else sys.stdout
+    output_format = getattr(args, "format", None) or "jsonl"
+
+    failed = []
+    for outcome in run_workspace(command, paths, options, args.jobs):
+        filepath = outcome["file"]
+        for record in outcome.get("result", {}).get("records", []):
+            if output_format == "jsonl":
+                record = {"file": filepath, **record}
+                sys.stdout.write(json.dumps(record, ensure_ascii=False) + "\n")
+            else:
+                sys.stdout.write(
+                    f"{filepath}\0{record['version']}\0{record['notes']}\0"
+                )
+        if outcome["ok"]:
+            print(f"✓ {filepath}", file=report)
+        else:
+            failed.append(outcome)
+            print(f"✗ {filepath}: {outcome['error']}", file=report)
+
+    print(
+        f"{len(paths) - len(failed)} of {len(paths)} CHANGELOG(s) passed {command}",
+        file=report,
+    )
+    if failed:
+        sys.exit(1)
+
+
+class ChangelogCache:
+    """
+    Parsed CHANGELOG documents kept in memory between requests.
+
+    Entries are keyed by resolved path and validated against the file's
+    mtime, size and inode on every lookup, so rewrites made by prepare,
+    reset and finalize (which replace the file) or by anything else are
+    picked up on the next request.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path):
+        """Return the parsed document for ``path``, re-parsing if it changed."""
+        from pathlib import Path
+
+        path = Path(path).resolve()
+        stat = path.stat()
+        key = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        entry = self._entries.get(path)
+        if entry is not None and entry[0] == key:
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        doc = parse_changelog(path.read_bytes())
+        self._entries[path] = (key, doc)
+        return doc
+
+
+# JSON-RPC 2.0 error codes
+RPC_PARSE_ERROR = -32700
+RPC_INVALID_REQUEST = -32600
+RPC_METHOD_NOT_FOUND = -32601
+RPC_INVALID_PARAMS = -32602
+RPC_APPLICATION_ERROR = -32000
+
+
+def _rpc_prepare(version, file="CHANGELOG.md"):
+    return {"sections": list(prepare_changelog(version, file))}
+
+
+def _rpc_validate(file="CHANGELOG.md"):
+    has_section, has_content = validate_changelog(file)
+    return {"has_section": has_section, "has_content": has_content}
+
+
+def _rpc_add(section, text, file="CHANGELOG.md", fragment_id=None):
+    return {"path": add_fragment(section, text, file, fragment_id)}
+
+
+def _rpc_reset(file="CHANGELOG.md"):
+    reset_unreleased(file)
+    return {}
+
+
+def _rpc_finalize(version, date, file="CHANGELOG.md"):
+    finalize_release_date(version, date, file)
+    return {}
+
+
+def _rpc_archive(file="CHANGELOG.md", keep=None, before_major=None):
+    archived = archive_changelog(file, keep, before_major)
+    return {"archived": archived}
+
+
+def _rpc_lint(file="CHANGELOG.md"):
+    return {"findings": lint_changelog(file)}
+
+
+def _rpc_extract_notes(versions=None, file="CHANGELOG.md", index=False):
+    records = [
+        {"version": version, "date": date, "notes": notes}
+        for version, date, notes in iter_release_notes(versions, file, index)
+    ]
+    return {"records": records}
+
+
+RPC_METHODS = {
+    "prepare": _rpc_prepare,
+    "validate": _rpc_validate,
+    "reset": _rpc_reset,
+    "finalize": _rpc_finalize,
+    "extract-notes": _rpc_extract_notes,
+    "archive": _rpc_archive,
+    "add": _rpc_add,
+    "lint": _rpc_lint,
+}
+
+
+class ChangelogServer:
+    """
+    Long-lived JSON-RPC 2.0 front end for the CHANGELOG commands.
+
+    Requests and responses are newline-delimited JSON objects. Methods are
+    the CLI command names (``prepare``, ``validate``, ``reset``,
+    ``finalize``, ``extract-notes``, ``archive``, ``add``, ``lint``) with the
+    command arguments passed as named params, plus ``shutdown`` to stop the
+    server. Requests without an ``id`` are notifications and never get a
+    response, not even an error.
+    """
+
+    def __init__(self):
+        self.cache = ChangelogCache()
+        self.running = True
+
+    def handle(self, request):
+        """Handle one decoded request; returns None for notifications."""
+        if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+            return _rpc_error(None, RPC_INVALID_REQUEST, "Invalid Request")
+
+        response = self._dispatch(request)
+        if "id" not in request:
+            return None
+        return response
+
+    def _dispatch(self, request):
+        """Run a well-formed request; returns its response object."""
+        global _document_cache
+
+        request_id = request.get("id")
+        method = request["method"]
+        params = request.get("params") or {}
+
+        if method == "shutdown":
+            self.running = False
+            result = {}
+        elif method not in RPC_METHODS:
+            return _rpc_error(request_id, RPC_METHOD_NOT_FOUND, "Method not found")
+        elif not isinstance(params, dict):
+            return _rpc_error(
+                request_id, RPC_INVALID_PARAMS, "Params must be an object"
+            )
+        else:
+            import inspect
+
+            handler = RPC_METHODS[method]
+            try:
+                inspect.signature(handler).bind(**params)
+            except TypeError as e:
+                return _rpc_error(request_id, RPC_INVALID_PARAMS, str(e))
+
+            _document_cache = self.cache
+            try:
+                result = handler(**params)
+            except Exception as e:
+                return _rpc_error(request_id, RPC_APPLICATION_ERROR, str(e))
+            finally:
+                _document_cache = None
+
+        return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+    def handle_line(self, line):
+        """Handle one newline-delimited request; returns the response line or None."""
+        import json
+
+        try:
+            request = json.loads(line)
+        except ValueError:
+            response = _rpc_error(None, RPC_PARSE_ERROR, "Parse error")
+        else:
+            response = self.handle(request)
+        if response is None:
+            return None
+        return json.dumps(response, ensure_ascii=False) + "\n"
+
+    def serve_stream(self, rfile, wfile):
+        """Answer requests from binary ``rfile`` until EOF or shutdown."""
+        for line in rfile:
+            if not line.strip():
+                continue
+            response = self.handle_line(line)
+            if response is not None:
+                wfile.write(response.encode("utf-8"))
+                wfile.flush()
+            if not self.running:
+                break
+
+    def serve_socket(self, socket_path):
+        """
+        Answer requests on a Unix socket, one connection at a time.
+
+        Raises:
+            ValueError: If ``socket_path`` exists and is not a socket
+        """
+        import socketserver
+
+        server = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                server.serve_stream(self.rfile, self.wfile)
+
+        try:
+            mode = os.lstat(socket_path).st_mode
+        except FileNotFoundError:
+            pass
+        else:
+            import stat
+
+            if not stat.S_ISSOCK(mode):
+                raise ValueError(f"{socket_path} exists and is not a socket")
+            # Left behind by a server that did not shut down cleanly
+            os.unlink(socket_path)
+        with socketserver.UnixStreamServer(socket_path, Handler) as unix_server:
+            try:
+                while self.running:
+                    unix_server.handle_request()
+            finally:
+                os.unlink(socket_path)
+
+
+def _rpc_error(request_id, code, message):
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "error": {"code": code, "message": message},
+    }
+
+
+def rpc_call(socket_path, method, params=None):
+    """
+    Call a method on a server started with ``serve --socket``.
+
+    Returns the ``result`` member of the response.
+
+    Raises:
+        RuntimeError: If the server answers with an error
+    """
+    import json
+    import socket
+
+    request = {"jsonrpc": "2.0", "id": 1, "method": method, "params": params or {}}
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        with sock.makefile("rwb") as stream:
+            stream.write(json.dumps(request).encode("utf-8") + b"\n")
+            stream.flush()
+            response = json.loads(stream.readline())
+    if "error" in response:
+        raise RuntimeError(response["error"]["message"])
+    return response["result"]
+
+
+def cmd_serve(args):
+    """Handle serve command."""
+    server = ChangelogServer()
+    if args.socket:
+        server.serve_socket(args.socket)
+    else:
+        server.serve_stream(sys.stdin.buffer, sys.stdout.buffer)
+
+
+def cmd_call(args):
+    """Handle call command."""
+    import json
+
+    params = json.loads(args.params) if args.params else {}
+    result = rpc_call(args.socket, args.method, params)
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+
+
+class _FastArgs:
+    """Stand-in for argparse.Namespace built by ``_fast_args``."""
+
+    def __init__(self, **values):
+        self.__dict__.update(values)
+
+
+# Commands dispatched by _fast_args: (handler, positionals, option defaults)
+_FAST_COMMANDS = {
+    "prepare": (cmd_prepare, ("version",), {}),
+    "validate": (cmd_validate, (), {"stats": False, "refs": None}),
+    "finalize": (cmd_finalize, ("version", "date"), {}),
+    "reset": (cmd_reset, (), {}),
+    "lint": (cmd_lint, (), {"format": "text", "refs": None}),
+}
+
+
+def _fast_args(argv):
+    """
+    Parse common invocations without building the argparse parser.
+
+    Handles ``prepare VERSION [FILE]``, ``validate [FILE]``, ``finalize
+    VERSION DATE [FILE]``, ``reset [FILE]``, ``lint [FILE]`` and
+    ``extract-notes VERSION... [FILE]`` when no option is given. Returns None for anything else so
+    argparse produces its usual help and error messages.
+    """
+    if not argv or any(arg.startswith("-") for arg in argv):
+        return None
+    command, rest = argv[0], argv[1:]
+    workspace = {"glob": None, "manifest": None, "jobs": None}
+
+    if command == "extract-notes":
+        if not rest:
+            return None
+        return _FastArgs(
+            func=cmd_extract_notes,
+            targets=rest,
+            all=False,
+            format=None,
+            index=False,
+            refs=None,
+            **workspace,
+        )
+
+    if command not in _FAST_COMMANDS:
+        return None
+    func, positionals, defaults = _FAST_COMMANDS[command]
+    if not len(positionals) <= len(rest) <= len(positionals) + 1:
+        return None
+    values = dict(zip(positionals, rest))
+    values["file"] = (
+        rest[len(positionals)] if len(rest) > len(positionals) else "CHANGELOG.md"
+    )
+    return _FastArgs(func=func, **workspace, **defaults, **values)
+
+
+def _build_parser():
+    """Build the full argparse parser for every command and option."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="CHANGELOG.md management tool for release workflow",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -369,14 +2287,78 @@ Examples:
   # Validate CHANGELOG has unreleased changes
   %(prog)s validate
 
+  # Add an Unreleased entry as changelog.d/123.fixed.md
+  %(prog)s add fixed "Handle empty PR bodies" --id 123
+
+  # Validate and print bullet counts, bytes scanned and time taken
+  %(prog)s validate --stats
+
+  # Validate the CHANGELOG committed on origin/dev without checking it out
+  %(prog)s validate --ref origin/dev
+
   # Set release date for version 1.0.0
   %(prog)s finalize 1.0.0 2026-02-11
 
   # Reset Unreleased section after release merge
   %(prog)s reset
+
+  # Extract release notes for a range of versions as JSON Lines
+  %(prog)s extract-notes 1.0.0..2.0.0 CHANGELOG.md
+
+  # Compare the notes of 1.2.0 on main and dev in one git session
+  %(prog)s extract-notes 1.2.0 --ref main --ref dev --format jsonl
+
+  # Check the whole history, including archive shards, and emit SARIF
+  %(prog)s lint --format sarif > changelog.sarif
+
+  # Keep the 20 newest releases, moving older ones to changelog/<major>.x.md
+  %(prog)s archive --keep 20
+
+  # Validate every package CHANGELOG in a monorepo in parallel
+  %(prog)s validate --glob 'packages/*/CHANGELOG.md'
+
+  # Allow CHANGELOGs up to 1 GiB and parses up to 5 minutes
+  CHANGELOG_MAX_BYTES=1073741824 CHANGELOG_PARSE_TIMEOUT=300 %(prog)s validate
+
+  # Serve JSON-RPC requests on a Unix socket and call it
+  %(prog)s serve --socket /tmp/changelog.sock &
+  %(prog)s call validate '{"file": "CHANGELOG.md"}' --socket /tmp/changelog.sock
         """,
     )
 
+    # Option shared by commands that only read CHANGELOGs
+    ref_parser = argparse.ArgumentParser(add_help=False)
+    ref_parser.add_argument(
+        "--ref",
+        action="append",
+        dest="refs",
+        metavar="REF",
+        help=(
+            "Read the CHANGELOG from this git ref instead of the working tree; "
+            "repeat to read several refs through one git process"
+        ),
+    )
+
+    # Options shared by commands that can run over many CHANGELOGs
+    workspace_parser = argparse.ArgumentParser(add_help=False)
+    workspace_group = workspace_parser.add_argument_group(
+        "workspace",
+        "Run over many CHANGELOG files in parallel instead of a single file",
+    )
+    workspace_group.add_argument(
+        "--glob",
+        help="Glob pattern selecting CHANGELOG files (e.g., 'packages/*/CHANGELOG.md')",
+    )
+    workspace_group.add_argument(
+        "--manifest",
+        help="File listing CHANGELOG paths, one per line",
+    )
+    workspace_group.add_argument(
+        "--jobs",
+        type=int,
+        help="Number of worker processes (default: number of CPUs)",
+    )
+
     subparsers = parser.add_subparsers(
         title="commands",
         description="Available commands",
@@ -387,6 +2369,7 @@ Examples:
     # prepare command
     prepare_parser = subparsers.add_parser(
         "prepare",
+        parents=[workspace_parser],
         help="Prepare CHANGELOG for release (move Unreleased to version section)",
     )
     prepare_parser.add_argument(
@@ -404,6 +2387,7 @@ Examples:
     # validate command
     validate_parser = subparsers.add_parser(
         "validate",
+        parents=[workspace_parser, ref_parser],
         help="Validate CHANGELOG has Unreleased section with content",
     )
     validate_parser.add_argument(
@@ -412,8 +2396,38 @@ Examples:
         default="CHANGELOG.md",
         help="Path to CHANGELOG file (default: CHANGELOG.md)",
     )
+    validate_parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="Print Unreleased bullet counts per section, bytes scanned and time taken",
+    )
     validate_parser.set_defaults(func=cmd_validate)
 
+    # add command
+    add_parser = subparsers.add_parser(
+        "add",
+        help=f"Add an Unreleased entry as a fragment file in {FRAGMENT_DIR}/",
+    )
+    add_parser.add_argument(
+        "section",
+        help=f"Section of the entry ({', '.join(STANDARD_SECTIONS)})",
+    )
+    add_parser.add_argument(
+        "text",
+        help="Entry text; a leading '- ' is added if missing",
+    )
+    add_parser.add_argument(
+        "file",
+        nargs="?",
+        default="CHANGELOG.md",
+        help="Path to CHANGELOG file (default: CHANGELOG.md)",
+    )
+    add_parser.add_argument(
+        "--id",
+        help="Fragment name, e.g. the PR number (default: random)",
+    )
+    add_parser.set_defaults(func=cmd_add)
+
     # reset command
     reset_parser = subparsers.add_parser(
         "reset",
@@ -430,6 +2444,7 @@ Examples:
     # finalize command
     finalize_parser = subparsers.add_parser(
         "finalize",
+        parents=[workspace_parser],
         help="Set release date (replace TBD with actual date)",
     )
     finalize_parser.add_argument(
@@ -451,22 +2466,130 @@ Examples:
     # extract-notes command
     extract_parser = subparsers.add_parser(
         "extract-notes",
-        help="Extract release notes for a specific version",
+        parents=[workspace_parser, ref_parser],
+        help="Extract release notes for one or more versions",
     )
     extract_parser.add_argument(
-        "version",
-        help="Semantic version (e.g., 1.0.0)",
+        "targets",
+        nargs="*",
+        metavar="VERSION",
+        help=(
+            "Semantic versions (e.g., 1.0.0) or inclusive ranges "
+            "(e.g., 1.0.0..2.0.0), optionally followed by the path to the "
+            "CHANGELOG file (default: CHANGELOG.md)"
+        ),
+    )
+    extract_parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Extract notes for every version in the CHANGELOG",
+    )
+    extract_parser.add_argument(
+        "--format",
+        choices=["text", "jsonl", "nul"],
+        help=(
+            "Output format: plain text (default for a single version), "
+            "JSON Lines (default otherwise) or NUL-delimited version/notes pairs"
+        ),
     )
     extract_parser.add_argument(
+        "--index",
+        action="store_true",
+        help=(
+            f"Use an offset index sidecar (<file>{INDEX_SUFFIX}) for the lookup, "
+            "creating or refreshing it as needed"
+        ),
+    )
+    extract_parser.set_defaults(func=cmd_extract_notes)
+
+    # lint command
+    lint_parser = subparsers.add_parser(
+        "lint",
+        parents=[ref_parser],
+        help="Check the whole release history in one pass",
+        description="Rules: "
+        + "; ".join(f"{rule}: {text}" for rule, text in LINT_RULES.items()),
+    )
+    lint_parser.add_argument(
         "file",
         nargs="?",
         default="CHANGELOG.md",
         help="Path to CHANGELOG file (default: CHANGELOG.md)",
     )
-    extract_parser.set_defaults(func=cmd_extract_notes)
+    lint_parser.add_argument(
+        "--format",
+        choices=["text", "json", "sarif"],
+        default="text",
+        help="Output format: file:line lines (default), a JSON list or SARIF 2.1.0",
+    )
+    lint_parser.set_defaults(func=cmd_lint)
+
+    # archive command
+    archive_parser = subparsers.add_parser(
+        "archive",
+        help=f"Move old releases into per-major shard files under {ARCHIVE_DIR}/",
+    )
+    archive_selection = archive_parser.add_mutually_exclusive_group(required=True)
+    archive_selection.add_argument(
+        "--keep",
+        type=int,
+        help="Number of newest releases to keep in the CHANGELOG",
+    )
+    archive_selection.add_argument(
+        "--before-major",
+        type=int,
+        help="Archive releases whose major version is lower than this",
+    )
+    archive_parser.add_argument(
+        "file",
+        nargs="?",
+        default="CHANGELOG.md",
+        help="Path to CHANGELOG file (default: CHANGELOG.md)",
+    )
+    archive_parser.set_defaults(func=cmd_archive)
+
+    # serve command
+    serve_parser = subparsers.add_parser(
+        "serve",
+        help="Answer JSON-RPC requests on stdin/stdout or a Unix socket",
+    )
+    serve_parser.add_argument(
+        "--socket",
+        help="Listen on this Unix socket path instead of stdin/stdout",
+    )
+    serve_parser.set_defaults(func=cmd_serve)
 
-    # Parse and execute
-    args = parser.parse_args()
+    # call command
+    call_parser = subparsers.add_parser(
+        "call",
+        help="Send one JSON-RPC request to a running 'serve --socket'",
+    )
+    call_parser.add_argument(
+        "method",
+        choices=sorted([*RPC_METHODS, "shutdown"]),
+        help="Command to run on the server",
+    )
+    call_parser.add_argument(
+        "params",
+        nargs="?",
+        help='Named parameters as a JSON object (e.g., \'{"version": "1.0.0"}\')',
+    )
+    call_parser.add_argument(
+        "--socket",
+        required=True,
+        help="Unix socket path of the server",
+    )
+    call_parser.set_defaults(func=cmd_call)
+
+    return parser
+
+
+def main():
+    """CLI entry point."""
+    # Common invocations skip argparse, which is slow to import and build
+    args = _fast_args(sys.argv[1:])
+    if args is None:
+        args = _build_parser().parse_args()
 
     try:
         args.func(args)
@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for prepare_changelog.py on synthetic CHANGELOGs.
+
+Generates Keep a Changelog files of configurable size plus pathological
+inputs, times every public command function on them and records wall time,
+throughput and peak memory. Results can be saved as a JSON baseline and
+compared against a previous baseline to flag regressions.
+
+Usage:
+    # Run and save a baseline
+    python3 .github/tests/bench_prepare_changelog.py --output baseline.json
+
+    # Compare against it (exit code 1 on regression)
+    python3 .github/tests/bench_prepare_changelog.py --compare baseline.json
+"""
+
+import argparse
+import json
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from prepare_changelog import (  # noqa: E402
+    STANDARD_SECTIONS,
+    extract_release_notes,
+    extract_unreleased_content,
+    finalize_release_date,
+    prepare_changelog,
+    reset_unreleased,
+    validate_changelog,
+)
+
+HEADER = """\
+# Changelog
+
+All notable changes to this project will be documented in this file.
+
+The format is based on [Keep a Changelog](https://keepachangelog.com/en/1.0.0/),
+and this project adheres to [Semantic Versioning](https://semver.org/spec/v2.0.0.html).
+
+"""
+
+# Version used for the release created by prepare in every scenario
+BENCH_VERSION = "999.0.0"
+BENCH_DATE = "2026-01-01"
+
+
+def _bullet(rng, line_length):
+    words = []
+    length = 2
+    while length < line_length:
+        word = "".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(6))
+        words.append(word)
+        length += len(word) + 1
+    return "- " + " ".join(words)[: max(1, line_length - 2)]
+
+
+def generate_changelog(
+    versions=100,
+    sections=3,
+    bullets=5,
+    line_length=80,
+    unreleased_bullets=10,
+    seed=0,
+):
+    """
+    Generate a synthetic Keep a Changelog document.
+
+    Args:
+        versions: Number of released version blocks
+        sections: Subsections per block (taken from STANDARD_SECTIONS)
+        bullets: Bullets per subsection in released blocks
+        line_length: Approximate length of each bullet line
+        unreleased_bullets: Bullets per subsection in the Unreleased block
+        seed: Seed for the random word generator
+
+    Returns:
+        (content, oldest_version)
+    """
+    rng = random.Random(seed)
+    names = STANDARD_SECTIONS[: max(1, min(sections, len(STANDARD_SECTIONS)))]
+    parts = [HEADER, "## Unreleased\n\n"]
+    for name in names:
+        parts.append(f"### {name}\n\n")
+        parts.extend(
+            _bullet(rng, line_length) + "\n" for _ in range(unreleased_bullets)
+        )
+        parts.append("\n")
+
+    version = None
+    for i in range(versions, 0, -1):
+        version = f"{i // 100}.{i % 100}.0"
+        parts.append(f"## [{version}] - 2025-01-01\n\n")
+        for name in names:
+            parts.append(f"### {name}\n\n")
+            parts.extend(_bullet(rng, line_length) + "\n" for _ in range(bullets))
+            parts.append("\n")
+
+    return "".join(parts), version
+
+
+def pathological_inputs(scale=1):
+    """
+    Inputs that stress the parser rather than look like real CHANGELOGs.
+
+    Returns dict: {name: (content, oldest_version)}
+    """
+    tail = "## [0.1.0] - 2025-01-01\n\n### Added\n\n- Initial release\n"
+    long_line = "x" * 4000
+    return {
+        # Huge Unreleased block made of long lines without any heading
+        "long-lines-no-headings": (
+            HEADER
+            + "## Unreleased\n\n- start\n"
+            + (long_line + "\n") * (1000 * scale)
+            + "\n"
+            + tail,
+            "0.1.0",
+        ),
+        # Thousands of ### headings in the Unreleased block
+        "many-subsections": (
+            HEADER
+            + "## Unreleased\n\n"
+            + "### Misc\n\n- entry\n\n" * (20000 * scale)
+            + "### Added\n\n- last\n\n"
+            + tail,
+            "0.1.0",
+        ),
+        # Many '#' and '-' characters that look like, but are not, headings
+        "near-miss-headings": (
+            HEADER
+            + "## Unreleased\n\n### Added\n\n- x\n"
+            + "##Unreleased ###Added -\n" * (50000 * scale)
+            + "\n"
+            + tail,
+            "0.1.0",
+        ),
+    }
+
+
+def build_scenarios(scale=1):
+    """Return dict: {name: (content, oldest_version)}."""
+    scenarios = {
+        "small": generate_changelog(versions=10),
+        "large": generate_changelog(versions=2000 * scale),
+        "long-bullets": generate_changelog(
+            versions=200 * scale, bullets=2, line_length=2000
+        ),
+    }
+    scenarios.update(pathological_inputs(scale))
+    return scenarios
+
+
+def _cases(content, oldest_version):
+    """
+    Benchmark cases for one scenario.
+
+    Each case is (name, source_content, function) where ``function`` takes
+    the path of a fresh copy of ``source_content``.
+    """
+    workdir = Path(tempfile.mkdtemp(prefix="bench_changelog_"))
+    prepared_path = workdir / "prepared.md"
+    prepared_path.write_text(content, encoding="utf-8")
+    prepare_changelog(BENCH_VERSION, prepared_path)
+    prepared = prepared_path.read_text(encoding="utf-8")
+    shutil.rmtree(workdir)
+
+    return [
+        (
+            "extract_unreleased_content",
+            content,
+            lambda path: extract_unreleased_content(
+                Path(path).read_text(encoding="utf-8")
+            ),
+        ),
+        ("validate_changelog", content, validate_changelog),
+        ("prepare_changelog", content, lambda p: prepare_changelog(BENCH_VERSION, p)),
+        (
+            "finalize_release_date",
+            prepared,
+            lambda p: finalize_release_date(BENCH_VERSION, BENCH_DATE, p),
+        ),
+        (
+            "extract_release_notes",
+            prepared,
+            lambda p: extract_release_notes(oldest_version, p),
+        ),
+        ("reset_unreleased", prepared, reset_unreleased),
+    ]
+
+
+def _measure(function, content, repeat):
+    """Return (best_seconds, peak_bytes) for running ``function`` on a copy."""
+    workdir = Path(tempfile.mkdtemp(prefix="bench_changelog_"))
+    try:
+        path = workdir / "CHANGELOG.md"
+        best = None
+        for _ in range(repeat):
+            path.write_text(content, encoding="utf-8")
+            start = time.perf_counter()
+            function(path)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+
+        path.write_text(content, encoding="utf-8")
+        tracemalloc.start()
+        try:
+            function(path)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return best, peak
+    finally:
+        shutil.rmtree(workdir)
+
+
+def run_benchmarks(scale=1, repeat=3, only=None):
+    """
+    Run every case on every scenario.
+
+    Returns dict: {"<function>/<scenario>": {"seconds", "bytes",
+    "mb_per_s", "peak_kib"}}
+    """
+    results = {}
+    for scenario, (content, oldest_version) in build_scenarios(scale).items():
+        for name, source, function in _cases(content, oldest_version):
+            if only and name not in only:
+                continue
+            seconds, peak = _measure(function, source, repeat)
+            size = len(source.encode("utf-8"))
+            results[f"{name}/{scenario}"] = {
+                "seconds": seconds,
+                "bytes": size,
+                "mb_per_s": size / 1e6 / seconds if seconds else None,
+                "peak_kib": peak / 1024,
+            }
+    return results
+
+
+def compare(baseline, current, threshold=1.5, min_seconds=0.005):
+    """
+    Compare two result sets.
+
+    A case regresses when its time or peak memory grows by more than
+    ``threshold`` times the baseline value. Timings below ``min_seconds``
+    are too noisy to compare and never count as regressions.
+
+    Returns list of (key, metric, baseline_value, current_value) regressions.
+    """
+    regressions = []
+    for key, now in current.items():
+        before = baseline.get(key)
+        if before is None:
+            continue
+        for metric in ("seconds", "peak_kib"):
+            if metric == "seconds" and now[metric] < min_seconds:
+                continue
+            if before[metric] and now[metric] > before[metric] * threshold:
+                regressions.append((key, metric, before[metric], now[metric]))
+    return regressions
+
+
+def _print_results(results):
+    width = max(len(key) for key in results)
+    print(f"{'case':<{width}}  {'time (ms)':>10}  {'MB/s':>9}  {'peak (KiB)':>11}")
+    for key, result in results.items():
+        mb_per_s = result["mb_per_s"]
+        print(
+            f"{key:<{width}}  {result['seconds'] * 1000:>10.2f}  "
+            f"{mb_per_s if mb_per_s is not None else float('nan'):>9.1f}  "
+            f"{result['peak_kib']:>11.0f}"
+        )
+
+
+def main():
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark prepare_changelog.py on synthetic CHANGELOGs",
+    )
+    parser.add_argument(
+        "--scale",
+        type=int,
+        default=1,
+        help="Multiply the size of the large and pathological scenarios",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Timed runs per case; the fastest is kept (default: 3)",
+    )
+    parser.add_argument(
+        "--only",
+        action="append",
+        help="Only run this function (repeatable)",
+    )
+    parser.add_argument("--output", help="Write results to this JSON file")
+    parser.add_argument(
+        "--compare",
+        help="Baseline JSON file to compare against; exit 1 on regression",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.5,
+        help="Slowdown/memory growth factor treated as a regression (default: 1.5)",
+    )
+    parser.add_argument(
+        "--min-seconds",
+        type=float,
+        default=0.005,
+        help="Ignore timing regressions for cases faster than this (default: 0.005)",
+    )
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.scale, args.repeat, args.only)
+    _print_results(results)
+
+    if args.output:
+        report = {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "scale": args.scale,
+            "results": results,
+        }
+        Path(args.output).write_text(json.dumps(report, indent=2) + "\n")
+        print(f"✓ Wrote results to {args.output}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        regressions = compare(
+            baseline["results"], results, args.threshold, args.min_seconds
+        )
+        for key, metric, before, now in regressions:
+            print(
+                f"✗ {key}: {metric} {before:.4g} → {now:.4g} " f"({now / before:.2f}x)",
+                file=sys.stderr,
+            )
+        if regressions:
+            sys.exit(1)
+        print(f"✓ No regressions against {args.compare}")
+
+
+if __name__ == "__main__":
+    main()
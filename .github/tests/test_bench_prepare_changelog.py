@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""Tests for bench_prepare_changelog.py."""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from bench_prepare_changelog import (
+    compare,
+    generate_changelog,
+    pathological_inputs,
+)
+from prepare_changelog import parse_changelog
+
+
+class TestGenerateChangelog(unittest.TestCase):
+    def test_generates_requested_structure(self):
+        content, oldest = generate_changelog(versions=12, sections=2, bullets=3)
+        doc = parse_changelog(content)
+        self.assertEqual(len(doc.versions), 12)
+        self.assertEqual(doc.versions[-1].version, oldest)
+        self.assertEqual(
+            [s.name for s in doc.unreleased.subsections], ["Added", "Changed"]
+        )
+        self.assertEqual(len(doc.versions[0].bullets), 6)
+
+    def test_is_deterministic(self):
+        self.assertEqual(generate_changelog(versions=5), generate_changelog(versions=5))
+
+    def test_pathological_inputs_keep_unreleased_and_release(self):
+        for name, (content, oldest) in pathological_inputs().items():
+            doc = parse_changelog(content)
+            self.assertIsNotNone(doc.unreleased, name)
+            self.assertEqual(doc.versions[-1].version, oldest, name)
+
+
+class TestCompare(unittest.TestCase):
+    BASELINE = {"validate/large": {"seconds": 0.1, "peak_kib": 1000}}
+
+    def test_flags_slowdown(self):
+        current = {"validate/large": {"seconds": 0.2, "peak_kib": 1000}}
+        regressions = compare(self.BASELINE, current, threshold=1.5)
+        self.assertEqual(regressions, [("validate/large", "seconds", 0.1, 0.2)])
+
+    def test_flags_memory_growth(self):
+        current = {"validate/large": {"seconds": 0.1, "peak_kib": 4000}}
+        self.assertEqual(compare(self.BASELINE, current)[0][1], "peak_kib")
+
+    def test_ignores_noise_and_new_cases(self):
+        baseline = {"validate/small": {"seconds": 0.0001, "peak_kib": 10}}
+        current = {
+            "validate/small": {"seconds": 0.0004, "peak_kib": 10},
+            "lint/small": {"seconds": 1.0, "peak_kib": 10},
+        }
+        self.assertEqual(compare(baseline, current), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
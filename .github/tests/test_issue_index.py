@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""Tests for issue_index.py."""
+
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+
+SCRIPT = Path(__file__).resolve().parent.parent / "issue_index.py"
+sys.path.insert(0, str(SCRIPT.parent))
+from issue_index import (
+    _parse_since,
+    connect,
+    parse_item,
+    query_items,
+    update_index,
+)
+
+
+def _issue(number, state="open", labels="none", updated="2026-02-23T10:46:30Z"):
+    return f"""\
+---
+type: issue
+state: {state}
+created: 2026-02-20T09:00:00Z
+updated: {updated}
+author: alice
+author_url: https://github.com/alice
+url: https://github.com/org/repo/issues/{number}
+comments: 1
+labels: {labels}
+assignees: none
+milestone: none
+projects: none
+parent: none
+children: none
+synced: 2026-02-23T10:46:45.205Z
+---
+
+# [Issue {number}]: [Crash on start {number}](https://github.com/org/repo/issues/{number})
+
+The parser crashes on empty input.
+---
+
+# [Comment #1]() by [bob]()
+
+_Posted on February 21, 2026 at 10:00 AM_
+
+Reproduced with a segfault.
+"""
+
+
+def _pr(number, state="open", labels="none", updated="2026-02-23T10:34:55Z"):
+    merged = "\nmerged: 2026-02-23T10:34:55Z" if state == "closed (merged)" else ""
+    return f"""\
+---
+type: pull_request
+state: {state}
+branch: feature/{number} → dev
+created: 2026-02-23T10:30:21Z
+updated: {updated}
+author: bob
+author_url: https://github.com/bob
+url: https://github.com/org/repo/pull/{number}
+comments: 0
+labels: {labels}
+assignees: alice, carol
+milestone: 1.0
+projects: none{merged}
+synced: 2026-02-23T10:35:23.487Z
+---
+
+# [PR {number}](https://github.com/org/repo/pull/{number}) fix: handle empty input
+
+## Summary
+
+- Guard the parser against empty input
+"""
+
+
+class TestParseItem(unittest.TestCase):
+    def test_issue_frontmatter_and_title(self):
+        fields, title, body = parse_item(_issue(7, labels="bug, area:ci"))
+        self.assertEqual(fields["state"], "open")
+        self.assertEqual(fields["labels"], "bug, area:ci")
+        self.assertEqual(fields["author_url"], "https://github.com/alice")
+        self.assertEqual(title, "Crash on start 7")
+        self.assertIn("Reproduced with a segfault.", body)
+        self.assertFalse(body.startswith("---"))
+
+    def test_pr_title(self):
+        fields, title, _ = parse_item(_pr(8))
+        self.assertEqual(fields["branch"], "feature/8 → dev")
+        self.assertEqual(title, "fix: handle empty input")
+
+    def test_rejects_missing_frontmatter(self):
+        with self.assertRaises(ValueError):
+            parse_item("# Just a heading\n")
+        with self.assertRaises(ValueError):
+            parse_item("---\ntype: issue\n")
+
+
+class TestIndex(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        cwd = os.getcwd()
+        os.chdir(self.tmp.name)
+        self.addCleanup(os.chdir, cwd)
+        self.files = {
+            "synced/issues/issue-1.md": _issue(1, labels="bug, area:ci"),
+            "synced/issues/issue-2.md": _issue(
+                2, state="closed", updated="2026-01-01T00:00:00Z"
+            ),
+            "synced/pull-requests/pr-3.md": _pr(3, labels="bug"),
+            "synced/pull-requests/pr-4.md": _pr(4, state="closed (merged)"),
+        }
+        for path, content in self.files.items():
+            self._write(path, content)
+        self.conn = connect("index.sqlite")
+        self.addCleanup(self.conn.close)
+
+    def _write(self, path, content):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        Path(path).write_text(content)
+
+    def _numbers(self, **filters):
+        return [item["number"] for item in query_items(self.conn, **filters)]
+
+    def test_scan_is_incremental(self):
+        counts = update_index(self.conn, ["synced"])
+        self.assertEqual(counts["indexed"], 4)
+
+        self._write("synced/issues/issue-1.md", _issue(1, state="closed"))
+        os.remove("synced/pull-requests/pr-3.md")
+        counts = update_index(self.conn, ["synced"])
+
+        self.assertEqual(
+            counts, {"indexed": 1, "unchanged": 2, "removed": 1, "skipped": 0}
+        )
+        self.assertEqual(self._numbers(state="closed", kind="issue"), [1, 2])
+
+    def test_modified_and_removed_files(self):
+        update_index(self.conn, ["synced"])
+        self._write("synced/issues/issue-5.md", _issue(5))
+        os.remove("synced/issues/issue-2.md")
+
+        counts = update_index(
+            self.conn,
+            files=["synced/issues/issue-5.md", "synced/.sync-manifest.json"],
+            removed=["synced/issues/issue-2.md"],
+        )
+
+        self.assertEqual(
+            counts, {"indexed": 1, "unchanged": 0, "removed": 1, "skipped": 0}
+        )
+        self.assertEqual(self._numbers(kind="issue"), [5, 1])
+
+    def test_filters(self):
+        update_index(self.conn, ["synced"])
+
+        self.assertEqual(self._numbers(kind="pull_request", labels=["bug"]), [3])
+        self.assertEqual(self._numbers(labels=["bug", "area:ci"]), [1])
+        self.assertEqual(self._numbers(state="merged"), [4])
+        self.assertEqual(self._numbers(assignee="carol", state="open"), [3])
+        self.assertEqual(self._numbers(updated_since="2026-02-01", author="alice"), [1])
+        self.assertEqual(sorted(self._numbers(search="segfault")), [1, 2])
+        self.assertEqual(self._numbers(limit=1), [1])
+
+        item = query_items(self.conn, kind="pull_request", state="merged")[0]
+        self.assertEqual(item["state"], "closed")
+        self.assertEqual(item["assignees"], ["alice", "carol"])
+        self.assertEqual(item["milestone"], "1.0")
+        self.assertEqual(
+            item["path"], os.path.join("synced", "pull-requests", "pr-4.md")
+        )
+
+    def test_search_matches_words_literally(self):
+        self._write(
+            "synced/issues/issue-6.md",
+            _issue(6).replace("empty input", "the force-update input"),
+        )
+        update_index(self.conn, ["synced"])
+
+        self.assertEqual(self._numbers(search="force-update"), [6])
+        self.assertEqual(self._numbers(search='"force update'), [6])
+        self.assertEqual(sorted(self._numbers(search="   ")), [1, 2, 3, 4, 6])
+        self.assertEqual(
+            sorted(self._numbers(search="segfault OR guard", fts_syntax=True)),
+            [1, 2, 3, 4, 6],
+        )
+        with self.assertRaises(sqlite3.OperationalError):
+            query_items(self.conn, search="force-update", fts_syntax=True)
+
+    def test_unparseable_file_is_skipped(self):
+        self._write("synced/issues/issue-9.md", "no frontmatter\n")
+        counts = update_index(self.conn, ["synced"])
+        self.assertEqual(counts["skipped"], 1)
+        self.assertNotIn(9, self._numbers())
+
+    def test_old_schema_is_rebuilt(self):
+        update_index(self.conn, ["synced"])
+        self.conn.execute("PRAGMA user_version = 0")
+        self.conn.commit()
+        self.conn.close()
+
+        self.conn = connect("index.sqlite")
+        self.assertEqual(self._numbers(), [])
+        self.assertEqual(update_index(self.conn, ["synced"])["indexed"], 4)
+
+    def test_relative_since(self):
+        now = datetime(2026, 2, 23, 12, 0, tzinfo=timezone.utc)
+        self.assertEqual(_parse_since("7d", now), "2026-02-16T12:00:00Z")
+        self.assertEqual(_parse_since("2w", now), "2026-02-09T12:00:00Z")
+        self.assertEqual(_parse_since("2026-02-01"), "2026-02-01")
+        with self.assertRaises(ValueError):
+            _parse_since("last week")
+
+    def test_cli(self):
+        def run(*args):
+            return subprocess.run(
+                [sys.executable, str(SCRIPT), "--db", "cli.sqlite", *args],
+                capture_output=True,
+                text=True,
+            )
+
+        self.assertEqual(run("query").returncode, 1)
+        result = run("update", "synced")
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIn("✓ Indexed 4 file(s)", result.stdout)
+
+        result = run("query", "--type", "prs", "--state", "open", "--label", "bug")
+        self.assertEqual(
+            result.stdout,
+            "PR #3\topen\t2026-02-23T10:34:55Z\tfix: handle empty input\n",
+        )
+        result = run("query", "--search", "parser", "--format", "jsonl")
+        records = [json.loads(line) for line in result.stdout.splitlines()]
+        self.assertEqual(len(records), 4)
+
+        result = run("update", "--files", "synced/issues/issue-1.md,")
+        self.assertIn("0 file(s), 1 unchanged", result.stdout)
+        with sqlite3.connect("cli.sqlite") as conn:
+            self.assertEqual(
+                conn.execute("SELECT COUNT(*) FROM items").fetchone(), (4,)
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
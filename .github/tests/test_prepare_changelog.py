@@ -1,20 +1,51 @@
 #!/usr/bin/env python3
 """Tests for prepare_changelog.py."""
 
+import json
+import os
+import subprocess
 import sys
 import tempfile
+import threading
+import time
 import unittest
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+SCRIPT = Path(__file__).resolve().parent.parent / "prepare_changelog.py"
+sys.path.insert(0, str(SCRIPT.parent))
 from prepare_changelog import (
+    ARCHIVE_HEADING,
+    ChangelogServer,
+    GitObjectReader,
+    _fast_args,
+    add_fragment,
+    archive_changelog,
+    build_index,
+    changelog_stats,
+    collect_fragments,
+    index_path,
+    iter_release_notes,
+    lint_changelog,
+    load_index,
     extract_release_notes,
     finalize_release_date,
+    parse_changelog,
     prepare_changelog,
     reset_unreleased,
+    resolve_workspace,
+    rpc_call,
+    run_workspace,
+    shard_path,
     validate_changelog,
 )
 
+# Import overhead (microseconds, per -X importtime) that the CLI fast path may
+# add on top of the bare interpreter
+COLD_START_BUDGET_US = int(os.environ.get("COLD_START_BUDGET_US", 10_000))
+
+# Seconds lint may take on a 50k-line CHANGELOG
+LINT_BUDGET_SECONDS = float(os.environ.get("LINT_BUDGET_SECONDS", 1.0))
+
 SAMPLE_CHANGELOG = """\
 # Changelog
 
@@ -41,6 +72,20 @@ and this project adheres to [Semantic Versioning](https://semver.org/spec/v2.0.0
 """
 
 
+def _importtime(*args):
+    """Run Python with -X importtime; returns (result, {module: self_us})."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args], capture_output=True, text=True
+    )
+    modules = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and line.count("|") == 2:
+            self_us, _, name = line[len("import time:") :].split("|")
+            if self_us.strip().isdigit():
+                modules[name.strip()] = int(self_us)
+    return result, modules
+
+
 def _write_tmp(content):
     f = tempfile.NamedTemporaryFile(
         mode="w", suffix=".md", delete=False, prefix="changelog_"
@@ -50,6 +95,48 @@ def _write_tmp(content):
     return f.name
 
 
+class TestParseChangelog(unittest.TestCase):
+    """Tests for the single-pass structural parser."""
+
+    def test_finds_unreleased_and_version_blocks(self):
+        doc = parse_changelog(SAMPLE_CHANGELOG)
+        self.assertEqual(doc.unreleased.title, "Unreleased")
+        self.assertEqual([b.version for b in doc.versions], ["0.1.0"])
+        self.assertEqual(doc.versions[0].date, "2025-12-01")
+
+    def test_header_ends_at_first_block(self):
+        doc = parse_changelog(SAMPLE_CHANGELOG)
+        self.assertTrue(doc.text(0, doc.header_end).startswith("# Changelog"))
+        self.assertTrue(doc.text(doc.header_end).startswith("## Unreleased"))
+
+    def test_records_subsections_and_bullets(self):
+        doc = parse_changelog(SAMPLE_CHANGELOG)
+        unreleased = doc.unreleased
+        self.assertEqual([s.name for s in unreleased.subsections], ["Added", "Fixed"])
+        self.assertEqual(len(unreleased.bullets), 2)
+        start, end = unreleased.subsection("Fixed").bullets[0]
+        self.assertEqual(doc.text(start, end), "- Bug fix B\n")
+
+    def test_offsets_are_byte_offsets(self):
+        doc = parse_changelog("# C\n\n## [1.0.0] - TBD\n\n- caf\u00e9 \u2192 bar\n")
+        start, end = doc.versions[0].bullets[0]
+        self.assertEqual(end - start, len("- caf\u00e9 \u2192 bar\n".encode("utf-8")))
+        self.assertEqual(doc.text(start, end), "- caf\u00e9 \u2192 bar\n")
+
+    def test_parses_linked_version_headings(self):
+        doc = parse_changelog(
+            "## [0.1.1](https://example.com/v0.1.1) - 2025-12-19\n\n- Fix\n"
+        )
+        self.assertEqual(doc.versions[0].version, "0.1.1")
+        self.assertEqual(doc.versions[0].date, "2025-12-19")
+
+    def test_line_numbers_are_one_based(self):
+        doc = parse_changelog(SAMPLE_CHANGELOG)
+        lines = SAMPLE_CHANGELOG.splitlines()
+        self.assertEqual(lines[doc.unreleased.line - 1], "## Unreleased")
+        self.assertEqual(lines[doc.versions[0].line - 1], "## [0.1.0] - 2025-12-01")
+
+
 class TestPrepareChangelog(unittest.TestCase):
     def test_prepare_does_not_create_unreleased_section(self):
         """prepare() should NOT add an Unreleased section on the release branch.
@@ -120,6 +207,98 @@ class TestPrepareChangelog(unittest.TestCase):
         self.assertIn("already exists", str(ctx.exception))
 
 
+class TestIncrementalValidate(unittest.TestCase):
+    """Tests for validate reading only the Unreleased head."""
+
+    def test_stops_at_first_release_after_unreleased(self):
+        path = _write_tmp(SAMPLE_CHANGELOG)
+        stats = changelog_stats(path)
+        self.assertEqual(
+            stats["bytes_scanned"],
+            len(SAMPLE_CHANGELOG[: SAMPLE_CHANGELOG.index("## [0.1.0]")].encode()),
+        )
+
+    def test_history_is_not_read(self):
+        path = _write_tmp(SAMPLE_CHANGELOG)
+        with open(path, "ab") as f:
+            f.write(b"## [\xff\xfe] - broken\n")
+        self.assertEqual(validate_changelog(path), (True, True))
+
+    def test_stats_count_bullets_per_section(self):
+        path = _write_tmp(SAMPLE_CHANGELOG)
+        stats = changelog_stats(path)
+        self.assertTrue(stats["has_section"])
+        self.assertTrue(stats["has_content"])
+        self.assertEqual(
+            stats["sections"],
+            {
+                "Added": 1,
+                "Changed": 0,
+                "Deprecated": 0,
+                "Removed": 0,
+                "Fixed": 1,
+                "Security": 0,
+            },
+        )
+        self.assertGreaterEqual(stats["seconds"], 0)
+
+    def test_cli_stats(self):
+        path = _write_tmp(SAMPLE_CHANGELOG)
+        result = subprocess.run(
+            [sys.executable, str(SCRIPT), "validate", path, "--stats"],
+            capture_output=True,
+            text=True,
+        )
+        self.assertEqual(result.returncode, 0)
+        self.assertIn("Added: 1 bullet(s)", result.stdout)
+        self.assertIn("Security: 0 bullet(s)", result.stdout)
+        self.assertIn("Scanned ", result.stdout)
+        self.assertIn("✓ CHANGELOG validation passed", result.stdout)
+
+
+class TestStreamingRewrite(unittest.TestCase):
+    """prepare and reset rewrite the head and copy the tail unchanged."""
+
+    def test_prepare_copies_tail_bytes_unchanged(self):
+        tail = "## [0.1.0] - 2025-12-01\n\n- caf\u00e9\r\n" + "- old entry\n" * 5000
+        path = _write_tmp(SAMPLE_CHANGELOG.split("## [0.1.0]")[0] + tail)
+        prepare_changelog("1.0.0", path)
+        data = Path(path).read_bytes()
+        self.assertTrue(data.endswith(tail.encode("utf-8")))
+
+    def test_failed_prepare_leaves_file_untouched(self):
+        original = "# Changelog\n\n## [0.1.0] - 2025-12-01\n\n- Initial release\n"
+        path = _write_tmp(original)
+        with self.assertRaises(ValueError):
+            prepare_changelog("1.0.0", path)
+        self.assertEqual(Path(path).read_text(), original)
+        leftovers = [
+            name
+            for name in os.listdir(Path(path).parent)
+            if name.startswith(f".{Path(path).name}.")
+        ]
+        self.assertEqual(leftovers, [])
+
+    def test_reset_inserts_before_first_version(self):
+        path = _write_tmp(SAMPLE_CHANGELOG)
+        prepare_changelog("1.0.0", path)
+        reset_unreleased(path)
+        content = Path(path).read_text()
+        self.assertLess(content.index("## Unreleased"), content.index("## [1.0.0]"))
+        self.assertTrue(content.endswith("- Initial release\n"))
+
+    def test_reset_fails_without_version_section(self):
+        path = _write_tmp("# Changelog\n\nNothing yet.\n")
+        with self.assertRaises(ValueError):
+            reset_unreleased(path)
+
+    def test_rewrite_preserves_file_mode(self):
+        path = _write_tmp(SAMPLE_CHANGELOG)
+        os.chmod(path, 0o640)
+        prepare_changelog("1.0.0", path)
+        self.assertEqual(os.stat(path).st_mode & 0o777, 0o640)
+
+
 class TestFinalizeReleaseDate(unittest.TestCase):
     def test_replaces_tbd_with_date(self):
         path = _write_tmp(SAMPLE_CHANGELOG)
@@ -129,6 +308,21 @@ class TestFinalizeReleaseDate(unittest.TestCase):
         self.assertIn("## [1.0.0] - 2026-02-22", content)
         self.assertNotIn("TBD", content)
 
+    def test_replaces_tbd_in_link_and_spacing_variants(self):
+        for heading, expected in (
+            (
+                "## [1.0.0](https://example.com/releases/1.0.0) - TBD",
+                "## [1.0.0](https://example.com/releases/1.0.0) - 2026-02-22",
+            ),
+            ("## [1.0.0]  -  TBD  ", "## [1.0.0]  -  2026-02-22  "),
+        ):
+            with self.subTest(heading=heading):
+                path = _write_tmp(SAMPLE_CHANGELOG.replace("## Unreleased", heading))
+                finalize_release_date("1.0.0", "2026-02-22", path)
+                content = Path(path).read_text()
+                self.assertIn(expected + "\n", content)
+                self.assertNotIn("TBD", content)
+
     def test_rejects_invalid_version(self):
         path = _write_tmp(SAMPLE_CHANGELOG)
         with self.assertRaises(ValueError):
@@ -223,5 +417,830 @@ and this project adheres to [Semantic Versioning](https://semver.org/spec/v2.0.0
         self.assertIn("- Bug fix B", notes)
 
 
+class TestChangelogIndex(unittest.TestCase):
+    """Tests for the offset index sidecar."""
+
+    def test_indexed_lookup_matches_full_parse(self):
+        path = _write_tmp(SAMPLE_CHANGELOG)
+        prepare_changelog("1.0.0", path)
+        for version in ("1.0.0", "0.1.0", "9.9.9"):
+            self.assertEqual(
+                extract_release_notes(version, path, use_index=True),
+                extract_release_notes(version, path),
+            )
+        self.assertTrue(index_path(path).exists())
+
+    def test_index_records_byte_ranges(self):
+        path = _write_tmp(SAMPLE_CHANGELOG)
+        index = load_index(path)
+        data = Path(path).read_bytes()
+        entry = index["blocks"][-1]
+        self.assertEqual(entry["version"], "0.1.0")
+        self.assertTrue(data[entry["start"] :].startswith(b"## [0.1.0]"))
+        self.assertEqual(entry["end"], len(data))
+
+    def test_stale_index_is_rebuilt_after_edit(self):
+        path = _write_tmp(SAMPLE_CHANGELOG)
+        load_index(path)
+        prepare_changelog("1.0.0", path)
+        notes = extract_release_notes("1.0.0", path, use_index=True)
+        self.assertIn("- New feature A", notes)
+
+    def test_incremental_rebuild_matches_full_build(self):
+        path = _write_tmp(SAMPLE_CHANGELOG)
+        previous = build_index(path)
+        prepare_changelog("1.0.0", path)
+        self.assertEqual(
+            build_index(path, previous=previous)["blocks"], build_index(path)["blocks"]
+        )
+
+    def test_corrupt_index_is_replaced(self):
+        path = _write_tmp(SAMPLE_CHANGELOG)
+        index_path(path).write_text("not json")
+        notes = extract_release_notes("0.1.0", path, use_index=True)
+        self.assertIn("- Initial release", notes)
+
+
+class TestFragments(unittest.TestCase):
+    """Tests for changelog.d fragments added with add_fragment()."""
+
+    EMPTY_UNRELEASED = SAMPLE_CHANGELOG.replace("- New feature A\n", "").replace(
+        "- Bug fix B\n", ""
+    )
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, "CHANGELOG.md")
+        Path(self.path).write_text(SAMPLE_CHANGELOG)
+
+    def test_add_writes_one_file_per_entry(self):
+        before = Path(self.path).read_bytes()
+        path = add_fragment("fixed", "Handle empty bodies", self.path, 42)
+
+        self.assertEqual(
+            path, os.path.join(self.tmp.name, "changelog.d", "42.fixed.md")
+        )
+        self.assertEqual(Path(path).read_text(), "- Handle empty bodies\n")
+        self.assertEqual(Path(self.path).read_bytes(), before)
+        self.assertEqual(
+            collect_fragments(self.path), [(path, "Fixed", "- Handle empty bodies")]
+        )
+
+    def test_add_rejects_bad_input(self):
+        add_fragment("Added", "- Entry", self.path, "7")
+        for args in (
+            ("Misc", "Entry", self.path, "1"),
+            ("Added", "  ", self.path, "1"),
+            ("Added", "Entry", self.path, "../1"),
+            ("Added", "Other", self.path, "7"),
+        ):
+            with self.subTest(args=args), self.assertRaises(ValueError):
+                add_fragment(*args)
+
+    def test_validate_counts_fragments_as_content(self):
+        Path(self.path).write_text(self.EMPTY_UNRELEASED)
+        self.assertEqual(validate_changelog(self.path), (True, False))
+
+        add_fragment("Security", "Pin actions", self.path)
+
+        self.assertEqual(validate_changelog(self.path), (True, True))
+        stats = changelog_stats(self.path)
+        self.assertEqual(stats["sections"]["Security"], 1)
+        self.assertEqual(stats["fragments"], 1)
+
+    def test_prepare_folds_fragments_and_deletes_them(self):
+        add_fragment("Fixed", "Bug fix C", self.path, "2")
+        add_fragment("Removed", "- Old flag\n- Old input", self.path, "1")
+
+        sections = prepare_changelog("1.0.0", self.path)
+
+        self.assertEqual(sections["Fixed"], "- Bug fix B\n- Bug fix C")
+        self.assertEqual(sections["Removed"], "- Old flag\n- Old input")
+        notes = extract_release_notes("1.0.0", self.path)
+        self.assertIn("### Removed\n\n- Old flag\n- Old input", notes)
+        self.assertLess(notes.index("### Removed"), notes.index("### Fixed"))
+        self.assertEqual(collect_fragments(self.path), [])
+
+    def test_unknown_fragment_section_fails_validation(self):
+        directory = Path(self.tmp.name, "changelog.d")
+        directory.mkdir()
+        (directory / "README.md").write_text("How to add entries")
+        (directory / "3.misc.md").write_text("- Entry")
+        with self.assertRaises(ValueError):
+            validate_changelog(self.path)
+
+    def test_cli(self):
+        result = subprocess.run(
+            [sys.executable, str(SCRIPT), "add", "Added", "CLI entry", self.path],
+            capture_output=True,
+            text=True,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIn("✓ Added Added entry:", result.stdout)
+        self.assertEqual(len(collect_fragments(self.path)), 1)
+
+
+class TestArchive(unittest.TestCase):
+    """Tests for archive_changelog() and lookups in archive shards."""
+
+    RELEASES = [
+        ("2.1.0", "2026-03-01"),
+        ("2.0.0", "2026-02-01"),
+        ("1.1.0", "2026-01-01"),
+        ("1.0.0", "2025-12-01"),
+        ("0.1.0", "2025-11-01"),
+    ]
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, "CHANGELOG.md")
+        blocks = "".join(
+            f"## [{version}] - {date}\n\n### Added\n\n- Feature {version}\n\n"
+            for version, date in self.RELEASES
+        )
+        Path(self.path).write_text(SAMPLE_CHANGELOG.split("## [")[0] + blocks)
+
+    def test_keep_moves_older_releases_into_major_shards(self):
+        archived = archive_changelog(self.path, keep=2)
+
+        self.assertEqual(
+            archived,
+            {
+                shard_path(self.path, 1): ["1.1.0", "1.0.0"],
+                shard_path(self.path, 0): ["0.1.0"],
+            },
+        )
+        doc = parse_changelog(Path(self.path).read_bytes())
+        self.assertEqual([b.version for b in doc.versions], ["2.1.0", "2.0.0"])
+        self.assertTrue(doc.text(doc.archive_start).startswith(ARCHIVE_HEADING))
+        self.assertIn("- [1.x](changelog/1.x.md)", doc.text(doc.archive_start))
+        shard = parse_changelog(Path(shard_path(self.path, 1)).read_bytes())
+        self.assertEqual([b.version for b in shard.versions], ["1.1.0", "1.0.0"])
+
+    def test_pointer_section_is_not_part_of_the_last_release(self):
+        archive_changelog(self.path, keep=2)
+        notes = extract_release_notes("2.0.0", self.path)
+        self.assertEqual(notes, "### Added\n\n- Feature 2.0.0")
+
+    def test_lookups_only_read_the_matching_shard(self):
+        archive_changelog(self.path, before_major=2)
+        os.remove(shard_path(self.path, 0))
+
+        self.assertEqual(
+            extract_release_notes("1.0.0", self.path), "### Added\n\n- Feature 1.0.0"
+        )
+        self.assertEqual(
+            extract_release_notes("1.0.0", self.path, use_index=True),
+            "### Added\n\n- Feature 1.0.0",
+        )
+        versions = [v for v, _, _ in iter_release_notes(None, self.path)]
+        self.assertEqual(versions, ["2.1.0", "2.0.0", "1.1.0", "1.0.0"])
+        in_range = [v for v, _, _ in iter_release_notes(["1.1.0..2.0.0"], self.path)]
+        self.assertEqual(in_range, ["2.0.0", "1.1.0"])
+
+    def test_archiving_again_merges_into_existing_shards(self):
+        archive_changelog(self.path, keep=4)
+        archive_changelog(self.path, keep=2)
+
+        shard = parse_changelog(Path(shard_path(self.path, 1)).read_bytes())
+        self.assertEqual([b.version for b in shard.versions], ["1.1.0", "1.0.0"])
+        content = Path(self.path).read_text()
+        self.assertEqual(content.count(ARCHIVE_HEADING), 1)
+        self.assertEqual(archive_changelog(self.path, keep=2), {})
+        self.assertEqual(Path(self.path).read_text(), content)
+
+    def test_prepare_and_finalize_keep_the_pointer_section(self):
+        archive_changelog(self.path, keep=1)
+        prepare_changelog("3.0.0", self.path)
+        finalize_release_date("3.0.0", "2026-04-01", self.path)
+        reset_unreleased(self.path)
+
+        content = Path(self.path).read_text()
+        self.assertTrue(content.endswith("- [0.x](changelog/0.x.md)\n"))
+        self.assertIn("- Bug fix B", extract_release_notes("3.0.0", self.path))
+        self.assertEqual(
+            extract_release_notes("2.1.0", self.path), "### Added\n\n- Feature 2.1.0"
+        )
+
+    def test_newest_and_tbd_releases_are_never_archived(self):
+        archive_changelog(self.path, before_major=9)
+        versions = [
+            b.version for b in parse_changelog(Path(self.path).read_bytes()).versions
+        ]
+        self.assertEqual(versions, ["2.1.0"])
+
+    def test_rejects_invalid_selection(self):
+        with self.assertRaises(ValueError):
+            archive_changelog(self.path)
+        with self.assertRaises(ValueError):
+            archive_changelog(self.path, keep=0)
+
+    def test_cli(self):
+        result = subprocess.run(
+            [sys.executable, str(SCRIPT), "archive", "--keep", "3", self.path],
+            capture_output=True,
+            text=True,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIn("✓ Archived 1 version(s) to", result.stdout)
+        self.assertIn("  - 0.1.0", result.stdout)
+
+
+class TestLint(unittest.TestCase):
+    """Tests for lint_changelog() and the lint command."""
+
+    BROKEN = """\
+# Changelog
+
+## Unreleased
+
+### Misc
+
+- Something
+
+## [1.2.0] - TBD
+
+### Added
+
+- Feature
+
+## [1.3.0] - TBD
+
+### Added
+
+- Newer feature
+
+## [1.1.0] - 2026-01-01
+
+### Added
+
+## [1.2.0] - 2025-12-01
+
+- Again
+"""
+
+    def test_clean_changelog_has_no_findings(self):
+        self.assertEqual(lint_changelog(_write_tmp(SAMPLE_CHANGELOG)), [])
+
+    def test_reports_every_rule_with_line_numbers(self):
+        path = _write_tmp(self.BROKEN)
+        findings = [(f["rule"], f["line"]) for f in lint_changelog(path)]
+        self.assertEqual(
+            findings,
+            [
+                ("unknown-section", 5),
+                ("version-order", 15),
+                ("release-date-tbd", 15),
+                ("empty-release", 21),
+                ("duplicate-version", 25),
+            ],
+        )
+        self.assertIn("line 9", lint_changelog(path)[-1]["message"])
+
+    def test_newest_release_may_be_tbd(self):
+        path = _write_tmp(SAMPLE_CHANGELOG.replace("2025-12-01", "TBD"))
+        self.assertEqual(lint_changelog(path), [])
+
+    def test_checks_archive_shards(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "CHANGELOG.md")
+            Path(path).write_text(
+                "# Changelog\n\n## [2.0.0] - 2026-02-01\n\n- Two\n\n"
+                "## [1.0.0] - 2026-01-01\n\n- One\n"
+            )
+            archive_changelog(path, keep=1)
+            with open(shard_path(path, 1), "a") as f:
+                f.write("\n## [2.0.0] - 2025-01-01\n\n- Old\n")
+
+            findings = lint_changelog(path)
+
+        self.assertEqual(
+            [(f["rule"], f["file"]) for f in findings],
+            [("duplicate-version", shard_path(path, 1))],
+        )
+        self.assertIn(f"of {path}", findings[0]["message"])
+
+    def test_large_history_is_linted_quickly(self):
+        blocks = "".join(
+            f"## [{n // 100}.{n % 100}.0] - 2020-01-01\n\n### Fixed\n\n- Fix {n}\n\n"
+            for n in range(10_000, 0, -1)
+        )
+        path = _write_tmp("# Changelog\n\n" + blocks)
+        start = time.perf_counter()
+        findings = lint_changelog(path)
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(findings, [])
+        self.assertLess(elapsed, LINT_BUDGET_SECONDS)
+
+    def test_cli_formats(self):
+        path = _write_tmp(self.BROKEN)
+
+        def run(*args):
+            return subprocess.run(
+                [sys.executable, str(SCRIPT), "lint", path, *args],
+                capture_output=True,
+                text=True,
+            )
+
+        text = run()
+        self.assertEqual(text.returncode, 1)
+        self.assertIn(f"{path}:25: duplicate-version: ", text.stdout)
+        self.assertIn("✗ 5 lint finding(s)", text.stderr)
+
+        self.assertEqual(len(json.loads(run("--format", "json").stdout)), 5)
+
+        sarif = json.loads(run("--format", "sarif").stdout)
+        results = sarif["runs"][0]["results"]
+        self.assertEqual(sarif["version"], "2.1.0")
+        self.assertEqual(results[0]["ruleId"], "unknown-section")
+        self.assertEqual(
+            results[0]["locations"][0]["physicalLocation"]["region"], {"startLine": 5}
+        )
+
+        clean = subprocess.run(
+            [sys.executable, str(SCRIPT), "lint", _write_tmp(SAMPLE_CHANGELOG)],
+            capture_output=True,
+            text=True,
+        )
+        self.assertEqual(clean.returncode, 0, clean.stdout)
+        self.assertIn("✓ No lint findings", clean.stdout)
+
+
+class TestGitRefs(unittest.TestCase):
+    """Tests for reading CHANGELOGs from git refs with GitObjectReader."""
+
+    def _git(self, *args):
+        subprocess.run(
+            ["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+            cwd=self.repo,
+            check=True,
+            capture_output=True,
+        )
+
+    def _commit(self, files):
+        for name, content in files.items():
+            path = Path(self.repo, name)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content)
+        self._git("add", "-A")
+        self._git("commit", "-q", "-m", "update")
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.repo = self.tmp.name
+        self.path = os.path.join(self.repo, "CHANGELOG.md")
+        self._git("init", "-q", "-b", "main")
+        self._commit({"CHANGELOG.md": SAMPLE_CHANGELOG})
+        self._git("checkout", "-q", "-b", "dev")
+        self._commit(
+            {
+                "CHANGELOG.md": SAMPLE_CHANGELOG.replace("0.1.0", "0.2.0"),
+                "changelog.d/7.security.md": "- Patch CVE",
+            }
+        )
+        # The working tree no longer matches either ref
+        Path(self.path).write_text("# Changelog\n")
+
+    def _run(self, *args):
+        return subprocess.run(
+            [sys.executable, str(SCRIPT), *args],
+            cwd=self.repo,
+            capture_output=True,
+            text=True,
+        )
+
+    def test_reads_several_refs_in_one_session(self):
+        with GitObjectReader(self.repo) as reader:
+            with reader.at("main"):
+                main = list(iter_release_notes(None, self.path))
+                self.assertEqual(collect_fragments(self.path), [])
+            with reader.at("dev"):
+                dev = list(iter_release_notes(None, self.path))
+                stats = changelog_stats(self.path)
+
+        self.assertEqual(
+            main, [("0.1.0", "2025-12-01", "### Added\n\n- Initial release")]
+        )
+        self.assertEqual([v for v, _, _ in dev], ["0.2.0"])
+        self.assertEqual(stats["sections"]["Security"], 1)
+        self.assertEqual(validate_changelog(self.path), (False, False))
+
+    def test_reads_archive_shards_from_the_ref(self):
+        Path(self.path).write_text(
+            SAMPLE_CHANGELOG.replace(
+                "## [0.1.0]", "## [1.0.0] - 2026-01-01\n\n- One\n\n## [0.1.0]"
+            )
+        )
+        archive_changelog(self.path, keep=1)
+        self._commit({})
+        Path(shard_path(self.path, 0)).unlink()
+
+        with GitObjectReader(self.repo) as reader, reader.at("HEAD"):
+            notes = extract_release_notes("0.1.0", self.path)
+        self.assertEqual(notes, "### Added\n\n- Initial release")
+
+    def test_missing_ref_or_file(self):
+        with GitObjectReader(self.repo) as reader:
+            with reader.at("nope"), self.assertRaises(FileNotFoundError):
+                validate_changelog(self.path)
+            with reader.at("main"), self.assertRaises(FileNotFoundError):
+                validate_changelog(os.path.join(self.repo, "OTHER.md"))
+            with reader.at("main"), self.assertRaises(ValueError):
+                extract_release_notes("0.1.0", self.path, use_index=True)
+            self.assertEqual(
+                reader.listdir("dev", self.repo + "/changelog.d"), ["7.security.md"]
+            )
+            with self.assertRaises(ValueError):
+                reader.read("main my-branch", self.path)
+
+    def test_cli_compares_refs(self):
+        result = self._run(
+            "extract-notes",
+            "--all",
+            "--ref",
+            "main",
+            "--ref",
+            "dev",
+            "--format",
+            "jsonl",
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        records = [json.loads(line) for line in result.stdout.splitlines()]
+        self.assertEqual(
+            [(r["ref"], r["version"]) for r in records],
+            [("main", "0.1.0"), ("dev", "0.2.0")],
+        )
+
+        result = self._run("extract-notes", "0.2.0", "--ref", "main", "--ref", "dev")
+        self.assertEqual(result.returncode, 1)
+        self.assertIn("No changelog notes found for 0.2.0 at main", result.stderr)
+        self.assertIn(
+            "dev\x000.2.0\x00",
+            self._run(
+                "extract-notes", "0.2.0", "--ref", "dev", "--format", "nul"
+            ).stdout,
+        )
+
+    def test_cli_validate_refs(self):
+        result = self._run("validate", "--ref", "main", "--ref", "dev")
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIn("✓ CHANGELOG validation passed at dev", result.stdout)
+
+        self.assertEqual(self._run("validate").returncode, 1)
+        result = self._run("validate", "--ref", "main", "--glob", "*.md")
+        self.assertIn("--ref is not supported", result.stderr)
+
+    def test_cli_lint_refs(self):
+        duplicate = "\n## [0.1.0] - 2025-11-01\n\n- Again\n"
+        self._commit({"CHANGELOG.md": SAMPLE_CHANGELOG + duplicate})
+        result = self._run("lint", "--ref", "main", "--ref", "HEAD")
+        self.assertEqual(result.returncode, 1)
+        self.assertNotIn("main:", result.stdout)
+        self.assertIn("HEAD:CHANGELOG.md:24: duplicate-version", result.stdout)
+
+        result = self._run("lint", "--ref", "HEAD", "--format", "json")
+        self.assertEqual({f["ref"] for f in json.loads(result.stdout)}, {"HEAD"})
+        result = self._run("lint", "--ref", "HEAD", "--format", "sarif")
+        results = json.loads(result.stdout)["runs"][0]["results"]
+        self.assertEqual(results[0]["properties"], {"ref": "HEAD"})
+
+        self.assertEqual(self._run("lint", "--ref", "main").returncode, 0)
+
+    def test_oversized_blob_fails_without_hanging(self):
+        # Larger than a pipe buffer, so git blocks until the blob is drained
+        self._commit({"CHANGELOG.md": SAMPLE_CHANGELOG + "- padding\n" * 20000})
+        result = subprocess.run(
+            [sys.executable, str(SCRIPT), "validate", "--ref", "HEAD"],
+            cwd=self.repo,
+            capture_output=True,
+            text=True,
+            env={**os.environ, "CHANGELOG_MAX_BYTES": "1000"},
+            timeout=30,
+        )
+        self.assertEqual(result.returncode, 1)
+        self.assertIn("above the 1000 byte limit", result.stderr)
+
+
+class TestBatchExtractNotes(unittest.TestCase):
+    """Tests for extracting many versions in one invocation."""
+
+    HISTORY = """\
+# Changelog
+
+## [2.0.0] - 2026-03-01
+
+- Two
+
+## [1.2.0] - 2026-02-01
+
+- One two
+
+## [1.1.0] - 2026-01-01
+
+- One one
+
+## [1.0.0] - 2025-12-01
+
+- One
+"""
+
+    def test_all_versions_in_document_order(self):
+        path = _write_tmp(self.HISTORY)
+        versions = [v for v, _, _ in iter_release_notes(None, path)]
+        self.assertEqual(versions, ["2.0.0", "1.2.0", "1.1.0", "1.0.0"])
+
+    def test_range_is_inclusive(self):
+        path = _write_tmp(self.HISTORY)
+        records = list(iter_release_notes(["1.1.0..2.0.0"], path))
+        self.assertEqual([v for v, _, _ in records], ["2.0.0", "1.2.0", "1.1.0"])
+        self.assertEqual(records[0][1:], ("2026-03-01", "- Two"))
+
+    def test_missing_version_yields_none(self):
+        path = _write_tmp(self.HISTORY)
+        records = list(iter_release_notes(["1.0.0", "9.9.9"], path))
+        self.assertEqual(records[1], ("9.9.9", None, None))
+
+    def test_versions_are_emitted_once(self):
+        path = _write_tmp(self.HISTORY)
+        records = list(iter_release_notes(["1.2.0", "1.0.0..2.0.0"], path))
+        self.assertEqual(len(records), 4)
+
+    def test_rejects_invalid_range(self):
+        path = _write_tmp(self.HISTORY)
+        with self.assertRaises(ValueError):
+            list(iter_release_notes(["1.0..2.0.0"], path))
+
+    def test_index_lookup_matches_full_parse(self):
+        path = _write_tmp(self.HISTORY)
+        self.assertEqual(
+            list(iter_release_notes(None, path, use_index=True)),
+            list(iter_release_notes(None, path)),
+        )
+
+    def test_cli_streams_json_lines(self):
+        path = _write_tmp(self.HISTORY)
+        result = subprocess.run(
+            [sys.executable, str(SCRIPT), "extract-notes", "1.0.0..1.2.0", path],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        records = [json.loads(line) for line in result.stdout.splitlines()]
+        self.assertEqual([r["version"] for r in records], ["1.2.0", "1.1.0", "1.0.0"])
+
+    def test_cli_nul_format_and_missing_version(self):
+        path = _write_tmp(self.HISTORY)
+        result = subprocess.run(
+            [
+                sys.executable,
+                str(SCRIPT),
+                "extract-notes",
+                "2.0.0",
+                "9.9.9",
+                path,
+                "--format",
+                "nul",
+            ],
+            capture_output=True,
+            text=True,
+        )
+        self.assertEqual(result.returncode, 1)
+        self.assertEqual(result.stdout, "2.0.0\0- Two\0")
+        self.assertIn("9.9.9", result.stderr)
+
+
+class TestChangelogServer(unittest.TestCase):
+    """Tests for the JSON-RPC serve mode."""
+
+    def _call(self, server, method, **params):
+        return server.handle(
+            {"jsonrpc": "2.0", "id": 1, "method": method, "params": params}
+        )
+
+    def test_validate(self):
+        path = _write_tmp(SAMPLE_CHANGELOG)
+        response = self._call(ChangelogServer(), "validate", file=path)
+        self.assertEqual(response["result"], {"has_section": True, "has_content": True})
+
+    def test_repeated_reads_hit_cache(self):
+        path = _write_tmp(SAMPLE_CHANGELOG)
+        server = ChangelogServer()
+        self._call(server, "extract-notes", versions=["0.1.0"], file=path)
+        self._call(server, "validate", file=path)
+        self.assertEqual((server.cache.misses, server.cache.hits), (1, 1))
+
+    def test_cache_invalidated_by_rewrite(self):
+        path = _write_tmp(SAMPLE_CHANGELOG)
+        server = ChangelogServer()
+        self._call(server, "validate", file=path)
+        self._call(server, "prepare", version="1.0.0", file=path)
+        response = self._call(server, "validate", file=path)
+        self.assertFalse(response["result"]["has_section"])
+
+    def test_errors_follow_json_rpc(self):
+        server = ChangelogServer()
+        self.assertEqual(self._call(server, "nope")["error"]["code"], -32601)
+        self.assertEqual(self._call(server, "finalize")["error"]["code"], -32602)
+        missing = self._call(server, "validate", file="/nonexistent.md")
+        self.assertEqual(missing["error"]["code"], -32000)
+        self.assertIn("-32700", server.handle_line("not json"))
+
+    def test_notifications_get_no_response(self):
+        path = _write_tmp(SAMPLE_CHANGELOG)
+        request = {"jsonrpc": "2.0", "method": "validate", "params": {"file": path}}
+        self.assertIsNone(ChangelogServer().handle(request))
+        for method, params in [
+            ("nope", {}),
+            ("finalize", {}),
+            ("validate", {"file": "/nonexistent.md"}),
+            ("validate", []),
+        ]:
+            request = {"jsonrpc": "2.0", "method": method, "params": params}
+            self.assertIsNone(ChangelogServer().handle(request), method)
+
+    def test_socket_path_must_be_a_socket(self):
+        path = _write_tmp(SAMPLE_CHANGELOG)
+        with self.assertRaises(ValueError):
+            ChangelogServer().serve_socket(path)
+        self.assertEqual(Path(path).read_text(), SAMPLE_CHANGELOG)
+
+    def test_socket_round_trip(self):
+        path = _write_tmp(SAMPLE_CHANGELOG)
+        socket_path = tempfile.mktemp(suffix=".sock")
+        server = ChangelogServer()
+        thread = threading.Thread(target=server.serve_socket, args=(socket_path,))
+        thread.start()
+        try:
+            for _ in range(100):
+                if os.path.exists(socket_path):
+                    break
+                time.sleep(0.01)
+            result = rpc_call(socket_path, "validate", {"file": path})
+            self.assertTrue(result["has_content"])
+            with self.assertRaises(RuntimeError):
+                rpc_call(socket_path, "prepare", {"version": "bad", "file": path})
+        finally:
+            rpc_call(socket_path, "shutdown")
+            thread.join(timeout=5)
+        self.assertFalse(os.path.exists(socket_path))
+
+
+class TestWorkspace(unittest.TestCase):
+    """Tests for running commands over many CHANGELOGs."""
+
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp(prefix="workspace_"))
+        for name in ("a", "b"):
+            (self.root / name).mkdir()
+            (self.root / name / "CHANGELOG.md").write_text(SAMPLE_CHANGELOG)
+        (self.root / "c").mkdir()
+        (self.root / "c" / "CHANGELOG.md").write_text(
+            TestExtractReleaseNotes.PREPARED_CHANGELOG
+        )
+
+    def test_resolve_glob_and_manifest(self):
+        manifest = self.root / "changelogs.txt"
+        manifest.write_text("# packages\nc/CHANGELOG.md\n\na/CHANGELOG.md\n")
+        paths = resolve_workspace(str(self.root / "*" / "CHANGELOG.md"), manifest)
+        self.assertEqual(
+            [Path(p).parent.name for p in paths], ["a", "b", "c"], "duplicates dropped"
+        )
+
+    def test_resolve_nothing_selected(self):
+        with self.assertRaises(ValueError):
+            resolve_workspace(str(self.root / "*" / "NOPE.md"))
+
+    def test_failures_are_collected_per_file(self):
+        paths = resolve_workspace(str(self.root / "*" / "CHANGELOG.md"))
+        outcomes = list(run_workspace("validate", paths, jobs=2))
+        self.assertEqual([o["ok"] for o in outcomes], [True, True, False])
+        self.assertIn("No Unreleased section", outcomes[2]["error"])
+
+    def test_prepare_runs_on_every_file(self):
+        paths = resolve_workspace(str(self.root / "[ab]" / "CHANGELOG.md"))
+        outcomes = list(run_workspace("prepare", paths, {"version": "1.0.0"}, jobs=2))
+        self.assertTrue(all(o["ok"] for o in outcomes))
+        for path in paths:
+            self.assertIn("## [1.0.0] - TBD", Path(path).read_text())
+
+    def test_extract_notes_reports_missing_versions(self):
+        paths = resolve_workspace(str(self.root / "*" / "CHANGELOG.md"))
+        options = {"selectors": ["1.0.0"], "index": False}
+        outcomes = list(run_workspace("extract-notes", paths, options, jobs=1))
+        self.assertFalse(outcomes[0]["ok"])
+        self.assertTrue(outcomes[2]["ok"])
+        self.assertIn("- New feature A", outcomes[2]["result"]["records"][0]["notes"])
+
+    def test_cli_aggregates_exit_code(self):
+        result = subprocess.run(
+            [
+                sys.executable,
+                str(SCRIPT),
+                "validate",
+                "--glob",
+                str(self.root / "*" / "CHANGELOG.md"),
+            ],
+            capture_output=True,
+            text=True,
+        )
+        self.assertEqual(result.returncode, 1)
+        self.assertIn("2 of 3 CHANGELOG(s) passed validate", result.stdout)
+
+    def test_cli_rejects_stats(self):
+        result = subprocess.run(
+            [
+                sys.executable,
+                str(SCRIPT),
+                "validate",
+                "--stats",
+                "--glob",
+                str(self.root / "*" / "CHANGELOG.md"),
+            ],
+            capture_output=True,
+            text=True,
+        )
+        self.assertEqual(result.returncode, 1)
+        self.assertIn("--stats is not supported with --glob/--manifest", result.stderr)
+        self.assertEqual(result.stdout, "")
+
+
+class TestColdStart(unittest.TestCase):
+    """Tests for the argparse-free fast path and its start-up cost."""
+
+    HEAVY_MODULES = {
+        "argparse",
+        "contextlib",
+        "dataclasses",
+        "glob",
+        "hashlib",
+        "json",
+        "pathlib",
+        "re",
+        "shutil",
+        "tempfile",
+    }
+
+    @classmethod
+    def setUpClass(cls):
+        cls.baseline = set(_importtime("-c", "pass")[1])
+
+    def _cli_imports(self, *args):
+        result, modules = _importtime(str(SCRIPT), *args)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        return {name: us for name, us in modules.items() if name not in self.baseline}
+
+    def test_read_commands_stay_within_budget(self):
+        path = _write_tmp(SAMPLE_CHANGELOG)
+        for args in (
+            ["validate", path],
+            ["extract-notes", "0.1.0", path],
+            ["lint", path],
+        ):
+            with self.subTest(args=args):
+                extra = self._cli_imports(*args)
+                self.assertEqual(self.HEAVY_MODULES & set(extra), set())
+                self.assertLessEqual(sum(extra.values()), COLD_START_BUDGET_US)
+
+    def test_write_commands_skip_argparse(self):
+        path = _write_tmp(SAMPLE_CHANGELOG)
+        extra = self._cli_imports("prepare", "1.0.0", path)
+        self.assertEqual(
+            {"argparse", "dataclasses", "json", "pathlib"} & set(extra), set()
+        )
+
+    def test_options_fall_back_to_argparse(self):
+        path = _write_tmp(SAMPLE_CHANGELOG)
+        self.assertIn("argparse", self._cli_imports("validate", path, "--stats"))
+
+    def test_fast_args(self):
+        args = _fast_args(["finalize", "1.0.0", "2026-01-01", "CHANGES.md"])
+        self.assertEqual(
+            (args.version, args.date, args.file), ("1.0.0", "2026-01-01", "CHANGES.md")
+        )
+        self.assertIsNone(args.glob)
+        self.assertEqual(_fast_args(["validate"]).file, "CHANGELOG.md")
+        self.assertEqual(
+            _fast_args(["extract-notes", "1.0.0", "2.0.0"]).targets, ["1.0.0", "2.0.0"]
+        )
+
+    def test_fast_args_defers_to_argparse(self):
+        for argv in (
+            [],
+            ["--help"],
+            ["validate", "--stats"],
+            ["prepare"],
+            ["finalize", "1.0.0"],
+            ["reset", "a.md", "b.md"],
+            ["extract-notes"],
+            ["serve"],
+        ):
+            with self.subTest(argv=argv):
+                self.assertIsNone(_fast_args(argv))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Property and fuzz tests for the prepare_changelog.py parser.
+
+Randomly generated CHANGELOGs are run through the parser and compared with
+the baseline regex implementation it replaced, and pathological inputs are
+measured at growing sizes to check that parsing stays linear. The work is
+counted as function calls, which is deterministic; the wall-clock variant
+only runs with CHANGELOG_TIMING_TESTS=1 since it is noisy on shared runners.
+"""
+
+import os
+import random
+import re
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import prepare_changelog  # noqa: E402
+from prepare_changelog import (  # noqa: E402
+    STANDARD_SECTIONS,
+    extract_release_notes,
+    extract_unreleased_content,
+    parse_changelog,
+    validate_changelog,
+)
+
+# Number of random documents checked per property
+ITERATIONS = 300
+
+# Lines that may appear inside a block. Block headings are placed by the
+# generator itself, since the reference regexes treat a stray
+# ``## Unreleased`` after a release differently from a heading.
+BODY_LINES = [
+    "",
+    "",
+    "- entry",
+    "- entry with `code` and [link](https://example.com)",
+    "  - nested entry",
+    "\t- tab indented entry",
+    "-no space entry",
+    "plain text",
+    "  indented text",
+    "## Notes",
+    "#### Details",
+    "###Added",
+    "##[1.0.0]",
+    "### Misc",
+    "### Added  ",
+] + [f"### {name}" for name in STANDARD_SECTIONS]
+
+
+def random_changelog(rng):
+    """
+    Return (content, versions) for a random Keep a Changelog document.
+
+    Lines end with ``\\n`` or ``\\r\\n`` and the document may or may not end
+    with a newline.
+    """
+    newline = rng.choice(["\n", "\n", "\r\n"])
+    lines = ["# Changelog", "", "Header text", ""]
+
+    def body():
+        return [rng.choice(BODY_LINES) for _ in range(rng.randint(0, 12))]
+
+    if rng.random() < 0.8:
+        # The regex implementation let an Unreleased block with a blank body
+        # swallow the release below it; the parser stops at the release
+        # heading, so Unreleased always gets at least one non-blank line.
+        lines.append(rng.choice(["## Unreleased", "## Unreleased  "]))
+        lines.extend(body())
+        lines.append(rng.choice([line for line in BODY_LINES if line]))
+
+    versions = []
+    for i in range(rng.randint(0, 4), 0, -1):
+        version = f"{i}.{rng.randint(0, 9)}.{rng.randint(0, 9)}"
+        date = rng.choice(["2025-01-01", "TBD", ""])
+        lines.append(f"## [{version}] - {date}" if date else f"## [{version}]")
+        lines.extend(body())
+        versions.append(version)
+
+    content = newline.join(lines)
+    if rng.random() < 0.7:
+        content += newline
+    return content, versions
+
+
+def reference_extract_unreleased_content(content):
+    """The baseline regex implementation of extract_unreleased_content."""
+    unreleased_match = re.search(
+        r"## Unreleased\s*\n(.*?)(?=\n## \[|\Z)", content, re.DOTALL
+    )
+    if not unreleased_match:
+        raise ValueError("No '## Unreleased' section found in CHANGELOG")
+
+    unreleased_text = unreleased_match.group(1)
+    sections = {}
+    for section in STANDARD_SECTIONS:
+        pattern = rf"^### {section}\s*\n(.*?)(?=^### |^## |\Z)"
+        match = re.search(pattern, unreleased_text, re.MULTILINE | re.DOTALL)
+        if match:
+            section_content = match.group(1).strip()
+            if section_content and any(
+                line.strip().startswith("-") for line in section_content.split("\n")
+            ):
+                sections[section] = section_content
+    return sections
+
+
+def reference_validate_changelog(content):
+    """The baseline regex implementation of validate_changelog."""
+    has_section = bool(re.search(r"## Unreleased", content))
+    has_content = False
+    if has_section:
+        unreleased_match = re.search(
+            r"## Unreleased\s*\n(.*?)(?=\n## \[|\Z)", content, re.DOTALL
+        )
+        if unreleased_match:
+            has_content = bool(
+                re.search(r"^\s*-", unreleased_match.group(1), re.MULTILINE)
+            )
+    return has_section, has_content
+
+
+def reference_extract_release_notes(version, content):
+    """The baseline regex implementation of extract_release_notes."""
+    pattern = rf"^## \[{re.escape(version)}\][^\n]*\n(.*?)(?=^## \[|\Z)"
+    match = re.search(pattern, content, re.MULTILINE | re.DOTALL)
+    return match.group(1).strip() if match else ""
+
+
+def _outcome(function, *args):
+    """Return ("ok", result) or ("error", message) for a call."""
+    try:
+        return "ok", function(*args)
+    except ValueError as e:
+        return "error", str(e)
+
+
+# Opt in to the wall-clock linearity checks
+TIMING_TESTS = os.environ.get("CHANGELOG_TIMING_TESTS") == "1"
+
+
+def _call_count(function, data):
+    """Count the Python and builtin calls made by ``function(data)``."""
+    count = 0
+
+    def profile(frame, event, arg):
+        nonlocal count
+        if event in ("call", "c_call"):
+            count += 1
+
+    sys.setprofile(profile)
+    try:
+        function(data)
+    finally:
+        sys.setprofile(None)
+    return count
+
+
+def _best_time(function, data, repeat=3):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(data)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+class TestParserMatchesReference(unittest.TestCase):
+    """Random documents give the same results as the regex implementation."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.path = Path(self.tmpdir.name) / "CHANGELOG.md"
+
+    def test_extract_unreleased_content(self):
+        for seed in range(ITERATIONS):
+            content, _ = random_changelog(random.Random(seed))
+            self.assertEqual(
+                _outcome(extract_unreleased_content, content),
+                _outcome(reference_extract_unreleased_content, content),
+            )
+
+    def test_validate_changelog(self):
+        for seed in range(ITERATIONS):
+            content, _ = random_changelog(random.Random(seed))
+            self.path.write_bytes(content.encode("utf-8"))
+            self.assertEqual(
+                validate_changelog(self.path), reference_validate_changelog(content)
+            )
+
+    def test_extract_release_notes(self):
+        for seed in range(ITERATIONS):
+            content, versions = random_changelog(random.Random(seed))
+            self.path.write_bytes(content.encode("utf-8"))
+            for version in versions + ["9.9.9"]:
+                self.assertEqual(
+                    extract_release_notes(version, self.path),
+                    reference_extract_release_notes(version, content),
+                )
+
+
+class TestLinearTime(unittest.TestCase):
+    """Parsing work grows linearly with the size of the input."""
+
+    # A quadratic parser would do 64x the work on 8x the input
+    SIZE_FACTOR = 8
+    MAX_CALL_RATIO = 10
+    MAX_TIME_RATIO = 24
+
+    INPUTS = {
+        "many-subsections": "### Misc\n\n- entry\n\n",
+        "near-miss-headings": "##Unreleased ###Added -\n",
+        "long-lines": "x" * 4000 + "\n",
+        "blank-lines": "\n",
+        "bullets": "-\n",
+        "whitespace": " " * 200 + "\n",
+    }
+
+    def _document(self, unit, repeat):
+        return ("## Unreleased\n\n### Added\n\n" + unit * repeat).encode("utf-8")
+
+    def _cases(self):
+        for name, unit in self.INPUTS.items():
+            yield name, parse_changelog, unit, max(1, 25_000 // len(unit))
+        yield "extract-unreleased", extract_unreleased_content, "### Misc\n\n- entry\n\n", 2_000
+
+    def test_parse_calls_are_linear(self):
+        for name, function, unit, repeat in self._cases():
+            with self.subTest(input=name):
+                small = _call_count(function, self._document(unit, repeat))
+                large = _call_count(
+                    function, self._document(unit, repeat * self.SIZE_FACTOR)
+                )
+                self.assertLess(large, small * self.MAX_CALL_RATIO)
+
+    @unittest.skipUnless(TIMING_TESTS, "set CHANGELOG_TIMING_TESTS=1 to run")
+    def test_parse_time_is_linear(self):
+        for name, function, unit, repeat in self._cases():
+            with self.subTest(input=name):
+                small = _best_time(function, self._document(unit, repeat))
+                large = _best_time(
+                    function, self._document(unit, repeat * self.SIZE_FACTOR)
+                )
+                self.assertLess(large, max(small, 0.001) * self.MAX_TIME_RATIO)
+
+
+class TestResourceLimits(unittest.TestCase):
+    """Oversized inputs and slow parses fail fast with a clear error."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.path = Path(self.tmpdir.name) / "CHANGELOG.md"
+
+    def test_parse_rejects_input_over_size_limit(self):
+        with self.assertRaisesRegex(ValueError, "above the 10 byte limit"):
+            parse_changelog(b"## Unreleased\n", max_bytes=10)
+
+    def test_parse_enforces_time_limit(self):
+        data = b"- entry\n" * (prepare_changelog._DEADLINE_CHECK_INTERVAL * 2)
+        with self.assertRaisesRegex(ValueError, "exceeded the 0s time limit"):
+            parse_changelog(data, timeout=0)
+
+    def test_file_size_checked_before_reading(self):
+        self.path.write_text("## Unreleased\n\n### Added\n\n- entry\n")
+        with mock.patch.dict(os.environ, {"CHANGELOG_MAX_BYTES": "16"}):
+            with self.assertRaisesRegex(ValueError, "CHANGELOG_MAX_BYTES"):
+                validate_changelog(self.path)
+            with self.assertRaisesRegex(ValueError, "CHANGELOG_MAX_BYTES"):
+                prepare_changelog.prepare_changelog("1.0.0", self.path)
+        self.assertEqual(validate_changelog(self.path), (True, True))
+
+    def test_malformed_limits_are_reported_when_checked(self):
+        self.path.write_text("## Unreleased\n\n### Added\n\n- entry\n")
+        script = Path(prepare_changelog.__file__)
+        for name, value in [
+            ("CHANGELOG_MAX_BYTES", "256M"),
+            ("CHANGELOG_PARSE_TIMEOUT", "soon"),
+        ]:
+            with self.subTest(variable=name):
+                env = {**os.environ, name: value}
+                result = subprocess.run(
+                    [sys.executable, str(script), "validate", str(self.path)],
+                    capture_output=True,
+                    text=True,
+                    env=env,
+                )
+                self.assertEqual(result.returncode, 1)
+                self.assertIn(f"Error: {name} must be", result.stderr)
+                self.assertIn(repr(value), result.stderr)
+
+                result = subprocess.run(
+                    [sys.executable, str(script), "--help"],
+                    capture_output=True,
+                    text=True,
+                    env=env,
+                )
+                self.assertEqual(result.returncode, 0, result.stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()
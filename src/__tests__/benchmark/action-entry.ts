@@ -0,0 +1,17 @@
+/**
+ * Child process entry point for the benchmark runner: runs the action from source and
+ * records its peak resident set size to BENCH_RESULT_FILE when the process exits.
+ */
+
+import * as fs from 'fs';
+
+process.on('exit', () => {
+  const resultFile = process.env.BENCH_RESULT_FILE;
+  if (resultFile) {
+    // maxRSS is reported in kilobytes
+    fs.writeFileSync(resultFile, JSON.stringify({ peak_rss_kib: process.resourceUsage().maxRSS }));
+  }
+});
+
+// Importing the action runs it
+import('../../index');
@@ -0,0 +1,531 @@
+/**
+ * Local stand-in for the parts of the GitHub REST and GraphQL APIs the action uses.
+ *
+ * Items are synthesized from their number with a seeded generator, so a 50k item
+ * repository costs a few arrays of numbers rather than 50k JSON documents. Every
+ * request can be delayed and counted, and primary and secondary rate limits can be
+ * injected to exercise the request scheduler.
+ */
+
+import * as http from 'http';
+import { AddressInfo } from 'net';
+
+export interface FakeRepoOptions {
+  /** Total number of issues and pull requests; every fourth number is a PR. */
+  items: number;
+  /** Seed for the generated titles, bodies, states and counts. */
+  seed?: number;
+  /** Average number of comments per item; one item in 500 gets more than one page. */
+  comments?: number;
+  /** Maximum number of commits per pull request. */
+  commits?: number;
+}
+
+export interface FakeGitHubOptions extends FakeRepoOptions {
+  owner?: string;
+  repo?: string;
+  /** Delay added to every response, in milliseconds. */
+  latencyMs?: number;
+  /** Requests (REST) or points (GraphQL) allowed per rate limit window. */
+  rateLimit?: number;
+  rateLimitWindowMs?: number;
+  /** Answer every Nth request with a secondary rate limit error. */
+  secondaryLimitEvery?: number;
+  /** `retry-after` sent with secondary rate limit errors, in seconds. */
+  secondaryRetryAfter?: number;
+}
+
+export interface FakeGitHubStats {
+  requests: number;
+  endpoints: Record<string, number>;
+  bytes: number;
+  rateLimited: number;
+}
+
+export interface FakeGitHub {
+  url: string;
+  stats: FakeGitHubStats;
+  close(): Promise<void>;
+}
+
+const PER_PAGE_MAX = 100;
+const BASE_TIME = Date.parse('2024-01-01T00:00:00Z');
+const HOUR = 3_600_000;
+
+/** Small deterministic PRNG, so the same seed always produces the same repository. */
+function random(seed: number, n: number, salt: number): number {
+  let t = (seed * 0x9e3779b1 + n * 0x85ebca6b + salt * 0xc2b2ae35) >>> 0;
+  t = Math.imul(t ^ (t >>> 15), t | 1);
+  t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+  return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+}
+
+function words(seed: number, n: number, salt: number, count: number): string {
+  const vocabulary = ['sync', 'issue', 'label', 'parser', 'cache', 'token', 'page', 'query'];
+  return Array.from(
+    { length: count },
+    (_, i) => vocabulary[Math.floor(random(seed, n, salt + i) * vocabulary.length)]
+  ).join(' ');
+}
+
+/**
+ * Deterministic synthetic repository. Item `n` is a pull request when `n % 4 === 0`,
+ * about half of all items are closed, and every seventh issue is a sub-issue of the
+ * issue before it.
+ */
+export function createFakeRepo(options: FakeRepoOptions) {
+  const { items, seed = 1, comments = 3, commits = 5 } = options;
+  const isPR = (n: number) => n % 4 === 0;
+  const isIssue = (n: number) => n >= 1 && n <= items && !isPR(n);
+  const isClosed = (n: number) => random(seed, n, 1) < 0.5;
+  const createdAt = (n: number) => BASE_TIME + n * HOUR;
+  const updatedAt = (n: number) => createdAt(n) + Math.floor(random(seed, n, 2) * 24 * 30) * HOUR;
+  const commentCount = (n: number) =>
+    random(seed, n, 3) < 0.002 ? 150 : Math.floor(random(seed, n, 4) * (comments * 2 + 1));
+  const commitCount = (n: number) => 1 + Math.floor(random(seed, n, 5) * commits);
+  const parentOf = (n: number) => (isIssue(n) && n % 7 === 0 && isIssue(n - 1) ? n - 1 : null);
+  const childrenOf = (n: number) => (parentOf(n + 1) === n ? [n + 1] : []);
+
+  const numbers = Array.from({ length: items }, (_, i) => items - i);
+  // Newest first, as GitHub lists them by default
+  const lists = {
+    all: numbers,
+    open: numbers.filter((n) => !isClosed(n)),
+    prsAll: numbers.filter(isPR),
+    prsOpen: numbers.filter((n) => isPR(n) && !isClosed(n)),
+  };
+  const byUpdated = (list: number[]) => [...list].sort((a, b) => updatedAt(b) - updatedAt(a));
+  const prsByUpdated = { all: byUpdated(lists.prsAll), open: byUpdated(lists.prsOpen) };
+
+  return {
+    items,
+    seed,
+    lists,
+    prsByUpdated,
+    isPR,
+    isIssue,
+    isClosed,
+    createdAt,
+    updatedAt,
+    commentCount,
+    commitCount,
+    parentOf,
+    childrenOf,
+    words: (n: number, salt: number, count: number) => words(seed, n, salt, count),
+  };
+}
+
+export type FakeRepo = ReturnType<typeof createFakeRepo>;
+
+function iso(time: number): string {
+  return new Date(time).toISOString();
+}
+
+function itemJson(repo: FakeRepo, base: string, n: number) {
+  return {
+    number: n,
+    title: `${repo.isPR(n) ? 'PR' : 'Issue'} ${n}: ${repo.words(n, 10, 4)}`,
+    body: `${repo.words(n, 20, 40)}\n\n## Details\n\n- ${repo.words(n, 60, 12)}`,
+    state: repo.isClosed(n) ? 'closed' : 'open',
+    labels: n % 3 === 0 ? [{ name: 'bug' }] : [],
+    created_at: iso(repo.createdAt(n)),
+    updated_at: iso(repo.updatedAt(n)),
+    user: { login: `user${n % 50}` },
+    html_url: `${base}/${repo.isPR(n) ? 'pull' : 'issues'}/${n}`,
+    assignees: [],
+    milestone: null,
+  };
+}
+
+/** An item as the issues endpoints return it; pull requests carry `pull_request`. */
+function issueJson(repo: FakeRepo, base: string, n: number) {
+  const item = { ...itemJson(repo, base, n), comments: repo.commentCount(n) };
+  return repo.isPR(n) ? { ...item, pull_request: { url: item.html_url } } : item;
+}
+
+function prJson(repo: FakeRepo, base: string, n: number) {
+  const item = itemJson(repo, base, n);
+  return {
+    ...item,
+    comments: repo.commentCount(n),
+    review_comments: n % 6,
+    merged_at: repo.isClosed(n) && n % 8 === 0 ? item.updated_at : null,
+    head: { ref: `feature/${n}` },
+    base: { ref: 'main' },
+  };
+}
+
+function commentJson(repo: FakeRepo, base: string, n: number, index: number) {
+  const id = n * 1000 + index;
+  return {
+    id,
+    body: repo.words(n, 100 + index, 20),
+    user: { login: `user${index % 50}`, html_url: `https://github.com/user${index % 50}` },
+    created_at: iso(repo.createdAt(n) + (index + 1) * HOUR),
+    updated_at: iso(repo.createdAt(n) + (index + 1) * HOUR),
+    html_url: `${base}/issues/${n}#issuecomment-${id}`,
+  };
+}
+
+function reviewCommentJson(repo: FakeRepo, base: string, n: number, index: number) {
+  return {
+    ...commentJson(repo, base, n, index),
+    path: `src/file-${index % 3}.ts`,
+    line: 10 + index,
+    side: 'RIGHT',
+    in_reply_to_id: index > 0 && index % 2 === 0 ? n * 1000 : null,
+    pull_request_review_id: n,
+    diff_hunk: '@@ -1,3 +1,4 @@\n line\n+added',
+    original_line: 10 + index,
+    original_commit_id: sha(n, 0),
+  };
+}
+
+function sha(n: number, index: number): string {
+  return (n * 1000 + index).toString(16).padStart(40, '0');
+}
+
+function commitJson(repo: FakeRepo, base: string, n: number, index: number) {
+  return {
+    sha: sha(n, index),
+    commit: {
+      message: `${repo.words(n, 200 + index, 5)}\n\nDetails`,
+      author: { name: `User ${n % 50}`, date: iso(repo.createdAt(n) + index * HOUR) },
+      committer: { date: iso(repo.createdAt(n) + index * HOUR) },
+    },
+    author: { login: `user${n % 50}`, html_url: `https://github.com/user${n % 50}` },
+    html_url: `${base}/commit/${sha(n, index)}`,
+  };
+}
+
+function page<T>(all: T[], query: URLSearchParams): T[] {
+  const perPage = Math.min(Number(query.get('per_page') ?? 30), PER_PAGE_MAX);
+  const start = (Number(query.get('page') ?? 1) - 1) * perPage;
+  return all.slice(start, start + perPage);
+}
+
+/** Comment indexes of item `n`, limited to those updated at or after `since` if given. */
+function commentIndexes(repo: FakeRepo, n: number, count: number, query: URLSearchParams) {
+  const since = query.get('since') ? Date.parse(query.get('since')!) : undefined;
+  return range(count, (index) => index).filter(
+    (index) => since === undefined || repo.createdAt(n) + (index + 1) * HOUR >= since
+  );
+}
+
+function range<T>(count: number, make: (index: number) => T): T[] {
+  return Array.from({ length: count }, (_, index) => make(index));
+}
+
+function graphqlComments(repo: FakeRepo, base: string, n: number, after: string | null) {
+  const start = after ? Number(Buffer.from(after, 'base64').toString()) : 0;
+  const total = repo.commentCount(n);
+  const end = Math.min(start + PER_PAGE_MAX, total);
+  return {
+    pageInfo: {
+      hasNextPage: end < total,
+      endCursor: end > start ? Buffer.from(String(end)).toString('base64') : null,
+    },
+    nodes: range(end - start, (i) => {
+      const comment = commentJson(repo, base, n, start + i);
+      return {
+        databaseId: comment.id,
+        body: comment.body,
+        createdAt: comment.created_at,
+        updatedAt: comment.updated_at,
+        url: comment.html_url,
+        author: { login: comment.user.login, url: comment.user.html_url },
+      };
+    }),
+  };
+}
+
+function graphqlRelationship(repo: FakeRepo, n: number) {
+  const parent = repo.parentOf(n);
+  return {
+    parent: parent === null ? null : { number: parent },
+    subIssues: { nodes: repo.childrenOf(n).map((number) => ({ number })) },
+  };
+}
+
+/**
+ * Answers the three query shapes the action sends: the paginated issues connection,
+ * aliased `issue_N: issue(number: N)` relationship lookups and aliased
+ * `c_N: node(id: ...)` comment follow-ups. Returns the endpoint name the action uses
+ * for the query, the data and the number of nodes it contains, from which the query
+ * cost is derived.
+ */
+function answerGraphQL(
+  repo: FakeRepo,
+  base: string,
+  query: string,
+  variables: Record<string, any>
+): { endpoint: string; data: Record<string, any>; nodes: number } {
+  const withRelationships = query.includes('subIssues');
+
+  if (/issues\(\s*first:/.test(query)) {
+    const since = variables.since ? Date.parse(variables.since) : undefined;
+    const list = (variables.states ? repo.lists.open : repo.lists.all).filter(
+      (n) => !repo.isPR(n) && (since === undefined || repo.updatedAt(n) >= since)
+    );
+    const start = variables.after ? Number(Buffer.from(variables.after, 'base64').toString()) : 0;
+    const end = Math.min(start + Math.min(variables.first, PER_PAGE_MAX), list.length);
+    const nodes = list.slice(start, end).map((n) => {
+      const issue = issueJson(repo, base, n);
+      return {
+        id: `I_${n}`,
+        number: n,
+        title: issue.title,
+        body: issue.body,
+        state: issue.state.toUpperCase(),
+        createdAt: issue.created_at,
+        updatedAt: issue.updated_at,
+        url: issue.html_url,
+        author: issue.user,
+        labels: { nodes: issue.labels },
+        assignees: { nodes: [] },
+        milestone: null,
+        comments: graphqlComments(repo, base, n, null),
+        ...(withRelationships ? graphqlRelationship(repo, n) : {}),
+      };
+    });
+    return {
+      endpoint: 'graphql.issues',
+      data: {
+        repository: {
+          issues: {
+            pageInfo: {
+              hasNextPage: end < list.length,
+              endCursor: Buffer.from(String(end)).toString('base64'),
+            },
+            nodes,
+          },
+        },
+      },
+      nodes: nodes.length,
+    };
+  }
+
+  const relationships = [...query.matchAll(/(issue_\d+): issue\(number: (\d+)\)/g)];
+  if (relationships.length > 0) {
+    const repository: Record<string, unknown> = {};
+    for (const [, alias, number] of relationships) {
+      const n = Number(number);
+      repository[alias] = repo.isIssue(n) ? graphqlRelationship(repo, n) : null;
+    }
+    return { endpoint: 'graphql.relationships', data: { repository }, nodes: relationships.length };
+  }
+
+  const data: Record<string, unknown> = {};
+  const followUps = [
+    ...query.matchAll(/(c_\d+): node\(id: "I_(\d+)"\)[\s\S]*?after: (null|"[^"]*")/g),
+  ];
+  for (const [, alias, number, after] of followUps) {
+    const n = Number(number);
+    data[alias] = { comments: graphqlComments(repo, base, n, JSON.parse(after)) };
+  }
+  return { endpoint: 'graphql.comments', data, nodes: followUps.length };
+}
+
+interface Budget {
+  remaining: number;
+  reset: number;
+}
+
+/**
+ * Starts the fake API on a random local port. Point the action at it with
+ * `GITHUB_API_URL=<url>`; GraphQL requests go to `<url>/graphql`.
+ */
+export async function startFakeGitHub(options: FakeGitHubOptions): Promise<FakeGitHub> {
+  const {
+    owner = 'bench',
+    repo: repoName = 'repo',
+    latencyMs = 0,
+    rateLimit = 5000,
+    rateLimitWindowMs = HOUR,
+    secondaryLimitEvery = 0,
+    secondaryRetryAfter = 1,
+  } = options;
+  const repo = createFakeRepo(options);
+  const base = `https://github.com/${owner}/${repoName}`;
+  const stats: FakeGitHubStats = { requests: 0, endpoints: {}, bytes: 0, rateLimited: 0 };
+  const budgets: Record<'core' | 'graphql', Budget> = {
+    core: { remaining: rateLimit, reset: Date.now() + rateLimitWindowMs },
+    graphql: { remaining: rateLimit, reset: Date.now() + rateLimitWindowMs },
+  };
+
+  const rest = (method: string, pathname: string, query: URLSearchParams) => {
+    const prefix = `/repos/${owner}/${repoName}`;
+    if (method !== 'GET' || !pathname.startsWith(prefix)) {
+      return undefined;
+    }
+    const route = pathname.slice(prefix.length);
+    const state = query.get('state') === 'all' ? 'all' : 'open';
+    let match: RegExpMatchArray | null;
+
+    if (route === '/issues') {
+      const since = query.get('since') ? Date.parse(query.get('since')!) : undefined;
+      const list =
+        since === undefined
+          ? repo.lists[state]
+          : repo.lists[state].filter((n) => repo.updatedAt(n) >= since);
+      return {
+        endpoint: 'issues.listForRepo',
+        body: page(list, query).map((n) => issueJson(repo, base, n)),
+      };
+    }
+    if (route === '/pulls') {
+      const list =
+        query.get('sort') === 'updated'
+          ? repo.prsByUpdated[state]
+          : repo.lists[state === 'all' ? 'prsAll' : 'prsOpen'];
+      return { endpoint: 'pulls.list', body: page(list, query).map((n) => prJson(repo, base, n)) };
+    }
+    if ((match = route.match(/^\/issues\/(\d+)$/))) {
+      const n = Number(match[1]);
+      return n >= 1 && n <= repo.items
+        ? { endpoint: 'issues.get', body: issueJson(repo, base, n) }
+        : { endpoint: 'issues.get', status: 404, body: { message: 'Not Found' } };
+    }
+    if ((match = route.match(/^\/issues\/(\d+)\/comments$/))) {
+      const n = Number(match[1]);
+      const all = commentIndexes(repo, n, repo.commentCount(n), query);
+      return {
+        endpoint: 'issues.listComments',
+        body: page(all, query).map((index) => commentJson(repo, base, n, index)),
+      };
+    }
+    if ((match = route.match(/^\/pulls\/(\d+)$/))) {
+      const n = Number(match[1]);
+      return repo.isPR(n) && n <= repo.items
+        ? { endpoint: 'pulls.get', body: prJson(repo, base, n) }
+        : { endpoint: 'pulls.get', status: 404, body: { message: 'Not Found' } };
+    }
+    if ((match = route.match(/^\/pulls\/(\d+)\/comments$/))) {
+      const n = Number(match[1]);
+      const all = commentIndexes(repo, n, n % 6, query);
+      return {
+        endpoint: 'pulls.listReviewComments',
+        body: page(all, query).map((index) => reviewCommentJson(repo, base, n, index)),
+      };
+    }
+    if ((match = route.match(/^\/pulls\/(\d+)\/commits$/))) {
+      const n = Number(match[1]);
+      const all = range(repo.commitCount(n), (index) => index);
+      return {
+        endpoint: 'pulls.listCommits',
+        body: page(all, query).map((index) => commitJson(repo, base, n, index)),
+      };
+    }
+    if ((match = route.match(/^\/commits\/([0-9a-f]{40})$/))) {
+      const value = parseInt(match[1], 16);
+      const n = Math.floor(value / 1000);
+      return {
+        endpoint: 'repos.getCommit',
+        body: {
+          ...commitJson(repo, base, n, value % 1000),
+          stats: { total: 12, additions: 10, deletions: 2 },
+          files: [{ filename: `src/file-${value % 3}.ts` }],
+        },
+      };
+    }
+    return undefined;
+  };
+
+  const handle = async (request: http.IncomingMessage, response: http.ServerResponse) => {
+    const url = new URL(request.url ?? '/', 'http://localhost');
+    const chunks: Buffer[] = [];
+    for await (const chunk of request) {
+      chunks.push(chunk as Buffer);
+    }
+    stats.requests++;
+
+    let endpoint: string;
+    let status = 200;
+    let body: unknown;
+    let resource: 'core' | 'graphql' = 'core';
+    let cost = 1;
+
+    if (request.method === 'POST' && url.pathname === '/graphql') {
+      resource = 'graphql';
+      const { query, variables = {} } = JSON.parse(Buffer.concat(chunks).toString() || '{}');
+      const answer = answerGraphQL(repo, base, String(query), variables);
+      endpoint = answer.endpoint;
+      cost = Math.max(1, Math.ceil(answer.nodes / 10));
+      body = { data: answer.data };
+    } else {
+      const answer = rest(request.method ?? 'GET', url.pathname, url.searchParams);
+      endpoint = answer?.endpoint ?? 'unknown';
+      status = answer?.status ?? (answer ? 200 : 404);
+      body = answer?.body ?? { message: 'Not Found' };
+    }
+    stats.endpoints[endpoint] = (stats.endpoints[endpoint] ?? 0) + 1;
+
+    const budget = budgets[resource];
+    const now = Date.now();
+    if (now >= budget.reset) {
+      budget.remaining = rateLimit;
+      budget.reset = now + rateLimitWindowMs;
+    }
+    const headers: Record<string, string> = {
+      'content-type': 'application/json; charset=utf-8',
+      'x-ratelimit-limit': String(rateLimit),
+      'x-ratelimit-resource': resource,
+      'x-ratelimit-reset': String(Math.ceil(budget.reset / 1000)),
+    };
+
+    if (secondaryLimitEvery > 0 && stats.requests % secondaryLimitEvery === 0) {
+      stats.rateLimited++;
+      status = 403;
+      headers['retry-after'] = String(secondaryRetryAfter);
+      body = { message: 'You have exceeded a secondary rate limit.' };
+    } else if (budget.remaining < cost) {
+      stats.rateLimited++;
+      status = resource === 'core' ? 403 : 200;
+      body =
+        resource === 'core'
+          ? { message: 'API rate limit exceeded' }
+          : { errors: [{ type: 'RATE_LIMITED', message: 'API rate limit exceeded' }] };
+    } else {
+      budget.remaining -= cost;
+      if (resource === 'graphql') {
+        const data = (body as { data: Record<string, unknown> }).data;
+        data.rateLimit = {
+          limit: rateLimit,
+          cost,
+          remaining: budget.remaining,
+          resetAt: iso(budget.reset),
+        };
+      }
+    }
+    headers['x-ratelimit-remaining'] = String(budget.remaining);
+    headers['x-ratelimit-used'] = String(rateLimit - budget.remaining);
+
+    const payload = JSON.stringify(body);
+    headers['content-length'] = String(Buffer.byteLength(payload));
+    stats.bytes += Buffer.byteLength(payload);
+
+    if (latencyMs > 0) {
+      await new Promise((resolve) => setTimeout(resolve, latencyMs));
+    }
+    response.writeHead(status, headers);
+    response.end(payload);
+  };
+
+  const server = http.createServer((request, response) => {
+    handle(request, response).catch((error) => {
+      response.writeHead(500, { 'content-type': 'application/json' });
+      response.end(JSON.stringify({ message: String(error) }));
+    });
+  });
+  await new Promise<void>((resolve) => server.listen(0, '127.0.0.1', resolve));
+  const { port } = server.address() as AddressInfo;
+
+  return {
+    url: `http://127.0.0.1:${port}`,
+    stats,
+    close: () =>
+      new Promise<void>((resolve, reject) =>
+        server.close((error) => (error ? reject(error) : resolve()))
+      ),
+  };
+}
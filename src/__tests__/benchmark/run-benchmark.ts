@@ -0,0 +1,267 @@
+/**
+ * End-to-end benchmark of the action against a local fake GitHub API.
+ *
+ * Each scenario starts the fake API seeded with a synthetic repository, runs the action
+ * from source in a child process pointed at it, and records wall time, API requests
+ * (as counted by the server), bytes served and peak RSS. Results can be saved as a JSON
+ * baseline and compared against a previous baseline to flag regressions.
+ *
+ * Usage:
+ *   # Run the 1k and 10k scenarios and save a baseline
+ *   npm run bench -- --output baseline.json
+ *
+ *   # Compare against it (exit code 1 on regression)
+ *   npm run bench -- --compare baseline.json
+ *
+ *   # 50k items with 20ms latency, a secondary rate limit every 500 requests and
+ *   # the GraphQL issue sync
+ *   npm run bench -- --size 50k --latency 20 --secondary-every 500 --input graphql-issues=true
+ *
+ * No baseline is checked in: wall time and peak RSS depend on the machine, so a baseline
+ * is only meaningful when recorded on the machine (or runner type) that compares against
+ * it. Record one from the base branch first, then run `--compare` on the change.
+ */
+
+import { spawn } from 'child_process';
+import * as fs from 'fs';
+import * as os from 'os';
+import * as path from 'path';
+import { startFakeGitHub, FakeGitHubOptions } from './fake-github';
+
+/** Synthetic repository sizes, as the total number of issues and pull requests. */
+export const SIZES: Record<string, number> = {
+  '1k': 1_000,
+  '10k': 10_000,
+  '50k': 50_000,
+};
+
+export interface BenchmarkResult {
+  seconds: number;
+  requests: number;
+  endpoints: Record<string, number>;
+  bytes: number;
+  rate_limited: number;
+  peak_rss_kib: number;
+}
+
+export interface BenchmarkOptions {
+  latencyMs?: number;
+  rateLimit?: number;
+  rateLimitWindowMs?: number;
+  secondaryLimitEvery?: number;
+  /** Action inputs, e.g. `{ 'max-concurrency': '8' }`. */
+  inputs?: Record<string, string>;
+}
+
+/** Inputs every scenario runs with; `--input` overrides them. */
+export const DEFAULT_INPUTS: Record<string, string> = {
+  'include-closed': 'true',
+  'job-summary': 'false',
+};
+
+function runAction(env: NodeJS.ProcessEnv): Promise<number> {
+  const entry = path.join(__dirname, 'action-entry.ts');
+  return new Promise((resolve, reject) => {
+    const child = spawn(process.execPath, ['--import', 'tsx', entry], {
+      env,
+      stdio: ['ignore', 'ignore', 'inherit'],
+    });
+    child.on('error', reject);
+    child.on('exit', (code) => resolve(code ?? 1));
+  });
+}
+
+/** Runs the action once against a fresh fake API with `items` issues and PRs. */
+export async function runScenario(
+  items: number,
+  options: BenchmarkOptions = {}
+): Promise<BenchmarkResult> {
+  const serverOptions: FakeGitHubOptions = {
+    items,
+    latencyMs: options.latencyMs,
+    rateLimit: options.rateLimit,
+    rateLimitWindowMs: options.rateLimitWindowMs,
+    secondaryLimitEvery: options.secondaryLimitEvery,
+  };
+  const server = await startFakeGitHub(serverOptions);
+  const workdir = fs.mkdtempSync(path.join(os.tmpdir(), 'bench-sync-'));
+  try {
+    const inputs: Record<string, string> = {
+      ...DEFAULT_INPUTS,
+      token: 'bench-token',
+      'output-dir': path.join(workdir, 'synced'),
+      ...options.inputs,
+    };
+    const env: NodeJS.ProcessEnv = {
+      PATH: process.env.PATH,
+      GITHUB_API_URL: server.url,
+      GITHUB_REPOSITORY: 'bench/repo',
+      GITHUB_OUTPUT: path.join(workdir, 'outputs'),
+      BENCH_RESULT_FILE: path.join(workdir, 'result.json'),
+    };
+    for (const [name, value] of Object.entries(inputs)) {
+      env[`INPUT_${name.replace(/ /g, '_').toUpperCase()}`] = value;
+    }
+
+    const start = process.hrtime.bigint();
+    const code = await runAction(env);
+    const seconds = Number(process.hrtime.bigint() - start) / 1e9;
+    if (code !== 0) {
+      throw new Error(`Action exited with code ${code} on ${items} item(s)`);
+    }
+
+    const { peak_rss_kib } = JSON.parse(fs.readFileSync(env.BENCH_RESULT_FILE!, 'utf-8'));
+    return {
+      seconds,
+      requests: server.stats.requests,
+      endpoints: { ...server.stats.endpoints },
+      bytes: server.stats.bytes,
+      rate_limited: server.stats.rateLimited,
+      peak_rss_kib,
+    };
+  } finally {
+    await server.close();
+    fs.rmSync(workdir, { recursive: true, force: true });
+  }
+}
+
+/**
+ * Compares two result sets. A scenario regresses when its time, request count or peak
+ * memory grows by more than `threshold` times the baseline value. Timings below
+ * `minSeconds` are too noisy to compare and never count as regressions.
+ *
+ * Returns a list of [scenario, metric, baselineValue, currentValue] regressions.
+ */
+export function compare(
+  baseline: Record<string, Partial<BenchmarkResult>>,
+  current: Record<string, Partial<BenchmarkResult>>,
+  threshold = 1.5,
+  minSeconds = 0.5
+): Array<[string, string, number, number]> {
+  const regressions: Array<[string, string, number, number]> = [];
+  for (const [name, now] of Object.entries(current)) {
+    const before = baseline[name];
+    if (!before) {
+      continue;
+    }
+    for (const metric of ['seconds', 'requests', 'peak_rss_kib'] as const) {
+      const beforeValue = before[metric];
+      const nowValue = now[metric];
+      if (beforeValue === undefined || nowValue === undefined) {
+        continue;
+      }
+      if (metric === 'seconds' && nowValue < minSeconds) {
+        continue;
+      }
+      if (beforeValue && nowValue > beforeValue * threshold) {
+        regressions.push([name, metric, beforeValue, nowValue]);
+      }
+    }
+  }
+  return regressions;
+}
+
+function printResults(results: Record<string, BenchmarkResult>): void {
+  const width = Math.max(8, ...Object.keys(results).map((name) => name.length));
+  console.log(
+    `${'scenario'.padEnd(width)}  ${'time (s)'.padStart(9)}  ${'requests'.padStart(9)}  ` +
+      `${'MiB served'.padStart(10)}  ${'limited'.padStart(7)}  ${'peak RSS (MiB)'.padStart(14)}`
+  );
+  for (const [name, result] of Object.entries(results)) {
+    console.log(
+      `${name.padEnd(width)}  ${result.seconds.toFixed(2).padStart(9)}  ` +
+        `${String(result.requests).padStart(9)}  ` +
+        `${(result.bytes / 1024 / 1024).toFixed(1).padStart(10)}  ` +
+        `${String(result.rate_limited).padStart(7)}  ` +
+        `${(result.peak_rss_kib / 1024).toFixed(0).padStart(14)}`
+    );
+  }
+}
+
+/** Minimal `--flag value` parser; repeatable flags collect into arrays. */
+export function parseArgs(argv: string[]): Record<string, string[]> {
+  const args: Record<string, string[]> = {};
+  for (let i = 0; i < argv.length; i++) {
+    const flag = argv[i];
+    if (!flag.startsWith('--')) {
+      throw new Error(`Unexpected argument "${flag}"`);
+    }
+    const value = argv[i + 1];
+    if (value === undefined || value.startsWith('--')) {
+      throw new Error(`Missing value for ${flag}`);
+    }
+    (args[flag.slice(2)] ??= []).push(value);
+    i++;
+  }
+  return args;
+}
+
+async function main(): Promise<void> {
+  const args = parseArgs(process.argv.slice(2));
+  const last = (name: string) => args[name]?.[args[name].length - 1];
+  const sizes = args.size ?? ['1k', '10k'];
+  const inputs = Object.fromEntries(
+    (args.input ?? []).map((pair) => {
+      const separator = pair.indexOf('=');
+      if (separator < 1) {
+        throw new Error(`Invalid --input "${pair}". Expected name=value.`);
+      }
+      return [pair.slice(0, separator), pair.slice(separator + 1)];
+    })
+  );
+  const options: BenchmarkOptions = {
+    latencyMs: Number(last('latency') ?? 5),
+    rateLimit: last('rate-limit') ? Number(last('rate-limit')) : undefined,
+    rateLimitWindowMs: last('rate-limit-window') ? Number(last('rate-limit-window')) : undefined,
+    secondaryLimitEvery: Number(last('secondary-every') ?? 0),
+    inputs,
+  };
+
+  const results: Record<string, BenchmarkResult> = {};
+  for (const size of sizes) {
+    const items = SIZES[size] ?? Number(size);
+    if (!Number.isInteger(items) || items <= 0) {
+      throw new Error(`Unknown size "${size}". Use ${Object.keys(SIZES).join(', ')} or a count.`);
+    }
+    console.error(`Running ${size} (${items} items)...`);
+    results[size] = await runScenario(items, options);
+  }
+  printResults(results);
+
+  const output = last('output');
+  if (output) {
+    const report = {
+      node: process.version,
+      platform: `${os.platform()}-${os.arch()}`,
+      options: { ...options, inputs: { ...DEFAULT_INPUTS, ...inputs } },
+      results,
+    };
+    fs.writeFileSync(output, JSON.stringify(report, null, 2) + '\n');
+    console.log(`✓ Wrote results to ${output}`);
+  }
+
+  const baselineFile = last('compare');
+  if (baselineFile) {
+    const baseline = JSON.parse(fs.readFileSync(baselineFile, 'utf-8'));
+    const regressions = compare(
+      baseline.results,
+      results,
+      Number(last('threshold') ?? 1.5),
+      Number(last('min-seconds') ?? 0.5)
+    );
+    for (const [name, metric, before, now] of regressions) {
+      console.error(`✗ ${name}: ${metric} ${before} → ${now} (${(now / before).toFixed(2)}x)`);
+    }
+    if (regressions.length > 0) {
+      process.exit(1);
+    }
+    console.log(`✓ No regressions against ${baselineFile}`);
+  }
+}
+
+if (require.main === module) {
+  main().catch((error) => {
+    console.error(error instanceof Error ? error.message : error);
+    process.exit(1);
+  });
+}
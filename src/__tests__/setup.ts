@@ -9,6 +9,9 @@ if (!originalFs.promises) {
     mkdir: jest.fn(),
     readFile: jest.fn(),
     access: jest.fn(),
+    readdir: jest.fn(),
+    rename: jest.fn(),
+    rm: jest.fn(),
   };
 }
 
@@ -120,6 +123,9 @@ jest.mock('fs', () => {
       mkdir: jest.fn(),
       readFile: jest.fn(),
       access: jest.fn(),
+      readdir: jest.fn(),
+      rename: jest.fn(),
+      rm: jest.fn(),
     },
   };
 });
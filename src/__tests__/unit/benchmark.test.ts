@@ -0,0 +1,162 @@
+// Tests for the offline benchmark harness in src/__tests__/benchmark
+import { createFakeRepo, startFakeGitHub, FakeGitHub } from '../benchmark/fake-github';
+import { compare, parseArgs } from '../benchmark/run-benchmark';
+
+describe('Benchmark harness', () => {
+  describe('createFakeRepo', () => {
+    it('should be deterministic for a seed', () => {
+      const a = createFakeRepo({ items: 200, seed: 3 });
+      const b = createFakeRepo({ items: 200, seed: 3 });
+
+      expect(a.lists).toEqual(b.lists);
+      expect(a.words(7, 1, 5)).toBe(b.words(7, 1, 5));
+      expect(a.commentCount(42)).toBe(b.commentCount(42));
+    });
+
+    it('should list items newest first with every fourth one a pull request', () => {
+      const repo = createFakeRepo({ items: 100 });
+
+      expect(repo.lists.all.slice(0, 3)).toEqual([100, 99, 98]);
+      expect(repo.lists.prsAll.every((n) => n % 4 === 0)).toBe(true);
+      expect(repo.lists.prsAll).toHaveLength(25);
+      expect(repo.lists.open.every((n) => !repo.isClosed(n))).toBe(true);
+    });
+
+    it('should link sub-issues to their parent in both directions', () => {
+      const repo = createFakeRepo({ items: 100 });
+
+      expect(repo.parentOf(7)).toBe(6);
+      expect(repo.childrenOf(6)).toEqual([7]);
+      // 28 is a pull request, so it cannot be a sub-issue
+      expect(repo.parentOf(28)).toBeNull();
+    });
+  });
+
+  describe('startFakeGitHub', () => {
+    let server: FakeGitHub | undefined;
+
+    afterEach(async () => {
+      await server?.close();
+      server = undefined;
+    });
+
+    const get = async (path: string) => {
+      const response = await fetch(`${server!.url}${path}`);
+      return { status: response.status, headers: response.headers, body: await response.json() };
+    };
+
+    it('should paginate the issue listing and count requests per endpoint', async () => {
+      server = await startFakeGitHub({ items: 250 });
+
+      const first = await get('/repos/bench/repo/issues?state=all&per_page=100&page=1');
+      const last = await get('/repos/bench/repo/issues?state=all&per_page=100&page=3');
+
+      expect(first.body).toHaveLength(100);
+      expect(first.body[0].number).toBe(250);
+      const prs = first.body.filter((item: { pull_request?: unknown }) => item.pull_request);
+      expect(prs).toHaveLength(25);
+      expect(last.body).toHaveLength(50);
+      expect(first.headers.get('x-ratelimit-remaining')).toBe('4999');
+      expect(server.stats.endpoints['issues.listForRepo']).toBe(2);
+      expect(server.stats.requests).toBe(2);
+    });
+
+    it('should only return comments updated since the given time', async () => {
+      const repo = createFakeRepo({ items: 20 });
+      const n = repo.lists.all.find((number) => repo.commentCount(number) >= 2)!;
+      server = await startFakeGitHub({ items: 20 });
+      const all = await get(`/repos/bench/repo/issues/${n}/comments?per_page=100`);
+      const since = all.body[1].updated_at;
+
+      const recent = await get(`/repos/bench/repo/issues/${n}/comments?since=${since}`);
+
+      expect(recent.body).toEqual(all.body.slice(1));
+    });
+
+    it('should answer the GraphQL relationship and issue queries', async () => {
+      server = await startFakeGitHub({ items: 20 });
+      const post = async (query: string, variables: Record<string, unknown> = {}) => {
+        const response = await fetch(`${server!.url}/graphql`, {
+          method: 'POST',
+          body: JSON.stringify({ query, variables }),
+        });
+        return (await response.json()).data;
+      };
+
+      const relationships = await post(
+        'query { repository { issue_6: issue(number: 6) { ' +
+          'parent { number } subIssues { nodes { number } } } } }'
+      );
+      const issues = await post(
+        'query { repository { issues(\n first: $first after: $after) { nodes { id } } } }',
+        { first: 5, after: null, states: null }
+      );
+
+      expect(relationships.repository.issue_6).toEqual({
+        parent: null,
+        subIssues: { nodes: [{ number: 7 }] },
+      });
+      expect(issues.repository.issues.nodes.map((node: { number: number }) => node.number)).toEqual(
+        [19, 18, 17, 15, 14]
+      );
+      expect(issues.repository.issues.pageInfo.hasNextPage).toBe(true);
+      expect(issues.rateLimit.remaining).toBeLessThan(5000);
+    });
+
+    it('should inject primary and secondary rate limits', async () => {
+      server = await startFakeGitHub({ items: 10, rateLimit: 2, secondaryLimitEvery: 4 });
+
+      const statuses: Array<[number, string | null, string | null]> = [];
+      for (let i = 0; i < 4; i++) {
+        const { status, headers } = await get('/repos/bench/repo/issues/1');
+        statuses.push([status, headers.get('x-ratelimit-remaining'), headers.get('retry-after')]);
+      }
+
+      expect(statuses).toEqual([
+        [200, '1', null],
+        [200, '0', null],
+        [403, '0', null],
+        [403, '0', '1'],
+      ]);
+      expect(server.stats.rateLimited).toBe(2);
+    });
+  });
+
+  describe('compare', () => {
+    const baseline = { '10k': { seconds: 10, requests: 1000, peak_rss_kib: 100_000 } };
+
+    it('should flag slowdowns, extra requests and memory growth', () => {
+      const current = { '10k': { seconds: 20, requests: 2000, peak_rss_kib: 400_000 } };
+
+      expect(compare(baseline, current)).toEqual([
+        ['10k', 'seconds', 10, 20],
+        ['10k', 'requests', 1000, 2000],
+        ['10k', 'peak_rss_kib', 100_000, 400_000],
+      ]);
+    });
+
+    it('should ignore noise, small changes and new scenarios', () => {
+      const current = {
+        '10k': { seconds: 12, requests: 1100, peak_rss_kib: 120_000 },
+        '50k': { seconds: 60, requests: 5000, peak_rss_kib: 500_000 },
+      };
+      const fast = { '1k': { seconds: 0.1, requests: 10, peak_rss_kib: 1 } };
+
+      expect(compare(baseline, current)).toEqual([]);
+      expect(compare(fast, { '1k': { seconds: 0.4, requests: 10, peak_rss_kib: 1 } })).toEqual([]);
+    });
+  });
+
+  describe('parseArgs', () => {
+    it('should collect repeated flags', () => {
+      expect(parseArgs(['--size', '1k', '--size', '10k', '--input', 'max-concurrency=8'])).toEqual({
+        size: ['1k', '10k'],
+        input: ['max-concurrency=8'],
+      });
+    });
+
+    it('should reject flags without a value', () => {
+      expect(() => parseArgs(['--output'])).toThrow('Missing value for --output');
+    });
+  });
+});
@@ -11,6 +11,21 @@ import {
   shiftHeadersToMinLevel,
   fetchIssueRelationships,
   GRAPHQL_BATCH_SIZE,
+  GRAPHQL_MAX_BATCH_SIZE,
+  createBatchSizer,
+  createLimiter,
+  createRequestScheduler,
+  createSyncMetrics,
+  createMarkdownWriter,
+  fetchCommentsSince,
+  mergeComments,
+  isRateLimitError,
+  fetchIssuesWithGraphQL,
+  IssueWithComments,
+  loadCommitCache,
+  createManifestEntry,
+  manifestEntryMatches,
+  mapInOrder,
   run,
 } from '../../index';
 
@@ -1150,6 +1165,270 @@ describe('Sync Issues Action', () => {
       );
       expect(core.warning).not.toHaveBeenCalled();
     });
+    it('should retry with a smaller batch when a query exceeds GraphQL limits', async () => {
+      const issues = Array.from({ length: GRAPHQL_BATCH_SIZE }, (_, i) => i + 1);
+      mockOctokit.graphql.mockReset();
+      mockOctokit.graphql
+        .mockRejectedValueOnce(new Error('MAX_NODE_LIMIT_EXCEEDED'))
+        .mockImplementation(async (query: string) => {
+          const repository: Record<string, any> = {};
+          for (const match of query.matchAll(/issue_(\d+):/g)) {
+            repository[`issue_${match[1]}`] = { parent: null, subIssues: { nodes: [] } };
+          }
+          return { repository };
+        });
+
+      const result = await fetchIssueRelationships(mockOctokit, 'owner', 'repo', issues);
+
+      expect(result.size).toBe(GRAPHQL_BATCH_SIZE);
+      expect(mockOctokit.graphql).toHaveBeenCalledTimes(3);
+      expect(core.warning).not.toHaveBeenCalled();
+      mockOctokit.graphql.mockReset();
+    });
+  });
+
+  describe('createBatchSizer', () => {
+    it('should grow towards the target cost but at most twofold per query', () => {
+      const sizer = createBatchSizer(10, 10);
+
+      sizer.record(1, 10);
+      expect(sizer.size).toBe(20);
+      sizer.record(1, 20);
+      expect(sizer.size).toBe(40);
+      sizer.record(1, 40);
+      expect(sizer.size).toBe(80);
+    });
+
+    it('should shrink when a query costs more than the target', () => {
+      const sizer = createBatchSizer(50, 10);
+
+      sizer.record(25, 50);
+
+      expect(sizer.size).toBe(20);
+    });
+
+    it('should ignore queries without a reported cost', () => {
+      const sizer = createBatchSizer();
+
+      sizer.record(undefined, GRAPHQL_BATCH_SIZE);
+
+      expect(sizer.size).toBe(GRAPHQL_BATCH_SIZE);
+    });
+
+    it('should never exceed the maximum batch size', () => {
+      const sizer = createBatchSizer(GRAPHQL_MAX_BATCH_SIZE * 2);
+      expect(sizer.size).toBe(GRAPHQL_MAX_BATCH_SIZE);
+
+      sizer.record(1, GRAPHQL_MAX_BATCH_SIZE);
+      expect(sizer.size).toBe(GRAPHQL_MAX_BATCH_SIZE);
+    });
+
+    it('should halve on shrink and report when it cannot shrink further', () => {
+      const sizer = createBatchSizer(3);
+
+      expect(sizer.shrink()).toBe(true);
+      expect(sizer.size).toBe(1);
+      expect(sizer.shrink()).toBe(false);
+      expect(sizer.size).toBe(1);
+    });
+  });
+
+  describe('fetchIssuesWithGraphQL', () => {
+    const mockOctokit = github.getOctokit('fake-token') as any;
+
+    const commentNode = (id: number) => ({
+      databaseId: id,
+      body: `Comment ${id}`,
+      createdAt: '2024-01-03T00:00:00Z',
+      updatedAt: '2024-01-03T00:00:00Z',
+      url: `https://example.com/issue/1#issuecomment-${id}`,
+      author: { login: 'commenter', url: 'https://github.com/commenter' },
+    });
+
+    const issueNode = (number: number, overrides: Record<string, unknown> = {}) => ({
+      id: `I_${number}`,
+      number,
+      title: `Issue ${number}`,
+      body: 'Body',
+      state: 'OPEN',
+      createdAt: '2024-01-01T00:00:00Z',
+      updatedAt: '2024-01-02T00:00:00Z',
+      url: `https://example.com/issue/${number}`,
+      author: { login: 'user1' },
+      labels: { nodes: [{ name: 'bug' }] },
+      assignees: { nodes: [] },
+      milestone: null,
+      comments: { pageInfo: { hasNextPage: false, endCursor: null }, nodes: [] },
+      parent: null,
+      subIssues: { nodes: [] },
+      ...overrides,
+    });
+
+    const collectPages = async (includeClosed: boolean) => {
+      const pages: IssueWithComments[][] = [];
+      const issues = fetchIssuesWithGraphQL(mockOctokit, 'owner', 'repo', includeClosed);
+      for await (const page of issues) {
+        pages.push(page);
+      }
+      return pages;
+    };
+    const fetchAll = async (includeClosed: boolean) => (await collectPages(includeClosed)).flat();
+
+    beforeEach(() => {
+      jest.clearAllMocks();
+      mockOctokit.graphql.mockReset();
+    });
+
+    it('should map issues, comments and relationships from one query per page', async () => {
+      mockOctokit.graphql
+        .mockResolvedValueOnce({
+          rateLimit: { cost: 1 },
+          repository: {
+            issues: {
+              pageInfo: { hasNextPage: true, endCursor: 'page1' },
+              nodes: [
+                issueNode(1, {
+                  comments: {
+                    pageInfo: { hasNextPage: false, endCursor: null },
+                    nodes: [commentNode(100)],
+                  },
+                  parent: { number: 9 },
+                }),
+              ],
+            },
+          },
+        })
+        .mockResolvedValueOnce({
+          rateLimit: { cost: 1 },
+          repository: {
+            issues: {
+              pageInfo: { hasNextPage: false, endCursor: 'page2' },
+              nodes: [issueNode(2, { state: 'CLOSED', subIssues: { nodes: [{ number: 3 }] } })],
+            },
+          },
+        });
+
+      const result = await fetchAll(true);
+
+      expect(mockOctokit.graphql).toHaveBeenCalledTimes(2);
+      expect(mockOctokit.graphql).toHaveBeenLastCalledWith(
+        expect.stringContaining('subIssues'),
+        expect.objectContaining({ after: 'page1', states: null, since: null })
+      );
+      expect(result.map(({ issue }) => issue.number)).toEqual([1, 2]);
+      expect(result[0].issue).toEqual(
+        expect.objectContaining({
+          state: 'open',
+          labels: [{ name: 'bug' }],
+          user: { login: 'user1' },
+          html_url: 'https://example.com/issue/1',
+        })
+      );
+      expect(result[0].comments).toEqual([
+        expect.objectContaining({ id: 100, body: 'Comment 100', user: expect.any(Object) }),
+      ]);
+      expect(result[0].relationship).toEqual({ parent: 9, children: [] });
+      expect(result[1].issue.state).toBe('closed');
+      expect(result[1].relationship).toEqual({ parent: null, children: [3] });
+    });
+
+    it('should yield each page as soon as it is complete', async () => {
+      const page = (number: number, hasNextPage: boolean) => ({
+        repository: {
+          issues: {
+            pageInfo: { hasNextPage, endCursor: `after-${number}` },
+            nodes: [issueNode(number)],
+          },
+        },
+      });
+      let releaseLast: (value: unknown) => void = () => undefined;
+      mockOctokit.graphql
+        .mockResolvedValueOnce(page(1, true))
+        .mockReturnValueOnce(new Promise((resolve) => (releaseLast = resolve)));
+
+      const pages = fetchIssuesWithGraphQL(mockOctokit, 'owner', 'repo', false);
+      const first = await pages.next();
+
+      // The second query is in flight while the first page is handled
+      expect(first.value.map(({ issue }: IssueWithComments) => issue.number)).toEqual([1]);
+      expect(mockOctokit.graphql).toHaveBeenCalledTimes(2);
+
+      releaseLast(page(2, false));
+      const second = await pages.next();
+      expect(second.value.map(({ issue }: IssueWithComments) => issue.number)).toEqual([2]);
+      expect((await pages.next()).done).toBe(true);
+    });
+
+    it('should follow comment cursors in aliased batches', async () => {
+      const firstPage = Array.from({ length: 100 }, (_, i) => commentNode(i + 1));
+      mockOctokit.graphql
+        .mockResolvedValueOnce({
+          repository: {
+            issues: {
+              pageInfo: { hasNextPage: false, endCursor: null },
+              nodes: [
+                issueNode(1, {
+                  comments: { pageInfo: { hasNextPage: true, endCursor: 'c1' }, nodes: firstPage },
+                }),
+                issueNode(2),
+              ],
+            },
+          },
+        })
+        .mockResolvedValueOnce({
+          c_0: {
+            comments: {
+              pageInfo: { hasNextPage: false, endCursor: null },
+              nodes: [commentNode(101)],
+            },
+          },
+        });
+
+      const result = await fetchAll(false);
+
+      expect(mockOctokit.graphql).toHaveBeenCalledTimes(2);
+      const followUp = mockOctokit.graphql.mock.calls[1][0] as string;
+      expect(followUp).toContain('c_0: node(id: "I_1")');
+      expect(followUp).toContain('after: "c1"');
+      expect(result[0].comments).toHaveLength(101);
+      expect(result[1].comments).toHaveLength(0);
+    });
+
+    it('should skip relationships when the sub-issues API is unavailable', async () => {
+      mockOctokit.graphql
+        .mockRejectedValueOnce(new Error("Field 'parent' doesn't exist on type 'Issue'"))
+        .mockResolvedValueOnce({
+          repository: {
+            issues: {
+              pageInfo: { hasNextPage: false, endCursor: null },
+              nodes: [issueNode(1)],
+            },
+          },
+        });
+
+      const result = await fetchAll(false);
+
+      expect(mockOctokit.graphql.mock.calls[1][0]).not.toContain('subIssues');
+      expect(result[0].relationship).toBeUndefined();
+      expect(core.info).toHaveBeenCalledWith(
+        'Sub-issues API is not available for this repository. Skipping relationship sync.'
+      );
+    });
+
+    it('should shrink the page size after a GraphQL timeout', async () => {
+      mockOctokit.graphql
+        .mockRejectedValueOnce(Object.assign(new Error('Bad Gateway'), { status: 502 }))
+        .mockResolvedValueOnce({
+          repository: {
+            issues: { pageInfo: { hasNextPage: false, endCursor: null }, nodes: [] },
+          },
+        });
+
+      await fetchAll(false);
+
+      expect(mockOctokit.graphql.mock.calls[0][1].first).toBe(GRAPHQL_BATCH_SIZE);
+      expect(mockOctokit.graphql.mock.calls[1][1].first).toBe(GRAPHQL_BATCH_SIZE / 2);
+    });
   });
 
   describe('shiftHeadersToMinLevel', () => {
@@ -1191,88 +1470,1078 @@ describe('Sync Issues Action', () => {
     });
   });
 
-  describe('Input Parameters', () => {
-    const mockGetInput = core.getInput as jest.MockedFunction<typeof core.getInput>;
-    const mockGetOctokit = github.getOctokit as jest.MockedFunction<typeof github.getOctokit>;
-    type MockOctokit = ReturnType<typeof github.getOctokit>;
-    const setMockOctokit = (mock: unknown) => mockGetOctokit.mockReturnValue(mock as MockOctokit);
+  describe('createLimiter', () => {
+    it('should never run more tasks than its concurrency at once', async () => {
+      const limit = createLimiter(3);
+      let active = 0;
+      let peak = 0;
+      const task = async (value: number) => {
+        active++;
+        peak = Math.max(peak, active);
+        await new Promise((resolve) => setTimeout(resolve, 1 + (value % 3)));
+        active--;
+        return value * 2;
+      };
+
+      const results = await Promise.all(
+        Array.from({ length: 20 }, (_, i) => limit(() => task(i)))
+      );
+
+      expect(limit.concurrency).toBe(3);
+      expect(peak).toBe(3);
+      expect(results).toEqual(Array.from({ length: 20 }, (_, i) => i * 2));
+    });
+
+    it('should release the slot when a task rejects', async () => {
+      const limit = createLimiter(1);
+
+      await expect(limit(() => Promise.reject(new Error('boom')))).rejects.toThrow('boom');
+      await expect(limit(() => Promise.resolve('ok'))).resolves.toBe('ok');
+    });
+  });
+
+  describe('createRequestScheduler', () => {
+    let clock: number;
+    let sleeps: number[];
+    const options = () => ({
+      now: () => clock,
+      sleep: async (ms: number) => {
+        sleeps.push(ms);
+        clock += ms;
+      },
+    });
+    const rateLimited = (status: number, headers: Record<string, string>, message = '') =>
+      Object.assign(new Error(message || `HTTP ${status}`), { status, response: { headers } });
+
+    beforeEach(() => {
+      clock = 1_700_000_000_000;
+      sleeps = [];
+    });
+
+    it('should retry after retry-after on a secondary rate limit', async () => {
+      const scheduler = createRequestScheduler(2, options());
+      const task = jest
+        .fn()
+        .mockRejectedValueOnce(rateLimited(403, { 'retry-after': '3' }))
+        .mockResolvedValueOnce({ data: 'ok' });
+
+      await expect(scheduler(task)).resolves.toEqual({ data: 'ok' });
+
+      expect(task).toHaveBeenCalledTimes(2);
+      expect(sleeps).toEqual([3000]);
+      expect(scheduler.throttledMs()).toBe(3000);
+    });
+
+    it('should wait for the reset when the primary rate limit is exhausted', async () => {
+      const scheduler = createRequestScheduler(1, options());
+      const reset = Math.floor(clock / 1000) + 60;
+      const task = jest
+        .fn()
+        .mockRejectedValueOnce(
+          rateLimited(429, { 'x-ratelimit-remaining': '0', 'x-ratelimit-reset': String(reset) })
+        )
+        .mockResolvedValueOnce({ data: [] });
+
+      await scheduler(task);
+
+      expect(sleeps).toEqual([reset * 1000 - 1_700_000_000_000 + 1000]);
+    });
+
+    it('should rethrow errors that are not rate limits without retrying', async () => {
+      const scheduler = createRequestScheduler(1, options());
+      const task = jest.fn().mockRejectedValue(rateLimited(403, {}, 'Resource not accessible'));
+
+      await expect(scheduler(task)).rejects.toThrow('Resource not accessible');
+      expect(task).toHaveBeenCalledTimes(1);
+      expect(sleeps).toEqual([]);
+    });
+
+    it('should give up after the maximum number of retries', async () => {
+      const scheduler = createRequestScheduler(1, { ...options(), maxRetries: 2 });
+      const task = jest.fn().mockRejectedValue(rateLimited(429, { 'retry-after': '1' }));
+
+      await expect(scheduler(task)).rejects.toThrow('HTTP 429');
+      expect(task).toHaveBeenCalledTimes(3);
+    });
+
+    it('should track REST and GraphQL budgets separately', async () => {
+      const scheduler = createRequestScheduler(1, options());
+      const reset = Math.floor(clock / 1000) + 3600;
+
+      await scheduler(() =>
+        Promise.resolve({
+          data: [],
+          headers: {
+            'x-ratelimit-limit': '5000',
+            'x-ratelimit-remaining': '4200',
+            'x-ratelimit-reset': String(reset),
+            'x-ratelimit-resource': 'core',
+          },
+        })
+      );
+      await scheduler(
+        () =>
+          Promise.resolve({
+            rateLimit: {
+              limit: 5000,
+              cost: 2,
+              remaining: 4990,
+              resetAt: new Date(clock + 3_600_000).toISOString(),
+            },
+          }),
+        'graphql'
+      );
+
+      expect(scheduler.remaining('core')).toBe(4200);
+      expect(scheduler.remaining('graphql')).toBe(4990);
+    });
+
+    it('should wait for the reset before a request once the budget is used up', async () => {
+      const scheduler = createRequestScheduler(1, options());
+      const reset = Math.floor(clock / 1000) + 120;
+      const exhausted = {
+        data: [],
+        headers: {
+          'x-ratelimit-limit': '5000',
+          'x-ratelimit-remaining': '0',
+          'x-ratelimit-reset': String(reset),
+        },
+      };
+
+      await scheduler(() => Promise.resolve(exhausted));
+      await scheduler(() => Promise.resolve({ data: [] }));
+
+      expect(sleeps).toEqual([reset * 1000 - 1_700_000_000_000 + 1000]);
+    });
+
+    it('should count a pause shared by concurrent requests once', async () => {
+      const scheduler = createRequestScheduler(4, {
+        now: () => clock,
+        // Concurrent sleeps overlap, so the clock is advanced by the test
+        sleep: async (ms: number) => {
+          sleeps.push(ms);
+        },
+      });
+      const limitedOnce = () =>
+        jest
+          .fn()
+          .mockRejectedValueOnce(rateLimited(403, { 'retry-after': '60' }))
+          .mockResolvedValueOnce({ data: 'ok' });
+
+      await Promise.all([1, 2, 3, 4].map(() => scheduler(limitedOnce())));
+
+      expect(sleeps).toEqual([60_000, 60_000, 60_000, 60_000]);
+      expect(scheduler.throttledMs()).toBe(60_000);
+
+      clock += 60_000;
+      await scheduler(
+        jest
+          .fn()
+          .mockRejectedValueOnce(rateLimited(403, { 'retry-after': '3' }))
+          .mockResolvedValueOnce({ data: 'ok' })
+      );
+
+      expect(scheduler.throttledMs()).toBe(63_000);
+    });
+
+    it('should spread the last part of the budget evenly until the reset', async () => {
+      const scheduler = createRequestScheduler(3, options());
+      const reset = Math.floor(clock / 1000) + 100;
+      await scheduler(() =>
+        Promise.resolve({
+          headers: {
+            'x-ratelimit-limit': '5000',
+            'x-ratelimit-remaining': '10',
+            'x-ratelimit-reset': String(reset),
+          },
+        })
+      );
+
+      await Promise.all([1, 2, 3].map(() => scheduler(() => Promise.resolve({}))));
+
+      // 100s left for 10 requests: one every 10s, reserved in order
+      expect(sleeps.length).toBe(2);
+      expect(sleeps.every((ms) => ms > 0)).toBe(true);
+      expect(scheduler.throttledMs()).toBeGreaterThan(0);
+    });
+
+    it('should classify rate limit errors', () => {
+      expect(isRateLimitError(rateLimited(429, {}))).toBe(true);
+      expect(isRateLimitError(rateLimited(403, { 'retry-after': '60' }))).toBe(true);
+      expect(isRateLimitError(rateLimited(403, {}, 'You have exceeded a secondary rate limit'))).toBe(
+        true
+      );
+      expect(isRateLimitError({ errors: [{ type: 'RATE_LIMITED' }] })).toBe(true);
+      expect(isRateLimitError(rateLimited(403, {}, 'Forbidden'))).toBe(false);
+      expect(isRateLimitError(new Error('GraphQL rate limit'))).toBe(false);
+    });
+  });
+
+  describe('createSyncMetrics', () => {
+    it('should add up the time spent in each phase for sync and async tasks', async () => {
+      let clock = 0;
+      const metrics = createSyncMetrics(() => clock);
+
+      const rendered = metrics.time('rendering', () => {
+        clock += 5;
+        return 'markdown';
+      });
+      await metrics.time('comments', async () => {
+        await Promise.resolve();
+        clock += 20;
+      });
+      await expect(
+        metrics.time('comments', () => {
+          clock += 10;
+          return Promise.reject(new Error('boom'));
+        })
+      ).rejects.toThrow('boom');
+
+      const report = metrics.report();
+      expect(rendered).toBe('markdown');
+      expect(report.phases.rendering).toEqual({ ms: 5, count: 1 });
+      expect(report.phases.comments).toEqual({ ms: 30, count: 2 });
+      expect(report.phases.listing).toEqual({ ms: 0, count: 0 });
+      expect(report.duration_ms).toBe(35);
+    });
+
+    it('should count API calls and response bytes per endpoint', () => {
+      const metrics = createSyncMetrics();
+
+      metrics.request('issues.get', { headers: { 'content-length': '1200' }, data: {} });
+      metrics.request('issues.get', { headers: {}, data: { body: 'abc' } });
+      metrics.request('graphql.issues', { repository: null });
+      metrics.request('issues.listComments', undefined);
+
+      const { api } = metrics.report();
+      expect(api.endpoints['issues.get']).toEqual({ calls: 2, bytes: 1200 + 14 });
+      expect(api.endpoints['graphql.issues']).toEqual({ calls: 1, bytes: 19 });
+      expect(api.endpoints['issues.listComments']).toEqual({ calls: 1, bytes: 0 });
+      expect(api.calls).toBe(4);
+      expect(api.bytes).toBe(1233);
+    });
+
+    it('should keep counters', () => {
+      const metrics = createSyncMetrics();
+
+      metrics.count('files-written');
+      metrics.count('files-written');
+      metrics.count('commit-cache-hits', 7);
+
+      expect(metrics.report().counters).toEqual({
+        'files-written': 2,
+        'files-unchanged': 0,
+        'items-skipped': 0,
+        'commit-cache-hits': 7,
+        'commit-cache-misses': 0,
+      });
+    });
+  });
+
+  describe('mapInOrder', () => {
+    it('should emit results in input order when items finish out of order', async () => {
+      const emitted: number[] = [];
+      const delays = [30, 5, 20, 1, 10];
+
+      await mapInOrder(
+        delays,
+        3,
+        async (delay) => {
+          await new Promise((resolve) => setTimeout(resolve, delay));
+          return delay;
+        },
+        (result) => emitted.push(result)
+      );
+
+      expect(emitted).toEqual(delays);
+    });
+
+    it('should stop starting items and rethrow after a worker fails', async () => {
+      const started: number[] = [];
+
+      await expect(
+        mapInOrder(
+          [1, 2, 3, 4, 5],
+          1,
+          async (item) => {
+            started.push(item);
+            if (item === 2) throw new Error('fetch failed');
+            return item;
+          },
+          () => undefined
+        )
+      ).rejects.toThrow('fetch failed');
+      expect(started).toEqual([1, 2]);
+    });
+  });
+
+  describe('loadCommitCache', () => {
     const mockExistsSync = fs.existsSync as jest.MockedFunction<typeof fs.existsSync>;
-    const mockMkdirSync = fs.mkdirSync as jest.MockedFunction<typeof fs.mkdirSync>;
-    const mockWriteFileSync = fs.writeFileSync as jest.MockedFunction<typeof fs.writeFileSync>;
     const mockReadFileSync = fs.readFileSync as jest.MockedFunction<typeof fs.readFileSync>;
-    const mockPathJoin = path.join as jest.MockedFunction<typeof path.join>;
-    const mockInfo = core.info as jest.MockedFunction<typeof core.info>;
-    const mockWarning = core.warning as jest.MockedFunction<typeof core.warning>;
-    const mockSetFailed = core.setFailed as jest.MockedFunction<typeof core.setFailed>;
-    const mockSetOutput = core.setOutput as jest.MockedFunction<typeof core.setOutput>;
+    const mockWriteFileSync = fs.writeFileSync as jest.MockedFunction<typeof fs.writeFileSync>;
+    const detail = (total: number) => ({ stats: { total }, files: [{ filename: 'a.ts' }] });
+    const savedEntries = () =>
+      JSON.parse(mockWriteFileSync.mock.calls[0][1] as string).entries.map(
+        ([sha]: [string]) => sha
+      );
 
     beforeEach(() => {
-      jest.clearAllMocks();
       mockExistsSync.mockReturnValue(false);
-      mockMkdirSync.mockImplementation(() => undefined);
-      mockPathJoin.mockImplementation((...args) => args.join('/'));
       mockWriteFileSync.mockImplementation(() => undefined);
-      mockReadFileSync.mockImplementation(() => '2024-01-01T00:00:00Z');
     });
 
-    describe('token input', () => {
-      it('should set outputs for issues-count, prs-count, last-synced-at, and modified-files', async () => {
-        mockGetInput.mockImplementation((name: string): string => {
-          if (name === 'token') return 'test-token';
-          return '';
-        });
-        mockExistsSync.mockReturnValue(false);
+    it('should load entries and count hits and misses', () => {
+      mockExistsSync.mockReturnValue(true);
+      mockReadFileSync.mockReturnValue(
+        JSON.stringify({ version: 1, entries: [['abc', detail(3)]] })
+      );
 
-        const issue = {
-          number: 1,
-          title: 'Issue 1',
-          body: 'Body',
-          state: 'open',
-          labels: [],
-          created_at: '2024-01-01T00:00:00Z',
-          updated_at: '2024-01-02T00:00:00Z',
-          user: { login: 'user1' },
-          html_url: 'https://example.com/issue/1',
-          milestone: null,
-        };
-        const issue2 = {
-          ...issue,
-          number: 2,
-          title: 'Issue 2',
-          html_url: 'https://example.com/issue/2',
-        };
+      const cache = loadCommitCache('.cache/commits.json', 10);
 
-        const pr = {
-          number: 10,
-          title: 'PR 10',
-          body: 'PR Body',
-          state: 'open',
-          labels: [],
-          created_at: '2024-01-01T00:00:00Z',
-          updated_at: '2024-01-02T00:00:00Z',
-          merged_at: null,
-          user: { login: 'pr-user' },
-          html_url: 'https://example.com/pr/10',
-          head: { ref: 'feature' },
-          base: { ref: 'main' },
-        };
-        const pr2 = { ...pr, number: 11, title: 'PR 11', html_url: 'https://example.com/pr/11' };
+      expect(cache.get('abc')).toEqual(detail(3));
+      expect(cache.get('def')).toBeUndefined();
+      expect(cache.hits).toBe(1);
+      expect(cache.misses).toBe(1);
+    });
+
+    it('should evict the least recently used entry over the size cap', () => {
+      const cache = loadCommitCache('.cache/commits.json', 2);
+
+      cache.set('a', detail(1));
+      cache.set('b', detail(2));
+      cache.get('a');
+      cache.set('c', detail(3));
+      cache.save();
+
+      expect(cache.size).toBe(2);
+      expect(cache.get('b')).toBeUndefined();
+      expect(savedEntries()).toEqual(['a', 'c']);
+    });
+
+    it('should start empty and warn when the cache file is unreadable', () => {
+      mockExistsSync.mockReturnValue(true);
+      mockReadFileSync.mockReturnValue('not json');
+
+      const cache = loadCommitCache('.cache/commits.json', 10);
+
+      expect(cache.size).toBe(0);
+      expect(core.warning).toHaveBeenCalledWith(
+        expect.stringContaining('Ignoring unreadable commit cache .cache/commits.json')
+      );
+    });
+
+    it('should not rewrite the file when nothing was used or added', () => {
+      const cache = loadCommitCache('.cache/commits.json', 10);
+
+      cache.get('missing');
+      cache.save();
+
+      expect(mockWriteFileSync).not.toHaveBeenCalled();
+    });
+  });
+
+  describe('fetchCommentsSince', () => {
+    const comment = (id: number, body = `Comment ${id}`) => ({ id, body });
+    const cached = { since: '2024-01-01T00:00:00Z', comments: [comment(1), comment(2)] };
+
+    it('should merge edited and new comments into the cached ones by id', () => {
+      expect(mergeComments(cached.comments, [comment(3), comment(1, 'Edited')])).toEqual([
+        comment(1, 'Edited'),
+        comment(2),
+        comment(3),
+      ]);
+    });
+
+    it('should only fetch comments updated since the cached fetch', async () => {
+      const fetch = jest.fn().mockResolvedValue([comment(2, 'Edited'), comment(3)]);
+
+      const result = await fetchCommentsSince(cached, 3, fetch);
+
+      expect(fetch).toHaveBeenCalledTimes(1);
+      expect(fetch).toHaveBeenCalledWith('2024-01-01T00:00:00Z');
+      expect(result.comments).toEqual([comment(1), comment(2, 'Edited'), comment(3)]);
+      expect(Date.parse(result.since)).toBeGreaterThan(Date.parse(cached.since));
+      expect(Date.parse(result.since)).toBeLessThan(Date.now());
+    });
+
+    it('should fetch everything without a cache or when the count disagrees', async () => {
+      const fetch = jest
+        .fn()
+        .mockResolvedValueOnce([])
+        .mockResolvedValueOnce([comment(1)])
+        .mockResolvedValueOnce([comment(1)]);
+
+      // Comment 2 was deleted, which `since` cannot show
+      expect((await fetchCommentsSince(cached, 1, fetch)).comments).toEqual([comment(1)]);
+      expect(fetch.mock.calls).toEqual([['2024-01-01T00:00:00Z'], []]);
+      expect((await fetchCommentsSince(undefined, 1, fetch)).comments).toEqual([comment(1)]);
+      expect(fetch).toHaveBeenLastCalledWith();
+    });
+  });
+
+  describe('createMarkdownWriter', () => {
+    const mockFsPromises = fs.promises as unknown as Record<
+      'readdir' | 'readFile' | 'writeFile' | 'rename' | 'rm',
+      jest.Mock
+    >;
+    const markdown = (body: string, synced = '2024-01-01T00:00:00Z') =>
+      `---\ntitle: "Issue"\nsynced: ${synced}\n---\n\n${body}\n`;
+
+    beforeEach(() => {
+      (path.join as jest.MockedFunction<typeof path.join>).mockImplementation((...args) =>
+        args.join('/')
+      );
+      mockFsPromises.readdir.mockResolvedValue(['issue-1.md', '.issue-2.md.41.0.tmp']);
+      mockFsPromises.readFile.mockResolvedValue(markdown('Body'));
+      mockFsPromises.writeFile.mockResolvedValue(undefined);
+      mockFsPromises.rename.mockResolvedValue(undefined);
+      mockFsPromises.rm.mockResolvedValue(undefined);
+    });
+
+    it('should list the directory once and remove leftover temporary files', async () => {
+      const writer = await createMarkdownWriter('out');
+
+      expect(mockFsPromises.readdir).toHaveBeenCalledTimes(1);
+      expect(mockFsPromises.rm).toHaveBeenCalledWith('out/.issue-2.md.41.0.tmp', { force: true });
+      expect(writer.exists('issue-1.md')).toBe(true);
+      expect(writer.exists('issue-2.md')).toBe(false);
+      expect(writer.exists('.issue-2.md.41.0.tmp')).toBe(false);
+    });
+
+    it('should start empty when the directory does not exist yet', async () => {
+      mockFsPromises.readdir.mockRejectedValue(
+        Object.assign(new Error('ENOENT'), { code: 'ENOENT' })
+      );
+
+      const writer = await createMarkdownWriter('out');
+
+      expect(writer.exists('issue-1.md')).toBe(false);
+    });
+
+    it('should write to a temporary file and rename it over the target', async () => {
+      const writer = await createMarkdownWriter('out');
+
+      expect(await writer.write('issue-3.md', markdown('New'))).toBe(true);
+
+      const [[tempPath, content]] = mockFsPromises.writeFile.mock.calls;
+      expect(tempPath).toMatch(/^out\/\.issue-3\.md\.\d+\.0\.tmp$/);
+      expect(content).toBe(markdown('New'));
+      expect(mockFsPromises.rename).toHaveBeenCalledWith(tempPath, 'out/issue-3.md');
+      expect(mockFsPromises.readFile).not.toHaveBeenCalled();
+      expect(writer.exists('issue-3.md')).toBe(true);
+    });
+
+    it('should skip files whose content only differs in frontmatter unless forced', async () => {
+      const metrics = createSyncMetrics();
+      const writer = await createMarkdownWriter('out', metrics);
+
+      const resynced = markdown('Body', '2024-06-01T00:00:00Z');
+
+      expect(await writer.write('issue-1.md', resynced)).toBe(false);
+      expect(mockFsPromises.writeFile).not.toHaveBeenCalled();
+      expect(await writer.write('issue-1.md', markdown('Body'), true)).toBe(true);
+      expect(await writer.write('issue-1.md', markdown('Edited'))).toBe(true);
+      expect(mockFsPromises.rename).toHaveBeenCalledTimes(2);
+      expect(metrics.report().phases.diffing.count).toBe(2);
+      expect(metrics.report().phases.writing.count).toBe(2);
+    });
+
+    it('should remove the temporary file when the write fails', async () => {
+      mockFsPromises.rename.mockRejectedValue(new Error('EXDEV'));
+      const writer = await createMarkdownWriter('out');
+
+      await expect(writer.write('issue-3.md', markdown('New'))).rejects.toThrow('EXDEV');
+
+      const [[tempPath]] = mockFsPromises.writeFile.mock.calls;
+      expect(mockFsPromises.rm).toHaveBeenLastCalledWith(tempPath, { force: true });
+      expect(writer.exists('issue-3.md')).toBe(false);
+    });
+
+    it('should keep at most queueSize writes in flight', async () => {
+      let active = 0;
+      let peak = 0;
+      mockFsPromises.writeFile.mockImplementation(async () => {
+        peak = Math.max(peak, ++active);
+        await new Promise((resolve) => setTimeout(resolve, 5));
+        active--;
+      });
+      const writer = await createMarkdownWriter('out', undefined, 2);
+
+      await Promise.all(
+        [3, 4, 5, 6, 7].map((number) => writer.write(`issue-${number}.md`, markdown('New')))
+      );
+
+      expect(peak).toBe(2);
+      expect(mockFsPromises.rename).toHaveBeenCalledTimes(5);
+    });
+  });
+
+  describe('manifestEntryMatches', () => {
+    const relationship = { parent: 1, children: [3, 4] };
+    const previous = createManifestEntry('2024-01-02T00:00:00Z', 'Body', 2, relationship);
+
+    it('should match an identical listing', () => {
+      const current = createManifestEntry('2024-01-02T00:00:00Z', 'Body', 2, {
+        parent: 1,
+        children: [3, 4],
+      });
+
+      expect(manifestEntryMatches(previous, current)).toBe(true);
+    });
+
+    it('should not match when updated_at, body, comments or relationships differ', () => {
+      const changed = [
+        createManifestEntry('2024-02-01T00:00:00Z', 'Body', 2, relationship),
+        createManifestEntry('2024-01-02T00:00:00Z', 'Edited', 2, relationship),
+        createManifestEntry('2024-01-02T00:00:00Z', 'Body', 3, relationship),
+        createManifestEntry('2024-01-02T00:00:00Z', 'Body', 2, { parent: null, children: [3, 4] }),
+      ];
+
+      for (const current of changed) {
+        expect(manifestEntryMatches(previous, current)).toBe(false);
+      }
+    });
+
+    it('should ignore the comment count when the listing has none', () => {
+      const current = createManifestEntry('2024-01-02T00:00:00Z', 'Body', undefined, relationship);
+
+      expect(manifestEntryMatches(previous, current)).toBe(true);
+    });
+
+    it('should not match without a previous entry or an updated_at', () => {
+      const undated = createManifestEntry(undefined, 'Body');
+
+      expect(manifestEntryMatches(undefined, previous)).toBe(false);
+      expect(manifestEntryMatches(undated, undated)).toBe(false);
+    });
+  });
+
+  describe('Input Parameters', () => {
+    const mockGetInput = core.getInput as jest.MockedFunction<typeof core.getInput>;
+    const mockGetOctokit = github.getOctokit as jest.MockedFunction<typeof github.getOctokit>;
+    type MockOctokit = ReturnType<typeof github.getOctokit>;
+    const setMockOctokit = (mock: unknown) => mockGetOctokit.mockReturnValue(mock as MockOctokit);
+    const mockExistsSync = fs.existsSync as jest.MockedFunction<typeof fs.existsSync>;
+    const mockMkdirSync = fs.mkdirSync as jest.MockedFunction<typeof fs.mkdirSync>;
+    const mockWriteFileSync = fs.writeFileSync as jest.MockedFunction<typeof fs.writeFileSync>;
+    const mockReadFileSync = fs.readFileSync as jest.MockedFunction<typeof fs.readFileSync>;
+    const mockPathJoin = path.join as jest.MockedFunction<typeof path.join>;
+    const mockInfo = core.info as jest.MockedFunction<typeof core.info>;
+    const mockWarning = core.warning as jest.MockedFunction<typeof core.warning>;
+    const mockSetFailed = core.setFailed as jest.MockedFunction<typeof core.setFailed>;
+    const mockSetOutput = core.setOutput as jest.MockedFunction<typeof core.setOutput>;
+
+    const mockFsPromises = fs.promises as unknown as Record<
+      'readdir' | 'readFile' | 'writeFile' | 'rename' | 'rm',
+      jest.Mock
+    >;
+
+    // [path, content] of every markdown file written, following each temp file to the
+    // name it was renamed to
+    const writtenMarkdown = (): Array<[string, string]> =>
+      mockFsPromises.rename.mock.calls.map(([from, to]) => [
+        to,
+        mockFsPromises.writeFile.mock.calls.find(([file]) => file === from)![1],
+      ]);
+
+    // Makes the given markdown files appear in their output directories
+    const mockExistingMarkdown = (files: Record<string, string>) => {
+      mockFsPromises.readdir.mockImplementation(async (dir: string) =>
+        Object.keys(files)
+          .filter((file) => path.dirname(file) === dir)
+          .map((file) => path.basename(file))
+      );
+      mockFsPromises.readFile.mockImplementation(async (file: string) => {
+        if (!(file in files)) {
+          throw Object.assign(new Error(`ENOENT: ${file}`), { code: 'ENOENT' });
+        }
+        return files[file];
+      });
+    };
+
+    beforeEach(() => {
+      jest.clearAllMocks();
+      mockExistsSync.mockReturnValue(false);
+      mockMkdirSync.mockImplementation(() => undefined);
+      mockPathJoin.mockImplementation((...args) => args.join('/'));
+      mockWriteFileSync.mockImplementation(() => undefined);
+      mockReadFileSync.mockImplementation(() => '2024-01-01T00:00:00Z');
+      mockExistingMarkdown({});
+      mockFsPromises.writeFile.mockResolvedValue(undefined);
+      mockFsPromises.rename.mockResolvedValue(undefined);
+      mockFsPromises.rm.mockResolvedValue(undefined);
+    });
+
+    describe('token input', () => {
+      it('should set outputs for issues-count, prs-count, last-synced-at, and modified-files', async () => {
+        mockGetInput.mockImplementation((name: string): string => {
+          if (name === 'token') return 'test-token';
+          return '';
+        });
+        mockExistsSync.mockReturnValue(false);
+
+        const issue = {
+          number: 1,
+          title: 'Issue 1',
+          body: 'Body',
+          state: 'open',
+          labels: [],
+          created_at: '2024-01-01T00:00:00Z',
+          updated_at: '2024-01-02T00:00:00Z',
+          user: { login: 'user1' },
+          html_url: 'https://example.com/issue/1',
+          milestone: null,
+        };
+        const issue2 = {
+          ...issue,
+          number: 2,
+          title: 'Issue 2',
+          html_url: 'https://example.com/issue/2',
+        };
+
+        const pr = {
+          number: 10,
+          title: 'PR 10',
+          body: 'PR Body',
+          state: 'open',
+          labels: [],
+          created_at: '2024-01-01T00:00:00Z',
+          updated_at: '2024-01-02T00:00:00Z',
+          merged_at: null,
+          user: { login: 'pr-user' },
+          html_url: 'https://example.com/pr/10',
+          head: { ref: 'feature' },
+          base: { ref: 'main' },
+        };
+        const pr2 = { ...pr, number: 11, title: 'PR 11', html_url: 'https://example.com/pr/11' };
+
+        const mockOctokit = {
+          rest: {
+            issues: {
+              listForRepo: jest.fn().mockResolvedValue({ data: [issue, issue2] }),
+              get: jest.fn().mockImplementation(({ issue_number }) => {
+                return Promise.resolve({ data: issue_number === 1 ? issue : issue2 });
+              }),
+              listComments: jest.fn().mockResolvedValue({ data: [] }),
+            },
+            pulls: {
+              list: jest.fn().mockResolvedValue({ data: [pr, pr2] }),
+              get: jest.fn().mockImplementation(({ pull_number }) => {
+                return Promise.resolve({ data: pull_number === 10 ? pr : pr2 });
+              }),
+              listReviewComments: jest.fn().mockResolvedValue({ data: [] }),
+            },
+          },
+        };
+        setMockOctokit(mockOctokit);
+
+        await run();
+
+        expect(mockSetOutput).toHaveBeenCalledWith('issues-count', 2);
+        expect(mockSetOutput).toHaveBeenCalledWith('prs-count', 2);
+        expect(mockSetOutput).toHaveBeenCalledWith('last-synced-at', expect.any(String));
+        const modifiedFilesCall = mockSetOutput.mock.calls.find(
+          (call) => call[0] === 'modified-files'
+        );
+        expect(modifiedFilesCall).toBeDefined();
+        const modifiedFiles = modifiedFilesCall![1] as string;
+        expect(modifiedFiles).toContain('synced-issues/issues/issue-1.md');
+        expect(modifiedFiles).toContain('synced-issues/issues/issue-2.md');
+        expect(modifiedFiles).toContain('synced-issues/pull-requests/pr-10.md');
+        expect(modifiedFiles).toContain('synced-issues/pull-requests/pr-11.md');
+        expect(mockSetOutput).toHaveBeenCalledWith('app-token', '');
+        expect(mockSetOutput).toHaveBeenCalledWith('github-token', 'test-token');
+      });
+
+      it('should error when token input is not provided and env is missing', async () => {
+        mockGetInput.mockImplementation((name: string): string => {
+          if (name === 'token') {
+            return '';
+          }
+          return '';
+        });
+        delete process.env.GITHUB_TOKEN;
+
+        await run();
+
+        expect(mockGetInput).toHaveBeenCalledWith('token');
+        expect(mockSetFailed).toHaveBeenCalledWith(
+          expect.stringContaining('GitHub token is required')
+        );
+      });
+
+      it('should use provided token input', async () => {
+        mockGetInput.mockImplementation((name: string): string => {
+          if (name === 'token') return 'test-token-123';
+          return '';
+        });
+        delete process.env.GITHUB_TOKEN;
+
+        const mockOctokit = {
+          rest: {
+            issues: {
+              listForRepo: jest.fn().mockResolvedValue({ data: [] }),
+              get: jest.fn(),
+              listComments: jest.fn().mockResolvedValue({ data: [] }),
+            },
+            pulls: {
+              list: jest.fn().mockResolvedValue({ data: [] }),
+              get: jest.fn(),
+              listReviewComments: jest.fn().mockResolvedValue({ data: [] }),
+            },
+          },
+        };
+        setMockOctokit(mockOctokit);
+
+        await run();
+
+        expect(mockGetInput).toHaveBeenCalledWith('token');
+        expect(mockGetOctokit).toHaveBeenCalledWith('test-token-123');
+      });
+    });
+
+    describe('output-dir input', () => {
+      it('should use default output directory when not provided', async () => {
+        mockGetInput.mockImplementation((name: string) => {
+          if (name === 'token') return 'test-token';
+          if (name === 'output-dir') return '';
+          return '';
+        });
+
+        const mockOctokit = {
+          rest: {
+            issues: {
+              listForRepo: jest.fn().mockResolvedValue({ data: [] }),
+              get: jest.fn(),
+              listComments: jest.fn().mockResolvedValue({ data: [] }),
+            },
+            pulls: {
+              list: jest.fn().mockResolvedValue({ data: [] }),
+              get: jest.fn(),
+              listReviewComments: jest.fn().mockResolvedValue({ data: [] }),
+            },
+          },
+        };
+        setMockOctokit(mockOctokit);
+
+        await run();
+
+        expect(mockGetInput).toHaveBeenCalledWith('output-dir');
+        expect(mockExistsSync).toHaveBeenCalledWith('synced-issues');
+        expect(mockMkdirSync).toHaveBeenCalledWith('synced-issues', { recursive: true });
+      });
+
+      it('should use custom output directory when provided', async () => {
+        mockGetInput.mockImplementation((name: string) => {
+          if (name === 'token') return 'test-token';
+          if (name === 'output-dir') return '/custom/output/path';
+          return '';
+        });
+
+        const mockOctokit = {
+          rest: {
+            issues: {
+              listForRepo: jest.fn().mockResolvedValue({ data: [] }),
+              get: jest.fn(),
+              listComments: jest.fn().mockResolvedValue({ data: [] }),
+            },
+            pulls: {
+              list: jest.fn().mockResolvedValue({ data: [] }),
+              get: jest.fn(),
+              listReviewComments: jest.fn().mockResolvedValue({ data: [] }),
+            },
+          },
+        };
+        setMockOctokit(mockOctokit);
+
+        await run();
+
+        expect(mockExistsSync).toHaveBeenCalledWith('/custom/output/path');
+        expect(mockMkdirSync).toHaveBeenCalledWith('/custom/output/path', { recursive: true });
+      });
+
+      it('should not create directory if it already exists', async () => {
+        mockGetInput.mockImplementation((name: string) => {
+          if (name === 'token') return 'test-token';
+          if (name === 'output-dir') return '/existing/path';
+          return '';
+        });
+        mockExistsSync.mockReturnValue(true);
+
+        const mockOctokit = {
+          rest: {
+            issues: {
+              listForRepo: jest.fn().mockResolvedValue({ data: [] }),
+              get: jest.fn(),
+              listComments: jest.fn().mockResolvedValue({ data: [] }),
+            },
+            pulls: {
+              list: jest.fn().mockResolvedValue({ data: [] }),
+              get: jest.fn(),
+              listReviewComments: jest.fn().mockResolvedValue({ data: [] }),
+            },
+          },
+        };
+        setMockOctokit(mockOctokit);
+
+        await run();
+
+        expect(mockExistsSync).toHaveBeenCalledWith('/existing/path');
+        expect(mockMkdirSync).not.toHaveBeenCalledWith('/existing/path', expect.anything());
+      });
+    });
+
+    describe('sync-issues input', () => {
+      it('should default to true when not provided', async () => {
+        mockGetInput.mockImplementation((name: string): string => {
+          if (name === 'token') return 'test-token';
+          if (name === 'sync-issues') return '';
+          return '';
+        });
+
+        const mockOctokit = {
+          rest: {
+            issues: {
+              listForRepo: jest.fn().mockResolvedValue({ data: [] }),
+              get: jest.fn(),
+              listComments: jest.fn().mockResolvedValue({ data: [] }),
+            },
+            pulls: {
+              list: jest.fn().mockResolvedValue({ data: [] }),
+              get: jest.fn(),
+              listReviewComments: jest.fn().mockResolvedValue({ data: [] }),
+            },
+          },
+        };
+        setMockOctokit(mockOctokit);
+
+        await run();
+
+        expect(mockInfo).toHaveBeenCalledWith('Syncing issues...');
+        expect(mockOctokit.rest.issues.listForRepo).toHaveBeenCalled();
+      });
+
+      it('should sync issues when set to true', async () => {
+        mockGetInput.mockImplementation((name: string): string => {
+          if (name === 'token') return 'test-token';
+          if (name === 'sync-issues') return 'true';
+          return '';
+        });
+
+        const mockOctokit = {
+          rest: {
+            issues: {
+              listForRepo: jest.fn().mockResolvedValue({ data: [] }),
+              get: jest.fn(),
+              listComments: jest.fn().mockResolvedValue({ data: [] }),
+            },
+            pulls: {
+              list: jest.fn().mockResolvedValue({ data: [] }),
+              get: jest.fn(),
+            },
+          },
+        };
+        setMockOctokit(mockOctokit);
+
+        await run();
+
+        expect(mockInfo).toHaveBeenCalledWith('Syncing issues...');
+        expect(mockOctokit.rest.issues.listForRepo).toHaveBeenCalled();
+      });
+
+      it('should not sync issues when set to false', async () => {
+        mockGetInput.mockImplementation((name: string): string => {
+          if (name === 'token') return 'test-token';
+          if (name === 'sync-issues') return 'false';
+          return '';
+        });
+
+        const mockOctokit = {
+          rest: {
+            issues: {
+              listForRepo: jest.fn(),
+              get: jest.fn(),
+              listComments: jest.fn(),
+            },
+            pulls: {
+              list: jest.fn().mockResolvedValue({ data: [] }),
+              get: jest.fn(),
+            },
+          },
+        };
+        setMockOctokit(mockOctokit);
+
+        await run();
+
+        expect(mockInfo).not.toHaveBeenCalledWith('Syncing issues...');
+        expect(mockOctokit.rest.issues.listForRepo).not.toHaveBeenCalled();
+      });
+
+      it('should handle case-insensitive true values', async () => {
+        mockGetInput.mockImplementation((name: string): string => {
+          if (name === 'token') return 'test-token';
+          if (name === 'sync-issues') return 'TRUE';
+          return '';
+        });
+
+        const mockOctokit = {
+          rest: {
+            issues: {
+              listForRepo: jest.fn().mockResolvedValue({ data: [] }),
+              get: jest.fn(),
+              listComments: jest.fn().mockResolvedValue({ data: [] }),
+            },
+            pulls: {
+              list: jest.fn().mockResolvedValue({ data: [] }),
+              get: jest.fn(),
+            },
+          },
+        };
+        setMockOctokit(mockOctokit);
+
+        await run();
+
+        expect(mockInfo).toHaveBeenCalledWith('Syncing issues...');
+        expect(mockOctokit.rest.issues.listForRepo).toHaveBeenCalled();
+      });
+    });
+
+    describe('sync-prs input', () => {
+      it('should default to true when not provided', async () => {
+        mockGetInput.mockImplementation((name: string): string => {
+          if (name === 'token') return 'test-token';
+          if (name === 'sync-prs') return '';
+          return '';
+        });
+
+        const mockOctokit = {
+          rest: {
+            issues: {
+              listForRepo: jest.fn().mockResolvedValue({ data: [] }),
+              get: jest.fn(),
+              listComments: jest.fn().mockResolvedValue({ data: [] }),
+            },
+            pulls: {
+              list: jest.fn().mockResolvedValue({ data: [] }),
+              get: jest.fn(),
+            },
+          },
+        };
+        setMockOctokit(mockOctokit);
+
+        await run();
+
+        expect(mockInfo).toHaveBeenCalledWith('Syncing pull requests...');
+        expect(mockOctokit.rest.pulls.list).toHaveBeenCalled();
+      });
+
+      it('should sync PRs when set to true', async () => {
+        mockGetInput.mockImplementation((name: string): string => {
+          if (name === 'token') return 'test-token';
+          if (name === 'sync-prs') return 'true';
+          return '';
+        });
+
+        const mockOctokit = {
+          rest: {
+            issues: {
+              listForRepo: jest.fn().mockResolvedValue({ data: [] }),
+              get: jest.fn(),
+              listComments: jest.fn().mockResolvedValue({ data: [] }),
+            },
+            pulls: {
+              list: jest.fn().mockResolvedValue({ data: [] }),
+              get: jest.fn(),
+            },
+          },
+        };
+        setMockOctokit(mockOctokit);
+
+        await run();
+
+        expect(mockInfo).toHaveBeenCalledWith('Syncing pull requests...');
+        expect(mockOctokit.rest.pulls.list).toHaveBeenCalled();
+      });
+
+      it('should not sync PRs when set to false', async () => {
+        mockGetInput.mockImplementation((name: string): string => {
+          if (name === 'token') return 'test-token';
+          if (name === 'sync-prs') return 'false';
+          return '';
+        });
+
+        const mockOctokit = {
+          rest: {
+            issues: {
+              listForRepo: jest.fn().mockResolvedValue({ data: [] }),
+              get: jest.fn(),
+              listComments: jest.fn().mockResolvedValue({ data: [] }),
+            },
+            pulls: {
+              list: jest.fn(),
+              get: jest.fn(),
+            },
+          },
+        };
+        setMockOctokit(mockOctokit);
+
+        await run();
+
+        expect(mockInfo).not.toHaveBeenCalledWith('Syncing pull requests...');
+        expect(mockOctokit.rest.pulls.list).not.toHaveBeenCalled();
+      });
+    });
+
+    describe('include-closed input', () => {
+      it('should default to false when not provided', async () => {
+        mockGetInput.mockImplementation((name: string): string => {
+          if (name === 'token') return 'test-token';
+          if (name === 'include-closed') return '';
+          return '';
+        });
+
+        const mockOctokit = {
+          rest: {
+            issues: {
+              listForRepo: jest.fn().mockResolvedValue({ data: [] }),
+              get: jest.fn(),
+              listComments: jest.fn().mockResolvedValue({ data: [] }),
+            },
+            pulls: {
+              list: jest.fn().mockResolvedValue({ data: [] }),
+              get: jest.fn(),
+            },
+          },
+        };
+        setMockOctokit(mockOctokit);
+
+        await run();
+
+        expect(mockOctokit.rest.issues.listForRepo).toHaveBeenCalledWith(
+          expect.objectContaining({ state: 'open' })
+        );
+        expect(mockOctokit.rest.pulls.list).toHaveBeenCalledWith(
+          expect.objectContaining({ state: 'open' })
+        );
+      });
+
+      it('should include closed items when set to true', async () => {
+        mockGetInput.mockImplementation((name: string): string => {
+          if (name === 'token') return 'test-token';
+          if (name === 'include-closed') return 'true';
+          return '';
+        });
 
         const mockOctokit = {
           rest: {
             issues: {
-              listForRepo: jest.fn().mockResolvedValue({ data: [issue, issue2] }),
-              get: jest.fn().mockImplementation(({ issue_number }) => {
-                return Promise.resolve({ data: issue_number === 1 ? issue : issue2 });
-              }),
+              listForRepo: jest.fn().mockResolvedValue({ data: [] }),
+              get: jest.fn(),
               listComments: jest.fn().mockResolvedValue({ data: [] }),
             },
             pulls: {
-              list: jest.fn().mockResolvedValue({ data: [pr, pr2] }),
-              get: jest.fn().mockImplementation(({ pull_number }) => {
-                return Promise.resolve({ data: pull_number === 10 ? pr : pr2 });
-              }),
-              listReviewComments: jest.fn().mockResolvedValue({ data: [] }),
+              list: jest.fn().mockResolvedValue({ data: [] }),
+              get: jest.fn(),
             },
           },
         };
@@ -1280,45 +2549,54 @@ describe('Sync Issues Action', () => {
 
         await run();
 
-        expect(mockSetOutput).toHaveBeenCalledWith('issues-count', 2);
-        expect(mockSetOutput).toHaveBeenCalledWith('prs-count', 2);
-        expect(mockSetOutput).toHaveBeenCalledWith('last-synced-at', expect.any(String));
-        const modifiedFilesCall = mockSetOutput.mock.calls.find(
-          (call) => call[0] === 'modified-files'
+        expect(mockOctokit.rest.issues.listForRepo).toHaveBeenCalledWith(
+          expect.objectContaining({ state: 'all' })
+        );
+        expect(mockOctokit.rest.pulls.list).toHaveBeenCalledWith(
+          expect.objectContaining({ state: 'all' })
         );
-        expect(modifiedFilesCall).toBeDefined();
-        const modifiedFiles = modifiedFilesCall![1] as string;
-        expect(modifiedFiles).toContain('synced-issues/issues/issue-1.md');
-        expect(modifiedFiles).toContain('synced-issues/issues/issue-2.md');
-        expect(modifiedFiles).toContain('synced-issues/pull-requests/pr-10.md');
-        expect(modifiedFiles).toContain('synced-issues/pull-requests/pr-11.md');
-        expect(mockSetOutput).toHaveBeenCalledWith('app-token', '');
-        expect(mockSetOutput).toHaveBeenCalledWith('github-token', 'test-token');
       });
 
-      it('should error when token input is not provided and env is missing', async () => {
+      it('should exclude closed items when set to false', async () => {
         mockGetInput.mockImplementation((name: string): string => {
-          if (name === 'token') {
-            return '';
-          }
+          if (name === 'token') return 'test-token';
+          if (name === 'include-closed') return 'false';
           return '';
         });
-        delete process.env.GITHUB_TOKEN;
+
+        const mockOctokit = {
+          rest: {
+            issues: {
+              listForRepo: jest.fn().mockResolvedValue({ data: [] }),
+              get: jest.fn(),
+              listComments: jest.fn().mockResolvedValue({ data: [] }),
+            },
+            pulls: {
+              list: jest.fn().mockResolvedValue({ data: [] }),
+              get: jest.fn(),
+            },
+          },
+        };
+        setMockOctokit(mockOctokit);
 
         await run();
 
-        expect(mockGetInput).toHaveBeenCalledWith('token');
-        expect(mockSetFailed).toHaveBeenCalledWith(
-          expect.stringContaining('GitHub token is required')
+        expect(mockOctokit.rest.issues.listForRepo).toHaveBeenCalledWith(
+          expect.objectContaining({ state: 'open' })
+        );
+        expect(mockOctokit.rest.pulls.list).toHaveBeenCalledWith(
+          expect.objectContaining({ state: 'open' })
         );
       });
+    });
 
-      it('should use provided token input', async () => {
+    describe('updated-since input', () => {
+      it('should pass since to issues and filter PRs when provided', async () => {
         mockGetInput.mockImplementation((name: string): string => {
-          if (name === 'token') return 'test-token-123';
+          if (name === 'token') return 'test-token';
+          if (name === 'updated-since') return '2024-02-01T00:00:00Z';
           return '';
         });
-        delete process.env.GITHUB_TOKEN;
 
         const mockOctokit = {
           rest: {
@@ -1328,7 +2606,12 @@ describe('Sync Issues Action', () => {
               listComments: jest.fn().mockResolvedValue({ data: [] }),
             },
             pulls: {
-              list: jest.fn().mockResolvedValue({ data: [] }),
+              list: jest.fn().mockResolvedValue({
+                data: [
+                  { number: 1, updated_at: '2024-02-05T00:00:00Z' },
+                  { number: 2, updated_at: '2024-01-01T00:00:00Z' },
+                ],
+              }),
               get: jest.fn(),
               listReviewComments: jest.fn().mockResolvedValue({ data: [] }),
             },
@@ -1338,19 +2621,31 @@ describe('Sync Issues Action', () => {
 
         await run();
 
-        expect(mockGetInput).toHaveBeenCalledWith('token');
-        expect(mockGetOctokit).toHaveBeenCalledWith('test-token-123');
+        expect(mockOctokit.rest.issues.listForRepo).toHaveBeenCalledWith(
+          expect.objectContaining({ since: '2024-02-01T00:00:00Z' })
+        );
+        expect(mockOctokit.rest.pulls.list).toHaveBeenCalledWith(
+          expect.objectContaining({ sort: 'updated', direction: 'desc' })
+        );
+        // PR with older updated_at should be skipped
+        expect(mockOctokit.rest.pulls.get).toHaveBeenCalledTimes(1);
+        expect(mockOctokit.rest.pulls.get).toHaveBeenCalledWith(
+          expect.objectContaining({ pull_number: 1 })
+        );
       });
-    });
 
-    describe('output-dir input', () => {
-      it('should use default output directory when not provided', async () => {
-        mockGetInput.mockImplementation((name: string) => {
+      it('should read updated-since from state file when input missing', async () => {
+        mockGetInput.mockImplementation((name: string): string => {
           if (name === 'token') return 'test-token';
-          if (name === 'output-dir') return '';
+          if (name === 'state-file') return '/tmp/state/last.txt';
           return '';
         });
 
+        mockExistsSync.mockImplementation((pathArg: fs.PathLike) => {
+          if (String(pathArg) === '/tmp/state/last.txt') return true;
+          return false;
+        });
+
         const mockOctokit = {
           rest: {
             issues: {
@@ -1369,59 +2664,118 @@ describe('Sync Issues Action', () => {
 
         await run();
 
-        expect(mockGetInput).toHaveBeenCalledWith('output-dir');
-        expect(mockExistsSync).toHaveBeenCalledWith('synced-issues');
-        expect(mockMkdirSync).toHaveBeenCalledWith('synced-issues', { recursive: true });
+        expect(mockReadFileSync).toHaveBeenCalledWith('/tmp/state/last.txt', 'utf-8');
+        expect(mockOctokit.rest.issues.listForRepo).toHaveBeenCalledWith(
+          expect.objectContaining({ since: '2024-01-01T00:00:00Z' })
+        );
+        expect(mockSetOutput).toHaveBeenCalledWith('last-synced-at', expect.any(String));
+        expect(mockWriteFileSync).toHaveBeenCalledWith(
+          '/tmp/state/last.txt',
+          expect.any(String),
+          'utf-8'
+        );
       });
+    });
 
-      it('should use custom output directory when provided', async () => {
-        mockGetInput.mockImplementation((name: string) => {
+    describe('force-update input', () => {
+      it('should re-write issue files even when body is unchanged', async () => {
+        mockGetInput.mockImplementation((name: string): string => {
           if (name === 'token') return 'test-token';
-          if (name === 'output-dir') return '/custom/output/path';
+          if (name === 'sync-prs') return 'false';
+          if (name === 'force-update') return 'true';
           return '';
         });
 
+        const issue = {
+          number: 1,
+          title: 'Issue 1',
+          body: 'Body',
+          state: 'open',
+          labels: [],
+          created_at: '2024-01-01T00:00:00Z',
+          updated_at: '2024-01-02T00:00:00Z',
+          user: { login: 'user1' },
+          html_url: 'https://example.com/issue/1',
+          milestone: null,
+        };
+
+        const newContent = formatIssueAsMarkdown(issue, []);
+        const existingContent = newContent.replace(/synced: .+/, 'synced: 2000-01-01T00:00:00Z');
+
+        mockExistingMarkdown({ 'synced-issues/issues/issue-1.md': existingContent });
+
         const mockOctokit = {
           rest: {
             issues: {
-              listForRepo: jest.fn().mockResolvedValue({ data: [] }),
-              get: jest.fn(),
+              listForRepo: jest.fn().mockResolvedValue({ data: [issue] }),
+              get: jest.fn().mockResolvedValue({ data: issue }),
               listComments: jest.fn().mockResolvedValue({ data: [] }),
             },
             pulls: {
-              list: jest.fn().mockResolvedValue({ data: [] }),
+              list: jest.fn(),
               get: jest.fn(),
-              listReviewComments: jest.fn().mockResolvedValue({ data: [] }),
+              listReviewComments: jest.fn(),
             },
           },
+          graphql: jest.fn().mockResolvedValue({ repository: {} }),
         };
         setMockOctokit(mockOctokit);
 
         await run();
 
-        expect(mockExistsSync).toHaveBeenCalledWith('/custom/output/path');
-        expect(mockMkdirSync).toHaveBeenCalledWith('/custom/output/path', { recursive: true });
+        expect(writtenMarkdown().map(([file]) => file)).toEqual([
+          'synced-issues/issues/issue-1.md',
+        ]);
+        expect(mockSetOutput).toHaveBeenCalledWith('issues-count', 1);
+        expect(mockSetOutput).toHaveBeenCalledWith(
+          'modified-files',
+          expect.stringContaining('issue-1.md')
+        );
       });
 
-      it('should not create directory if it already exists', async () => {
-        mockGetInput.mockImplementation((name: string) => {
+      it('should re-write PR files even when body is unchanged', async () => {
+        mockGetInput.mockImplementation((name: string): string => {
           if (name === 'token') return 'test-token';
-          if (name === 'output-dir') return '/existing/path';
+          if (name === 'sync-issues') return 'false';
+          if (name === 'force-update') return 'true';
           return '';
         });
-        mockExistsSync.mockReturnValue(true);
+
+        const pr = {
+          number: 10,
+          title: 'PR 10',
+          body: 'PR Body',
+          state: 'open',
+          labels: [],
+          created_at: '2024-01-01T00:00:00Z',
+          updated_at: '2024-01-02T00:00:00Z',
+          merged_at: null,
+          user: { login: 'pr-user' },
+          html_url: 'https://example.com/pr/10',
+          head: { ref: 'feature' },
+          base: { ref: 'main' },
+        };
+
+        const newContent = formatPRAsMarkdown(pr as never, [], []);
+        const existingContent = newContent.replace(/synced: .+/, 'synced: 2000-01-01T00:00:00Z');
+
+        mockExistingMarkdown({ 'synced-issues/pull-requests/pr-10.md': existingContent });
 
         const mockOctokit = {
           rest: {
             issues: {
-              listForRepo: jest.fn().mockResolvedValue({ data: [] }),
+              listForRepo: jest.fn(),
               get: jest.fn(),
-              listComments: jest.fn().mockResolvedValue({ data: [] }),
+              listComments: jest.fn(),
             },
             pulls: {
-              list: jest.fn().mockResolvedValue({ data: [] }),
-              get: jest.fn(),
+              list: jest.fn().mockResolvedValue({ data: [pr] }),
+              get: jest.fn().mockResolvedValue({ data: pr }),
               listReviewComments: jest.fn().mockResolvedValue({ data: [] }),
+              listCommits: jest.fn(),
+            },
+            repos: {
+              getCommit: jest.fn(),
             },
           },
         };
@@ -1429,30 +2783,60 @@ describe('Sync Issues Action', () => {
 
         await run();
 
-        expect(mockExistsSync).toHaveBeenCalledWith('/existing/path');
-        expect(mockMkdirSync).not.toHaveBeenCalledWith('/existing/path', expect.anything());
+        expect(writtenMarkdown().map(([file]) => file)).toEqual([
+          'synced-issues/pull-requests/pr-10.md',
+        ]);
+        expect(mockSetOutput).toHaveBeenCalledWith('prs-count', 1);
+        expect(mockSetOutput).toHaveBeenCalledWith(
+          'modified-files',
+          expect.stringContaining('pr-10.md')
+        );
       });
     });
 
-    describe('sync-issues input', () => {
-      it('should default to true when not provided', async () => {
+    describe('max-concurrency input', () => {
+      const makeIssue = (number: number) => ({
+        number,
+        title: `Issue ${number}`,
+        body: 'Body',
+        state: 'open',
+        labels: [],
+        created_at: '2024-01-01T00:00:00Z',
+        updated_at: '2024-01-02T00:00:00Z',
+        user: { login: 'user1' },
+        html_url: `https://example.com/issue/${number}`,
+        milestone: null,
+      });
+
+      it('should keep modified-files and log order deterministic', async () => {
         mockGetInput.mockImplementation((name: string): string => {
           if (name === 'token') return 'test-token';
-          if (name === 'sync-issues') return '';
+          if (name === 'sync-prs') return 'false';
+          if (name === 'sync-sub-issues') return 'false';
+          if (name === 'max-concurrency') return '3';
           return '';
         });
 
+        const issues = [1, 2, 3, 4, 5].map(makeIssue);
+        let active = 0;
+        let peak = 0;
         const mockOctokit = {
           rest: {
             issues: {
-              listForRepo: jest.fn().mockResolvedValue({ data: [] }),
-              get: jest.fn(),
+              listForRepo: jest.fn().mockResolvedValue({ data: issues }),
+              // Earlier issues take longer, so they finish last
+              get: jest.fn().mockImplementation(async ({ issue_number }) => {
+                active++;
+                peak = Math.max(peak, active);
+                await new Promise((resolve) => setTimeout(resolve, (6 - issue_number) * 5));
+                active--;
+                return { data: makeIssue(issue_number) };
+              }),
               listComments: jest.fn().mockResolvedValue({ data: [] }),
             },
             pulls: {
-              list: jest.fn().mockResolvedValue({ data: [] }),
+              list: jest.fn(),
               get: jest.fn(),
-              listReviewComments: jest.fn().mockResolvedValue({ data: [] }),
             },
           },
         };
@@ -1460,27 +2844,79 @@ describe('Sync Issues Action', () => {
 
         await run();
 
-        expect(mockInfo).toHaveBeenCalledWith('Syncing issues...');
-        expect(mockOctokit.rest.issues.listForRepo).toHaveBeenCalled();
+        expect(peak).toBe(3);
+        expect(mockSetOutput).toHaveBeenCalledWith(
+          'modified-files',
+          [1, 2, 3, 4, 5].map((n) => `synced-issues/issues/issue-${n}.md`).join(',')
+        );
+        const syncedLogs = mockInfo.mock.calls
+          .map((call) => call[0] as string)
+          .filter((message) => message.startsWith('Synced issue'));
+        expect(syncedLogs.map((message) => message.split(' ')[2])).toEqual([
+          '#1',
+          '#2',
+          '#3',
+          '#4',
+          '#5',
+        ]);
       });
 
-      it('should sync issues when set to true', async () => {
+      it('should bound getCommit calls for a closed PR by max-concurrency', async () => {
         mockGetInput.mockImplementation((name: string): string => {
           if (name === 'token') return 'test-token';
-          if (name === 'sync-issues') return 'true';
+          if (name === 'sync-issues') return 'false';
+          if (name === 'include-closed') return 'true';
+          if (name === 'max-concurrency') return '2';
           return '';
         });
 
+        const closedPR = {
+          number: 15,
+          title: 'Closed PR',
+          body: 'PR Body',
+          state: 'closed',
+          labels: [],
+          created_at: '2024-01-01T00:00:00Z',
+          updated_at: '2024-01-02T00:00:00Z',
+          merged_at: null,
+          user: { login: 'pr-user' },
+          html_url: 'https://example.com/pr/15',
+          head: { ref: 'feature' },
+          base: { ref: 'main' },
+        };
+        const commits = Array.from({ length: 10 }, (_, i) => ({
+          sha: `sha${i}`,
+          commit: {
+            message: `commit ${i}`,
+            author: { name: 'Author', date: '2024-01-02T10:00:00Z' },
+          },
+          author: null,
+          html_url: `https://github.com/test/repo/commit/sha${i}`,
+        }));
+
+        let active = 0;
+        let peak = 0;
         const mockOctokit = {
           rest: {
             issues: {
-              listForRepo: jest.fn().mockResolvedValue({ data: [] }),
+              listForRepo: jest.fn(),
               get: jest.fn(),
               listComments: jest.fn().mockResolvedValue({ data: [] }),
             },
             pulls: {
-              list: jest.fn().mockResolvedValue({ data: [] }),
-              get: jest.fn(),
+              list: jest.fn().mockResolvedValue({ data: [closedPR] }),
+              get: jest.fn().mockResolvedValue({ data: closedPR }),
+              listReviewComments: jest.fn().mockResolvedValue({ data: [] }),
+              listCommits: jest.fn().mockResolvedValue({ data: commits }),
+            },
+            repos: {
+              getCommit: jest.fn().mockImplementation(async () => {
+                active++;
+                peak = Math.max(peak, active);
+                await new Promise((resolve) => setTimeout(resolve, 2));
+                active--;
+                return { data: { stats: { total: 1 }, files: [{ filename: 'a.ts' }] } };
+              }),
             },
           },
         };
@@ -1488,85 +2924,169 @@ describe('Sync Issues Action', () => {
 
         await run();
 
-        expect(mockInfo).toHaveBeenCalledWith('Syncing issues...');
-        expect(mockOctokit.rest.issues.listForRepo).toHaveBeenCalled();
+        expect(mockOctokit.rest.repos.getCommit).toHaveBeenCalledTimes(10);
+        expect(peak).toBe(2);
+        expect(mockSetFailed).not.toHaveBeenCalled();
       });
 
-      it('should not sync issues when set to false', async () => {
+      it('should fail on a non-positive max-concurrency', async () => {
         mockGetInput.mockImplementation((name: string): string => {
           if (name === 'token') return 'test-token';
-          if (name === 'sync-issues') return 'false';
+          if (name === 'max-concurrency') return '0';
           return '';
         });
 
-        const mockOctokit = {
-          rest: {
-            issues: {
-              listForRepo: jest.fn(),
-              get: jest.fn(),
-              listComments: jest.fn(),
-            },
-            pulls: {
-              list: jest.fn().mockResolvedValue({ data: [] }),
-              get: jest.fn(),
-            },
-          },
-        };
-        setMockOctokit(mockOctokit);
-
         await run();
 
-        expect(mockInfo).not.toHaveBeenCalledWith('Syncing issues...');
-        expect(mockOctokit.rest.issues.listForRepo).not.toHaveBeenCalled();
+        expect(mockSetFailed).toHaveBeenCalledWith(
+          'Invalid max-concurrency "0". Expected a positive integer.'
+        );
       });
+    });
 
-      it('should handle case-insensitive true values', async () => {
+    describe('graphql-issues input', () => {
+      it('should sync issues from GraphQL without per-issue REST calls', async () => {
         mockGetInput.mockImplementation((name: string): string => {
           if (name === 'token') return 'test-token';
-          if (name === 'sync-issues') return 'TRUE';
+          if (name === 'sync-prs') return 'false';
+          if (name === 'graphql-issues') return 'true';
           return '';
         });
 
         const mockOctokit = {
           rest: {
             issues: {
-              listForRepo: jest.fn().mockResolvedValue({ data: [] }),
+              listForRepo: jest.fn(),
               get: jest.fn(),
-              listComments: jest.fn().mockResolvedValue({ data: [] }),
+              listComments: jest.fn(),
             },
             pulls: {
-              list: jest.fn().mockResolvedValue({ data: [] }),
+              list: jest.fn(),
               get: jest.fn(),
             },
           },
+          graphql: jest.fn().mockResolvedValue({
+            rateLimit: { cost: 1 },
+            repository: {
+              issues: {
+                pageInfo: { hasNextPage: false, endCursor: null },
+                nodes: [
+                  {
+                    id: 'I_7',
+                    number: 7,
+                    title: 'GraphQL issue',
+                    body: 'Body from GraphQL',
+                    state: 'OPEN',
+                    createdAt: '2024-01-01T00:00:00Z',
+                    updatedAt: '2024-01-02T00:00:00Z',
+                    url: 'https://example.com/issue/7',
+                    author: { login: 'user1' },
+                    labels: { nodes: [] },
+                    assignees: { nodes: [] },
+                    milestone: null,
+                    comments: {
+                      pageInfo: { hasNextPage: false, endCursor: null },
+                      nodes: [
+                        {
+                          databaseId: 70,
+                          body: 'First comment',
+                          createdAt: '2024-01-03T00:00:00Z',
+                          updatedAt: '2024-01-03T00:00:00Z',
+                          url: 'https://example.com/issue/7#issuecomment-70',
+                          author: null,
+                        },
+                      ],
+                    },
+                    parent: { number: 1 },
+                    subIssues: { nodes: [] },
+                  },
+                ],
+              },
+            },
+          }),
         };
         setMockOctokit(mockOctokit);
 
         await run();
 
-        expect(mockInfo).toHaveBeenCalledWith('Syncing issues...');
-        expect(mockOctokit.rest.issues.listForRepo).toHaveBeenCalled();
+        expect(mockOctokit.graphql).toHaveBeenCalledTimes(1);
+        expect(mockOctokit.rest.issues.listForRepo).not.toHaveBeenCalled();
+        expect(mockOctokit.rest.issues.get).not.toHaveBeenCalled();
+        expect(mockOctokit.rest.issues.listComments).not.toHaveBeenCalled();
+        const [[file, content]] = writtenMarkdown();
+        expect(file).toBe('synced-issues/issues/issue-7.md');
+        expect(content).toContain('First comment');
+        expect(content).toContain('parent: 1');
+        expect(content).toContain('comments: 1');
+        expect(content).toContain('Body from GraphQL');
+        expect(mockSetOutput).toHaveBeenCalledWith('issues-count', 1);
+        expect(mockSetOutput).toHaveBeenCalledWith(
+          'modified-files',
+          'synced-issues/issues/issue-7.md'
+        );
       });
     });
 
-    describe('sync-prs input', () => {
-      it('should default to true when not provided', async () => {
+    describe('commit-cache-path input', () => {
+      it('should reuse cached commit details instead of calling getCommit', async () => {
         mockGetInput.mockImplementation((name: string): string => {
           if (name === 'token') return 'test-token';
-          if (name === 'sync-prs') return '';
+          if (name === 'sync-issues') return 'false';
+          if (name === 'include-closed') return 'true';
+          if (name === 'commit-cache-path') return '.cache/commits.json';
           return '';
         });
 
+        const closedPR = {
+          number: 15,
+          title: 'Closed PR',
+          body: 'PR Body',
+          state: 'closed',
+          labels: [],
+          created_at: '2024-01-01T00:00:00Z',
+          updated_at: '2024-01-02T00:00:00Z',
+          merged_at: null,
+          user: { login: 'pr-user' },
+          html_url: 'https://example.com/pr/15',
+          head: { ref: 'feature' },
+          base: { ref: 'main' },
+        };
+        const makeCommit = (sha: string) => ({
+          sha,
+          commit: { message: `commit ${sha}`, author: { name: 'Author', date: '2024-01-02' } },
+          author: null,
+          html_url: `https://github.com/test/repo/commit/${sha}`,
+        });
+
+        mockExistsSync.mockImplementation((p) => p === '.cache/commits.json');
+        mockReadFileSync.mockImplementation((p) =>
+          p === '.cache/commits.json'
+            ? JSON.stringify({
+                version: 1,
+                entries: [['cached1', { stats: { total: 2 }, files: [{ filename: 'x.ts' }] }]],
+              })
+            : ''
+        );
+
         const mockOctokit = {
           rest: {
             issues: {
-              listForRepo: jest.fn().mockResolvedValue({ data: [] }),
+              listForRepo: jest.fn(),
               get: jest.fn(),
               listComments: jest.fn().mockResolvedValue({ data: [] }),
             },
             pulls: {
-              list: jest.fn().mockResolvedValue({ data: [] }),
-              get: jest.fn(),
+              list: jest.fn().mockResolvedValue({ data: [closedPR] }),
+              get: jest.fn().mockResolvedValue({ data: closedPR }),
+              listReviewComments: jest.fn().mockResolvedValue({ data: [] }),
+              listCommits: jest
+                .fn()
+                .mockResolvedValue({ data: [makeCommit('cached1'), makeCommit('new2')] }),
+            },
+            repos: {
+              getCommit: jest.fn().mockResolvedValue({
+                data: { stats: { total: 1 }, files: [{ filename: 'y.ts' }] },
+              }),
             },
           },
         };
@@ -1574,27 +3094,94 @@ describe('Sync Issues Action', () => {
 
         await run();
 
-        expect(mockInfo).toHaveBeenCalledWith('Syncing pull requests...');
-        expect(mockOctokit.rest.pulls.list).toHaveBeenCalled();
+        expect(mockOctokit.rest.repos.getCommit).toHaveBeenCalledTimes(1);
+        expect(mockOctokit.rest.repos.getCommit).toHaveBeenCalledWith(
+          expect.objectContaining({ ref: 'new2' })
+        );
+        const prContent = writtenMarkdown().find(
+          ([file]) => file === 'synced-issues/pull-requests/pr-15.md'
+        )![1];
+        expect(prContent).toContain('2 files modified (x.ts)');
+        expect(prContent).toContain('1 file modified (y.ts)');
+
+        const cacheWrite = mockWriteFileSync.mock.calls.find(
+          (call) => call[0] === '.cache/commits.json'
+        );
+        const cachedShas = JSON.parse(cacheWrite![1] as string).entries.map(
+          ([sha]: [string]) => sha
+        );
+        expect(cachedShas).toEqual(['cached1', 'new2']);
+        expect(mockInfo).toHaveBeenCalledWith(
+          'Commit cache: 1 hit(s), 1 miss(es), 2 entry(ies) in .cache/commits.json'
+        );
       });
+    });
 
-      it('should sync PRs when set to true', async () => {
+    describe('comment-cache-dir input', () => {
+      const pr = {
+        number: 10,
+        title: 'PR 10',
+        body: 'PR Body',
+        state: 'open',
+        labels: [],
+        created_at: '2024-01-01T00:00:00Z',
+        updated_at: '2024-01-03T00:00:00Z',
+        merged_at: null,
+        user: { login: 'pr-user' },
+        html_url: 'https://example.com/pr/10',
+        head: { ref: 'feature' },
+        base: { ref: 'main' },
+      };
+      const comment = (id: number, body: string, extra: Record<string, unknown> = {}) => ({
+        id,
+        body,
+        user: { login: 'user1', html_url: 'https://github.com/user1' },
+        created_at: `2024-01-0${id}T00:00:00Z`,
+        updated_at: `2024-01-0${id}T00:00:00Z`,
+        html_url: `https://example.com/comment/${id}`,
+        ...extra,
+      });
+      const cacheFile = '.cache/comments/pr-10.json';
+      const savedCache = () =>
+        JSON.parse(
+          mockFsPromises.writeFile.mock.calls.find((call) => call[0] === cacheFile)![1] as string
+        );
+
+      beforeEach(() => {
         mockGetInput.mockImplementation((name: string): string => {
           if (name === 'token') return 'test-token';
-          if (name === 'sync-prs') return 'true';
+          if (name === 'sync-issues') return 'false';
+          if (name === 'comment-cache-dir') return '.cache/comments';
           return '';
         });
+        mockExistingMarkdown({
+          [cacheFile]: JSON.stringify({
+            version: 1,
+            comments: { since: '2024-01-02T00:00:00Z', comments: [comment(1, 'Old')] },
+            review_comments: {
+              since: '2024-01-02T00:00:00Z',
+              comments: [comment(2, 'Root', { path: 'a.ts', line: 1 })],
+            },
+          }),
+        });
+      });
 
+      it('should only fetch comments updated since the cached fetch and merge them', async () => {
         const mockOctokit = {
           rest: {
             issues: {
-              listForRepo: jest.fn().mockResolvedValue({ data: [] }),
+              listForRepo: jest.fn(),
               get: jest.fn(),
-              listComments: jest.fn().mockResolvedValue({ data: [] }),
+              listComments: jest.fn().mockResolvedValue({ data: [comment(1, 'Edited')] }),
             },
             pulls: {
-              list: jest.fn().mockResolvedValue({ data: [] }),
-              get: jest.fn(),
+              list: jest.fn().mockResolvedValue({ data: [pr] }),
+              get: jest
+                .fn()
+                .mockResolvedValue({ data: { ...pr, comments: 1, review_comments: 2 } }),
+              listReviewComments: jest.fn().mockResolvedValue({
+                data: [comment(3, 'Reply', { path: 'a.ts', line: 1, in_reply_to_id: 2 })],
+              }),
             },
           },
         };
@@ -1602,27 +3189,37 @@ describe('Sync Issues Action', () => {
 
         await run();
 
-        expect(mockInfo).toHaveBeenCalledWith('Syncing pull requests...');
-        expect(mockOctokit.rest.pulls.list).toHaveBeenCalled();
+        expect(mockOctokit.rest.issues.listComments).toHaveBeenCalledTimes(1);
+        expect(mockOctokit.rest.issues.listComments).toHaveBeenCalledWith(
+          expect.objectContaining({ since: '2024-01-02T00:00:00Z' })
+        );
+        expect(mockOctokit.rest.pulls.listReviewComments).toHaveBeenCalledWith(
+          expect.objectContaining({ since: '2024-01-02T00:00:00Z' })
+        );
+        const [[, content]] = writtenMarkdown();
+        expect(content).toContain('Edited');
+        expect(content).not.toContain('Old');
+        expect(content).toMatch(/Root[\s\S]*Reply/);
+        const saved = savedCache();
+        expect(saved.comments.comments.map((c: { body: string }) => c.body)).toEqual(['Edited']);
+        expect(saved.review_comments.comments).toHaveLength(2);
+        expect(saved.comments.since > '2024-01-02T00:00:00Z').toBe(true);
       });
 
-      it('should not sync PRs when set to false', async () => {
-        mockGetInput.mockImplementation((name: string): string => {
-          if (name === 'token') return 'test-token';
-          if (name === 'sync-prs') return 'false';
-          return '';
-        });
-
+      it('should fetch all comments again when some were deleted', async () => {
         const mockOctokit = {
           rest: {
             issues: {
-              listForRepo: jest.fn().mockResolvedValue({ data: [] }),
+              listForRepo: jest.fn(),
               get: jest.fn(),
               listComments: jest.fn().mockResolvedValue({ data: [] }),
             },
             pulls: {
-              list: jest.fn(),
-              get: jest.fn(),
+              list: jest.fn().mockResolvedValue({ data: [pr] }),
+              get: jest
+                .fn()
+                .mockResolvedValue({ data: { ...pr, comments: 0, review_comments: 1 } }),
+              listReviewComments: jest.fn().mockResolvedValue({ data: [] }),
             },
           },
         };
@@ -1630,29 +3227,32 @@ describe('Sync Issues Action', () => {
 
         await run();
 
-        expect(mockInfo).not.toHaveBeenCalledWith('Syncing pull requests...');
-        expect(mockOctokit.rest.pulls.list).not.toHaveBeenCalled();
+        expect(mockOctokit.rest.issues.listComments).toHaveBeenCalledTimes(2);
+        expect(mockOctokit.rest.issues.listComments).toHaveBeenLastCalledWith(
+          expect.not.objectContaining({ since: expect.anything() })
+        );
+        expect(savedCache().comments.comments).toEqual([]);
       });
-    });
 
-    describe('include-closed input', () => {
-      it('should default to false when not provided', async () => {
+      it('should ignore the cache with force-update', async () => {
         mockGetInput.mockImplementation((name: string): string => {
           if (name === 'token') return 'test-token';
-          if (name === 'include-closed') return '';
+          if (name === 'sync-issues') return 'false';
+          if (name === 'comment-cache-dir') return '.cache/comments';
+          if (name === 'force-update') return 'true';
           return '';
         });
-
         const mockOctokit = {
           rest: {
             issues: {
-              listForRepo: jest.fn().mockResolvedValue({ data: [] }),
+              listForRepo: jest.fn(),
               get: jest.fn(),
               listComments: jest.fn().mockResolvedValue({ data: [] }),
             },
             pulls: {
-              list: jest.fn().mockResolvedValue({ data: [] }),
-              get: jest.fn(),
+              list: jest.fn().mockResolvedValue({ data: [pr] }),
+              get: jest.fn().mockResolvedValue({ data: pr }),
+              listReviewComments: jest.fn().mockResolvedValue({ data: [] }),
             },
           },
         };
@@ -1660,280 +3260,431 @@ describe('Sync Issues Action', () => {
 
         await run();
 
-        expect(mockOctokit.rest.issues.listForRepo).toHaveBeenCalledWith(
-          expect.objectContaining({ state: 'open' })
-        );
-        expect(mockOctokit.rest.pulls.list).toHaveBeenCalledWith(
-          expect.objectContaining({ state: 'open' })
+        expect(mockOctokit.rest.issues.listComments).toHaveBeenCalledWith(
+          expect.not.objectContaining({ since: expect.anything() })
         );
+        expect(mockFsPromises.readFile).not.toHaveBeenCalledWith(cacheFile, 'utf-8');
       });
+    });
 
-      it('should include closed items when set to true', async () => {
+    describe('sync-manifest input', () => {
+      const manifestPath = 'synced-issues/.sync-manifest.json';
+      const makeIssue = (number: number, overrides: Record<string, unknown> = {}) => ({
+        number,
+        title: `Issue ${number}`,
+        body: 'Body',
+        state: 'open',
+        labels: [],
+        comments: 0,
+        created_at: '2024-01-01T00:00:00Z',
+        updated_at: '2024-01-02T00:00:00Z',
+        user: { login: 'user1' },
+        html_url: `https://github.com/test-owner/test-repo/issues/${number}`,
+        milestone: null,
+        ...overrides,
+      });
+      const useManifest = (
+        entries: Record<string, unknown>,
+        existingFiles: string[],
+        inputs: Record<string, string> = {}
+      ) => {
         mockGetInput.mockImplementation((name: string): string => {
           if (name === 'token') return 'test-token';
-          if (name === 'include-closed') return 'true';
-          return '';
+          if (name === 'sync-prs') return 'false';
+          if (name === 'sync-sub-issues') return 'false';
+          if (name === 'sync-manifest') return 'true';
+          return inputs[name] ?? '';
         });
+        mockExistsSync.mockImplementation((p) => p === manifestPath);
+        mockExistingMarkdown(Object.fromEntries(existingFiles.map((file) => [file, ''])));
+        // Same formatting as the action writes, so an unchanged manifest is not rewritten
+        mockReadFileSync.mockImplementation((p) =>
+          p === manifestPath
+            ? `${JSON.stringify({ version: 1, issues: entries, prs: {} }, null, 2)}\n`
+            : ''
+        );
+      };
+      const savedManifest = () => {
+        const call = mockWriteFileSync.mock.calls.find((c) => c[0] === manifestPath);
+        return JSON.parse(call![1] as string);
+      };
+      const outputValue = (name: string) =>
+        mockSetOutput.mock.calls.find((call) => call[0] === name)?.[1];
 
+      it('should skip fetching issues whose listing matches the manifest', async () => {
+        useManifest(
+          { '1': createManifestEntry('2024-01-02T00:00:00Z', 'Body', 0) },
+          ['synced-issues/issues/issue-1.md']
+        );
         const mockOctokit = {
           rest: {
             issues: {
-              listForRepo: jest.fn().mockResolvedValue({ data: [] }),
-              get: jest.fn(),
+              listForRepo: jest.fn().mockResolvedValue({ data: [makeIssue(1), makeIssue(2)] }),
+              get: jest.fn().mockResolvedValue({ data: makeIssue(2) }),
               listComments: jest.fn().mockResolvedValue({ data: [] }),
             },
-            pulls: {
-              list: jest.fn().mockResolvedValue({ data: [] }),
-              get: jest.fn(),
-            },
+            pulls: { list: jest.fn(), get: jest.fn() },
           },
         };
         setMockOctokit(mockOctokit);
 
         await run();
 
-        expect(mockOctokit.rest.issues.listForRepo).toHaveBeenCalledWith(
-          expect.objectContaining({ state: 'all' })
+        expect(mockOctokit.rest.issues.get).toHaveBeenCalledTimes(1);
+        expect(mockOctokit.rest.issues.get).toHaveBeenCalledWith(
+          expect.objectContaining({ issue_number: 2 })
         );
-        expect(mockOctokit.rest.pulls.list).toHaveBeenCalledWith(
-          expect.objectContaining({ state: 'all' })
+        expect(mockOctokit.rest.issues.listComments).toHaveBeenCalledTimes(1);
+        expect(mockReadFileSync).not.toHaveBeenCalledWith(
+          'synced-issues/issues/issue-1.md',
+          'utf-8'
+        );
+        expect(mockInfo).toHaveBeenCalledWith(
+          'Issue #1 unchanged since last sync, skipping synced-issues/issues/issue-1.md'
+        );
+        expect(Object.keys(savedManifest().issues)).toEqual(['1', '2']);
+        expect(outputValue('modified-files')).toBe(
+          `synced-issues/issues/issue-2.md,${manifestPath}`
         );
       });
 
-      it('should exclude closed items when set to false', async () => {
-        mockGetInput.mockImplementation((name: string): string => {
-          if (name === 'token') return 'test-token';
-          if (name === 'include-closed') return 'false';
-          return '';
-        });
-
+      it('should re-fetch a listed issue whose updated_at changed', async () => {
+        useManifest(
+          { '1': createManifestEntry('2024-01-01T00:00:00Z', 'Body', 0) },
+          ['synced-issues/issues/issue-1.md']
+        );
         const mockOctokit = {
           rest: {
             issues: {
-              listForRepo: jest.fn().mockResolvedValue({ data: [] }),
-              get: jest.fn(),
+              listForRepo: jest.fn().mockResolvedValue({ data: [makeIssue(1)] }),
+              get: jest.fn().mockResolvedValue({ data: makeIssue(1) }),
               listComments: jest.fn().mockResolvedValue({ data: [] }),
             },
-            pulls: {
-              list: jest.fn().mockResolvedValue({ data: [] }),
-              get: jest.fn(),
-            },
+            pulls: { list: jest.fn(), get: jest.fn() },
           },
         };
         setMockOctokit(mockOctokit);
 
         await run();
 
-        expect(mockOctokit.rest.issues.listForRepo).toHaveBeenCalledWith(
-          expect.objectContaining({ state: 'open' })
-        );
-        expect(mockOctokit.rest.pulls.list).toHaveBeenCalledWith(
-          expect.objectContaining({ state: 'open' })
-        );
+        expect(mockOctokit.rest.issues.get).toHaveBeenCalledTimes(1);
+        expect(savedManifest().issues['1'].updated_at).toBe('2024-01-02T00:00:00Z');
       });
-    });
 
-    describe('updated-since input', () => {
-      it('should pass since to issues and filter PRs when provided', async () => {
-        mockGetInput.mockImplementation((name: string): string => {
-          if (name === 'token') return 'test-token';
-          if (name === 'updated-since') return '2024-02-01T00:00:00Z';
-          return '';
+      it('should remove issues missing from a full listing', async () => {
+        const entry = createManifestEntry('2024-01-02T00:00:00Z', 'Body', 0);
+        useManifest({ '1': entry, '3': entry }, ['synced-issues/issues/issue-1.md'], {
+          'include-closed': 'true',
         });
-
         const mockOctokit = {
           rest: {
             issues: {
-              listForRepo: jest.fn().mockResolvedValue({ data: [] }),
-              get: jest.fn(),
-              listComments: jest.fn().mockResolvedValue({ data: [] }),
-            },
-            pulls: {
-              list: jest.fn().mockResolvedValue({
-                data: [
-                  { number: 1, updated_at: '2024-02-05T00:00:00Z' },
-                  { number: 2, updated_at: '2024-01-01T00:00:00Z' },
-                ],
-              }),
+              listForRepo: jest.fn().mockResolvedValue({ data: [makeIssue(1)] }),
               get: jest.fn(),
-              listReviewComments: jest.fn().mockResolvedValue({ data: [] }),
+              listComments: jest.fn(),
             },
+            pulls: { list: jest.fn(), get: jest.fn() },
           },
         };
         setMockOctokit(mockOctokit);
 
-        await run();
-
-        expect(mockOctokit.rest.issues.listForRepo).toHaveBeenCalledWith(
-          expect.objectContaining({ since: '2024-02-01T00:00:00Z' })
-        );
-        expect(mockOctokit.rest.pulls.list).toHaveBeenCalledWith(
-          expect.objectContaining({ sort: 'updated', direction: 'desc' })
-        );
-        // PR with older updated_at should be skipped
-        expect(mockOctokit.rest.pulls.get).toHaveBeenCalledTimes(1);
-        expect(mockOctokit.rest.pulls.get).toHaveBeenCalledWith(
-          expect.objectContaining({ pull_number: 1 })
-        );
-      });
-
-      it('should read updated-since from state file when input missing', async () => {
-        mockGetInput.mockImplementation((name: string): string => {
-          if (name === 'token') return 'test-token';
-          if (name === 'state-file') return '/tmp/state/last.txt';
-          return '';
-        });
+        await run();
 
-        mockExistsSync.mockImplementation((pathArg: fs.PathLike) => {
-          if (String(pathArg) === '/tmp/state/last.txt') return true;
-          return false;
-        });
+        expect(mockOctokit.rest.issues.get).not.toHaveBeenCalled();
+        expect(outputValue('removed-files')).toBe('synced-issues/issues/issue-3.md');
+        expect(Object.keys(savedManifest().issues)).toEqual(['1']);
+      });
 
+      it('should only remove deleted or transferred issues from an open-only listing', async () => {
+        const entry = createManifestEntry('2024-01-02T00:00:00Z', 'Body', 0);
+        useManifest({ '4': entry, '5': entry, '6': entry }, []);
         const mockOctokit = {
           rest: {
             issues: {
               listForRepo: jest.fn().mockResolvedValue({ data: [] }),
-              get: jest.fn(),
-              listComments: jest.fn().mockResolvedValue({ data: [] }),
+              get: jest.fn().mockImplementation(async ({ issue_number }) => {
+                if (issue_number === 4) {
+                  throw Object.assign(new Error('Not Found'), { status: 404 });
+                }
+                if (issue_number === 5) {
+                  return { data: makeIssue(5, { state: 'closed' }) };
+                }
+                return {
+                  data: makeIssue(6, { html_url: 'https://github.com/other/repo/issues/1' }),
+                };
+              }),
+              listComments: jest.fn(),
             },
-            pulls: {
-              list: jest.fn().mockResolvedValue({ data: [] }),
+            pulls: { list: jest.fn(), get: jest.fn() },
+          },
+        };
+        setMockOctokit(mockOctokit);
+
+        await run();
+
+        expect(outputValue('removed-files')).toBe(
+          'synced-issues/issues/issue-4.md,synced-issues/issues/issue-6.md'
+        );
+        expect(savedManifest().issues).toEqual({ '5': { ...entry, unlisted: true } });
+      });
+
+      it('should not reconcile when only recently updated items were listed', async () => {
+        const entry = createManifestEntry('2024-01-02T00:00:00Z', 'Body', 0);
+        useManifest({ '7': entry }, [], { 'updated-since': '2024-01-01T00:00:00Z' });
+        const mockOctokit = {
+          rest: {
+            issues: {
+              listForRepo: jest.fn().mockResolvedValue({ data: [] }),
               get: jest.fn(),
-              listReviewComments: jest.fn().mockResolvedValue({ data: [] }),
+              listComments: jest.fn(),
             },
+            pulls: { list: jest.fn(), get: jest.fn() },
           },
         };
         setMockOctokit(mockOctokit);
 
         await run();
 
-        expect(mockReadFileSync).toHaveBeenCalledWith('/tmp/state/last.txt', 'utf-8');
-        expect(mockOctokit.rest.issues.listForRepo).toHaveBeenCalledWith(
-          expect.objectContaining({ since: '2024-01-01T00:00:00Z' })
-        );
-        expect(mockSetOutput).toHaveBeenCalledWith('last-synced-at', expect.any(String));
-        expect(mockWriteFileSync).toHaveBeenCalledWith(
-          '/tmp/state/last.txt',
-          expect.any(String),
+        expect(mockOctokit.rest.issues.get).not.toHaveBeenCalled();
+        expect(outputValue('removed-files')).toBe('');
+        expect(mockWriteFileSync).not.toHaveBeenCalledWith(
+          manifestPath,
+          expect.anything(),
           'utf-8'
         );
       });
     });
 
-    describe('force-update input', () => {
-      it('should re-write issue files even when body is unchanged', async () => {
+    describe('rate limits', () => {
+      const issue = {
+        number: 1,
+        title: 'Issue 1',
+        body: 'Body',
+        state: 'open',
+        labels: [],
+        created_at: '2024-01-01T00:00:00Z',
+        updated_at: '2024-01-02T00:00:00Z',
+        user: { login: 'user1' },
+        html_url: 'https://example.com/issue/1',
+        milestone: null,
+      };
+      const secondaryLimit = () =>
+        Object.assign(new Error('You have exceeded a secondary rate limit'), {
+          status: 403,
+          response: { headers: { 'retry-after': '0' } },
+        });
+
+      beforeEach(() => {
         mockGetInput.mockImplementation((name: string): string => {
           if (name === 'token') return 'test-token';
           if (name === 'sync-prs') return 'false';
-          if (name === 'force-update') return 'true';
+          if (name === 'sync-sub-issues') return 'false';
           return '';
         });
+      });
 
-        const issue = {
-          number: 1,
-          title: 'Issue 1',
-          body: 'Body',
-          state: 'open',
-          labels: [],
-          created_at: '2024-01-01T00:00:00Z',
-          updated_at: '2024-01-02T00:00:00Z',
-          user: { login: 'user1' },
-          html_url: 'https://example.com/issue/1',
-          milestone: null,
-        };
-
-        const newContent = formatIssueAsMarkdown(issue, []);
-        const existingContent = newContent.replace(/synced: .+/, 'synced: 2000-01-01T00:00:00Z');
-
-        mockExistsSync.mockReturnValue(true);
-        mockReadFileSync.mockReturnValue(existingContent);
-        mockWriteFileSync.mockImplementation(() => undefined);
-
+      it('should retry rate-limited comment pages instead of truncating them', async () => {
         const mockOctokit = {
           rest: {
             issues: {
               listForRepo: jest.fn().mockResolvedValue({ data: [issue] }),
               get: jest.fn().mockResolvedValue({ data: issue }),
-              listComments: jest.fn().mockResolvedValue({ data: [] }),
-            },
-            pulls: {
-              list: jest.fn(),
-              get: jest.fn(),
-              listReviewComments: jest.fn(),
+              listComments: jest
+                .fn()
+                .mockRejectedValueOnce(secondaryLimit())
+                .mockResolvedValueOnce({ data: [] }),
             },
+            pulls: { list: jest.fn(), get: jest.fn() },
           },
-          graphql: jest.fn().mockResolvedValue({ repository: {} }),
         };
         setMockOctokit(mockOctokit);
 
         await run();
 
-        expect(mockWriteFileSync).toHaveBeenCalled();
-        expect(mockSetOutput).toHaveBeenCalledWith('issues-count', 1);
-        expect(mockSetOutput).toHaveBeenCalledWith(
-          'modified-files',
-          expect.stringContaining('issue-1.md')
+        expect(mockOctokit.rest.issues.listComments).toHaveBeenCalledTimes(2);
+        expect(mockWarning).toHaveBeenCalledWith(
+          'Rate limited by GitHub, retrying in 0s (attempt 1 of 5)'
         );
+        expect(mockWarning).not.toHaveBeenCalledWith(
+          expect.stringContaining('Failed to fetch comments')
+        );
+        expect(writtenMarkdown()).toHaveLength(1);
+        expect(mockSetFailed).not.toHaveBeenCalled();
       });
 
-      it('should re-write PR files even when body is unchanged', async () => {
-        mockGetInput.mockImplementation((name: string): string => {
-          if (name === 'token') return 'test-token';
-          if (name === 'sync-issues') return 'false';
-          if (name === 'force-update') return 'true';
-          return '';
-        });
-
-        const pr = {
-          number: 10,
-          title: 'PR 10',
-          body: 'PR Body',
-          state: 'open',
-          labels: [],
-          created_at: '2024-01-01T00:00:00Z',
-          updated_at: '2024-01-02T00:00:00Z',
-          merged_at: null,
-          user: { login: 'pr-user' },
-          html_url: 'https://example.com/pr/10',
-          head: { ref: 'feature' },
-          base: { ref: 'main' },
+      it('should fail instead of writing truncated markdown when retries run out', async () => {
+        const mockOctokit = {
+          rest: {
+            issues: {
+              listForRepo: jest.fn().mockResolvedValue({ data: [issue] }),
+              get: jest.fn().mockResolvedValue({ data: issue }),
+              listComments: jest.fn().mockRejectedValue(secondaryLimit()),
+            },
+            pulls: { list: jest.fn(), get: jest.fn() },
+          },
         };
+        setMockOctokit(mockOctokit);
 
-        const newContent = formatPRAsMarkdown(pr as never, [], []);
-        const existingContent = newContent.replace(/synced: .+/, 'synced: 2000-01-01T00:00:00Z');
+        await run();
 
-        mockExistsSync.mockReturnValue(true);
-        mockReadFileSync.mockReturnValue(existingContent);
-        mockWriteFileSync.mockImplementation(() => undefined);
+        expect(mockOctokit.rest.issues.listComments).toHaveBeenCalledTimes(6);
+        expect(writtenMarkdown()).toEqual([]);
+        expect(mockSetFailed).toHaveBeenCalledWith('You have exceeded a secondary rate limit');
+      });
 
+      it('should report remaining budgets and throttled time as outputs', async () => {
+        const reset = String(Math.floor(Date.now() / 1000) + 3600);
         const mockOctokit = {
           rest: {
             issues: {
-              listForRepo: jest.fn(),
+              listForRepo: jest.fn().mockResolvedValue({
+                data: [],
+                headers: {
+                  'x-ratelimit-limit': '5000',
+                  'x-ratelimit-remaining': '4321',
+                  'x-ratelimit-reset': reset,
+                  'x-ratelimit-resource': 'core',
+                },
+              }),
               get: jest.fn(),
               listComments: jest.fn(),
             },
-            pulls: {
-              list: jest.fn().mockResolvedValue({ data: [pr] }),
-              get: jest.fn().mockResolvedValue({ data: pr }),
-              listReviewComments: jest.fn().mockResolvedValue({ data: [] }),
-              listCommits: jest.fn(),
-            },
-            repos: {
-              getCommit: jest.fn(),
-            },
+            pulls: { list: jest.fn(), get: jest.fn() },
           },
         };
         setMockOctokit(mockOctokit);
 
         await run();
 
-        expect(mockWriteFileSync).toHaveBeenCalled();
-        expect(mockSetOutput).toHaveBeenCalledWith('prs-count', 1);
-        expect(mockSetOutput).toHaveBeenCalledWith(
-          'modified-files',
-          expect.stringContaining('pr-10.md')
+        expect(mockSetOutput).toHaveBeenCalledWith('rate-limit-remaining', 4321);
+        expect(mockSetOutput).toHaveBeenCalledWith('graphql-rate-limit-remaining', '');
+        expect(mockSetOutput).toHaveBeenCalledWith('throttled-seconds', 0);
+      });
+    });
+
+    describe('metrics-file input', () => {
+      const issue = {
+        number: 1,
+        title: 'Issue 1',
+        body: 'Body',
+        state: 'open',
+        labels: [],
+        created_at: '2024-01-01T00:00:00Z',
+        updated_at: '2024-01-02T00:00:00Z',
+        user: { login: 'user1' },
+        html_url: 'https://example.com/issue/1',
+        milestone: null,
+      };
+      const summary = core.summary as unknown as Record<string, jest.Mock>;
+      const originalSummaryPath = process.env.GITHUB_STEP_SUMMARY;
+
+      const mockOctokit = () => ({
+        rest: {
+          issues: {
+            listForRepo: jest.fn().mockResolvedValue({ data: [issue] }),
+            get: jest.fn().mockResolvedValue({ data: issue }),
+            listComments: jest.fn().mockResolvedValue({ data: [] }),
+          },
+          pulls: { list: jest.fn().mockResolvedValue({ data: [] }), get: jest.fn() },
+        },
+      });
+
+      afterEach(() => {
+        if (originalSummaryPath === undefined) {
+          delete process.env.GITHUB_STEP_SUMMARY;
+        } else {
+          process.env.GITHUB_STEP_SUMMARY = originalSummaryPath;
+        }
+      });
+
+      it('should write per-phase timings, API calls and counters as JSON', async () => {
+        mockGetInput.mockImplementation((name: string): string => {
+          if (name === 'token') return 'test-token';
+          if (name === 'sync-sub-issues') return 'false';
+          if (name === 'metrics-file') return 'reports/sync-metrics.json';
+          return '';
+        });
+        setMockOctokit(mockOctokit());
+
+        await run();
+
+        const call = mockWriteFileSync.mock.calls.find(
+          ([file]) => file === 'reports/sync-metrics.json'
+        );
+        expect(call).toBeDefined();
+        expect(mockMkdirSync).toHaveBeenCalledWith('reports', { recursive: true });
+        const report = JSON.parse(call![1] as string);
+        expect(Object.keys(report.phases)).toEqual([
+          'listing',
+          'relationships',
+          'details',
+          'comments',
+          'review-comments',
+          'commits',
+          'rendering',
+          'diffing',
+          'writing',
+        ]);
+        expect(report.phases.listing.count).toBe(2);
+        expect(report.phases.details.count).toBe(1);
+        expect(report.phases.writing.count).toBe(1);
+        expect(report.api.endpoints).toEqual({
+          'issues.listForRepo': { calls: 1, bytes: expect.any(Number) },
+          'issues.get': { calls: 1, bytes: expect.any(Number) },
+          'issues.listComments': { calls: 1, bytes: 2 },
+          'pulls.list': { calls: 1, bytes: 2 },
+        });
+        expect(report.api.calls).toBe(4);
+        expect(report.counters['files-written']).toBe(1);
+        expect(mockSetOutput).toHaveBeenCalledWith('api-calls', 4);
+      });
+
+      it('should not write a metrics file by default', async () => {
+        mockGetInput.mockImplementation((name: string): string => {
+          if (name === 'token') return 'test-token';
+          if (name === 'sync-sub-issues') return 'false';
+          return '';
+        });
+        setMockOctokit(mockOctokit());
+
+        await run();
+
+        expect(mockWriteFileSync).not.toHaveBeenCalled();
+        expect(writtenMarkdown()).toHaveLength(1);
+        expect(mockSetOutput).toHaveBeenCalledWith('api-calls', 4);
+      });
+
+      it('should add the metrics to the job summary', async () => {
+        process.env.GITHUB_STEP_SUMMARY = '/tmp/step-summary.md';
+        mockGetInput.mockImplementation((name: string): string => {
+          if (name === 'token') return 'test-token';
+          if (name === 'sync-sub-issues') return 'false';
+          return '';
+        });
+        setMockOctokit(mockOctokit());
+
+        await run();
+
+        expect(summary.addHeading).toHaveBeenCalledWith('Sync metrics', 3);
+        expect(summary.addTable).toHaveBeenCalledWith(
+          expect.arrayContaining([['issues.get', '1', expect.any(String)]])
         );
+        expect(summary.write).toHaveBeenCalled();
+      });
+
+      it('should skip the job summary when job-summary is false', async () => {
+        process.env.GITHUB_STEP_SUMMARY = '/tmp/step-summary.md';
+        mockGetInput.mockImplementation((name: string): string => {
+          if (name === 'token') return 'test-token';
+          if (name === 'sync-sub-issues') return 'false';
+          if (name === 'job-summary') return 'false';
+          return '';
+        });
+        setMockOctokit(mockOctokit());
+
+        await run();
+
+        expect(summary.write).not.toHaveBeenCalled();
       });
     });
 
@@ -2130,9 +3881,7 @@ describe('Sync Issues Action', () => {
         const newContent = formatIssueAsMarkdown(issue, []);
         const existingContent = newContent.replace(/synced: .+/, 'synced: 2000-01-01T00:00:00Z');
 
-        mockExistsSync.mockReturnValue(true);
-        mockReadFileSync.mockReturnValue(existingContent);
-        mockWriteFileSync.mockImplementation(() => undefined);
+        mockExistingMarkdown({ 'synced-issues/issues/issue-1.md': existingContent });
 
         const mockOctokit = {
           rest: {
@@ -2153,7 +3902,7 @@ describe('Sync Issues Action', () => {
         await run();
 
         // No write because content (excluding synced) is unchanged
-        expect(mockWriteFileSync).not.toHaveBeenCalled();
+        expect(writtenMarkdown()).toEqual([]);
         expect(mockSetOutput).toHaveBeenCalledWith('issues-count', 1);
         expect(mockSetOutput).toHaveBeenCalledWith('prs-count', 0);
         expect(mockSetOutput).toHaveBeenCalledWith('modified-files', '');
@@ -2270,12 +4019,11 @@ describe('Sync Issues Action', () => {
         await run();
 
         // Should still write the file with basic commit info (fallback)
-        expect(mockWriteFileSync).toHaveBeenCalled();
         // The warning is logged via core.debug, not core.warning for individual commit failures
         // But we should verify the file was written with fallback commit info
-        const writeCall = mockWriteFileSync.mock.calls[0];
+        const [writeCall] = writtenMarkdown();
         expect(writeCall).toBeDefined();
-        const writtenContent = writeCall[1] as string;
+        const writtenContent = writeCall[1];
         expect(writtenContent).toContain('## Commits');
         expect(writtenContent).toContain('feat: add feature');
       });
@@ -2356,11 +4104,9 @@ describe('Sync Issues Action', () => {
         await run();
 
         expect(mockOctokit.graphql).not.toHaveBeenCalled();
-        const writeCall = mockWriteFileSync.mock.calls.find(
-          (call) => String(call[0]).includes('issue-5.md')
-        );
+        const writeCall = writtenMarkdown().find(([file]) => file.includes('issue-5.md'));
         expect(writeCall).toBeDefined();
-        const content = writeCall![1] as string;
+        const content = writeCall![1];
         expect(content).toContain('parent: none');
         expect(content).toContain('children: none');
       });
@@ -2461,11 +4207,9 @@ describe('Sync Issues Action', () => {
 
         await run();
 
-        const writeCall = mockWriteFileSync.mock.calls.find(
-          (call) => String(call[0]).includes('issue-5.md')
-        );
+        const writeCall = writtenMarkdown().find(([file]) => file.includes('issue-5.md'));
         expect(writeCall).toBeDefined();
-        const content = writeCall![1] as string;
+        const content = writeCall![1];
         expect(content).toContain('parent: 2');
         expect(content).toContain('children: 10, 11');
         expect(content).not.toContain('relationship:');
@@ -2538,6 +4282,120 @@ describe('Sync Issues Action', () => {
         expect(mockSetOutput).toHaveBeenCalledWith('issues-count', 101);
       });
 
+      it('should write each page of issues while the next page is being listed', async () => {
+        mockGetInput.mockImplementation((name: string): string => {
+          if (name === 'token') return 'test-token';
+          if (name === 'sync-prs') return 'false';
+          if (name === 'sync-sub-issues') return 'false';
+          return '';
+        });
+
+        const issueAt = (number: number) => ({
+          number,
+          title: `Issue ${number}`,
+          body: 'Body',
+          state: 'open',
+          labels: [],
+          created_at: '2024-01-01T00:00:00Z',
+          updated_at: '2024-01-02T00:00:00Z',
+          user: { login: 'user1' },
+          html_url: `https://example.com/issue/${number}`,
+          milestone: null,
+        });
+        const firstPageIssues = Array.from({ length: 100 }, (_, i) => issueAt(i + 1));
+        let writesBeforeSecondPage = -1;
+
+        const mockOctokit = {
+          rest: {
+            issues: {
+              listForRepo: jest
+                .fn()
+                .mockResolvedValueOnce({ data: firstPageIssues })
+                .mockImplementationOnce(
+                  () =>
+                    new Promise((resolve) =>
+                      setTimeout(() => {
+                        writesBeforeSecondPage = mockFsPromises.rename.mock.calls.length;
+                        resolve({ data: [issueAt(101)] });
+                      }, 20)
+                    )
+                ),
+              get: jest
+                .fn()
+                .mockImplementation(({ issue_number }) =>
+                  Promise.resolve({ data: issueAt(issue_number) })
+                ),
+              listComments: jest.fn().mockResolvedValue({ data: [] }),
+            },
+            pulls: { list: jest.fn(), get: jest.fn() },
+          },
+        };
+        setMockOctokit(mockOctokit);
+
+        await run();
+
+        expect(writesBeforeSecondPage).toBe(100);
+        expect(mockFsPromises.rename).toHaveBeenCalledTimes(101);
+        expect(mockSetOutput).toHaveBeenCalledWith('issues-count', 101);
+      });
+
+      it('should look up sub-issue relationships page by page', async () => {
+        mockGetInput.mockImplementation((name: string): string => {
+          if (name === 'token') return 'test-token';
+          if (name === 'sync-prs') return 'false';
+          return '';
+        });
+
+        const issueAt = (number: number) => ({
+          number,
+          title: `Issue ${number}`,
+          body: 'Body',
+          state: 'open',
+          labels: [],
+          created_at: '2024-01-01T00:00:00Z',
+          updated_at: '2024-01-02T00:00:00Z',
+          user: { login: 'user1' },
+          html_url: `https://example.com/issue/${number}`,
+          milestone: null,
+        });
+        const firstPageIssues = Array.from({ length: 100 }, (_, i) => issueAt(i + 1));
+
+        const mockOctokit = {
+          rest: {
+            issues: {
+              listForRepo: jest
+                .fn()
+                .mockResolvedValueOnce({ data: firstPageIssues })
+                .mockResolvedValueOnce({ data: [issueAt(101)] }),
+              get: jest
+                .fn()
+                .mockImplementation(({ issue_number }) =>
+                  Promise.resolve({ data: issueAt(issue_number) })
+                ),
+              listComments: jest.fn().mockResolvedValue({ data: [] }),
+            },
+            pulls: { list: jest.fn(), get: jest.fn() },
+          },
+          graphql: jest
+            .fn()
+            .mockRejectedValue(new Error("Field 'subIssues' doesn't exist on type 'Issue'")),
+        };
+        setMockOctokit(mockOctokit);
+
+        await run();
+
+        // The first page finds the API missing, so the second page does not ask again
+        expect(mockOctokit.graphql).toHaveBeenCalledTimes(1);
+        expect(mockOctokit.graphql.mock.calls[0][0]).toContain('issue_1: issue(number: 1)');
+        expect(mockOctokit.graphql.mock.calls[0][0]).not.toContain('issue_101:');
+        expect(
+          mockInfo.mock.calls.filter(([message]) =>
+            String(message).includes('Sub-issues API is not available')
+          )
+        ).toHaveLength(1);
+        expect(mockSetOutput).toHaveBeenCalledWith('issues-count', 101);
+      });
+
       it('should fetch commits for closed PRs', async () => {
         mockGetInput.mockImplementation((name: string): string => {
           if (name === 'token') return 'test-token';
@@ -1,6 +1,7 @@
 import * as core from '@actions/core';
 import * as github from '@actions/github';
 import { createAppAuth } from '@octokit/auth-app';
+import * as crypto from 'crypto';
 import * as fs from 'fs';
 import * as path from 'path';
 
@@ -25,6 +26,7 @@ interface Issue {
   html_url: string;
   assignees?: Array<{ login: string }>;
   milestone?: { title: string; number: number } | null;
+  comments?: number;
 }
 
 interface PullRequest {
@@ -42,6 +44,8 @@ interface PullRequest {
   base: { ref: string };
   assignees?: Array<{ login: string }>;
   milestone?: { title: string; number: number } | null;
+  comments?: number;
+  review_comments?: number;
 }
 
 interface ReviewComment {
@@ -122,6 +126,8 @@ async function run(): Promise<void> {
     const includeClosedInput = core.getInput('include-closed') || 'false';
     const forceUpdateInput = core.getInput('force-update') || 'false';
     const syncSubIssuesInput = core.getInput('sync-sub-issues') || 'true';
+    const graphqlIssuesInput = core.getInput('graphql-issues') || 'false';
+    const syncManifestInput = core.getInput('sync-manifest') || 'false';
 
     // Convert to boolean (getBooleanInput is strict and throws if input is missing)
     const syncIssues = syncIssuesInput.toLowerCase() === 'true';
@@ -129,7 +135,24 @@ async function run(): Promise<void> {
     const includeClosed = includeClosedInput.toLowerCase() === 'true';
     const forceUpdate = forceUpdateInput.toLowerCase() === 'true';
     const syncSubIssues = syncSubIssuesInput.toLowerCase() === 'true';
+    const graphqlIssues = graphqlIssuesInput.toLowerCase() === 'true';
+    const useManifest = syncManifestInput.toLowerCase() === 'true';
     const updatedSince = resolveUpdatedSince(updatedSinceInput, stateFilePath);
+    const maxConcurrency = parsePositiveInteger(
+      'max-concurrency',
+      core.getInput('max-concurrency') || '4'
+    );
+    const metrics = createSyncMetrics();
+    const limit = createRequestScheduler(maxConcurrency, { metrics });
+    const metricsFile = (core.getInput('metrics-file') || '').trim();
+    const jobSummaryInput = core.getInput('job-summary') || 'true';
+    const jobSummary = jobSummaryInput.toLowerCase() === 'true';
+    const commitCachePath = (core.getInput('commit-cache-path') || '').trim();
+    const commentCacheDir = (core.getInput('comment-cache-dir') || '').trim();
+    const commitCacheMaxEntries = parsePositiveInteger(
+      'commit-cache-max-entries',
+      core.getInput('commit-cache-max-entries') || '50000'
+    );
 
     const octokit = github.getOctokit(tokenToUse);
     const context = github.context;
@@ -147,6 +170,10 @@ async function run(): Promise<void> {
     const issuesDir = path.join(outputDir, 'issues');
     const prsDir = path.join(outputDir, 'pull-requests');
     const modifiedFiles: string[] = [];
+    const removedFiles: string[] = [];
+    const manifestPath = path.join(outputDir, MANIFEST_FILENAME);
+    const manifest = useManifest ? loadSyncManifest(manifestPath) : undefined;
+    const commentCache = commentCacheDir ? createCommentCache(commentCacheDir) : undefined;
 
     if (syncIssues) {
       core.info('Syncing issues...');
@@ -161,10 +188,16 @@ async function run(): Promise<void> {
         includeClosed,
         updatedSince,
         forceUpdate,
-        syncSubIssues
+        syncSubIssues,
+        limit,
+        graphqlIssues,
+        manifest?.issues,
+        metrics,
+        commentCache
       );
       issuesCount = issuesResult.count;
       modifiedFiles.push(...issuesResult.files);
+      removedFiles.push(...issuesResult.removed);
     }
 
     if (syncPRs) {
@@ -172,6 +205,9 @@ async function run(): Promise<void> {
       if (!fs.existsSync(prsDir)) {
         fs.mkdirSync(prsDir, { recursive: true });
       }
+      const commitCache = commitCachePath
+        ? loadCommitCache(commitCachePath, commitCacheMaxEntries)
+        : undefined;
       const prsResult = await syncPRsToMarkdown(
         octokit,
         owner,
@@ -179,10 +215,28 @@ async function run(): Promise<void> {
         prsDir,
         includeClosed,
         updatedSince,
-        forceUpdate
+        forceUpdate,
+        limit,
+        commitCache,
+        manifest?.prs,
+        metrics,
+        commentCache
       );
       prsCount = prsResult.count;
       modifiedFiles.push(...prsResult.files);
+      removedFiles.push(...prsResult.removed);
+      if (commitCache) {
+        metrics.count('commit-cache-hits', commitCache.hits);
+        metrics.count('commit-cache-misses', commitCache.misses);
+        commitCache.save();
+        core.info(
+          `Commit cache: ${commitCache.hits} hit(s), ${commitCache.misses} miss(es), ${commitCache.size} entry(ies) in ${commitCachePath}`
+        );
+      }
+    }
+
+    if (manifest && saveSyncManifest(manifestPath, manifest)) {
+      modifiedFiles.push(manifestPath);
     }
 
     const lastSyncedAt = new Date().toISOString();
@@ -190,10 +244,40 @@ async function run(): Promise<void> {
     core.setOutput('prs-count', prsCount);
     core.setOutput('last-synced-at', lastSyncedAt);
     core.setOutput('modified-files', modifiedFiles.join(','));
+    core.setOutput('removed-files', removedFiles.join(','));
+    const restRemaining = limit.remaining('core');
+    const graphqlRemaining = limit.remaining('graphql');
+    const throttledSeconds = Math.round(limit.throttledMs() / 1000);
+    core.setOutput('rate-limit-remaining', restRemaining ?? '');
+    core.setOutput('graphql-rate-limit-remaining', graphqlRemaining ?? '');
+    core.setOutput('throttled-seconds', throttledSeconds);
+    core.info(
+      `Rate limit: ${restRemaining ?? 'unknown'} REST and ${graphqlRemaining ?? 'unknown'} GraphQL remaining, throttled for ${throttledSeconds}s`
+    );
     if (stateFilePath) {
       persistLastSync(stateFilePath, lastSyncedAt);
     }
 
+    const report = metrics.report();
+    core.setOutput('api-calls', report.api.calls);
+    core.info(
+      `Metrics: ${report.api.calls} API call(s), ${(report.api.bytes / 1024).toFixed(0)} KiB received in ${(report.duration_ms / 1000).toFixed(1)}s`
+    );
+    if (metricsFile) {
+      fs.mkdirSync(path.dirname(metricsFile), { recursive: true });
+      fs.writeFileSync(metricsFile, JSON.stringify(report, null, 2) + '\n', 'utf-8');
+      core.info(`Wrote sync metrics to ${metricsFile}`);
+    }
+    if (jobSummary && process.env.GITHUB_STEP_SUMMARY) {
+      try {
+        await writeMetricsSummary(report);
+      } catch (error) {
+        core.warning(
+          `Failed to write job summary: ${error instanceof Error ? error.message : 'Unknown error'}`
+        );
+      }
+    }
+
     core.info('Sync completed successfully!');
   } catch (error) {
     if (error instanceof Error) {
@@ -212,64 +296,249 @@ async function syncIssuesToMarkdown(
   includeClosed: boolean,
   updatedSince?: string,
   forceUpdate = false,
-  syncSubIssues = true
-): Promise<{ count: number; files: string[] }> {
-  const state = includeClosed ? 'all' : 'open';
-  let page = 1;
-  const perPage = 100;
-  let hasMore = true;
-  const allIssues: Array<{ number: number; pull_request?: unknown }> = [];
+  syncSubIssues = true,
+  limit: Limiter = createLimiter(1),
+  useGraphQL = false,
+  manifest?: Record<string, ManifestEntry>,
+  metrics: SyncMetrics = createSyncMetrics(),
+  commentCache?: CommentCache
+): Promise<{ count: number; files: string[]; removed: string[] }> {
+  const files: string[] = [];
+  const issueFile = (issueNumber: number) => `issue-${issueNumber}.md`;
+  const issuePath = (issueNumber: number) => path.join(outputDir, issueFile(issueNumber));
+  const writer = await createMarkdownWriter(outputDir, metrics);
+
+  // True when the manifest shows the issue is already synced as listed
+  const isUnchanged = (issueNumber: number, entry: ManifestEntry) =>
+    !!manifest &&
+    !forceUpdate &&
+    manifestEntryMatches(manifest[issueNumber], entry) &&
+    writer.exists(issueFile(issueNumber));
+
+  const writeIssue = async (
+    issueNumber: number,
+    issue: Issue,
+    comments: Comment[],
+    relationship: IssueRelationship | undefined,
+    entry: ManifestEntry
+  ) => {
+    const filepath = issuePath(issueNumber);
+    const content = metrics.time('rendering', () =>
+      formatIssueAsMarkdown(issue, comments, relationship)
+    );
+    const written = await writer.write(issueFile(issueNumber), content, forceUpdate);
+    if (manifest) {
+      manifest[issueNumber] = { ...entry, comments: comments.length };
+    }
+    return { issueNumber, filepath, written, skipped: false, commentCount: comments.length };
+  };
+
+  const skipIssue = (issueNumber: number) => ({
+    issueNumber,
+    filepath: issuePath(issueNumber),
+    written: false,
+    skipped: true,
+    commentCount: 0,
+  });
 
-  while (hasMore) {
-    const { data: issues } = await octokit.rest.issues.listForRepo({
+  // Logged in list order once every earlier issue is done
+  const logIssue = ({
+    issueNumber,
+    filepath,
+    written,
+    skipped,
+    commentCount,
+  }: Awaited<ReturnType<typeof writeIssue>>) => {
+    if (skipped) {
+      metrics.count('items-skipped');
+      core.info(`Issue #${issueNumber} unchanged since last sync, skipping ${filepath}`);
+    } else if (written) {
+      metrics.count('files-written');
+      files.push(filepath);
+      core.info(`Synced issue #${issueNumber} with ${commentCount} comment(s) to ${filepath}`);
+    } else {
+      metrics.count('files-unchanged');
+      core.info(`Issue #${issueNumber} unchanged, skipping write to ${filepath}`);
+    }
+  };
+
+  // Issues that left the listing are only known to be gone when every open issue
+  // was listed; closed ones are then checked one by one unless include-closed is on
+  const reconcile = async (listed: number[]): Promise<string[]> => {
+    if (!manifest || updatedSince) {
+      return [];
+    }
+    const isGone = (issueNumber: number, entry: ManifestEntry) => {
+      if (includeClosed) {
+        return Promise.resolve(true);
+      }
+      return entry.unlisted
+        ? Promise.resolve(undefined)
+        : isIssueGone(octokit, owner, repo, issueNumber, limit);
+    };
+    return reconcileManifest(manifest, new Set(listed), issuePath, 'issue', isGone);
+  };
+
+  if (useGraphQL) {
+    // Bodies, comments and relationships all come from the bulk queries; each page is
+    // written while the next one is queried
+    const issueNumbers: number[] = [];
+    for await (const issues of fetchIssuesWithGraphQL(
+      octokit,
       owner,
       repo,
-      state,
-      per_page: perPage,
-      page,
-      ...(updatedSince ? { since: updatedSince } : {}),
-    });
-
-    const actualIssues = issues.filter((issue) => !issue.pull_request);
-    allIssues.push(...actualIssues);
-
-    hasMore = issues.length === perPage;
-    page++;
+      includeClosed,
+      updatedSince,
+      syncSubIssues,
+      limit,
+      metrics
+    )) {
+      issueNumbers.push(...issues.map(({ issue }) => issue.number));
+      await mapInOrder(
+        issues,
+        limit.concurrency,
+        async ({ issue, comments, relationship }) => {
+          const entry = createManifestEntry(
+            issue.updated_at,
+            issue.body,
+            comments.length,
+            relationship
+          );
+          return isUnchanged(issue.number, entry)
+            ? skipIssue(issue.number)
+            : writeIssue(issue.number, issue, comments, relationship, entry);
+        },
+        logIssue
+      );
+    }
+    const removed = await reconcile(issueNumbers);
+    return { count: issueNumbers.length, files, removed };
   }
 
-  const issueNumbers = allIssues.map((issue) => issue.number);
-  const relationships = syncSubIssues
-    ? await fetchIssueRelationships(octokit, owner, repo, issueNumbers)
-    : new Map<number, IssueRelationship>();
+  // Each page goes through relationships, details and writing while the next one is listed,
+  // so only one page of issues is held at a time
+  const issueNumbers: number[] = [];
+  const relationshipState = createRelationshipQueryState();
+  for await (const issues of listIssuePages(
+    octokit,
+    owner,
+    repo,
+    includeClosed,
+    updatedSince,
+    limit,
+    metrics
+  )) {
+    const pageNumbers = issues.map((issue) => issue.number);
+    issueNumbers.push(...pageNumbers);
+    const relationships = syncSubIssues
+      ? await metrics.time('relationships', () =>
+          fetchIssueRelationships(octokit, owner, repo, pageNumbers, limit, relationshipState)
+        )
+      : new Map<number, IssueRelationship>();
+
+    await mapInOrder(
+      issues,
+      limit.concurrency,
+      async (issue) => {
+        const relationship = relationships.get(issue.number);
+        const entry = createManifestEntry(
+          issue.updated_at,
+          issue.body,
+          issue.comments,
+          relationship
+        );
+        if (isUnchanged(issue.number, entry)) {
+          return skipIssue(issue.number);
+        }
 
-  const files: string[] = [];
-  for (const issue of allIssues) {
-    const filename = `issue-${issue.number}.md`;
-    const filepath = path.join(outputDir, filename);
+        const { data: fullIssue } = await metrics.time('details', () =>
+          limit(
+            () =>
+              octokit.rest.issues.get({
+                owner,
+                repo,
+                issue_number: issue.number,
+              }),
+            'issues.get'
+          )
+        );
 
-    const { data: fullIssue } = await octokit.rest.issues.get({
-      owner,
-      repo,
-      issue_number: issue.number,
-    });
+        // Only comments updated since the cached fetch are requested
+        const cacheKey = `issue-${issue.number}`;
+        const cached = commentCache && !forceUpdate ? await commentCache.load(cacheKey) : {};
+        const comments = await metrics.time('comments', () =>
+          fetchCommentsSince(cached.comments, fullIssue.comments, (since) =>
+            fetchComments(octokit, owner, repo, issue.number, limit, since)
+          )
+        );
+        await commentCache?.save(cacheKey, { comments });
+
+        return writeIssue(
+          issue.number,
+          fullIssue as Issue,
+          comments.comments,
+          relationship,
+          entry
+        );
+      },
+      logIssue
+    );
+  }
 
-    const comments = await fetchComments(octokit, owner, repo, issue.number);
-    const relationship = relationships.get(issue.number);
+  const removed = await reconcile(issueNumbers);
+  return { count: issueNumbers.length, files, removed };
+}
 
-    const content = formatIssueAsMarkdown(fullIssue as Issue, comments, relationship);
+interface ListedIssue {
+  number: number;
+  pull_request?: unknown;
+  updated_at?: string;
+  body?: string | null;
+  comments?: number;
+}
 
-    if (forceUpdate || hasContentChanged(content, filepath)) {
-      fs.writeFileSync(filepath, content, 'utf-8');
-      files.push(filepath);
-      core.info(
-        `Synced issue #${issue.number} with ${comments.length} comment(s) to ${filepath}`
-      );
-    } else {
-      core.info(`Issue #${issue.number} unchanged, skipping write to ${filepath}`);
-    }
-  }
+/**
+ * Yields the issues of each `listForRepo` page, without pull requests. The request for
+ * the next page is started before the current one is yielded, so listing overlaps with
+ * whatever the caller does with the page.
+ */
+async function* listIssuePages(
+  octokit: ReturnType<typeof github.getOctokit>,
+  owner: string,
+  repo: string,
+  includeClosed: boolean,
+  updatedSince?: string,
+  limit: Limiter = createLimiter(1),
+  metrics: SyncMetrics = createSyncMetrics()
+): AsyncGenerator<ListedIssue[]> {
+  const state = includeClosed ? 'all' : 'open';
+  const perPage = 100;
+  const fetchPage = (page: number) =>
+    metrics.time('listing', () =>
+      limit(
+        () =>
+          octokit.rest.issues.listForRepo({
+            owner,
+            repo,
+            state,
+            per_page: perPage,
+            page,
+            ...(updatedSince ? { since: updatedSince } : {}),
+          }),
+        'issues.listForRepo'
+      )
+    );
 
-  return { count: allIssues.length, files };
+  let page = 1;
+  let next: ReturnType<typeof fetchPage> | undefined = fetchPage(page);
+  while (next) {
+    const issues: ListedIssue[] = (await next).data;
+    next = issues.length === perPage ? fetchPage(++page) : undefined;
+    // The caller may stop early on an error; the prefetched page must not then
+    // surface as an unhandled rejection
+    next?.catch(() => undefined);
+    yield issues.filter((issue) => !issue.pull_request);
+  }
 }
 
 async function syncPRsToMarkdown(
@@ -279,76 +548,147 @@ async function syncPRsToMarkdown(
   outputDir: string,
   includeClosed: boolean,
   updatedSince?: string,
-  forceUpdate = false
-): Promise<{ count: number; files: string[] }> {
+  forceUpdate = false,
+  limit: Limiter = createLimiter(1),
+  commitCache?: CommitCache,
+  manifest?: Record<string, ManifestEntry>,
+  metrics: SyncMetrics = createSyncMetrics(),
+  commentCache?: CommentCache
+): Promise<{ count: number; files: string[]; removed: string[] }> {
   const state = includeClosed ? 'all' : 'open';
   let page = 1;
   const perPage = 100;
   let hasMore = true;
   let prsCount = 0;
   const files: string[] = [];
+  const listed: number[] = [];
+  const prFile = (pullNumber: number) => `pr-${pullNumber}.md`;
+  const prPath = (pullNumber: number) => path.join(outputDir, prFile(pullNumber));
+  const writer = await createMarkdownWriter(outputDir, metrics);
 
   while (hasMore) {
-    const { data: prs } = await octokit.rest.pulls.list({
-      owner,
-      repo,
-      state,
-      per_page: perPage,
-      page,
-      ...(updatedSince
-        ? {
-            sort: 'updated',
-            direction: 'desc',
-          }
-        : {}),
-    });
+    const { data: prs } = await metrics.time('listing', () =>
+      limit(
+        () =>
+          octokit.rest.pulls.list({
+            owner,
+            repo,
+            state,
+            per_page: perPage,
+            page,
+            ...(updatedSince
+              ? {
+                  sort: 'updated',
+                  direction: 'desc',
+                }
+              : {}),
+          }),
+        'pulls.list'
+      )
+    );
 
     const filteredPRs = updatedSince
       ? prs.filter((pr) => isUpdatedSince(pr.updated_at, updatedSince))
       : prs;
     prsCount += filteredPRs.length;
+    listed.push(...filteredPRs.map((pr) => pr.number));
+
+    await mapInOrder(
+      filteredPRs,
+      limit.concurrency,
+      async (pr) => {
+        const filepath = prPath(pr.number);
+
+        // The list endpoint has no comment count, but new comments and reviews
+        // bump updated_at
+        const entry = createManifestEntry(pr.updated_at, pr.body);
+        if (
+          manifest &&
+          !forceUpdate &&
+          manifestEntryMatches(manifest[pr.number], entry) &&
+          writer.exists(prFile(pr.number))
+        ) {
+          return { filepath, written: false, skipped: true, commentCount: 0, commitCount: 0 };
+        }
 
-    for (const pr of filteredPRs) {
-      const filename = `pr-${pr.number}.md`;
-      const filepath = path.join(outputDir, filename);
-
-      // Fetch full PR details to get all metadata
-      const { data: fullPR } = await octokit.rest.pulls.get({
-        owner,
-        repo,
-        pull_number: pr.number,
-      });
-
-      // Fetch comments for this PR (issue comments + review comments)
-      const comments = await fetchComments(octokit, owner, repo, pr.number);
-      const reviewComments = await fetchReviewComments(octokit, owner, repo, pr.number);
-
-      // Fetch commits if PR is closed
-      let commits: Array<{
-        sha: string;
-        commit: { message: string; author: { name: string; date: string } };
-        author: { login: string; html_url: string } | null;
-        html_url: string;
-        stats?: { total?: number; additions?: number; deletions?: number };
-        files?: Array<{ filename: string }>;
-      }> = [];
-      if (fullPR.state === 'closed') {
-        commits = await fetchPRCommits(octokit, owner, repo, pr.number);
-      }
+        // Fetch full PR details to get all metadata
+        const { data: fullPR } = await metrics.time('details', () =>
+          limit(
+            () =>
+              octokit.rest.pulls.get({
+                owner,
+                repo,
+                pull_number: pr.number,
+              }),
+            'pulls.get'
+          )
+        );
 
-      const content = formatPRAsMarkdown(fullPR as PullRequest, comments, reviewComments, commits);
+        // Fetch comments for this PR (issue comments + review comments), only asking
+        // for those updated since the cached fetch
+        const cacheKey = `pr-${pr.number}`;
+        const cached = commentCache && !forceUpdate ? await commentCache.load(cacheKey) : {};
+        const issueComments = await metrics.time('comments', () =>
+          fetchCommentsSince(cached.comments, fullPR.comments, (since) =>
+            fetchComments(octokit, owner, repo, pr.number, limit, since)
+          )
+        );
+        const reviewThreadComments = await metrics.time('review-comments', () =>
+          fetchCommentsSince(cached.review_comments, fullPR.review_comments, (since) =>
+            fetchReviewComments(octokit, owner, repo, pr.number, limit, since)
+          )
+        );
+        await commentCache?.save(cacheKey, {
+          comments: issueComments,
+          review_comments: reviewThreadComments,
+        });
+        const comments = issueComments.comments;
+        const reviewComments = reviewThreadComments.comments;
+
+        // Fetch commits if PR is closed
+        let commits: Array<{
+          sha: string;
+          commit: { message: string; author: { name: string; date: string } };
+          author: { login: string; html_url: string } | null;
+          html_url: string;
+          stats?: { total?: number; additions?: number; deletions?: number };
+          files?: Array<{ filename: string }>;
+        }> = [];
+        if (fullPR.state === 'closed') {
+          commits = await metrics.time('commits', () =>
+            fetchPRCommits(octokit, owner, repo, pr.number, limit, commitCache)
+          );
+        }
 
-      if (forceUpdate || hasContentChanged(content, filepath)) {
-        fs.writeFileSync(filepath, content, 'utf-8');
-        files.push(filepath);
-        const commitInfo = commits.length > 0 ? ` with ${commits.length} commit(s)` : '';
-        core.info(
-          `Synced PR #${pr.number}${commitInfo} with ${comments.length + reviewComments.length} comment(s) to ${filepath}`
+        const content = metrics.time('rendering', () =>
+          formatPRAsMarkdown(fullPR as PullRequest, comments, reviewComments, commits)
         );
-      } else {
-        core.info(`PR #${pr.number} unchanged, skipping write to ${filepath}`);
+
+        const written = await writer.write(prFile(pr.number), content, forceUpdate);
+        const commentCount = comments.length + reviewComments.length;
+        if (manifest) {
+          manifest[pr.number] = { ...entry, comments: commentCount };
+        }
+        return { filepath, written, skipped: false, commentCount, commitCount: commits.length };
+      },
+      // Logged in list order once every earlier PR is done
+      ({ filepath, written, skipped, commentCount, commitCount }, pr) => {
+        if (skipped) {
+          metrics.count('items-skipped');
+          core.info(`PR #${pr.number} unchanged since last sync, skipping ${filepath}`);
+        } else if (written) {
+          metrics.count('files-written');
+          files.push(filepath);
+          const commitInfo = commitCount > 0 ? ` with ${commitCount} commit(s)` : '';
+          core.info(
+            `Synced PR #${pr.number}${commitInfo} with ${commentCount} comment(s) to ${filepath}`
+          );
+        } else {
+          metrics.count('files-unchanged');
+          core.info(`PR #${pr.number} unchanged, skipping write to ${filepath}`);
+        }
       }
-    }
+    );
 
     if (updatedSince) {
       const lastPR = prs[prs.length - 1];
@@ -360,14 +700,25 @@ async function syncPRsToMarkdown(
     page++;
   }
 
-  return { count: prsCount, files };
+  // Pull requests cannot be deleted or transferred, so only a full listing
+  // shows that one is gone
+  const removed =
+    manifest && includeClosed && !updatedSince
+      ? await reconcileManifest(manifest, new Set(listed), prPath, 'PR', () =>
+          Promise.resolve(true)
+        )
+      : [];
+
+  return { count: prsCount, files, removed };
 }
 
 async function fetchComments(
   octokit: ReturnType<typeof github.getOctokit>,
   owner: string,
   repo: string,
-  issueNumber: number
+  issueNumber: number,
+  limit: Limiter = createLimiter(1),
+  since?: string
 ): Promise<Comment[]> {
   const comments: Comment[] = [];
   let page = 1;
@@ -376,18 +727,28 @@ async function fetchComments(
 
   while (hasMore) {
     try {
-      const { data: pageComments } = await octokit.rest.issues.listComments({
-        owner,
-        repo,
-        issue_number: issueNumber,
-        per_page: perPage,
-        page,
-      });
+      const { data: pageComments } = await limit(
+        () =>
+          octokit.rest.issues.listComments({
+            owner,
+            repo,
+            issue_number: issueNumber,
+            per_page: perPage,
+            page,
+            ...(since ? { since } : {}),
+          }),
+        'issues.listComments'
+      );
 
       comments.push(...(pageComments as Comment[]));
       hasMore = pageComments.length === perPage;
       page++;
     } catch (error) {
+      // Rate limits are already retried by the scheduler; truncating here
+      // would silently write incomplete markdown
+      if (isRateLimitError(error)) {
+        throw error;
+      }
       core.warning(
         `Failed to fetch comments for #${issueNumber}: ${error instanceof Error ? error.message : 'Unknown error'}`
       );
@@ -398,22 +759,552 @@ async function fetchComments(
   return comments;
 }
 
+/**
+ * Runs async tasks with at most `concurrency` of them in flight at once.
+ * Tasks beyond the bound wait in FIFO order. `endpoint` names the API call for
+ * rate limiting and metrics; names starting with `graphql` use the GraphQL budget.
+ */
+export interface Limiter {
+  <T>(task: () => Promise<T>, endpoint?: string): Promise<T>;
+  readonly concurrency: number;
+}
+
+export function createLimiter(concurrency: number): Limiter {
+  let active = 0;
+  const waiting: Array<() => void> = [];
+
+  const limit = async <T>(task: () => Promise<T>): Promise<T> => {
+    if (active >= concurrency) {
+      // The finishing task hands its slot over, so active is not incremented here
+      await new Promise<void>((resolve) => waiting.push(resolve));
+    } else {
+      active++;
+    }
+    try {
+      return await task();
+    } finally {
+      const next = waiting.shift();
+      if (next) {
+        next();
+      } else {
+        active--;
+      }
+    }
+  };
+
+  return Object.assign(limit, { concurrency });
+}
+
+/**
+ * Runs `worker` over `items` with at most `concurrency` items in flight and passes each
+ * result to `emit` in input order, as soon as that item and all earlier ones are done.
+ * After a worker throws no new items are started and the error is rethrown.
+ */
+export async function mapInOrder<T, R>(
+  items: T[],
+  concurrency: number,
+  worker: (item: T) => Promise<R>,
+  emit: (result: R, item: T) => void
+): Promise<void> {
+  const results: Array<{ value: R } | undefined> = new Array(items.length);
+  let nextIndex = 0;
+  let emitIndex = 0;
+  let failed = false;
+
+  const runWorker = async (): Promise<void> => {
+    while (!failed && nextIndex < items.length) {
+      const index = nextIndex++;
+      try {
+        results[index] = { value: await worker(items[index]) };
+      } catch (error) {
+        failed = true;
+        throw error;
+      }
+      let done = results[emitIndex];
+      while (done) {
+        results[emitIndex] = undefined;
+        emit(done.value, items[emitIndex]);
+        done = results[++emitIndex];
+      }
+    }
+  };
+
+  const workers = Math.max(1, Math.min(concurrency, items.length));
+  await Promise.all(Array.from({ length: workers }, runWorker));
+}
+
+/** GitHub rate limit buckets the scheduler keeps separate budgets for. */
+export type RateLimitResource = 'core' | 'graphql';
+
+/** Below this share of the budget, requests are spread evenly until the reset. */
+export const RATE_LIMIT_PACING_THRESHOLD = 0.1;
+
+/** Wait after a secondary rate limit without `retry-after`, as GitHub recommends. */
+export const SECONDARY_RATE_LIMIT_WAIT_MS = 60_000;
+
+interface RateLimitBudget {
+  limit: number;
+  remaining: number;
+  reset: number;
+  cost: number;
+  nextRequest: number;
+}
+
+type ResponseHeaders = Record<string, string | number | undefined>;
+
+interface RateLimitedError {
+  status?: number;
+  message?: string;
+  response?: { headers?: ResponseHeaders };
+  errors?: Array<{ type?: string }>;
+}
+
+interface RateLimitedResult {
+  headers?: ResponseHeaders;
+  rateLimit?: { limit?: number; cost?: number; remaining?: number; resetAt?: string };
+}
+
+/**
+ * Returns how long to wait before retrying a request that failed because of a primary or
+ * secondary rate limit, or undefined when the error is not rate-limit related.
+ */
+function rateLimitRetryDelay(
+  error: unknown,
+  now: number,
+  graphqlReset?: number
+): number | undefined {
+  const e = (error ?? {}) as RateLimitedError;
+  const headers = e.response?.headers ?? {};
+  const exhausted = String(headers['x-ratelimit-remaining']) === '0';
+  const rateLimited =
+    e.status === 429 ||
+    (e.status === 403 &&
+      (headers['retry-after'] !== undefined || exhausted || /rate limit/i.test(e.message ?? ''))) ||
+    !!e.errors?.some((graphqlError) => graphqlError.type === 'RATE_LIMITED');
+  if (!rateLimited) {
+    return undefined;
+  }
+  if (headers['retry-after'] !== undefined) {
+    return Number(headers['retry-after']) * 1000;
+  }
+  if (exhausted && headers['x-ratelimit-reset'] !== undefined) {
+    return Math.max(0, Number(headers['x-ratelimit-reset']) * 1000 - now) + 1000;
+  }
+  if (e.errors && graphqlReset && graphqlReset > now) {
+    return graphqlReset - now + 1000;
+  }
+  return SECONDARY_RATE_LIMIT_WAIT_MS;
+}
+
+/** Whether an error is a primary or secondary GitHub rate limit error. */
+export function isRateLimitError(error: unknown): boolean {
+  return rateLimitRetryDelay(error, Date.now()) !== undefined;
+}
+
+export interface RequestScheduler extends Limiter {
+  /** Requests left in the current window, or undefined before GitHub reported it. */
+  remaining(resource: RateLimitResource): number | undefined;
+  /** Total time spent waiting for rate limits. */
+  throttledMs(): number;
+}
+
+export interface RequestSchedulerOptions {
+  maxRetries?: number;
+  sleep?: (ms: number) => Promise<void>;
+  now?: () => number;
+  metrics?: SyncMetrics;
+}
+
+/**
+ * Creates the scheduler every GitHub API call goes through. On top of bounding
+ * concurrency it tracks the REST and GraphQL budgets from response headers and GraphQL
+ * `rateLimit` fields, spreads the last part of a budget evenly until it resets, and
+ * retries 403/429 rate limit errors after `retry-after` or the reset time.
+ */
+export function createRequestScheduler(
+  concurrency: number,
+  options: RequestSchedulerOptions = {}
+): RequestScheduler {
+  const {
+    maxRetries = 5,
+    sleep = (ms: number) => new Promise<void>((resolve) => setTimeout(resolve, ms)),
+    now = Date.now,
+    metrics,
+  } = options;
+  const gate = createLimiter(concurrency);
+  const budgets: Partial<Record<RateLimitResource, RateLimitBudget>> = {};
+  let pausedUntil = 0;
+  let throttled = 0;
+  let throttledUntil = 0;
+
+  const wait = async (ms: number) => {
+    if (ms > 0) {
+      // Count wall-clock time: waits that overlap one already counted (such as
+      // every worker sitting out the same pause) only add the part beyond it
+      const start = now();
+      const end = start + ms;
+      throttled += Math.max(0, end - Math.max(start, throttledUntil));
+      throttledUntil = Math.max(throttledUntil, end);
+      await sleep(ms);
+    }
+  };
+
+  const update = (
+    resource: RateLimitResource,
+    limit: number,
+    remaining: number,
+    reset: number,
+    cost?: number
+  ) => {
+    if (!Number.isFinite(remaining) || !Number.isFinite(reset)) {
+      return;
+    }
+    const budget = budgets[resource];
+    budgets[resource] = {
+      limit: Number.isFinite(limit) && limit > 0 ? limit : budget?.limit ?? remaining,
+      remaining,
+      reset,
+      cost: cost ?? budget?.cost ?? 1,
+      nextRequest: budget?.nextRequest ?? 0,
+    };
+  };
+
+  const record = (resource: RateLimitResource, result: unknown) => {
+    const { headers, rateLimit } = (result ?? {}) as RateLimitedResult;
+    if (headers?.['x-ratelimit-remaining'] !== undefined) {
+      const bucket = headers['x-ratelimit-resource'] ?? resource;
+      if (bucket === 'core' || bucket === 'graphql') {
+        update(
+          bucket,
+          Number(headers['x-ratelimit-limit']),
+          Number(headers['x-ratelimit-remaining']),
+          Number(headers['x-ratelimit-reset']) * 1000
+        );
+      }
+    }
+    if (rateLimit?.remaining !== undefined && rateLimit.resetAt) {
+      update(
+        'graphql',
+        Number(rateLimit.limit),
+        rateLimit.remaining,
+        Date.parse(rateLimit.resetAt),
+        rateLimit.cost
+      );
+    }
+  };
+
+  const pace = async (resource: RateLimitResource) => {
+    await wait(pausedUntil - now());
+    const budget = budgets[resource];
+    if (!budget || now() >= budget.reset) {
+      return;
+    }
+    if (budget.remaining < budget.cost) {
+      core.info(
+        `${resource === 'core' ? 'REST' : 'GraphQL'} rate limit exhausted, waiting until ${new Date(budget.reset).toISOString()}`
+      );
+      await wait(budget.reset - now() + 1000);
+      return;
+    }
+    if (budget.remaining < budget.limit * RATE_LIMIT_PACING_THRESHOLD) {
+      // Reserve the next evenly spaced slot before waiting, so concurrent
+      // requests queue behind each other instead of all firing together
+      const interval = (budget.reset - now()) / (budget.remaining / budget.cost);
+      const slot = Math.max(now(), budget.nextRequest);
+      budget.nextRequest = slot + interval;
+      await wait(slot - now());
+    }
+    budget.remaining -= budget.cost;
+  };
+
+  const schedule = <T>(task: () => Promise<T>, endpoint = 'rest') =>
+    gate(async () => {
+      const resource: RateLimitResource = endpoint.startsWith('graphql') ? 'graphql' : 'core';
+      for (let attempt = 1; ; attempt++) {
+        await pace(resource);
+        try {
+          const result = await task();
+          record(resource, result);
+          metrics?.request(endpoint, result);
+          return result;
+        } catch (error) {
+          const response = (error as RateLimitedError | null)?.response;
+          record(resource, response);
+          metrics?.request(endpoint, response);
+          const delay = rateLimitRetryDelay(error, now(), budgets.graphql?.reset);
+          if (delay === undefined || attempt > maxRetries) {
+            throw error;
+          }
+          core.warning(
+            `Rate limited by GitHub, retrying in ${Math.ceil(delay / 1000)}s (attempt ${attempt} of ${maxRetries})`
+          );
+          // Every request waits, not only the one that was limited
+          pausedUntil = Math.max(pausedUntil, now() + delay);
+        }
+      }
+    });
+
+  return Object.assign(schedule, {
+    concurrency,
+    remaining: (resource: RateLimitResource) => budgets[resource]?.remaining,
+    throttledMs: () => throttled,
+  });
+}
+
+/** Stages of syncing an item, in the order they are reported. */
+export const SYNC_PHASES = [
+  'listing',
+  'relationships',
+  'details',
+  'comments',
+  'review-comments',
+  'commits',
+  'rendering',
+  'diffing',
+  'writing',
+] as const;
+
+export type SyncPhase = (typeof SYNC_PHASES)[number];
+
+export type SyncCounter =
+  | 'files-written'
+  | 'files-unchanged'
+  | 'items-skipped'
+  | 'commit-cache-hits'
+  | 'commit-cache-misses';
+
+export interface SyncMetricsReport {
+  duration_ms: number;
+  phases: Record<SyncPhase, { ms: number; count: number }>;
+  api: {
+    calls: number;
+    bytes: number;
+    endpoints: Record<string, { calls: number; bytes: number }>;
+  };
+  counters: Record<SyncCounter, number>;
+}
+
+export interface SyncMetrics {
+  /** Runs `task` and adds its duration, including awaiting a returned promise, to `phase`. */
+  time<T>(phase: SyncPhase, task: () => T): T;
+  /** Counts one API call to `endpoint` and the size of its response. */
+  request(endpoint: string, response: unknown): void;
+  count(counter: SyncCounter, by?: number): void;
+  report(): SyncMetricsReport;
+}
+
+/**
+ * Size of an API response body: `content-length` when GitHub sent it, otherwise the
+ * length of the parsed body serialized back to JSON.
+ */
+function responseBytes(response: unknown): number {
+  if (!response || typeof response !== 'object') {
+    return 0;
+  }
+  const { headers, data } = response as { headers?: ResponseHeaders; data?: unknown };
+  const length = Number(headers?.['content-length']);
+  if (length > 0) {
+    return length;
+  }
+  // octokit.graphql resolves to the data itself
+  const json = JSON.stringify('data' in response ? data : response);
+  return json ? Buffer.byteLength(json) : 0;
+}
+
+/**
+ * Collects per-phase timings, API call counts and file counters for a sync. Phases
+ * overlap across concurrent items, so their times add up to more than the wall time.
+ */
+export function createSyncMetrics(now: () => number = () => performance.now()): SyncMetrics {
+  const start = now();
+  const phases = Object.fromEntries(
+    SYNC_PHASES.map((phase) => [phase, { ms: 0, count: 0 }])
+  ) as SyncMetricsReport['phases'];
+  const endpoints: SyncMetricsReport['api']['endpoints'] = {};
+  const counters: Record<SyncCounter, number> = {
+    'files-written': 0,
+    'files-unchanged': 0,
+    'items-skipped': 0,
+    'commit-cache-hits': 0,
+    'commit-cache-misses': 0,
+  };
+
+  return {
+    time<T>(phase: SyncPhase, task: () => T): T {
+      const started = now();
+      const finish = () => {
+        phases[phase].ms += now() - started;
+        phases[phase].count++;
+      };
+      let result: T;
+      try {
+        result = task();
+      } catch (error) {
+        finish();
+        throw error;
+      }
+      if (result instanceof Promise) {
+        return result.finally(finish) as T;
+      }
+      finish();
+      return result;
+    },
+    request(endpoint, response) {
+      const entry = (endpoints[endpoint] ??= { calls: 0, bytes: 0 });
+      entry.calls++;
+      entry.bytes += responseBytes(response);
+    },
+    count(counter, by = 1) {
+      counters[counter] += by;
+    },
+    report() {
+      const calls = Object.values(endpoints);
+      return {
+        duration_ms: Math.round(now() - start),
+        phases: Object.fromEntries(
+          SYNC_PHASES.map((phase) => [
+            phase,
+            { ms: Math.round(phases[phase].ms), count: phases[phase].count },
+          ])
+        ) as SyncMetricsReport['phases'],
+        api: {
+          calls: calls.reduce((total, entry) => total + entry.calls, 0),
+          bytes: calls.reduce((total, entry) => total + entry.bytes, 0),
+          endpoints: { ...endpoints },
+        },
+        counters: { ...counters },
+      };
+    },
+  };
+}
+
+async function writeMetricsSummary(report: SyncMetricsReport): Promise<void> {
+  const header = (...cells: string[]) => cells.map((data) => ({ data, header: true }));
+  core.summary.addHeading('Sync metrics', 3);
+  core.summary.addRaw(
+    `Synced in ${(report.duration_ms / 1000).toFixed(1)}s with ${report.api.calls} API call(s) and ${(report.api.bytes / 1024).toFixed(0)} KiB received.`,
+    true
+  );
+  core.summary.addTable([
+    header('Phase', 'Time (s)', 'Runs'),
+    ...SYNC_PHASES.map((phase) => [
+      phase,
+      (report.phases[phase].ms / 1000).toFixed(1),
+      String(report.phases[phase].count),
+    ]),
+  ]);
+  core.summary.addTable([
+    header('Endpoint', 'Calls', 'KiB'),
+    ...Object.entries(report.api.endpoints).map(([endpoint, { calls, bytes }]) => [
+      endpoint,
+      String(calls),
+      (bytes / 1024).toFixed(0),
+    ]),
+  ]);
+  core.summary.addTable([
+    header('Counter', 'Value'),
+    ...Object.entries(report.counters).map(([counter, value]) => [counter, String(value)]),
+  ]);
+  await core.summary.write();
+}
+
+/** Initial number of issues per GraphQL query, before it adapts to the reported cost. */
 export const GRAPHQL_BATCH_SIZE = 50;
 
+/** Largest batch the GraphQL queries grow to; `first` is capped at 100 by GitHub. */
+export const GRAPHQL_MAX_BATCH_SIZE = 100;
+
+/**
+ * Rate-limit points a single GraphQL query should cost. Keeps each query well below
+ * GitHub's node limit and 10 second timeout while still covering many issues per call.
+ */
+export const GRAPHQL_TARGET_COST = 10;
+
+export interface BatchSizer {
+  readonly size: number;
+  record(cost: number | undefined, items: number): void;
+  shrink(): boolean;
+}
+
+/**
+ * Chooses how many items to put in the next GraphQL query from the `rateLimit.cost`
+ * GitHub reported for earlier ones. The size grows at most twofold per query and is
+ * halved by `shrink()` after a query hits GraphQL's node or time limits.
+ */
+export function createBatchSizer(
+  initial = GRAPHQL_BATCH_SIZE,
+  targetCost = GRAPHQL_TARGET_COST,
+  max = GRAPHQL_MAX_BATCH_SIZE
+): BatchSizer {
+  let size = Math.max(1, Math.min(initial, max));
+  return {
+    get size() {
+      return size;
+    },
+    record(cost, items) {
+      if (!cost || items === 0) {
+        return;
+      }
+      const fit = Math.floor((targetCost * items) / cost);
+      size = Math.max(1, Math.min(fit, size * 2, max));
+    },
+    shrink() {
+      if (size <= 1) {
+        return false;
+      }
+      size = Math.floor(size / 2);
+      return true;
+    },
+  };
+}
+
+const GRAPHQL_RESOURCE_ERROR =
+  /MAX_NODE_LIMIT_EXCEEDED|RESOURCE_LIMITS_EXCEEDED|timed? ?out|Something went wrong while executing/i;
+
+/**
+ * Whether a GraphQL error means the query was too large or too slow, so retrying it
+ * with a smaller batch can succeed.
+ */
+function isGraphQLResourceError(error: unknown): boolean {
+  const status = (error as { status?: number } | null)?.status;
+  if (status === 502 || status === 504) {
+    return true;
+  }
+  return GRAPHQL_RESOURCE_ERROR.test(error instanceof Error ? error.message : String(error));
+}
+
+/**
+ * Carries the learned batch size and sub-issue API availability across calls to
+ * `fetchIssueRelationships`, so issues can be looked up page by page.
+ */
+export interface RelationshipQueryState {
+  sizer: BatchSizer;
+  available: boolean;
+}
+
+export function createRelationshipQueryState(): RelationshipQueryState {
+  return { sizer: createBatchSizer(), available: true };
+}
+
 export async function fetchIssueRelationships(
   octokit: ReturnType<typeof github.getOctokit>,
   owner: string,
   repo: string,
-  issueNumbers: number[]
+  issueNumbers: number[],
+  limit: Limiter = createLimiter(1),
+  state: RelationshipQueryState = createRelationshipQueryState()
 ): Promise<Map<number, IssueRelationship>> {
   const relationships = new Map<number, IssueRelationship>();
 
-  if (issueNumbers.length === 0) {
+  if (issueNumbers.length === 0 || !state.available) {
     return relationships;
   }
 
-  for (let i = 0; i < issueNumbers.length; i += GRAPHQL_BATCH_SIZE) {
-    const batch = issueNumbers.slice(i, i + GRAPHQL_BATCH_SIZE);
+  const { sizer } = state;
+  let batchNumber = 1;
+  let i = 0;
+  while (i < issueNumbers.length) {
+    const batch = issueNumbers.slice(i, i + sizer.size);
 
     const issueFields = batch
       .map(
@@ -426,16 +1317,21 @@ export async function fetchIssueRelationships(
       .join('\n');
 
     const query = `query($owner: String!, $repo: String!) {
+      ${GRAPHQL_RATE_LIMIT}
       repository(owner: $owner, name: $repo) {
         ${issueFields}
       }
     }`;
 
     try {
-      const response: any = await octokit.graphql(query, {
-        owner,
-        repo,
-      });
+      const response: any = await limit(
+        () =>
+          octokit.graphql(query, {
+            owner,
+            repo,
+          }),
+        'graphql.relationships'
+      );
 
       for (const num of batch) {
         const data = response.repository[`issue_${num}`];
@@ -446,29 +1342,413 @@ export async function fetchIssueRelationships(
           });
         }
       }
+      sizer.record(response.rateLimit?.cost, batch.length);
     } catch (error) {
+      if (isRateLimitError(error)) {
+        throw error;
+      }
+      if (isGraphQLResourceError(error) && sizer.shrink()) {
+        core.debug(`Relationship query too large, retrying with ${sizer.size} issue(s) per batch`);
+        continue;
+      }
       const message =
         error instanceof Error ? error.message : 'Unknown error';
       if (message.includes("doesn't exist on type")) {
         core.info(
           'Sub-issues API is not available for this repository. Skipping relationship sync.'
         );
+        state.available = false;
         break;
       }
+      core.warning(`Failed to fetch sub-issue relationships (batch ${batchNumber}): ${message}`);
+    }
+    i += batch.length;
+    batchNumber++;
+  }
+
+  return relationships;
+}
+
+interface GraphQLComment {
+  databaseId: number;
+  body: string;
+  createdAt: string;
+  updatedAt: string;
+  url: string;
+  author: { login: string; url: string } | null;
+}
+
+interface GraphQLCommentConnection {
+  pageInfo: { hasNextPage: boolean; endCursor: string | null };
+  nodes: GraphQLComment[];
+}
+
+interface GraphQLIssue {
+  id: string;
+  number: number;
+  title: string;
+  body: string;
+  state: string;
+  createdAt: string;
+  updatedAt: string;
+  url: string;
+  author: { login: string } | null;
+  labels: { nodes: Array<{ name: string }> } | null;
+  assignees: { nodes: Array<{ login: string }> } | null;
+  milestone: { title: string; number: number } | null;
+  comments: GraphQLCommentConnection;
+  parent?: { number: number } | null;
+  subIssues?: { nodes: Array<{ number: number }> } | null;
+}
+
+export interface IssueWithComments {
+  issue: Issue;
+  comments: Comment[];
+  relationship?: IssueRelationship;
+}
+
+const GRAPHQL_RATE_LIMIT = 'rateLimit { limit cost remaining resetAt }';
+
+const GRAPHQL_COMMENT_CONNECTION = `pageInfo { hasNextPage endCursor }
+  nodes { databaseId body createdAt updatedAt url author { login url } }`;
+
+const GRAPHQL_RELATIONSHIP_FIELDS = 'parent { number } subIssues(first: 100) { nodes { number } }';
+
+function buildIssuesQuery(includeRelationships: boolean): string {
+  return `query(
+    $owner: String!
+    $repo: String!
+    $first: Int!
+    $after: String
+    $states: [IssueState!]
+    $since: DateTime
+  ) {
+    ${GRAPHQL_RATE_LIMIT}
+    repository(owner: $owner, name: $repo) {
+      issues(
+        first: $first
+        after: $after
+        states: $states
+        filterBy: { since: $since }
+        orderBy: { field: CREATED_AT, direction: DESC }
+      ) {
+        pageInfo { hasNextPage endCursor }
+        nodes {
+          id number title body state createdAt updatedAt url
+          author { login }
+          labels(first: 100) { nodes { name } }
+          assignees(first: 100) { nodes { login } }
+          milestone { title number }
+          comments(first: 100) { ${GRAPHQL_COMMENT_CONNECTION} }
+          ${includeRelationships ? GRAPHQL_RELATIONSHIP_FIELDS : ''}
+        }
+      }
+    }
+  }`;
+}
+
+function toComment(node: GraphQLComment): Comment {
+  const login = node.author?.login ?? 'ghost';
+  return {
+    id: node.databaseId,
+    body: node.body,
+    user: { login, html_url: node.author?.url ?? `https://github.com/${login}` },
+    created_at: node.createdAt,
+    updated_at: node.updatedAt,
+    html_url: node.url,
+  };
+}
+
+function toIssue(node: GraphQLIssue): Issue {
+  return {
+    number: node.number,
+    title: node.title,
+    body: node.body,
+    state: node.state.toLowerCase(),
+    labels: node.labels?.nodes ?? [],
+    created_at: node.createdAt,
+    updated_at: node.updatedAt,
+    user: { login: node.author?.login ?? 'ghost' },
+    html_url: node.url,
+    assignees: node.assignees?.nodes ?? [],
+    milestone: node.milestone,
+  };
+}
+
+/**
+ * Yields pages of issues with their bodies, labels, comments and sub-issue relationships
+ * from GraphQL, so a page of issues costs one query instead of several REST calls per
+ * issue. Issues with more than 100 comments get the rest in aliased follow-up queries
+ * before their page is yielded. As in `listIssuePages`, the query for the next page is
+ * started before the current one is yielded.
+ */
+export async function* fetchIssuesWithGraphQL(
+  octokit: ReturnType<typeof github.getOctokit>,
+  owner: string,
+  repo: string,
+  includeClosed: boolean,
+  updatedSince?: string,
+  syncSubIssues = true,
+  limit: Limiter = createLimiter(1),
+  metrics: SyncMetrics = createSyncMetrics()
+): AsyncGenerator<IssueWithComments[]> {
+  const sizer = createBatchSizer();
+  let includeRelationships = syncSubIssues;
+
+  // Retries with a smaller page, or without relationships, until a query succeeds
+  const queryPage = async (after: string | null): Promise<any> => {
+    for (;;) {
+      try {
+        return await limit(
+          () =>
+            octokit.graphql(buildIssuesQuery(includeRelationships), {
+              owner,
+              repo,
+              first: sizer.size,
+              after,
+              states: includeClosed ? null : ['OPEN'],
+              since: updatedSince ?? null,
+            }),
+          'graphql.issues'
+        );
+      } catch (error) {
+        const message = error instanceof Error ? error.message : 'Unknown error';
+        if (includeRelationships && message.includes("doesn't exist on type")) {
+          core.info(
+            'Sub-issues API is not available for this repository. Skipping relationship sync.'
+          );
+          includeRelationships = false;
+          continue;
+        }
+        if (isGraphQLResourceError(error) && sizer.shrink()) {
+          core.debug(`Issue query too large, retrying with ${sizer.size} issue(s) per page`);
+          continue;
+        }
+        throw error;
+      }
+    }
+  };
+  const fetchPage = (after: string | null) => metrics.time('listing', () => queryPage(after));
+
+  let next: Promise<any> | undefined = fetchPage(null);
+  while (next) {
+    const response: any = await next;
+    const connection = response.repository.issues;
+    const nodes: GraphQLIssue[] = connection.nodes;
+    const page: IssueWithComments[] = [];
+    const pending: Array<{
+      id: string;
+      number: number;
+      cursor: string | null;
+      comments: Comment[];
+    }> = [];
+    for (const node of nodes) {
+      const comments = node.comments.nodes.map(toComment);
+      page.push({
+        issue: toIssue(node),
+        comments,
+        relationship: includeRelationships
+          ? {
+              parent: node.parent?.number ?? null,
+              children: (node.subIssues?.nodes ?? []).map((n) => n.number),
+            }
+          : undefined,
+      });
+      if (node.comments.pageInfo.hasNextPage) {
+        pending.push({
+          id: node.id,
+          number: node.number,
+          cursor: node.comments.pageInfo.endCursor,
+          comments,
+        });
+      }
+    }
+
+    sizer.record(response.rateLimit?.cost, nodes.length);
+    next = connection.pageInfo.hasNextPage ? fetchPage(connection.pageInfo.endCursor) : undefined;
+    // The caller may stop early on an error; the prefetched page must not then
+    // surface as an unhandled rejection
+    next?.catch(() => undefined);
+
+    await metrics.time('listing', () => fetchRemainingIssueComments(octokit, pending, limit));
+    yield page;
+  }
+}
+
+/**
+ * Follows the comment cursors of issues with more than one page of comments, fetching
+ * the next page of many issues per query. Comments are appended to each entry in place.
+ */
+async function fetchRemainingIssueComments(
+  octokit: ReturnType<typeof github.getOctokit>,
+  pending: Array<{ id: string; number: number; cursor: string | null; comments: Comment[] }>,
+  limit: Limiter = createLimiter(1)
+): Promise<void> {
+  const sizer = createBatchSizer();
+  let queue = pending;
+
+  while (queue.length > 0) {
+    const batch = queue.slice(0, sizer.size);
+    const fields = batch
+      .map(
+        (entry, index) =>
+          `c_${index}: node(id: ${JSON.stringify(entry.id)}) {
+            ... on Issue {
+              comments(first: 100, after: ${JSON.stringify(entry.cursor)}) {
+                ${GRAPHQL_COMMENT_CONNECTION}
+              }
+            }
+          }`
+      )
+      .join('\n');
+
+    let response: any;
+    try {
+      response = await limit(
+        () => octokit.graphql(`query { ${GRAPHQL_RATE_LIMIT} ${fields} }`),
+        'graphql.comments'
+      );
+    } catch (error) {
+      if (isRateLimitError(error)) {
+        throw error;
+      }
+      if (isGraphQLResourceError(error) && sizer.shrink()) {
+        continue;
+      }
+      const message = error instanceof Error ? error.message : 'Unknown error';
+      for (const entry of batch) {
+        core.warning(`Failed to fetch comments for #${entry.number}: ${message}`);
+      }
+      queue = queue.slice(batch.length);
+      continue;
+    }
+
+    const remaining = queue.slice(batch.length);
+    batch.forEach((entry, index) => {
+      const connection: GraphQLCommentConnection | undefined = response[`c_${index}`]?.comments;
+      if (!connection) {
+        return;
+      }
+      entry.comments.push(...connection.nodes.map(toComment));
+      if (connection.pageInfo.hasNextPage) {
+        entry.cursor = connection.pageInfo.endCursor;
+        remaining.push(entry);
+      }
+    });
+    sizer.record(response.rateLimit?.cost, batch.length);
+    queue = remaining;
+  }
+}
+
+interface CommitDetail {
+  stats?: { total?: number; additions?: number; deletions?: number };
+  files?: Array<{ filename: string }>;
+}
+
+export interface CommitCache {
+  readonly hits: number;
+  readonly misses: number;
+  readonly size: number;
+  get(sha: string): CommitDetail | undefined;
+  set(sha: string, detail: CommitDetail): void;
+  save(): void;
+}
+
+/**
+ * Loads the on-disk commit detail cache. Entries are keyed by SHA and kept in least to
+ * most recently used order; once more than `maxEntries` are stored the least recently
+ * used ones are evicted. A missing or unreadable file starts an empty cache.
+ */
+export function loadCommitCache(filePath: string, maxEntries: number): CommitCache {
+  const entries = new Map<string, CommitDetail>();
+  let hits = 0;
+  let misses = 0;
+  let dirty = false;
+
+  if (fs.existsSync(filePath)) {
+    try {
+      const data = JSON.parse(fs.readFileSync(filePath, 'utf-8'));
+      for (const [sha, detail] of data.entries as Array<[string, CommitDetail]>) {
+        entries.set(sha, detail);
+      }
+      core.info(`Loaded ${entries.size} cached commit detail(s) from ${filePath}`);
+    } catch (error) {
       core.warning(
-        `Failed to fetch sub-issue relationships (batch ${Math.floor(i / GRAPHQL_BATCH_SIZE) + 1}): ${message}`
+        `Ignoring unreadable commit cache ${filePath}: ${error instanceof Error ? error.message : 'Unknown error'}`
       );
     }
   }
 
-  return relationships;
+  const evict = () => {
+    for (const sha of entries.keys()) {
+      if (entries.size <= maxEntries) {
+        break;
+      }
+      entries.delete(sha);
+    }
+  };
+  evict();
+
+  return {
+    get hits() {
+      return hits;
+    },
+    get misses() {
+      return misses;
+    },
+    get size() {
+      return entries.size;
+    },
+    get(sha) {
+      const detail = entries.get(sha);
+      if (!detail) {
+        misses++;
+        return undefined;
+      }
+      hits++;
+      // Re-insert to mark as most recently used
+      entries.delete(sha);
+      entries.set(sha, detail);
+      dirty = true;
+      return detail;
+    },
+    set(sha, detail) {
+      entries.delete(sha);
+      entries.set(sha, detail);
+      evict();
+      dirty = true;
+    },
+    save() {
+      if (!dirty) {
+        return;
+      }
+      try {
+        const dir = path.dirname(filePath);
+        if (!fs.existsSync(dir)) {
+          fs.mkdirSync(dir, { recursive: true });
+        }
+        fs.writeFileSync(
+          filePath,
+          JSON.stringify({ version: 1, entries: Array.from(entries) }),
+          'utf-8'
+        );
+        dirty = false;
+      } catch (error) {
+        core.warning(
+          `Failed to save commit cache: ${error instanceof Error ? error.message : 'Unknown error'}`
+        );
+      }
+    },
+  };
 }
 
 async function fetchPRCommits(
   octokit: ReturnType<typeof github.getOctokit>,
   owner: string,
   repo: string,
-  pullNumber: number
+  pullNumber: number,
+  limit: Limiter = createLimiter(1),
+  commitCache?: CommitCache
 ): Promise<
   Array<{
     sha: string;
@@ -493,23 +1773,41 @@ async function fetchPRCommits(
 
   while (hasMore) {
     try {
-      const { data: pageCommits } = await octokit.rest.pulls.listCommits({
-        owner,
-        repo,
-        pull_number: pullNumber,
-        per_page: perPage,
-        page,
-      });
+      const { data: pageCommits } = await limit(
+        () =>
+          octokit.rest.pulls.listCommits({
+            owner,
+            repo,
+            pull_number: pullNumber,
+            per_page: perPage,
+            page,
+          }),
+        'pulls.listCommits'
+      );
 
-      // Fetch detailed commit info including stats and files
+      // Fetch detailed commit info including stats and files, sharing the
+      // request limiter so a large PR cannot exceed max-concurrency. Details
+      // never change for a given SHA, so cached ones are used as they are.
       const commitsWithDetails = await Promise.all(
         pageCommits.map(async (commit) => {
           try {
-            const { data: commitDetail } = await octokit.rest.repos.getCommit({
-              owner,
-              repo,
-              ref: commit.sha,
-            });
+            let commitDetail = commitCache?.get(commit.sha);
+            if (!commitDetail) {
+              const { data } = await limit(
+                () =>
+                  octokit.rest.repos.getCommit({
+                    owner,
+                    repo,
+                    ref: commit.sha,
+                  }),
+                'repos.getCommit'
+              );
+              commitDetail = {
+                stats: data.stats,
+                files: data.files?.map((f) => ({ filename: f.filename })),
+              };
+              commitCache?.set(commit.sha, commitDetail);
+            }
             return {
               sha: commit.sha,
               commit: {
@@ -530,9 +1828,12 @@ async function fetchPRCommits(
                 : null,
               html_url: commit.html_url,
               stats: commitDetail.stats,
-              files: commitDetail.files?.map((f) => ({ filename: f.filename })),
+              files: commitDetail.files,
             };
           } catch (error) {
+            if (isRateLimitError(error)) {
+              throw error;
+            }
             // Fallback to basic commit info if detail fetch fails
             core.debug(`Failed to fetch details for commit ${commit.sha}: ${error}`);
             const commitMessage = commit.commit?.message || '';
@@ -563,6 +1864,9 @@ async function fetchPRCommits(
       hasMore = pageCommits.length === perPage;
       page++;
     } catch (error) {
+      if (isRateLimitError(error)) {
+        throw error;
+      }
       core.warning(
         `Failed to fetch commits for PR #${pullNumber}: ${error instanceof Error ? error.message : 'Unknown error'}`
       );
@@ -577,7 +1881,9 @@ async function fetchReviewComments(
   octokit: ReturnType<typeof github.getOctokit>,
   owner: string,
   repo: string,
-  pullNumber: number
+  pullNumber: number,
+  limit: Limiter = createLimiter(1),
+  since?: string
 ): Promise<ReviewComment[]> {
   const reviewComments: ReviewComment[] = [];
   let page = 1;
@@ -586,18 +1892,26 @@ async function fetchReviewComments(
 
   while (hasMore) {
     try {
-      const { data: pageComments } = await octokit.rest.pulls.listReviewComments({
-        owner,
-        repo,
-        pull_number: pullNumber,
-        per_page: perPage,
-        page,
-      });
+      const { data: pageComments } = await limit(
+        () =>
+          octokit.rest.pulls.listReviewComments({
+            owner,
+            repo,
+            pull_number: pullNumber,
+            per_page: perPage,
+            page,
+            ...(since ? { since } : {}),
+          }),
+        'pulls.listReviewComments'
+      );
 
       reviewComments.push(...(pageComments as ReviewComment[]));
       hasMore = pageComments.length === perPage;
       page++;
     } catch (error) {
+      if (isRateLimitError(error)) {
+        throw error;
+      }
       core.warning(
         `Failed to fetch review comments for PR #${pullNumber}: ${
           error instanceof Error ? error.message : 'Unknown error'
@@ -633,6 +1947,108 @@ function groupReviewComments(reviewComments: ReviewComment[]): ReviewThread[] {
   return Array.from(threads.values());
 }
 
+/** Comments of one item as last fetched; `since` is when that fetch started. */
+export interface CachedComments<T> {
+  since: string;
+  comments: T[];
+}
+
+export interface CommentCacheEntry {
+  comments?: CachedComments<Comment>;
+  review_comments?: CachedComments<ReviewComment>;
+}
+
+export interface CommentCache {
+  load(key: string): Promise<CommentCacheEntry>;
+  save(key: string, entry: CommentCacheEntry): Promise<void>;
+}
+
+/**
+ * How far the recorded fetch time is set back, so clock skew between the runner and
+ * GitHub cannot hide comments updated while they were being fetched.
+ */
+export const COMMENT_CACHE_SKEW_MS = 5 * 60_000;
+
+/**
+ * Opens a directory of per-item comment files (`issue-1.json`, `pr-2.json`). Only the
+ * items being synced are read, so the cache never has to be loaded as a whole. Missing
+ * or unreadable files read as empty entries.
+ */
+export function createCommentCache(dir: string): CommentCache {
+  fs.mkdirSync(dir, { recursive: true });
+  const cacheFile = (key: string) => path.join(dir, `${key}.json`);
+
+  return {
+    async load(key) {
+      const filepath = cacheFile(key);
+      try {
+        const data = JSON.parse(await fs.promises.readFile(filepath, 'utf-8'));
+        if (data.version !== 1) {
+          return {};
+        }
+        return { comments: data.comments, review_comments: data.review_comments };
+      } catch (error) {
+        if ((error as NodeJS.ErrnoException | null)?.code !== 'ENOENT') {
+          core.warning(
+            `Ignoring unreadable comment cache ${filepath}: ${error instanceof Error ? error.message : 'Unknown error'}`
+          );
+        }
+        return {};
+      }
+    },
+    async save(key, entry) {
+      try {
+        await fs.promises.writeFile(
+          cacheFile(key),
+          JSON.stringify({ version: 1, ...entry }),
+          'utf-8'
+        );
+      } catch (error) {
+        core.warning(
+          `Failed to save comment cache for ${key}: ${error instanceof Error ? error.message : 'Unknown error'}`
+        );
+      }
+    },
+  };
+}
+
+/**
+ * Merges comments fetched with `since` into the cached ones by id. Edited comments
+ * replace their cached version in place and new ones are appended, so review threads
+ * group the same way as after a full fetch.
+ */
+export function mergeComments<T extends { id: number }>(cached: T[], updates: T[]): T[] {
+  const merged = new Map(cached.map((comment) => [comment.id, comment]));
+  for (const comment of updates) {
+    merged.set(comment.id, comment);
+  }
+  return Array.from(merged.values());
+}
+
+/**
+ * Fetches the comments of an item, only asking for those updated since the cached
+ * fetch when there is one. Deleted comments are not returned with `since`, so when the
+ * merged comments disagree with the count GitHub reports for the item, all of them
+ * are fetched again.
+ */
+export async function fetchCommentsSince<T extends { id: number }>(
+  cached: CachedComments<T> | undefined,
+  expectedCount: number | undefined,
+  fetch: (since?: string) => Promise<T[]>
+): Promise<CachedComments<T>> {
+  const since = new Date(Date.now() - COMMENT_CACHE_SKEW_MS).toISOString();
+  if (cached) {
+    const comments = mergeComments(cached.comments, await fetch(cached.since));
+    if (expectedCount === undefined || comments.length === expectedCount) {
+      return { since, comments };
+    }
+    core.debug(
+      `Cached comments do not add up to ${expectedCount} (got ${comments.length}), fetching all`
+    );
+  }
+  return { since, comments: await fetch() };
+}
+
 /**
  * Normalizes markdown content by extracting only the body and comments (excluding all frontmatter).
  * This allows comparing content without metadata that changes on every sync (synced, updated timestamps, etc.).
@@ -668,29 +2084,269 @@ function normalizeContent(content: string): string {
 }
 
 /**
- * Compares two markdown files ignoring all frontmatter metadata.
+ * Compares two markdown documents ignoring all frontmatter metadata.
  * Returns true if the actual content (body and comments) is different.
  */
-function hasContentChanged(newContent: string, existingFilePath: string): boolean {
-  if (!fs.existsSync(existingFilePath)) {
-    return true; // File doesn't exist, so it needs to be created
-  }
+function hasContentChanged(newContent: string, existingContent: string): boolean {
+  return normalizeContent(newContent).trim() !== normalizeContent(existingContent).trim();
+}
 
+/** Most markdown reads and writes in flight at once across all sync workers. */
+export const WRITE_QUEUE_SIZE = 8;
+
+/** Suffix of the temporary files markdown is written to before being renamed. */
+const TEMP_FILE_SUFFIX = '.tmp';
+
+export interface MarkdownWriter {
+  /** Whether the file was in the directory when the run started or has been written since. */
+  exists(filename: string): boolean;
+  /**
+   * Writes `content` unless the existing file has the same body and comments, replacing
+   * the file atomically. Resolves to whether it was written.
+   */
+  write(filename: string, content: string, force?: boolean): Promise<boolean>;
+}
+
+/**
+ * Creates the write stage for one output directory. The directory is listed once, so
+ * existence checks need no filesystem calls. Reads, writes and renames are async and
+ * bounded by `queueSize`, so they overlap with the API requests of other items. Each
+ * file is written to a temporary sibling first and renamed over the target, so a
+ * cancelled job never leaves a truncated file behind; temporary files left by such a
+ * job are removed here.
+ */
+export async function createMarkdownWriter(
+  dir: string,
+  metrics: SyncMetrics = createSyncMetrics(),
+  queueSize = WRITE_QUEUE_SIZE
+): Promise<MarkdownWriter> {
+  let entries: string[] = [];
   try {
-    const existingContent = fs.readFileSync(existingFilePath, 'utf-8');
-    const normalizedNew = normalizeContent(newContent).trim();
-    const normalizedExisting = normalizeContent(existingContent).trim();
-    const changed = normalizedNew !== normalizedExisting;
+    entries = await fs.promises.readdir(dir);
+  } catch (error) {
+    if ((error as NodeJS.ErrnoException | null)?.code !== 'ENOENT') {
+      throw error;
+    }
+  }
+  const names = new Set<string>();
+  for (const name of entries) {
+    if (name.startsWith('.') && name.endsWith(TEMP_FILE_SUFFIX)) {
+      await fs.promises.rm(path.join(dir, name), { force: true });
+    } else {
+      names.add(name);
+    }
+  }
 
-    if (!changed) {
-      core.debug(`Content unchanged for ${existingFilePath} (excluding synced timestamp)`);
+  const limit = createLimiter(queueSize);
+  let tempCounter = 0;
+
+  const isUnchanged = async (filepath: string, content: string) => {
+    try {
+      const existing = await fs.promises.readFile(filepath, 'utf-8');
+      return !hasContentChanged(content, existing);
+    } catch (error) {
+      // If we can't read the existing file, assume it needs to be written
+      core.warning(`Could not read existing file ${filepath}: ${error}`);
+      return false;
     }
+  };
+
+  return {
+    exists: (filename) => names.has(filename),
+    write: (filename, content, force = false) =>
+      limit(async () => {
+        const filepath = path.join(dir, filename);
+        if (
+          !force &&
+          names.has(filename) &&
+          (await metrics.time('diffing', () => isUnchanged(filepath, content)))
+        ) {
+          core.debug(`Content unchanged for ${filepath} (excluding synced timestamp)`);
+          return false;
+        }
+
+        const tempPath = path.join(
+          dir,
+          `.${filename}.${process.pid}.${tempCounter++}${TEMP_FILE_SUFFIX}`
+        );
+        await metrics.time('writing', async () => {
+          try {
+            await fs.promises.writeFile(tempPath, content, 'utf-8');
+            await fs.promises.rename(tempPath, filepath);
+          } catch (error) {
+            await fs.promises.rm(tempPath, { force: true }).catch(() => undefined);
+            throw error;
+          }
+        });
+        names.add(filename);
+        return true;
+      }),
+  };
+}
+
+export const MANIFEST_FILENAME = '.sync-manifest.json';
+
+/**
+ * What the last sync saw of an item. `unlisted` marks items that dropped out of an
+ * open-only listing but still exist, so they are not checked again on every run.
+ */
+export interface ManifestEntry {
+  updated_at: string;
+  body_hash: string;
+  comments?: number;
+  relationship?: string;
+  unlisted?: boolean;
+}
 
-    return changed;
+export interface SyncManifest {
+  version: number;
+  issues: Record<string, ManifestEntry>;
+  prs: Record<string, ManifestEntry>;
+}
+
+export function loadSyncManifest(filePath: string): SyncManifest {
+  const empty: SyncManifest = { version: 1, issues: {}, prs: {} };
+  if (!fs.existsSync(filePath)) {
+    return empty;
+  }
+  try {
+    const data = JSON.parse(fs.readFileSync(filePath, 'utf-8'));
+    return { version: 1, issues: data.issues ?? {}, prs: data.prs ?? {} };
   } catch (error) {
-    // If we can't read the existing file, assume it needs to be written
-    core.warning(`Could not read existing file ${existingFilePath}: ${error}`);
+    core.warning(
+      `Ignoring unreadable sync manifest ${filePath}: ${error instanceof Error ? error.message : 'Unknown error'}`
+    );
+    return empty;
+  }
+}
+
+/**
+ * Writes the manifest unless the file already has the same content.
+ * Returns true if the file was written.
+ */
+export function saveSyncManifest(filePath: string, manifest: SyncManifest): boolean {
+  const content = `${JSON.stringify(manifest, null, 2)}\n`;
+  try {
+    if (fs.existsSync(filePath) && fs.readFileSync(filePath, 'utf-8') === content) {
+      return false;
+    }
+    fs.writeFileSync(filePath, content, 'utf-8');
     return true;
+  } catch (error) {
+    core.warning(
+      `Failed to save sync manifest: ${error instanceof Error ? error.message : 'Unknown error'}`
+    );
+    return false;
+  }
+}
+
+export function createManifestEntry(
+  updatedAt: string | undefined,
+  body: string | null | undefined,
+  comments?: number,
+  relationship?: IssueRelationship
+): ManifestEntry {
+  return {
+    updated_at: updatedAt ?? '',
+    body_hash: crypto.createHash('sha256').update(body ?? '').digest('hex'),
+    comments,
+    relationship: relationship
+      ? `${relationship.parent ?? ''}|${relationship.children.join(',')}`
+      : undefined,
+  };
+}
+
+/**
+ * Whether an item as listed now matches what the last sync recorded. A comment count
+ * is only compared when the listing provides one.
+ */
+export function manifestEntryMatches(
+  previous: ManifestEntry | undefined,
+  current: ManifestEntry
+): boolean {
+  return (
+    !!previous &&
+    !!current.updated_at &&
+    previous.updated_at === current.updated_at &&
+    previous.body_hash === current.body_hash &&
+    (current.comments === undefined || previous.comments === current.comments) &&
+    (previous.relationship ?? '') === (current.relationship ?? '')
+  );
+}
+
+/**
+ * Removes the files and manifest entries of items that are missing from the listing
+ * and that `isGone` confirms were deleted or transferred. `isGone` resolving to
+ * undefined leaves the item alone; false marks it as still existing but unlisted.
+ */
+async function reconcileManifest(
+  manifest: Record<string, ManifestEntry>,
+  listed: Set<number>,
+  itemPath: (itemNumber: number) => string,
+  label: string,
+  isGone: (itemNumber: number, entry: ManifestEntry) => Promise<boolean | undefined>
+): Promise<string[]> {
+  const removed: string[] = [];
+
+  for (const [key, entry] of Object.entries(manifest)) {
+    const itemNumber = Number(key);
+    if (listed.has(itemNumber)) {
+      delete entry.unlisted;
+      continue;
+    }
+
+    const gone = await isGone(itemNumber, entry);
+    if (gone === false) {
+      entry.unlisted = true;
+    }
+    if (!gone) {
+      continue;
+    }
+
+    const filepath = itemPath(itemNumber);
+    try {
+      fs.rmSync(filepath, { force: true });
+    } catch (error) {
+      core.warning(
+        `Failed to remove ${filepath}: ${error instanceof Error ? error.message : 'Unknown error'}`
+      );
+      continue;
+    }
+    delete manifest[key];
+    removed.push(filepath);
+    core.info(`Removed ${label} #${itemNumber}, which was deleted or transferred: ${filepath}`);
+  }
+
+  return removed;
+}
+
+/**
+ * Checks whether an issue missing from an open-only listing was deleted or transferred
+ * rather than closed. Resolves to undefined when that cannot be determined.
+ */
+async function isIssueGone(
+  octokit: ReturnType<typeof github.getOctokit>,
+  owner: string,
+  repo: string,
+  issueNumber: number,
+  limit: Limiter
+): Promise<boolean | undefined> {
+  try {
+    const { data } = await limit(
+      () => octokit.rest.issues.get({ owner, repo, issue_number: issueNumber }),
+      'issues.get'
+    );
+    // Transferred issues redirect to their new repository
+    return !data.html_url.toLowerCase().includes(`/${owner}/${repo}/`.toLowerCase());
+  } catch (error) {
+    const status = (error as { status?: number } | null)?.status;
+    if (status === 404 || status === 410) {
+      return true;
+    }
+    core.warning(
+      `Could not check whether issue #${issueNumber} still exists: ${error instanceof Error ? error.message : 'Unknown error'}`
+    );
+    return undefined;
   }
 }
 
@@ -1005,6 +2661,14 @@ function persistLastSync(stateFilePath: string, timestamp: string): void {
   }
 }
 
+function parsePositiveInteger(name: string, value: string): number {
+  const parsed = Number(value.trim());
+  if (!Number.isInteger(parsed) || parsed < 1) {
+    throw new Error(`Invalid ${name} "${value}". Expected a positive integer.`);
+  }
+  return parsed;
+}
+
 function isUpdatedSince(updatedAt: string, updatedSince: string): boolean {
   return new Date(updatedAt).getTime() >= new Date(updatedSince).getTime();
 }